@@ -1,45 +1,62 @@
-# apps/dashboard_inicio.py
-import streamlit as st
-import streamlit_authenticator as stauth
-import yaml
-from yaml.loader import SafeLoader
-
-def run():
-    # --- Cargar configuración desde el archivo YAML ---
-    with open('apps/config/config.yaml') as file:
-        config = yaml.load(file, Loader=SafeLoader)
-
-    # --- Inicializar el autenticador ---
-    authenticator = stauth.Authenticate(
-        config['credentials'],
-        config['cookie']['name'],
-        config['cookie']['key'],
-        config['cookie']['expiry_days'],
-        # config['preauthorized']
-    )
-
-    # --- Renderizar el widget de login ---
-    login_result = authenticator.login('main')
-    # st.write(login_result)
-    if login_result:
-        name, authentication_status, username = login_result
-    else:
-        st.warning("Inicio de sesión.")
-        # st.stop()
-
-    # --- Lógica de la aplicación ---
-
-    if st.session_state["authentication_status"]:
-        # --- PÁGINA PRINCIPAL (CONTENIDO PROTEGIDO) ---
-        st.sidebar.title(f'Bienvenido, *{st.session_state["name"]}*')
-        authenticator.logout('Cerrar sesión', 'sidebar')
-
-        st.title('Aplicación Segura 🔐')
-        st.write('Has accedido al contenido exclusivo.')
-        
-        # 
-
-    elif st.session_state["authentication_status"] is False:
-        st.error('Usuario/contraseña incorrectos')
-    elif st.session_state["authentication_status"] is None:
-        st.warning('Por favor, introduce tu usuario y contraseña')
\ No newline at end of file
+# apps/dashboard_inicio.py
+"""
+Inicio de sesión. El archivo de acceso se lee, y sus contraseñas se cifran, una
+sola vez por proceso; cada sesión trabaja sobre su propia copia
+(``recursos.configuracion_acceso``) y en cada rerun solo se arma el
+autenticador con ella, sin tocar el disco. El autenticador no se guarda entre
+reruns porque dibuja el componente de cookies de la sesión.
+
+Sin archivo de acceso (``apps/config/config.yaml`` o GEOSUITE_ACCESO) la
+aplicación no arranca. Para una instalación de un solo usuario se puede correr
+sin inicio de sesión con GEOSUITE_SIN_ACCESO=1; entonces todos los casos quedan
+a nombre de un usuario local.
+"""
+import os
+
+import streamlit as st
+
+from apps import recursos
+from apps.proyectos import USUARIO_LOCAL
+
+RUTA_ACCESO = os.environ.get("GEOSUITE_ACCESO", os.path.join("apps", "config", "config.yaml"))
+SIN_ACCESO = os.environ.get("GEOSUITE_SIN_ACCESO", "0") == "1"
+CAMPOS = {"Form name": "Inicio de sesión", "Username": "Usuario", "Password": "Contraseña", "Login": "Entrar"}
+
+
+def acceso():
+    """Usuario de la sesión, o None mientras no haya iniciado sesión (el formulario ya quedó dibujado)."""
+    config = recursos.configuracion_acceso(RUTA_ACCESO)
+    if config is None:
+        if SIN_ACCESO:
+            return USUARIO_LOCAL
+        st.error(f"No se encontró el archivo de acceso ({RUTA_ACCESO}). Para usar la aplicación sin inicio de "
+                 "sesión en una instalación de un solo usuario, define GEOSUITE_SIN_ACCESO=1.")
+        st.stop()
+
+    import streamlit_authenticator as stauth
+
+    # --- Inicializar el autenticador (contraseñas ya cifradas: sin bcrypt en el rerun) ---
+    authenticator = stauth.Authenticate(
+        config['credentials'],
+        config['cookie']['name'],
+        config['cookie']['key'],
+        config['cookie']['expiry_days'],
+        auto_hash=False,
+    )
+
+    # --- Renderizar el widget de login ---
+    try:
+        authenticator.login('main', fields=CAMPOS)
+    except stauth.LoginError as error:
+        st.error(str(error))
+        return None
+
+    if st.session_state["authentication_status"]:
+        st.sidebar.write(f'Bienvenido, *{st.session_state["name"]}*')
+        authenticator.logout('Cerrar sesión', 'sidebar')
+        return st.session_state["username"]
+    if st.session_state["authentication_status"] is False:
+        st.error('Usuario/contraseña incorrectos')
+    else:
+        st.warning('Por favor, introduce tu usuario y contraseña')
+    return None
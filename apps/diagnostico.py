@@ -0,0 +1,73 @@
+# apps/diagnostico.py
+"""
+Panel de diagnóstico en la barra lateral.
+
+El interruptor está oculto: aparece solo con GEOSUITE_DIAGNOSTICO=1 o abriendo
+la app con ``?diagnostico=1`` en la URL. Activado desde el interruptor, el
+diagnóstico solo mide los reruns de esa sesión. Con GEOSUITE_METRICAS_PUERTO
+se sirven los acumulados en formato Prometheus en ``http://127.0.0.1:<puerto>/metrics``.
+"""
+import os
+from contextlib import contextmanager
+
+import streamlit as st
+
+from geosuite import diagnostico
+
+
+@st.cache_resource
+def _servidor_metricas():
+    puerto = os.environ.get("GEOSUITE_METRICAS_PUERTO")
+    if not puerto:
+        return None
+    return diagnostico.servir_metricas(int(puerto), os.environ.get("GEOSUITE_METRICAS_HOST", "127.0.0.1"))
+
+
+def _visible():
+    return diagnostico.activo() or st.query_params.get("diagnostico") == "1"
+
+
+@contextmanager
+def corrida(pagina):
+    """Envuelve el rerun de una página; al terminar muestra el panel si el diagnóstico está activo."""
+    _servidor_metricas()
+    visible = _visible()
+    forzar = visible and st.session_state.get("diagnostico_activo", False)
+    perfil = st.session_state.pop("diagnostico_perfilar", False) if forzar or diagnostico.activo() else False
+
+    with diagnostico.corrida(pagina, forzar=forzar, perfil=perfil) as traza:
+        yield traza
+
+    if visible:
+        with st.sidebar:
+            _panel(traza)
+
+
+def _panel(traza):
+    st.divider()
+    st.toggle("Diagnóstico", key="diagnostico_activo", help="Mide los tiempos y contadores de esta sesión")
+    if traza is None:
+        return
+
+    with st.expander(f"⏱️ Rerun: {traza.total * 1000:.1f} ms", expanded=True):
+        lineas = [f"- `{nombre}` {segundos * 1000:.2f} ms" for nombre, segundos in traza.etapas]
+        st.markdown("\n".join(lineas) or "Sin etapas registradas.")
+        recalculados = [n[len("grafo."):-len(".recalculos")] for n in traza.contadores if n.startswith("grafo.")
+                        and n.endswith(".recalculos")]
+        if recalculados:
+            st.caption("Nodos recalculados: " + ", ".join(recalculados))
+        if traza.contadores:
+            st.markdown("\n".join(f"- `{nombre}`: {valor:g}" for nombre, valor in sorted(traza.contadores.items())))
+
+        st.button("Perfilar el siguiente rerun", on_click=st.session_state.__setitem__,
+                  args=("diagnostico_perfilar", True))
+        if traza.perfil is not None:
+            st.session_state["diagnostico_ultimo_perfil"] = traza.perfil
+        perfil = st.session_state.get("diagnostico_ultimo_perfil")
+        if perfil is not None:
+            st.download_button("cProfile (.prof)", perfil.pstats, file_name="geosuite.prof",
+                               mime="application/octet-stream")
+            st.download_button("cProfile (texto)", perfil.resumen, file_name="geosuite_perfil.txt")
+            st.download_button("tracemalloc (texto)", perfil.memoria, file_name="geosuite_memoria.txt")
+        st.download_button("Métricas (Prometheus)", diagnostico.metricas_prometheus(),
+                           file_name="geosuite_metricas.txt")
@@ -1,195 +1,163 @@
-import streamlit as st
-import math
-
-# ACI 318-19 load factors
-PHI_FLEXION = 0.90
-PHI_CORTANTE = 0.75
-
-def run():
-
-    def calculate_footing_design(Pu, Mu, fc, fy, q_adm, b_col, h_col, d_propuesto, C_recubrimiento):
-        """
-        Calcula el diseño de una zapata aislada según el ACI 318-19.
-
-        Args:
-            Pu (float): Carga axial factorizada (factored axial load) en kg.
-            Mu (float): Momento factorizado (factored moment) en kg-m.
-            fc (float): Resistencia a la compresión del concreto (concrete compressive strength) en kg/cm².
-            fy (float): Esfuerzo de fluencia del acero (steel yield strength) en kg/cm².
-            q_adm (float): Presión admisible del suelo (allowable soil pressure) en kg/cm².
-            b_col (float): Ancho de la columna (column width) en cm.
-            h_col (float): Alto de la columna (column height) en cm.
-            d_propuesto (float): Peralte efectivo propuesto (proposed effective depth) en cm.
-            C_recubrimiento (float): Recubrimiento libre (clear cover) en cm.
-
-        Returns:
-            dict: Un diccionario con los resultados del diseño o un mensaje de error.
-        """
-        results = {}
-        
-        # 1. Dimensionamiento de la zapata (sin momento)
-        Pu_service = Pu / 1.4 # Asumiendo carga de servicio (aproximado)
-        q_service_pa = q_adm * 98066.5 # Convertir kg/cm² a Pa para cálculo de m²
-        A_requerida_m2 = (Pu / PHI_FLEXION) / q_service_pa # m^2
-        L_zapata = B_zapata = math.sqrt(A_requerida_m2)
-        
-        L_zapata_m = math.ceil(L_zapata * 10) / 10 # Redondear a la siguiente decima de metro
-        B_zapata_m = math.ceil(B_zapata * 10) / 10
-        
-        L_zapata_cm = L_zapata_m * 100
-        B_zapata_cm = B_zapata_m * 100
-        
-        results['L_zapata'] = L_zapata_cm
-        results['B_zapata'] = B_zapata_cm
-
-        results['Peralte_total'] = d_propuesto + C_recubrimiento + 1.27  # Considerando varilla #4
-        
-        # Cargas factorizadas de diseño
-        q_u_prom_kgcm2 = Pu / (L_zapata_cm * B_zapata_cm) # Presión neta factorizada en kg/cm^2
-        
-        # 2. Verificación por cortante a una dirección (One-way shear)
-        d = d_propuesto
-        c_a_corte = (B_zapata_cm - h_col) / 2
-        
-        V_u1 = q_u_prom_kgcm2 * (c_a_corte - d) * L_zapata_cm # kg
-        V_c1 = 0.53 * math.sqrt(fc) * L_zapata_cm * d # kg
-        
-        results['Cortante_1_direccion_Vu'] = V_u1
-        results['Cortante_1_direccion_Vc'] = PHI_CORTANTE * V_c1
-        
-        results['Cortante_1_direccion_status'] = "Pasa" if V_u1 < PHI_CORTANTE * V_c1 else "No pasa"
-
-        # 3. Verificación por cortante a dos direcciones (Two-way shear / Punching)
-        bo = 2 * (b_col + d) + 2 * (h_col + d)
-        V_u2 = q_u_prom_kgcm2 * (L_zapata_cm * B_zapata_cm - (b_col + d) * (h_col + d)) # kg
-        
-        # ACI 318-19, Section 22.6.5.2 - se toma el menor valor de las tres ecuaciones
-        Vc_1 = (1.06 * math.sqrt(fc)) * bo * d # kg
-        Vc_2 = (0.53 + 1.06 / (b_col/h_col)) * math.sqrt(fc) * bo * d # kg
-        Vc_3 = (0.53 * 2 * d / bo) * math.sqrt(fc) * bo * d # kg -> (0.53 * 40 * d / bo) * math.sqrt(fc) * bo * d (original)
-        
-        # Simplificando para columna cuadrada: b_col=h_col, entonces beta_c=1, alfa_s=40
-        Vc_punching = 1.06 * math.sqrt(fc) * bo * d # La más sencilla para este caso
-        
-        results['Cortante_2_direcciones_Vu'] = V_u2
-        results['Cortante_2_direcciones_Vc'] = PHI_CORTANTE * Vc_punching
-        
-        results['Cortante_2_direcciones_status'] = "Pasa" if V_u2 < PHI_CORTANTE * Vc_punching else "No pasa"
-
-        # 4. Diseño por momento
-        x_corte = (B_zapata_cm - b_col) / 2 # Distancia al corte de la cara de la columna
-        M_u_zapata = (q_u_prom_kgcm2 * 100) * (x_corte**2 / 2) * (L_zapata_cm) # kg-cm
-        
-        # Cálculo del área de acero As
-        # Revisión del factor dentro de la raíz cuadrada
-        discriminant = 1 - (2 * M_u_zapata) / (0.85 * fc * L_zapata_cm * d**2 * PHI_FLEXION)
-
-        if discriminant < 0:
-            return {'error': "El peralte efectivo (d) o las dimensiones de la zapata son insuficientes. Aumente los valores de entrada para el cálculo."}
-        
-        rho = 0.85 * fc / fy * (1 - math.sqrt(discriminant))
-        As_requerida = rho * L_zapata_cm * d # cm2
-        
-        # ACI 318-19, Sección 7.6.1.1 - Acero mínimo
-        rho_min = max(0.0018, 0.25 * math.sqrt(fc) / fy)
-        As_min = rho_min * L_zapata_cm * d
-        
-        As_final = max(As_requerida, As_min)
-        
-        results['Momento_diseño_Mu'] = M_u_zapata / 100 # kg-m
-        results['As_requerido'] = As_final
-        
-        # 5. Longitud de desarrollo (Development Length)
-        db = 1.27 # cm (varilla #4)
-        psi_t = 1.0 # Factor de posición (ACI 25.4.2.4)
-        psi_e = 1.0 # Factor de recubrimiento epóxico
-        lambda_c = 1.0 # Factor para concreto ligero
-        
-        # Simplificado de ACI 318-19, Eq. 25.4.2.3b
-        ld = (fy / (1.1 * math.sqrt(fc))) * db
-        
-        results['Longitud_desarrollo_ld'] = ld
-        results['Longitud_disponible'] = (B_zapata_cm - h_col) / 2 - C_recubrimiento
-        
-        results['Longitud_desarrollo_status'] = "Pasa" if results['Longitud_disponible'] > ld else "No pasa"
-        
-        return results
-
-    # --- INTERFAZ DE USUARIO CON STREAMLIT ---
-    st.set_page_config(page_title="Diseño de Zapata Aislada (ACI 318)", layout="centered")
-
-    st.title("👨‍💻 Diseño de Zapata Aislada (ACI 318)")
-    st.markdown("---")
-
-    st.sidebar.header("Parámetros de Diseño")
-
-    # User Inputs
-    st.sidebar.subheader("Cargas")
-    Pu = st.sidebar.number_input("Carga Axial Factorizada (Pu) [kg]", value=15000.0, step=1000.0)
-    Mu = st.sidebar.number_input("Momento Factorizado (Mu) [kg-m]", value=0.0, step=100.0)
-
-    st.sidebar.subheader("Propiedades de Materiales")
-    fc = st.sidebar.number_input("Resistencia del Concreto (f'c) [kg/cm²]", value=210.0, step=10.0)
-    fy = st.sidebar.number_input("Esfuerzo de Fluencia del Acero (fy) [kg/cm²]", value=4200.0, step=100.0)
-
-    st.sidebar.subheader("Propiedades del Suelo")
-    q_adm = st.sidebar.number_input("Presión Admisible del Suelo (q_adm) [kg/cm²]", value=2.0, step=0.1)
-
-    st.sidebar.subheader("Dimensiones de la Columna y Zapata")
-    b_col = st.sidebar.number_input("Ancho de la Columna [cm]", value=40.0, step=10.0)
-    h_col = st.sidebar.number_input("Alto de la Columna [cm]", value=40.0, step=10.0)
-    d_propuesto = st.sidebar.number_input("Peralte Efectivo Propuesto (d) [cm]", value=50.0, step=5.0)
-    C_recubrimiento = st.sidebar.number_input("Recubrimiento Libre (C) [cm]", value=7.5, step=1.0)
-
-
-    # Run calculation on button click
-    if st.button("Calcular Diseño"):
-        results = calculate_footing_design(Pu, Mu, fc, fy, q_adm, b_col, h_col, d_propuesto, C_recubrimiento)
-        
-        st.markdown("---")
-        st.header("Resultados del Diseño")
-        
-        if 'error' in results:
-            st.error(f"❌ Error de Cálculo: {results['error']}")
-            st.warning("Ajusta los parámetros de entrada y vuelve a intentar.")
-        else:
-            st.subheader("1. Dimensiones de la Zapata")
-            st.info(f"Dimensiones de la zapata: **{results['L_zapata']:.2f} cm x {results['B_zapata']:.2f} cm**")
-            st.info(f"Peralte Total (con d={d_propuesto}cm y recubrimiento): **{results['Peralte_total']:.2f} cm**")
-            
-            st.subheader("2. Verificación por Cortante")
-            
-            if results['Cortante_1_direccion_status'] == "Pasa":
-                st.success(f"✅ Cortante a una dirección: **Pasa**")
-                st.write(f"V_u = {results['Cortante_1_direccion_Vu']:.2f} kg < $\phi$V_c = {results['Cortante_1_direccion_Vc']:.2f} kg")
-            else:
-                st.error(f"❌ Cortante a una dirección: **No Pasa**")
-                st.write(f"V_u = {results['Cortante_1_direccion_Vu']:.2f} kg > $\phi$V_c = {results['Cortante_1_direccion_Vc']:.2f} kg")
-                st.warning("Se debe aumentar el peralte efectivo (d).")
-                
-            if results['Cortante_2_direcciones_status'] == "Pasa":
-                st.success(f"✅ Cortante a dos direcciones: **Pasa**")
-                st.write(f"V_u = {results['Cortante_2_direcciones_Vu']:.2f} kg < $\phi$V_c = {results['Cortante_2_direcciones_Vc']:.2f} kg")
-            else:
-                st.error(f"❌ Cortante a dos direcciones: **No Pasa**")
-                st.write(f"V_u = {results['Cortante_2_direcciones_Vu']:.2f} kg > $\phi$V_c = {results['Cortante_2_direcciones_Vc']:.2f} kg")
-                st.warning("Se debe aumentar el peralte efectivo (d).")
-                
-            st.subheader("3. Diseño por Momento")
-            st.write(f"Momento de diseño (Mu): **{results['Momento_diseño_Mu']:.2f} kg-m**")
-            st.write(f"Área de acero requerida (As): **{results['As_requerido']:.2f} cm²**")
-            st.info("Para un acero del #4 (1.27 cm²) se requieren {:.2f} varillas por lado.".format(results['As_requerido'] / 1.27))
-            st.info(f"Espaciamiento aproximado: **{100 / (results['As_requerido'] / 1.27):.2f} cm**")
-
-            st.subheader("4. Longitud de Desarrollo")
-            if results['Longitud_desarrollo_status'] == "Pasa":
-                st.success(f"✅ Longitud de desarrollo: **Pasa**")
-                st.write(f"Longitud disponible = {results['Longitud_disponible']:.2f} cm > Longitud de desarrollo requerida = {results['Longitud_desarrollo_ld']:.2f} cm")
-            else:
-                st.error(f"❌ Longitud de desarrollo: **No Pasa**")
-                st.write(f"Longitud disponible = {results['Longitud_disponible']:.2f} cm < Longitud de desarrollo requerida = {results['Longitud_desarrollo_ld']:.2f} cm")
-                st.warning("Se debe considerar ganchos de 90° o aumentar el tamaño de la zapata.")
-        
-        st.markdown("---")
-        st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
-        st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero estructural calificado. Siempre consulta a un profesional para el diseño final.")
+import streamlit as st
+
+from apps import proyectos, reportes
+from geosuite.diagnostico import etapa
+from geosuite.estr_zap import (
+    AREA_VARILLA, PRECIO_ACERO, PRECIO_CONCRETO, UNIDADES, EntradaZapata, calculate_footing_design, optimizar_zapatas,
+)
+from geosuite.unidades import convertir, en_sistema, normalizar_unidades
+
+SISTEMAS_UNIDADES = {"tecnico": "Técnico (kg, kg/cm², cm)", "SI": "SI (kN, kPa, m)"}
+
+
+def run():
+
+    # --- INTERFAZ DE USUARIO CON STREAMLIT ---
+    st.title("👨‍💻 Diseño de Zapata Aislada (ACI 318)")
+    st.markdown("---")
+
+    st.sidebar.header("Parámetros de Diseño")
+    sistema = st.sidebar.radio("Sistema de unidades", list(SISTEMAS_UNIDADES), format_func=SISTEMAS_UNIDADES.get)
+
+    def en(unidad_motor):
+        return en_sistema(unidad_motor, sistema)
+
+    def numero(etiqueta, campo, valor, paso):
+        # Valor y paso por defecto en las unidades del motor, mostrados en las del sistema elegido
+        unidad = en(UNIDADES[campo])
+        return st.sidebar.number_input(f"{etiqueta} [{unidad}]", value=convertir(valor, UNIDADES[campo], unidad),
+                                       step=convertir(paso, UNIDADES[campo], unidad), format="%.4g",
+                                       key=f"zapata_{campo}_{sistema}")
+
+    def mostrar(valor, unidad_motor):
+        decimales = 3 if sistema == "SI" else 2 # m y kN necesitan un decimal más que cm y kg
+        return f"{convertir(valor, unidad_motor, en(unidad_motor)):.{decimales}f} {en(unidad_motor)}"
+
+    # User Inputs
+    st.sidebar.subheader("Cargas")
+    Pu = numero("Carga Axial Factorizada (Pu)", "Pu", 15000.0, 1000.0)
+    Mu = numero("Momento Factorizado (Mu)", "Mu", 0.0, 100.0)
+
+    st.sidebar.subheader("Propiedades de Materiales")
+    fc = numero("Resistencia del Concreto (f'c)", "fc", 210.0, 10.0)
+    fy = numero("Esfuerzo de Fluencia del Acero (fy)", "fy", 4200.0, 100.0)
+
+    st.sidebar.subheader("Propiedades del Suelo")
+    q_adm = numero("Presión Admisible del Suelo (q_adm)", "q_adm", 2.0, 0.1)
+
+    st.sidebar.subheader("Dimensiones de la Columna y Zapata")
+    b_col = numero("Ancho de la Columna", "b_col", 40.0, 10.0)
+    h_col = numero("Alto de la Columna", "h_col", 40.0, 10.0)
+    d_propuesto = numero("Peralte Efectivo Propuesto (d)", "d_propuesto", 50.0, 5.0)
+    C_recubrimiento = numero("Recubrimiento Libre (C)", "C_recubrimiento", 7.5, 1.0)
+
+    # Frontera de unidades: el motor recibe kg, kg/cm² y cm
+    entrada = EntradaZapata(**normalizar_unidades(
+        {"Pu": Pu, "Mu": Mu, "fc": fc, "fy": fy, "q_adm": q_adm, "b_col": b_col, "h_col": h_col,
+         "d_propuesto": d_propuesto, "C_recubrimiento": C_recubrimiento}, UNIDADES, sistema))
+
+    tab_diseno, tab_optimizador = st.tabs(["Diseño individual", "Optimizador de cuadro de columnas"])
+
+    with tab_diseno:
+        # Run calculation on button click
+        if st.button("Calcular Diseño"):
+            st.markdown("---")
+            st.header("Resultados del Diseño")
+
+            try:
+                results = calculate_footing_design(entrada)
+            except ValueError as error:
+                st.error(f"❌ Error de Cálculo: {error}")
+                st.warning("Ajusta los parámetros de entrada y vuelve a intentar.")
+            else:
+                proyectos.registrar("zapatas", entrada, results,
+                                    f"{results.L_zapata:g} x {results.B_zapata:g} cm, h = {results.Peralte_total:g} cm")
+                st.subheader("1. Dimensiones de la Zapata")
+                st.info(f"Dimensiones de la zapata: **{mostrar(results.L_zapata, 'cm')} x {mostrar(results.B_zapata, 'cm')}**")
+                st.info(f"Peralte Total (con d={d_propuesto:g} {en('cm')} y recubrimiento): **{mostrar(results.Peralte_total, 'cm')}**")
+                st.write(f"Presión de servicio: q_max = {mostrar(results.q_max, 'kg/cm²')}, q_min = {mostrar(results.q_min, 'kg/cm²')}")
+
+                st.subheader("2. Verificación por Cortante")
+
+                if results.Cortante_1_direccion_pasa:
+                    st.success(f"✅ Cortante a una dirección: **Pasa**")
+                    st.write(f"V_u = {mostrar(results.Cortante_1_direccion_Vu, 'kg')} < $\phi$V_c = {mostrar(results.Cortante_1_direccion_Vc, 'kg')}")
+                else:
+                    st.error(f"❌ Cortante a una dirección: **No Pasa**")
+                    st.write(f"V_u = {mostrar(results.Cortante_1_direccion_Vu, 'kg')} > $\phi$V_c = {mostrar(results.Cortante_1_direccion_Vc, 'kg')}")
+                    st.warning("Se debe aumentar el peralte efectivo (d).")
+
+                if results.Cortante_2_direcciones_pasa:
+                    st.success(f"✅ Cortante a dos direcciones: **Pasa**")
+                    st.write(f"V_u = {mostrar(results.Cortante_2_direcciones_Vu, 'kg')} < $\phi$V_c = {mostrar(results.Cortante_2_direcciones_Vc, 'kg')}")
+                else:
+                    st.error(f"❌ Cortante a dos direcciones: **No Pasa**")
+                    st.write(f"V_u = {mostrar(results.Cortante_2_direcciones_Vu, 'kg')} > $\phi$V_c = {mostrar(results.Cortante_2_direcciones_Vc, 'kg')}")
+                    st.warning("Se debe aumentar el peralte efectivo (d).")
+                st.caption(f"Ecuación gobernante de Vc: {results.Cortante_2_direcciones_Vc_ecuacion}")
+
+                st.subheader("3. Diseño por Momento")
+                st.write(f"Momento de diseño (Mu): **{mostrar(results.Momento_diseno_Mu, 'kg·m')}**")
+                st.write(f"Área de acero requerida (As): **{mostrar(results.As_requerido, 'cm²')}**")
+                varillas = results.As_requerido / AREA_VARILLA
+                st.info(f"Para un acero del #4 ({AREA_VARILLA:g} cm²) se requieren {varillas:.2f} varillas por lado.")
+                st.info(f"Espaciamiento aproximado: **{mostrar(100 / varillas, 'cm')}**")
+
+                st.subheader("4. Longitud de Desarrollo")
+                if results.Longitud_desarrollo_pasa:
+                    st.success(f"✅ Longitud de desarrollo: **Pasa**")
+                    st.write(f"Longitud disponible = {mostrar(results.Longitud_disponible, 'cm')} ≥ Longitud de desarrollo requerida = {mostrar(results.Longitud_desarrollo_ld, 'cm')}")
+                else:
+                    st.error(f"❌ Longitud de desarrollo: **No Pasa**")
+                    st.write(f"Longitud disponible = {mostrar(results.Longitud_disponible, 'cm')} < Longitud de desarrollo requerida = {mostrar(results.Longitud_desarrollo_ld, 'cm')}")
+                    st.warning("Se debe considerar ganchos de 90° o aumentar el tamaño de la zapata.")
+
+        # La memoria se genera en segundo plano con los datos actuales de la barra lateral
+        st.markdown("---")
+        col_m1, col_m2 = st.columns([1, 3])
+        formato = col_m1.radio("Memoria de cálculo", reportes.FORMATOS, horizontal=True, format_func=str.upper)
+        if col_m1.button("Generar memoria"):
+            reportes.enviar("zapatas", entrada, formato, f"zapata_{entrada.b_col:g}x{entrada.h_col:g}_Pu{entrada.Pu:g}")
+        with col_m2:
+            reportes.panel()
+
+    with tab_optimizador:
+        import pandas as pd
+
+        st.write("Zapatas rectangulares de costo mínimo (concreto + acero) para todo el cuadro de columnas, con momento biaxial. "
+                 "Se usan f'c, fy, q_adm y recubrimiento de la barra lateral.")
+        st.caption(f"Cuadro en {SISTEMAS_UNIDADES[sistema]}: Pu en {en('kg')}, Mux y Muy en {en('kg·m')}, "
+                   f"b_col y h_col en {en('cm')}.")
+        ejemplo = pd.DataFrame({
+            "Columna": ["C-1", "C-2", "C-3"],
+            "Pu": [15000.0, 40000.0, 60000.0],
+            "Mux": [0.0, 2000.0, 5000.0],
+            "Muy": [0.0, 0.0, 3000.0],
+            "b_col": [40.0, 40.0, 50.0],
+            "h_col": [40.0, 40.0, 50.0],
+        })
+        cuadro = st.data_editor(
+            ejemplo.assign(**{c: convertir(ejemplo[c].to_numpy(), UNIDADES[c], en(UNIDADES[c]))
+                              for c in ("Pu", "Mux", "Muy", "b_col", "h_col")}),
+            num_rows="dynamic",
+            hide_index=True,
+            key=f"cuadro_{sistema}",
+        )
+        col_p1, col_p2, col_p3 = st.columns(3)
+        precio_concreto = col_p1.number_input("Concreto [$/m³]", value=PRECIO_CONCRETO, step=100.0)
+        precio_acero = col_p2.number_input("Acero [$/kg]", value=PRECIO_ACERO, step=1.0)
+        permitir_levantamiento = col_p3.checkbox("Permitir levantamiento parcial", value=False)
+
+        if st.button("Optimizar", type="primary"):
+            with etapa("zapatas.optimizar"):
+                optimo = optimizar_zapatas(cuadro.dropna(), fc, fy, q_adm, C_recubrimiento,
+                                           precio_concreto=precio_concreto, precio_acero=precio_acero,
+                                           permitir_levantamiento=permitir_levantamiento, unidades=sistema)
+            with etapa("zapatas.mostrar_tabla"):
+                st.dataframe(optimo, hide_index=True)
+            if (optimo["Estado"] != "Óptima").any():
+                st.warning("Algunas columnas no tienen solución dentro de los rangos de B, L y d evaluados.")
+
+    st.markdown("---")
+    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+    st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero estructural calificado. Siempre consulta a un profesional para el diseño final.")
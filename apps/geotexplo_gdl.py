@@ -1,106 +1,112 @@
-
-import streamlit as st
-
-
-def run():
-
-
-    geo_col1, geo_col2 = st.columns(2)
-    with geo_col1:
-        # Configuración general
-        st.set_page_config(page_title="Presupuesto Geotécnico", page_icon="📊")
-
-        st.markdown("<center><h2>📊 Cálculadora de Exploración Geotécnica Guadalajara MEX", unsafe_allow_html=True)
-
-        st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
-
-        st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
-        st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
-
-        st.markdown("Para proyectos de hasta 2000 m2 y 10 niveles")
-
-
-        # Ingreso de datos del proyecto
-        st.subheader("📝 Datos del Proyecto")
-        nombre_proyecto = st.text_input("Nombre del proyecto")
-        ubicacion = st.selectbox("Ubicación", ["Guadalajara", "Zapopan"])
-        area = st.number_input("Área de construcción (m²)", min_value=1, max_value=1000)
-        niveles = st.number_input("Número de niveles", min_value=1, max_value= 10)
-
-        st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
-        submit = st.button("CALCULAR", type="primary")
-
-
-
-    # Cálculos simples
-    if submit and area and niveles:
-        
-                #Determinar la profundidad de sondeos
-        # NumeroDeNiveles = float(input('¿Cual es el NÚMERO DE NIVELES del proyecto? '))
-
-        if niveles == 1:
-            profundidad = 4
-        elif niveles == 2:
-            profundidad = 5
-        elif niveles == 3:
-            profundidad = 7
-        elif niveles == 4 or 5:
-            profundidad = 9
-        elif niveles == 6 or 7:
-            profundidad = 12
-        elif niveles == 8 or 9:
-            profundidad = 14
-        elif niveles == 10:
-            profundidad = 14
-        else:
-            profundidad = 'error'   
-
-        
-        #Numero de sondeos
-        if 0 < area <= 100:
-            num_sondeos = 1
-        elif 100 < area <= 250:
-            num_sondeos = 2
-        elif 250 < area <=1000:
-            num_sondeos = 3
-        elif 1000 < area <=2000:
-            num_sondeos = 4
-        else:
-            num_sondeos = 'error'
-
-
-            
-
-        with geo_col2:    
-            # Ds_cal = bou_rect_c(q, L, B, z)
-
-            #Tipo de sondeo
-            tipo_sondeo = "SPT"
-            
-            st.header("🔍 Recomendación Técnica")
-            st.subheader(f"Tipo de sondeo sugerido:  {tipo_sondeo}")
-            st.subheader(f"Número de sondeos: {num_sondeos}")
-            st.subheader(f"Profundidad estimada por sondeo: {profundidad} m ")
-
-            # Precios base
-            #precio_por_m = 1000
-            #pu_laboratorio = 500
-            #laboratorio = num_sondeos * profundidad * pu_laboratorio
-            #movilizacion = 4000
-            #informe = 5000
-            #total_sondeo = num_sondeos * profundidad * precio_por_m
-            #total = total_sondeo + laboratorio + movilizacion + informe
-
-            st.header("💰 Cotizacion Estimada")
-            st.subheader("📩Contáctenos a proyectos@geotecniaterranova.com")
-            st.subheader("✅o por Whatsapp https://wa.link/vai3cy") 
-
-            
-
-            #st.subheader(f"Total sondeos: ${total_sondeo:,.0f} MXN, considerando {precio_por_m} MXN por m de profundidad")
-            #st.write(f"Laboratorio: ${laboratorio:,.0f} MXN, considerando {pu_laboratorio} MXN por m de profundidad")
-            #st.write(f"Movilizacion: ${movilizacion:,.0f} MXN")
-            #st.write(f"Informe: ${informe:,.0f} MXN")
-            #st.subheader(f"💰 Total: ${total:,.0f} MXN")
-
-            
+
+import streamlit as st
+
+from geosuite.exploracion import EntradaExploracion, cargar_reglas, leer_cuadro, leer_poligono, planear_exploracion, planear_lote
+from geosuite.graficas import grafica
+
+
+@grafica("exploracion", figsize=(6, 6))
+def grafica_sondeos(fig, poligono, sondeos, radio):
+    """Predio, sondeos y su círculo de cobertura."""
+    from matplotlib.patches import Circle, Polygon
+
+    ax = fig.subplots()
+    ax.add_patch(Polygon(poligono, closed=True, fill=False, color='k', label="Predio"))
+    for x, y in sondeos:
+        ax.add_patch(Circle((x, y), radio, color='tab:blue', alpha=0.08))
+    ax.plot(sondeos[:, 0], sondeos[:, 1], 'rv', markersize=9, label="Sondeos")
+    for i, (x, y) in enumerate(sondeos, start=1):
+        ax.annotate(f"S-{i}", (x, y), textcoords="offset points", xytext=(6, 6))
+    ax.set_xlim(poligono[:, 0].min() - 5, poligono[:, 0].max() + 5)
+    ax.set_ylim(poligono[:, 1].min() - 5, poligono[:, 1].max() + 5)
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_xlabel("x (m)"); ax.set_ylabel("y (m)")
+    ax.legend(loc="upper right"); ax.grid(True, linestyle='--', alpha=0.6)
+    fig.tight_layout()
+
+
+def run():
+
+    reglas = cargar_reglas()
+    area_maxima = int(reglas.area_max[-1])
+    niveles_maximos = int(reglas.niveles_max[-1])
+
+    tab_proyecto, tab_lote = st.tabs(["Proyecto", "Cotización por lote"])
+
+    with tab_proyecto:
+        geo_col1, geo_col2 = st.columns(2)
+        with geo_col1:
+            st.markdown("<center><h2>📊 Cálculadora de Exploración Geotécnica Guadalajara MEX", unsafe_allow_html=True)
+
+            st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
+
+            st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+            st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
+
+            st.markdown(f"Para proyectos de hasta {area_maxima} m2 y {niveles_maximos} niveles")
+
+
+            # Ingreso de datos del proyecto
+            st.subheader("📝 Datos del Proyecto")
+            nombre_proyecto = st.text_input("Nombre del proyecto")
+            ubicacion = st.selectbox("Ubicación", list(reglas.ubicaciones))
+            area = st.number_input("Área de construcción (m²)", min_value=1, max_value=area_maxima)
+            niveles = st.number_input("Número de niveles", min_value=1, max_value=niveles_maximos)
+            texto_poligono = st.text_area(
+                "Polígono del predio (opcional)", placeholder="0,0; 40,0; 40,25; 0,25",
+                help="Vértices x,y en metros separados por ';'. Si se indica, el área es la del polígono "
+                     "y los sondeos se ubican dentro de él.")
+
+            st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
+            submit = st.button("CALCULAR", type="primary")
+
+
+
+        # Cálculos simples
+        if submit and area and niveles:
+            try:
+                poligono = leer_poligono(texto_poligono)
+                plan = planear_exploracion(EntradaExploracion(niveles=int(niveles), area=None if poligono else float(area),
+                                                              poligono=poligono, ubicacion=ubicacion))
+            except ValueError as error:
+                with geo_col2:
+                    st.error(str(error))
+                return
+
+            with geo_col2:
+                st.header("🔍 Recomendación Técnica")
+                if nombre_proyecto:
+                    st.caption(nombre_proyecto)
+                st.subheader(f"Tipo de sondeo sugerido:  {plan.tipo_sondeo}")
+                st.subheader(f"Número de sondeos: {plan.num_sondeos}")
+                st.subheader(f"Profundidad estimada por sondeo: {plan.profundidad:g} m ")
+                if plan.num_sondeos > plan.num_sondeos_tabla:
+                    st.caption(f"La tabla indica {plan.num_sondeos_tabla} sondeos para {plan.area:,.0f} m²; se agregan "
+                               f"{plan.num_sondeos - plan.num_sondeos_tabla} por la forma del predio.")
+                st.write(f"Todo punto del predio queda a menos de {plan.cobertura:.1f} m de un sondeo "
+                         f"(máximo {plan.radio_cobertura:.1f} m, separación de {reglas.separacion_maxima:g} m).")
+                st.image(grafica_sondeos(plan.poligono, plan.sondeos, plan.radio_cobertura), use_container_width=True)
+
+                st.header("💰 Cotizacion Estimada")
+                st.subheader("📩Contáctenos a proyectos@geotecniaterranova.com")
+                st.subheader("✅o por Whatsapp https://wa.link/vai3cy")
+
+    with tab_lote:
+        st.subheader("Cotización por lote")
+        st.write("Sube un cuadro (CSV o Excel) con una fila por proyecto y las columnas **Niveles** y **Área** "
+                 "o **Polígono** (\"x,y; x,y; ...\"); opcionalmente **Proyecto** y **Ubicación**.")
+        archivo = st.file_uploader("Cuadro de proyectos", type=["csv", "xlsx"])
+        if archivo is not None:
+            try:
+                cuadro = leer_cuadro(archivo.getvalue(), archivo.name)
+            except ValueError as error:
+                st.error(str(error))
+                return
+            with st.spinner(f"Planeando {len(cuadro)} proyectos..."):
+                planes = planear_lote(cuadro)
+            correctos = planes["Estado"] == "OK"
+            st.caption(f"{int(correctos.sum())} de {len(planes)} proyectos planeados; "
+                       f"{planes.loc[correctos, 'Metros de perforación'].sum():,.0f} m de perforación en total.")
+            st.dataframe(planes, hide_index=True)
+            st.download_button("Descargar resultados (CSV)", planes.to_csv(index=False).encode("utf-8"),
+                               file_name="exploracion_lote.csv", mime="text/csv")
@@ -0,0 +1,92 @@
+# apps/proyectos.py
+"""
+Mis cálculos: los casos que cada usuario ha calculado, guardados en
+``geosuite.proyectos``. Las páginas de cálculo registran sus casos con
+``registrar``; la escritura se hace por lotes fuera del rerun. La lista se
+carga por páginas y un caso solo se decodifica al abrirlo.
+"""
+import dataclasses
+import sqlite3
+from datetime import datetime
+
+import streamlit as st
+
+from geosuite.proyectos import POR_PAGINA, obtener_proyectos
+
+USUARIO_LOCAL = "local" # con GEOSUITE_SIN_ACCESO=1, todos los casos son de este usuario
+NOMBRES_TIPO = {
+    "capacidad": "Capacidad de carga", "asentamientos": "Asentamiento", "losas": "Losa", "zapatas": "Zapata",
+    "taludes": "Talud", "muros": "Presión de tierras", "triaxiales": "Ensayo triaxial",
+}
+
+
+def usuario():
+    return st.session_state.get("usuario") or USUARIO_LOCAL
+
+
+def registrar(tipo, entrada, resultado=None, resumen=""):
+    """Guarda el caso en los cálculos del usuario; un fallo del almacén no interrumpe la página."""
+    try:
+        obtener_proyectos().guardar(usuario(), tipo, entrada, resultado, resumen=resumen)
+    except (TypeError, ValueError, OSError, sqlite3.Error):
+        return False
+    return True
+
+
+def _campos(valor):
+    """Campos escalares de un dataclass (o dict) para mostrarlos como tabla."""
+    datos = dataclasses.asdict(valor) if dataclasses.is_dataclass(valor) else dict(valor or {})
+    return {k: v for k, v in datos.items() if v is None or isinstance(v, (bool, int, float, str))}
+
+
+def run():
+    st.markdown("<center><h2>🗂️ Mis cálculos</h2></center>", unsafe_allow_html=True)
+    proyectos = obtener_proyectos()
+    quien = usuario()
+
+    tipo = st.selectbox("Tipo", ["todos", *NOMBRES_TIPO], format_func=lambda t: NOMBRES_TIPO.get(t, "Todos"))
+    tipo = None if tipo == "todos" else tipo
+    total = proyectos.contar(quien, tipo)
+    if total == 0:
+        st.info("Aún no hay cálculos guardados. Cada caso que calcules en las demás páginas aparecerá aquí.")
+        return
+
+    paginas = (total - 1) // POR_PAGINA + 1
+    pagina = st.number_input(f"Página (de {paginas})", min_value=1, max_value=paginas, value=1) if paginas > 1 else 1
+    casos = proyectos.listar(quien, tipo, limite=POR_PAGINA, desde=(pagina - 1) * POR_PAGINA)
+    st.caption(f"{total} cálculos guardados.")
+    st.dataframe(
+        [{"Tipo": NOMBRES_TIPO.get(c.tipo, c.tipo), "Nombre": c.nombre, "Resumen": c.resumen,
+          "Modificado": datetime.fromtimestamp(c.modificado).strftime("%Y-%m-%d %H:%M")} for c in casos],
+        hide_index=True,
+    )
+
+    etiquetas = {c.id: f"{c.nombre} — {c.resumen}" if c.resumen else c.nombre for c in casos}
+    elegido = st.selectbox("Abrir", list(etiquetas), format_func=etiquetas.get)
+    if elegido is None:
+        return
+    try:
+        caso = proyectos.abrir(quien, elegido)
+    except KeyError as error:
+        st.error(str(error))
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Datos de entrada")
+        st.dataframe([{"Campo": k, "Valor": str(v)} for k, v in _campos(caso.entrada).items()], hide_index=True)
+    with col2:
+        st.subheader("Resultados")
+        if caso.resultado is None:
+            st.write("Sin resultados guardados.")
+        else:
+            st.dataframe([{"Campo": k, "Valor": str(v)} for k, v in _campos(caso.resultado).items()], hide_index=True)
+
+    nombre = st.text_input("Nombre", value=caso.nombre)
+    col1, col2 = st.columns(2)
+    if col1.button("Renombrar", disabled=nombre == caso.nombre or not nombre.strip()):
+        proyectos.renombrar(quien, caso.id, nombre.strip())
+        st.rerun()
+    if col2.button("Borrar"):
+        proyectos.borrar(quien, caso.id)
+        st.rerun()
@@ -0,0 +1,63 @@
+# apps/recursos.py
+"""Recursos compartidos por todas las sesiones; se cargan una sola vez por proceso."""
+import copy
+import importlib
+import os
+import threading
+
+import streamlit as st
+
+
+@st.cache_resource
+def imagen(ruta):
+    """Bytes de una imagen, leídos del disco una sola vez por proceso."""
+    with open(ruta, "rb") as archivo:
+        return archivo.read()
+
+
+@st.cache_resource
+def _configuracion_leida(ruta):
+    """Archivo de acceso leído y con las contraseñas cifradas; compartido, no se modifica."""
+    if not os.path.exists(ruta):
+        return None
+    import streamlit_authenticator as stauth
+    import yaml
+
+    with open(ruta, encoding="utf-8") as archivo:
+        config = yaml.safe_load(archivo)
+    stauth.Hasher.hash_passwords(config["credentials"])
+    return config
+
+
+def configuracion_acceso(ruta):
+    """
+    Configuración de inicio de sesión (credenciales y cookie), con las
+    contraseñas en texto plano ya cifradas con bcrypt. El archivo se lee una
+    sola vez por proceso, pero cada sesión recibe su propia copia: el
+    autenticador escribe en ella (estado de la sesión, intentos fallidos).
+    None si el archivo no existe.
+    """
+    clave = f"_acceso:{ruta}"
+    if clave not in st.session_state:
+        config = _configuracion_leida(ruta)
+        st.session_state[clave] = None if config is None else copy.deepcopy(config)
+    return st.session_state[clave]
+
+
+@st.cache_resource
+def precalentar(modulos):
+    """
+    Importa en segundo plano las páginas y librerías pesadas después del primer render,
+    para que el primer cambio de página encuentre los módulos ya cargados.
+    Se desactiva con GEOSUITE_PRECALENTAR=0.
+    """
+    if os.environ.get("GEOSUITE_PRECALENTAR", "1") == "0":
+        return None
+
+    def importar():
+        for modulo in ("matplotlib.figure", "matplotlib.backends.backend_agg", *modulos):
+            importlib.import_module(modulo)
+
+    hilo = threading.Thread(target=importar, name="geosuite-precalentar", daemon=True)
+    hilo.start()
+    return hilo
@@ -0,0 +1,111 @@
+# apps/reportes.py
+"""
+Memorias de cálculo: una cola compartida por todas las sesiones genera los
+PDF/HTML en segundo plano y cada sesión ve solo sus trabajos. Las demás
+páginas encolan con ``enviar`` y muestran el estado con ``panel``.
+"""
+import os
+import tempfile
+
+import streamlit as st
+
+from geosuite.lote import TIPOS
+from geosuite.reportes import FORMATOS, ColaReportes, empaquetar
+
+MIME = {"pdf": "application/pdf", "html": "text/html"}
+ICONOS = {"en cola": "⏳", "generando": "⚙️", "listo": "✅", "error": "❌"}
+
+
+@st.cache_resource
+def cola():
+    """Cola de memorias del proceso (un pool de hilos para todas las sesiones)."""
+    return ColaReportes()
+
+
+def _ids():
+    return st.session_state.setdefault("memorias", [])
+
+
+def enviar(tipo, entrada, formato="pdf", nombre=None):
+    """Encola la memoria de una entrada y la agrega a los trabajos de la sesión."""
+    trabajo = cola().enviar(tipo, entrada, formato, nombre)
+    _ids().append(trabajo.id)
+    return trabajo
+
+
+def _lista(ids):
+    trabajos = cola().trabajos(ids)
+    for trabajo in reversed(trabajos):
+        col1, col2 = st.columns([3, 1])
+        col1.write(f"{ICONOS[trabajo.estado]} **{trabajo.nombre}** ({trabajo.tipo}, {trabajo.formato.upper()}): {trabajo.estado}")
+        if trabajo.estado == "listo":
+            col2.download_button("Descargar", trabajo.contenido(), file_name=trabajo.archivo,
+                                 mime=MIME[trabajo.formato], key=f"memoria_{trabajo.id}")
+        elif trabajo.estado == "error":
+            col1.caption(trabajo.mensaje)
+    listos = [t for t in trabajos if t.estado == "listo"]
+    if len(listos) > 1:
+        st.download_button(f"Descargar las {len(listos)} memorias (ZIP)", empaquetar(listos),
+                           file_name="memorias.zip", mime="application/zip", key="memorias_zip")
+    return any(t.estado in ("en cola", "generando") for t in trabajos)
+
+
+@st.fragment(run_every=1.0)
+def _lista_en_curso(ids):
+    # Se refresca sola cada segundo mientras haya trabajos pendientes; al terminar
+    # todos, un rerun completo la reemplaza por la lista estática.
+    if not _lista(ids):
+        st.rerun()
+
+
+def panel():
+    """Estado de las memorias de la sesión, con descarga de las que ya terminaron."""
+    ids = list(_ids())
+    if not ids:
+        return
+    st.subheader("Memorias de cálculo")
+    if any(t.estado in ("en cola", "generando") for t in cola().trabajos(ids)):
+        _lista_en_curso(ids)
+    else:
+        _lista(ids)
+
+
+def run():
+    st.markdown("<center><h2>📄 Memorias de Cálculo</h2></center>", unsafe_allow_html=True)
+    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+
+    st.write("Sube un proyecto (YAML o JSON, el mismo formato de `python -m geosuite.lote`) para generar una "
+             "memoria por cada zapata, talud o caso. Las memorias incluyen datos de entrada, ecuaciones, "
+             "resultados, figuras y las tablas de detalle (dovelas, estratos), y se generan en segundo plano: "
+             "puedes seguir usando las demás calculadoras mientras tanto.")
+    col1, col2 = st.columns(2)
+    with col1:
+        archivo = st.file_uploader("Proyecto", type=["yaml", "yml", "json"])
+        formato = st.radio("Formato", FORMATOS, horizontal=True, format_func=str.upper)
+        tipos = st.multiselect("Tipos de caso", list(TIPOS), default=list(TIPOS))
+        if st.button("Generar memorias", type="primary", disabled=archivo is None):
+            from geosuite.lote import leer_proyecto
+
+            # leer_proyecto necesita una ruta (los terrenos se resuelven relativos a ella)
+            with tempfile.TemporaryDirectory() as directorio:
+                ruta = os.path.join(directorio, archivo.name)
+                with open(ruta, "wb") as destino:
+                    destino.write(archivo.getvalue())
+                try:
+                    casos = leer_proyecto(ruta)
+                except ValueError as error:
+                    st.error(str(error))
+                    casos = None
+            if casos is not None:
+                try:
+                    trabajos = cola().enviar_proyecto(casos, formato, tipos, rutas=False)
+                except ValueError as error:
+                    st.error(str(error))
+                else:
+                    _ids().extend(t.id for t in trabajos)
+                    st.success(f"{len(trabajos)} memorias en cola.")
+    with col2:
+        panel()
+        if _ids() and st.button("Limpiar lista"):
+            _ids().clear()
+            st.rerun()
@@ -0,0 +1,152 @@
+# apps/sensibilidad.py
+import streamlit as st
+import numpy as np
+
+from geosuite.capacidad_carga import EntradaTerzaghi
+from geosuite.diagnostico import etapa
+from geosuite.graficas import grafica
+from geosuite.sensibilidad import sobol, tornado
+from geosuite.settlement import EntradaAsentamiento
+from geosuite.slope_bishop import EntradaBishop
+
+# modelo -> (título, clase de entrada, unidad de la salida, {campo: (etiqueta, base, mínimo, máximo, variar)})
+CALCULOS = {
+    "capacidad": ("Capacidad de carga admisible qadm", EntradaTerzaghi, "kPa", {
+        "B": ("Ancho B (m)", 2.0, 1.5, 2.5, True),
+        "L": ("Largo L (m)", 2.0, 1.5, 2.5, False),
+        "Df": ("Desplante Df (m)", 1.5, 1.0, 2.0, True),
+        "gamma": ("γ (kN/m³)", 18.0, 16.0, 20.0, True),
+        "c": ("c (kPa)", 10.0, 0.0, 20.0, True),
+        "phi": ("φ (°)", 30.0, 25.0, 35.0, True),
+        "FS": ("FS", 3.0, 2.5, 3.5, False),
+    }),
+    "asentamiento": ("Asentamiento elástico", EntradaAsentamiento, "m", {
+        "q": ("q (kPa)", 100.0, 80.0, 120.0, True),
+        "L": ("L (m)", 4.0, 3.0, 5.0, True),
+        "B": ("B (m)", 2.0, 1.5, 2.5, True),
+        "Es": ("Es (kPa)", 15000.0, 10000.0, 20000.0, True),
+        "delta_z": ("Δz (m)", 0.1, 0.1, 0.1, False),
+    }),
+    "bishop": ("Factor de seguridad del talud (Bishop)", EntradaBishop, "", {
+        "cohesion": ("c' (kPa)", 10.0, 5.0, 15.0, True),
+        "friction_angle": ("φ' (°)", 30.0, 25.0, 35.0, True),
+        "unit_weight": ("γ (kN/m³)", 16.0, 15.0, 18.0, True),
+        "slope_height": ("H (m)", 10.0, 9.0, 11.0, False),
+        "slope_angle": ("β (°)", 45.0, 40.0, 50.0, False),
+        "circle_center_x": ("Xc (m)", 5.0, 4.0, 6.0, False),
+        "circle_center_y": ("Yc (m)", 18.0, 17.0, 19.0, False),
+        "circle_radius": ("R (m)", 15.0, 14.0, 16.0, False),
+        "num_slices": ("Dovelas", 30, 30, 30, False),
+        "ru": ("ru", 0.0, 0.0, 0.3, True),
+    }),
+}
+NOMBRES = {"capacidad": "Capacidad de carga", "asentamiento": "Asentamiento elástico", "bishop": "Talud (Bishop)"}
+
+
+@grafica("tornado", figsize=(8, 5))
+def grafica_tornado(fig, etiquetas, bajo, alto, valor_base, titulo):
+    """Barras horizontales desde el valor base hasta la salida en el mínimo y en el máximo de cada parámetro."""
+    ax = fig.subplots()
+    y = np.arange(len(etiquetas))[::-1]
+    ax.barh(y, np.asarray(bajo) - valor_base, left=valor_base, color="tab:blue", label="Parámetro en su mínimo")
+    ax.barh(y, np.asarray(alto) - valor_base, left=valor_base, color="tab:orange", label="Parámetro en su máximo")
+    ax.axvline(valor_base, color="k", linewidth=1)
+    ax.set_yticks(y, etiquetas)
+    ax.set_xlabel(titulo)
+    ax.set_title("Diagrama de tornado")
+    ax.legend(loc="lower right")
+    ax.grid(True, axis="x", linestyle="--", alpha=0.6)
+    fig.tight_layout()
+
+
+@grafica("sobol", figsize=(8, 5))
+def grafica_sobol(fig, etiquetas, S1, ST, S1_ic, ST_ic):
+    """Índices de Sobol de primer orden y totales con su intervalo del 95 %."""
+    ax = fig.subplots()
+    x = np.arange(len(etiquetas))
+    ax.bar(x - 0.2, S1, 0.4, yerr=S1_ic, capsize=3, label="Primer orden S1")
+    ax.bar(x + 0.2, ST, 0.4, yerr=ST_ic, capsize=3, label="Total ST")
+    ax.set_xticks(x, etiquetas)
+    ax.set_ylim(0, max(1.0, float(np.max(np.asarray(ST) + np.asarray(ST_ic)))))
+    ax.set_ylabel("Índice")
+    ax.set_title("Índices de Sobol")
+    ax.legend()
+    ax.grid(True, axis="y", linestyle="--", alpha=0.6)
+    fig.tight_layout()
+
+
+def run():
+    st.markdown("<center><h2>📈 Análisis de Sensibilidad</h2></center>", unsafe_allow_html=True)
+    st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
+
+    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+    st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
+
+    st.write("Identifica qué parámetro controla el resultado: **tornado** (un parámetro a la vez) o **índices de Sobol** (muestreo de Saltelli, todos los parámetros a la vez).")
+
+    modelo = st.selectbox("Cálculo", list(CALCULOS), format_func=NOMBRES.get)
+    titulo, Entrada, unidad, campos = CALCULOS[modelo]
+
+    with st.form("sensibilidad_form"):
+        import pandas as pd
+
+        st.subheader("Parámetros")
+        st.caption("Valor base de cada dato y, para los marcados en 'Variar', su rango de variación (uniforme).")
+        tabla = pd.DataFrame(
+            [(etiqueta, base, minimo, maximo, variar) for etiqueta, base, minimo, maximo, variar in campos.values()],
+            columns=["Parámetro", "Base", "Mínimo", "Máximo", "Variar"], index=list(campos),
+        )
+        editada = st.data_editor(tabla, disabled=["Parámetro"], hide_index=True, key=f"sensibilidad_{modelo}")
+
+        col1, col2, col3 = st.columns(3)
+        metodo = col1.radio("Método", ["Tornado", "Sobol"], horizontal=True)
+        n = col2.select_slider("Muestras base (Sobol)", [1024, 2048, 4096, 8192, 16384], value=4096,
+                               help="Se evalúan n·(k + 2) casos, con k parámetros variables.")
+        procesos = col3.number_input("Procesos (Bishop)", min_value=1, max_value=16, value=1,
+                                     disabled=modelo != "bishop", help="Reparte las evaluaciones en un pool de procesos.")
+        submit = st.form_submit_button("CALCULAR", type="primary")
+
+    if not submit:
+        st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
+        return
+
+    editada.index = list(campos)
+    valores = {campo: editada.at[campo, "Base"] for campo in campos}
+    if "num_slices" in valores:
+        valores["num_slices"] = int(valores["num_slices"])
+    base = Entrada(**valores)
+    rangos = {campo: (float(editada.at[campo, "Mínimo"]), float(editada.at[campo, "Máximo"]))
+              for campo in campos if editada.at[campo, "Variar"]}
+    etiqueta_salida = f"{titulo} [{unidad}]" if unidad else titulo
+
+    try:
+        if metodo == "Tornado":
+            with etapa("sensibilidad.tornado"):
+                res = tornado(modelo, base, rangos)
+            etiquetas = [campos[p][0] for p in res.parametros]
+            st.metric(f"Valor base: {titulo}", f"{res.valor_base:.4g} {unidad}")
+            with etapa("sensibilidad.grafica"):
+                imagen = grafica_tornado(etiquetas, res.bajo, res.alto, res.valor_base, etiqueta_salida)
+            st.image(imagen, use_container_width=True)
+            st.dataframe(pd.DataFrame({
+                "Parámetro": etiquetas,
+                "Rango": [f"{a:g} – {b:g}" for a, b in res.rangos],
+                "Salida en el mínimo": res.bajo,
+                "Salida en el máximo": res.alto,
+                "Oscilación": np.abs(res.alto - res.bajo),
+            }), hide_index=True)
+        else:
+            with etapa("sensibilidad.sobol"):
+                res = sobol(modelo, base, rangos, n=n, procesos=int(procesos) if modelo == "bishop" else None)
+            etiquetas = [campos[p][0] for p in res.parametros]
+            st.metric(f"Media de {titulo}", f"{res.media:.4g} {unidad}",
+                      help=f"Desviación estándar {np.sqrt(res.varianza):.4g}")
+            st.caption(f"{res.evaluaciones:,} evaluaciones; {res.validas:,} de {n:,} filas válidas.")
+            with etapa("sensibilidad.grafica"):
+                imagen = grafica_sobol(etiquetas, res.S1, res.ST, res.S1_ic, res.ST_ic)
+            st.image(imagen, use_container_width=True)
+            st.dataframe(pd.DataFrame({
+                "Parámetro": etiquetas, "S1": res.S1, "± S1": res.S1_ic, "ST": res.ST, "± ST": res.ST_ic,
+            }).style.format(precision=3), hide_index=True)
+    except ValueError as error:
+        st.error(str(error))
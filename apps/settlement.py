@@ -1,106 +1,172 @@
-import streamlit as st
-import numpy as np
-
-def run():
-    st.markdown("<center><h2>🧱 Cálculo de Asentamientos Elásticos - Cimentación Superficial</h2></center>", unsafe_allow_html=True)
-    st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
-
-    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
-    st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
-
-    col1, col2 = st.columns(2)
-
-    #Funcion de Boussinesq rect al centro, esta z es desde la Df
-    def bou_rect_c (q, L, B, z):
-        m1 = L/B
-        b = B/2
-        n1 = z/b
-
-        I4 = 2 / np.pi * ((m1*n1)/np.sqrt(1+m1**2+n1**2)*(1+m1**2+2*n1**2)/((1+n1**2)*(m1**2+n1**2))+np.asin(m1/(np.sqrt(m1**2+n1**2)*np.sqrt(1+n1**2))))
-
-        Dsz = q * I4
-
-        if Dsz < 0 : #Supone que el incremento de esfuerzos es representativo hasta la profundidad que llega el 10% de q y tambien evita errores si Dsz es negativo
-            return 0
-        else:
-            return Dsz
-
-    #Incremento de esfuerzos a diferentes profundidades
-    def calculo_matrices(q, L, B, E):
-        Matriz_z = [] #Profunididad
-        Matriz_E = [] #modulo de young a la prof de calculo
-        Matriz_Dsz = [] #Incremento de esfuerzos a la profundidad de calculo
-        Matriz_Elastic_Settle = [] #Matriz de asentamientos en el suelo
-        
-        Delta_z = 0.1 #Valor para subdividir el medio
-        prof_max = 8*B
-
-        #Va a calcular los valores de cada valor de las matrices hasta llegar a la profundidad maxima
-        z_actual = Delta_z
-        s_acumulado = 0.0
-        while z_actual < prof_max:
-            Matriz_z.append(z_actual)
-            
-            E_actual = E #En el futuro este valor se puede hacer variar por estrato
-            Matriz_E.append(E_actual)
-
-            Dsz_actual = bou_rect_c(q, L, B, z_actual)
-            Matriz_Dsz.append(Dsz_actual)
-
-            Elastic_Settle_actual = (1 / E_actual) * Dsz_actual * Delta_z 
-
-            s_acumulado= s_acumulado + Elastic_Settle_actual
-
-            z_actual += np.round(Delta_z,2)
-
-
-        return Matriz_z, Matriz_Dsz, Matriz_Elastic_Settle, s_acumulado
-
-    
-
-
-    with col1:
-        st.header("Datos de entrada")
-
-        B = st.number_input("Ancho de la cimentación (B) [m]", min_value=0.01, value=2.0, step=0.01)
-        L = st.number_input("Longitud de la cimentación (L) [m]", min_value=0.01, value=4.0, step=0.01)
-        q = st.number_input("Presión de contacto (q) [kPa]", min_value=0.0, value=100.0, step=0.1)
-        Es = st.number_input("Módulo de elasticidad del suelo (Es) [kPa]", min_value=1.0, value=15000.0, step=100.0)
-
-        # z = st.slider("Profundidad z", min_value=0.1, max_value= 6*B, step=0.1)
-
-
-            
-    with col2:
-        # st.header("Cálculo del asentamiento elástico")
-        st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
-
-        if st.button("CALCULAR", type="primary"):
-            
-            # Ds_cal = bou_rect_c(q, L, B, z)
-
-            # st.write(f"Incremento de esfuerzos Δσz: {Ds_cal:.2f} kPa")
-
-
-            #Con matrices
-            Matriz_zcal, Matriz_Dsz, Matriz_Elastic_Settle, Asent_acum = calculo_matrices(q, L, B, Es)
-
-            Asent_acum_cm = Asent_acum * 100
-
-            import matplotlib.pyplot as plt
-
-            fig, ax = plt.subplots()
-            ax.plot(Matriz_Dsz, Matriz_zcal)
-            ax.set_xlabel("Incremento de esfuerzos Δσz [kPa]")
-            ax.set_ylabel("Profundidad [m]")
-            ax.set_title("Distribución de Incremento de Esf. Verticales vs profundidad")
-            ax.invert_yaxis()
-            st.pyplot(fig)
-
-            st.success(f"Asentamiento Total = {Asent_acum_cm:.2f} [cm]")
-
-
-
-            
-            
-    
\ No newline at end of file
+import numpy as np
+import streamlit as st
+
+from apps import proyectos
+from geosuite.diagnostico import etapa
+from geosuite.esfuerzos import esfuerzo_circular, esfuerzo_franja, esfuerzo_poligono_malla, esfuerzo_poligono_rectangulos, esfuerzo_terraplen
+from geosuite.exploracion import leer_poligono
+from geosuite.graficas import grafica, svg_lineas
+from geosuite.settlement import EntradaAsentamiento, EntradaLosa, asentamiento_losa, calculo_matrices
+from geosuite.unidades import convertir
+
+
+@grafica("asentamiento_losa", figsize=(7, 6), max_entradas=16)
+def grafica_losa(fig, vertices, x, y, asentamiento_cm):
+    """Contornos de asentamiento (cm) bajo la losa."""
+    from matplotlib.patches import Polygon
+
+    ax = fig.subplots()
+    if len(x) >= 3:
+        contornos = ax.tricontourf(x, y, asentamiento_cm, levels=12, cmap="viridis_r")
+        fig.colorbar(contornos, ax=ax, label="Asentamiento [cm]")
+    else:
+        ax.scatter(x, y, c=asentamiento_cm, cmap="viridis_r")
+    ax.add_patch(Polygon(vertices, closed=True, fill=False, color="k"))
+    i = int(np.argmax(asentamiento_cm))
+    ax.plot(x[i], y[i], "r+", markersize=12, label=f"Máximo: {asentamiento_cm[i]:.2f} cm")
+    ax.set_aspect("equal", adjustable="box")
+    ax.set_xlabel("x (m)"); ax.set_ylabel("y (m)")
+    ax.legend(loc="upper right"); ax.grid(True, linestyle="--", alpha=0.4)
+    fig.tight_layout()
+
+
+def run():
+    st.markdown("<center><h2>🧱 Cálculo de Asentamientos Elásticos - Cimentación Superficial</h2></center>", unsafe_allow_html=True)
+    st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
+
+    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+    st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
+
+    tab_zapata, tab_losa, tab_perfil = st.tabs(["Zapata rectangular", "Losa poligonal", "Franja, círculo y terraplén"])
+
+    with tab_zapata:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.header("Datos de entrada")
+
+            B = st.number_input("Ancho de la cimentación (B) [m]", min_value=0.01, value=2.0, step=0.01)
+            L = st.number_input("Longitud de la cimentación (L) [m]", min_value=0.01, value=4.0, step=0.01)
+            q = st.number_input("Presión de contacto (q) [kPa]", min_value=0.0, value=100.0, step=0.1)
+            Es = st.number_input("Módulo de elasticidad del suelo (Es) [kPa]", min_value=1.0, value=15000.0, step=100.0)
+
+            # z = st.slider("Profundidad z", min_value=0.1, max_value= 6*B, step=0.1)
+
+
+            
+        with col2:
+            # st.header("Cálculo del asentamiento elástico")
+            st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
+
+            if st.button("CALCULAR", type="primary"):
+            
+                # Ds_cal = bou_rect_c(q, L, B, z)
+
+                # st.write(f"Incremento de esfuerzos Δσz: {Ds_cal:.2f} kPa")
+
+
+                #Con matrices
+                entrada = EntradaAsentamiento(q=q, L=L, B=B, Es=Es)
+                res = calculo_matrices(entrada)
+                Matriz_zcal, Matriz_Dsz = res.z, res.Dsz
+
+                Asent_acum_cm = convertir(res.asentamiento, "m", "cm")
+                proyectos.registrar("asentamientos", entrada, res, f"{Asent_acum_cm:.2f} cm")
+
+                with etapa("asentamiento.grafica"):
+                    imagen = svg_lineas(
+                        [(Matriz_Dsz, Matriz_zcal, None, None)],
+                        titulo="Distribución de Incremento de Esf. Verticales vs profundidad",
+                        etiqueta_x="Incremento de esfuerzos Δσz [kPa]", etiqueta_y="Profundidad [m]", invertir_y=True,
+                    )
+                with etapa("asentamiento.mostrar_grafica"):
+                    st.image(imagen, use_container_width=True)
+
+                st.success(f"Asentamiento Total = {Asent_acum_cm:.2f} [cm]")
+
+    with tab_losa:
+        losa()
+
+    with tab_perfil:
+        perfil_carga()
+
+
+def losa():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.header("Datos de la losa")
+        texto = st.text_area("Vértices de la losa [m]", value="0,0; 30,0; 30,12; 12,12; 12,30; 0,30",
+                             help="Vértices x,y en metros separados por ';', en cualquier sentido.")
+        q = st.number_input("Presión de contacto (q) [kPa]", min_value=0.0, value=60.0, step=0.1, key="losa_q")
+        Es = st.number_input("Módulo de elasticidad del suelo (Es) [kPa]", min_value=1.0, value=15000.0, step=100.0, key="losa_Es")
+        paso = st.number_input("Separación de la malla de puntos [m]", min_value=0.1, value=1.0, step=0.1)
+        delta_z = st.number_input("Espesor de las subcapas (Δz) [m]", min_value=0.05, value=0.5, step=0.05)
+        verificar = st.checkbox("Verificar Δσz por subdivisión en rectángulos",
+                                help="Compara, bajo el punto de asentamiento máximo, la integración por aristas "
+                                     "con la suma de 64 × 64 rectángulos.")
+
+    with col2:
+        st.info("Ajusta los parámetros y haz clic en 'CALCULAR'.")
+        if not st.button("CALCULAR", type="primary", key="losa_calcular"):
+            return
+        try:
+            vertices = leer_poligono(texto)
+            if vertices is None:
+                raise ValueError("Indique los vértices de la losa.")
+            entrada = EntradaLosa(q=q, vertices=vertices, Es=Es, paso=paso, delta_z=delta_z)
+            res = asentamiento_losa(entrada)
+        except ValueError as error:
+            st.error(str(error))
+            return
+        proyectos.registrar("losas", entrada, res, f"máximo {convertir(res.maximo, 'm', 'cm'):.2f} cm")
+
+        asentamiento_cm = convertir(res.asentamiento, "m", "cm")
+        with etapa("asentamiento_losa.grafica"):
+            imagen = grafica_losa(np.asarray(vertices), res.x, res.y, asentamiento_cm)
+        st.image(imagen, use_container_width=True)
+        st.success(f"Asentamiento máximo = {convertir(res.maximo, 'm', 'cm'):.2f} [cm]")
+        st.write(f"Mínimo: {convertir(res.minimo, 'm', 'cm'):.2f} cm — diferencial: "
+                 f"{convertir(res.diferencial, 'm', 'cm'):.2f} cm en {res.x.size:,} puntos de cálculo "
+                 f"hasta {res.z[-1]:.1f} m de profundidad.")
+
+        if verificar:
+            i = int(np.argmax(res.asentamiento))
+            aristas = esfuerzo_poligono_malla(q, vertices, res.x[i:i + 1], res.y[i:i + 1], res.z)[0]
+            rectangulos = esfuerzo_poligono_rectangulos(q, vertices, res.x[i], res.y[i], res.z)
+            st.caption(f"Bajo ({res.x[i]:g}, {res.y[i]:g}): diferencia máxima de Δσz entre aristas y rectángulos "
+                       f"{np.abs(aristas - rectangulos).max():.3f} kPa.")
+
+
+def perfil_carga():
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.header("Carga")
+        tipo = st.selectbox("Tipo de carga", ["Franja", "Circular", "Terraplén"])
+        if tipo == "Terraplén":
+            gamma = st.number_input("Peso volumétrico del terraplén (γ) [kN/m³]", min_value=0.0, value=19.0, step=0.1)
+            H = st.number_input("Altura (H) [m]", min_value=0.1, value=4.0, step=0.1)
+            corona = st.number_input("Ancho de la corona [m]", min_value=0.0, value=10.0, step=0.1)
+            talud = st.number_input("Talud (horizontal:1)", min_value=0.0, value=2.0, step=0.1)
+            ancho = corona + 2 * talud * H
+        else:
+            q = st.number_input("Presión (q) [kPa]", min_value=0.0, value=100.0, step=0.1, key="perfil_q")
+            ancho = st.number_input("Ancho de la franja (B) [m]" if tipo == "Franja" else "Diámetro [m]",
+                                    min_value=0.1, value=3.0, step=0.1)
+        x = st.number_input("Distancia horizontal del eje al punto de cálculo [m]", value=0.0, step=0.1)
+        profundidad = st.number_input("Profundidad máxima [m]", min_value=0.5, value=round(3 * ancho, 1), step=0.5)
+
+    with col2:
+        z = np.linspace(profundidad / 200, profundidad, 200)
+        if tipo == "Franja":
+            Dsz = esfuerzo_franja(q, ancho, x, z)
+        elif tipo == "Circular":
+            Dsz = esfuerzo_circular(q, ancho / 2, x, 0.0, z)
+        else:
+            Dsz = esfuerzo_terraplen(gamma, H, corona, talud, x, z)
+        imagen = svg_lineas(
+            [(Dsz, z, None, None)], titulo=f"Δσz bajo x = {x:g} m",
+            etiqueta_x="Incremento de esfuerzos Δσz [kPa]", etiqueta_y="Profundidad [m]", invertir_y=True,
+        )
+        st.image(imagen, use_container_width=True)
@@ -0,0 +1,165 @@
+import os
+
+import streamlit as st
+
+from apps import reportes
+from geosuite.graficas import grafica
+from geosuite.spt import (CORRELACIONES_ES, CORRELACIONES_PHI, CORRELACIONES_SU, EntradaSPT, entrada_asentamiento,
+                          entrada_capacidad, leer_registros, perfil_de_diseno, procesar_spt, tabla_spt)
+from geosuite.unidades import convertir
+
+EJEMPLO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ejemplos", "sondeos_spt.csv")
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _leer(nombre, contenido):
+    return leer_registros(contenido, nombre)
+
+
+@grafica("spt", figsize=(10, 6), max_entradas=32)
+def grafica_spt(fig, resultado, sondeos):
+    """N60, (N1)60 y FS contra licuación con la profundidad, un color por sondeo."""
+    import numpy as np
+
+    r = resultado.registros
+    ax1, ax2, ax3 = fig.subplots(1, 3, sharey=True)
+    for k in sondeos:
+        muestras = slice(r.inicio[k], r.inicio[k + 1])
+        z = r.z[muestras]
+        linea, = ax1.plot(resultado.N60[muestras], z, 'o-', markersize=3, label=r.nombres[k])
+        ax2.plot(resultado.N1_60[muestras], z, 'o-', markersize=3, color=linea.get_color())
+        fs = np.minimum(resultado.FS_licuacion[muestras], 3.0) # los no licuables se dibujan en el tope
+        ax3.plot(fs, z, 'o', markersize=4, color=linea.get_color())
+    ax3.axvline(1.0, color='r', linestyle='--')
+    ax3.set_xlim(0, 3.05)
+    for ax, titulo in zip((ax1, ax2, ax3), ("N60", "(N1)60", "FS licuación")):
+        ax.set_xlabel(titulo)
+        ax.grid(True, linestyle='--', alpha=0.6)
+    ax1.set_ylabel("Profundidad (m)")
+    ax1.invert_yaxis()
+    if len(sondeos) <= 10:
+        ax1.legend(loc="lower left", fontsize=8)
+    fig.tight_layout()
+
+
+def run():
+
+    st.markdown("<center><h2>🔩 Registros de Sondeos SPT</h2></center>", unsafe_allow_html=True)
+    st.markdown("<center><h3>(Version de Prueba)</h3></center>", unsafe_allow_html=True)
+    st.markdown("<center><h5>Made by Geotecnia TerraNova</h5></center>", unsafe_allow_html=True)
+    st.warning("⚠️ **Descargo de Responsabilidad:** Esta aplicación es una herramienta educativa y no reemplaza la evaluación de un ingeniero geotecnico calificado. Siempre consulta a un profesional para el diseño final.")
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.subheader("Registros")
+        archivo = st.file_uploader("Sondeos (CSV, Excel o .npz)", type=["csv", "xlsx", "npz"],
+                                   help="Una fila por muestra con Sondeo, Profundidad (m) y N (o G1, G2, G3 por "
+                                        "cada 15 cm; \"R\" para rechazo). Opcionales: Suelo (SUCS o descripción; "
+                                        "sin esta columna todo se toma como granular), Finos (%), Gamma (kN/m³) "
+                                        "y NAF (m).")
+        try:
+            if archivo is not None:
+                registros = _leer(archivo.name, archivo.getvalue())
+            else:
+                with open(EJEMPLO, "rb") as ejemplo:
+                    registros = _leer(EJEMPLO, ejemplo.read())
+                st.caption("Sin archivo se usa el registro de ejemplo.")
+        except ValueError as error:
+            st.error(str(error))
+            return
+        st.caption(f"{len(registros.nombres)} sondeos, {registros.z.size} muestras.")
+
+        tab1, tab2, tab3 = st.tabs(["Correcciones", "Correlaciones", "Sismo"])
+        with tab1:
+            energia = st.number_input("Relación de energía del martinete, ER (%)", 30.0, 100.0, value=60.0, step=5.0)
+            diametro = st.number_input("Diámetro de la perforación (mm)", 50.0, 250.0, value=100.0, step=5.0)
+            sin_camisa = st.checkbox("Muestreador sin camisa (CS = 1.2)")
+            naf = st.number_input("NAF donde el registro no lo indica (m, 0 = sin NAF)", 0.0, value=0.0, step=0.5)
+            gamma = st.number_input("γ arriba del NAF (kN/m³)", 10.0, 25.0, value=18.0, step=0.1)
+            gamma_sat = st.number_input("γsat abajo del NAF (kN/m³)", 10.0, 25.0, value=19.5, step=0.1)
+        with tab2:
+            correlacion_phi = st.selectbox("φ' (granulares)", list(CORRELACIONES_PHI))
+            correlacion_Es = st.selectbox("Es (granulares)", list(CORRELACIONES_ES))
+            correlacion_Su = st.selectbox("Su (finos; Es = 300·Su)", list(CORRELACIONES_SU))
+        with tab3:
+            amax = st.number_input("Aceleración máxima, amax (g)", 0.0, 1.5, value=0.15, step=0.01)
+            Mw = st.number_input("Magnitud, Mw", 5.0, 9.0, value=7.5, step=0.1)
+
+    entrada = EntradaSPT(registros, energia, diametro, sin_camisa, naf or None, gamma, gamma_sat,
+                         correlacion_phi, correlacion_Es, correlacion_Su, amax, Mw)
+    try:
+        resultado = procesar_spt(entrada)
+    except ValueError as error:
+        with col2:
+            st.error(str(error))
+        return
+
+    with col2:
+        nombres = list(registros.nombres)
+        elegidos = st.multiselect("Sondeos", nombres, default=nombres[:10])
+        indices = [nombres.index(n) for n in elegidos]
+        st.image(grafica_spt(resultado, indices), use_container_width=True)
+
+        import numpy as np
+
+        licuables = np.nan_to_num(resultado.FS_licuacion, nan=np.inf) < 1.0
+        if licuables.any():
+            sondeos = sorted({nombres[k] for k in registros.sondeo[licuables]})
+            st.error(f"{int(licuables.sum())} muestras con FS < 1.0 contra licuación en {len(sondeos)} sondeos: "
+                     f"{', '.join(sondeos[:10])}{'...' if len(sondeos) > 10 else ''}")
+        else:
+            st.success("Ninguna muestra con FS < 1.0 contra licuación.")
+
+    st.subheader("Valores corregidos por muestra")
+    tabla = tabla_spt(resultado)
+    if elegidos:
+        tabla = tabla[tabla["Sondeo"].isin(elegidos)]
+    st.dataframe(tabla.style.format(precision=2), hide_index=True)
+    col_a, col_b = st.columns(2)
+    col_a.download_button("Descargar tabla (CSV)", tabla_spt(resultado).to_csv(index=False).encode("utf-8"),
+                          file_name="spt_corregido.csv", mime="text/csv")
+    import io
+
+    compacto = io.BytesIO()
+    registros.guardar(compacto)
+    col_b.download_button("Descargar registros compactos (.npz)", compacto.getvalue(),
+                          file_name="sondeos_spt.npz", mime="application/octet-stream",
+                          help="Carga instantánea del proyecto en visitas posteriores.")
+
+    st.markdown("---")
+    st.subheader("Perfil de diseño y calculadoras")
+    col3, col4 = st.columns(2)
+    with col3:
+        paso = st.number_input("Espesor de los estratos (m)", 0.25, 5.0, value=1.0, step=0.25)
+        estadistico = st.radio("Valor por estrato", ["media", "minimo"], horizontal=True)
+        B = st.number_input("Ancho de la zapata, B (m)", 0.5, value=2.0, step=0.1)
+        L = st.number_input("Largo de la zapata, L (m)", 0.5, value=2.0, step=0.1)
+        Df = st.number_input("Desplante, Df (m)", 0.0, value=1.5, step=0.1)
+        q = st.number_input("Presión de contacto, q (kPa)", 1.0, value=150.0, step=10.0)
+    if not elegidos:
+        col4.info("Elige al menos un sondeo.")
+        return
+    perfil = perfil_de_diseno(resultado, paso, estadistico, elegidos)
+    with col4:
+        from geosuite.capacidad_carga import capacidad_carga_terzaghi
+        from geosuite.settlement import calculo_matrices
+
+        terzaghi = entrada_capacidad(perfil, B, L, Df)
+        asentamiento = entrada_asentamiento(perfil, q, L, B, Df)
+        try:
+            capacidad = capacidad_carga_terzaghi(terzaghi)
+            st.metric("Capacidad admisible, qadm (kPa)", f"{capacidad.qadm:.1f}")
+            st.caption(f"Con γ = {terzaghi.gamma:.2f} kN/m³, c = {terzaghi.c:.1f} kPa y φ' = {terzaghi.phi:.1f}° "
+                       f"promedio de {Df:g} a {Df + B:g} m.")
+        except ValueError as error:
+            st.error(str(error))
+        try:
+            st.metric("Asentamiento elástico al centro (cm)", f"{convertir(calculo_matrices(asentamiento).asentamiento, 'm', 'cm'):.2f}")
+            st.caption(f"Con Es por estrato ({len(asentamiento.estratos or ()) + 1} estratos debajo del desplante).")
+        except ValueError as error:
+            st.error(str(error))
+        formato = st.radio("Memoria de cálculo", reportes.FORMATOS, horizontal=True, format_func=str.upper)
+        if st.button("Generar memorias"):
+            reportes.enviar("capacidad", terzaghi, formato, f"zapata_SPT_B{B:g}")
+            reportes.enviar("asentamientos", asentamiento, formato, f"asentamiento_SPT_q{q:g}")
+        reportes.panel()
@@ -0,0 +1,355 @@
+# benchmarks/calculadoras.py
+"""
+Benchmarks del núcleo de cálculo, con varios tamaños de problema por caso.
+
+Cada caso se mide sin caché (``.sin_cache``) para que el tiempo sea el del
+cálculo. El número de llamadas por repetición se calibra para que cada
+repetición dure al menos ``--min-tiempo`` segundos; se reporta el mínimo y la
+mediana del tiempo por llamada.
+
+    python benchmarks/calculadoras.py correr
+    python benchmarks/calculadoras.py correr --casos bishop_circulo asentamiento --salida /tmp/nuevo.json
+    python benchmarks/calculadoras.py comparar benchmarks/resultados/calculadoras.json /tmp/nuevo.json
+
+``comparar`` marca como regresión todo caso cuyo mínimo sea más de ``--umbral``
+veces el de la línea base y termina con código 1 si hay alguna; sirve como
+verificación antes de desplegar.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import replace
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import numpy as np  # noqa: E402
+
+from geosuite.capacidad_carga import EntradaTerzaghi, capacidad_carga_lote, capacidad_carga_terzaghi  # noqa: E402
+from geosuite.ensayo_triaxial import EntradaTriaxial, ajuste_mohr_coulomb  # noqa: E402
+from geosuite.esfuerzos import esfuerzo_poligono  # noqa: E402
+from geosuite.estr_zap import (  # noqa: E402
+    UNIDADES as UNIDADES_ZAPATA, EntradaZapata, calculate_footing_design, optimizar_zapatas,
+)
+from geosuite.exploracion import planear_exploracion, planear_lote  # noqa: E402
+from geosuite.presiones_tierra import EntradaRankine, perfil_rankine  # noqa: E402
+from geosuite.proyectos import Proyectos  # noqa: E402
+from geosuite.reportes import generar_memoria  # noqa: E402
+from geosuite.settlement import EntradaAsentamiento, EntradaLosa, asentamiento_lote, asentamiento_losa, calculo_matrices  # noqa: E402
+from geosuite.slope_bishop import EntradaBishop, buscar_circulo_critico, calculate_bishop_fs, fs_lote  # noqa: E402
+from geosuite.spt import EntradaSPT, RegistrosSPT, procesar_spt, registros_de_tabla  # noqa: E402
+from geosuite.terreno import Terreno  # noqa: E402
+from geosuite.unidades import normalizar_unidades  # noqa: E402
+
+SALIDA = os.path.join(RAIZ, "benchmarks", "resultados", "calculadoras.json")
+UMBRAL = 1.25 # 25 % más lento que la línea base es regresión
+
+
+def _talud(n_dovelas=30):
+    return EntradaBishop(10.0, 30.0, 16.0, 10.0, 45.0, 5.0, 18.0, 15.0, n_dovelas)
+
+
+def _bishop_circulo(n):
+    entrada = _talud(n)
+    return lambda: calculate_bishop_fs.sin_cache(entrada)
+
+
+def _bishop_malla(n):
+    entrada = _talud()
+    xs, ys, rs = np.linspace(0, 10, n), np.linspace(12, 22, n), np.linspace(10, 20, n)
+    return lambda: buscar_circulo_critico.sin_cache(entrada, xs, ys, rs)
+
+
+def _bishop_lote(n):
+    # n taludes con c' y φ' variables, 30 dovelas cada uno
+    generador = np.random.default_rng(0)
+    c, phi = generador.uniform(5, 15, n), generador.uniform(25, 35, n)
+    return lambda: fs_lote(c, phi, 16.0, 10.0, 45.0, 5.0, 18.0, 15.0, 30)
+
+
+def _bishop_terreno(n):
+    # Búsqueda de 20³ círculos sobre un terreno levantado de n vértices
+    x = np.linspace(-20, 40, n)
+    entrada = replace(_talud(), terreno=Terreno(x, np.clip(10 - x, 0, 10) + 0.5 * np.sin(x)))
+    xs, ys, rs = np.linspace(0, 10, 20), np.linspace(12, 22, 20), np.linspace(10, 20, 20)
+    return lambda: buscar_circulo_critico.sin_cache(entrada, xs, ys, rs)
+
+
+def _asentamiento(n):
+    # n puntos de profundidad hasta 8·B
+    B = 2.0
+    entrada = EntradaAsentamiento(q=100.0, L=4.0, B=B, Es=15000.0, delta_z=8 * B / (n + 1))
+    return lambda: calculo_matrices.sin_cache(entrada)
+
+
+def _asentamiento_lote(n):
+    generador = np.random.default_rng(0)
+    q, B = generador.uniform(50, 300, n), generador.uniform(1, 3, n)
+    return lambda: asentamiento_lote(q, 4.0, B, 15000.0)
+
+
+LOSA_L = ((0.0, 0.0), (30.0, 0.0), (30.0, 12.0), (12.0, 12.0), (12.0, 30.0), (0.0, 30.0))
+
+
+def _esfuerzo_poligono(n):
+    # n puntos al azar (planta y profundidad) bajo una losa en L
+    generador = np.random.default_rng(0)
+    x, y, z = generador.uniform(-5, 35, n), generador.uniform(-5, 35, n), generador.uniform(0.5, 60, n)
+    return lambda: esfuerzo_poligono(100.0, LOSA_L, x, y, z)
+
+
+def _asentamiento_losa(n):
+    # losa en L con una malla de ~n puntos, subcapas de 0.5 m hasta 60 m
+    paso = float(np.sqrt(576 / n)) # la losa tiene 576 m²
+    entrada = EntradaLosa(q=60.0, vertices=LOSA_L, Es=15000.0, paso=paso, delta_z=0.5, profundidad=60.0)
+    return lambda: asentamiento_losa.sin_cache(entrada)
+
+
+def _exploracion_lote(n):
+    # n proyectos con niveles y área aleatorios (predio cuadrado)
+    generador = np.random.default_rng(0)
+    cuadro = {"Niveles": generador.integers(1, 11, n), "Área": generador.uniform(50, 2000, n)}
+
+    def llamada():
+        planear_exploracion.cache.limpiar() # planear_lote pasa por la caché de cada predio
+        return planear_lote(cuadro)
+
+    return llamada
+
+
+def _memoria_talud(n):
+    # Memoria PDF de un talud de n dovelas (resultado y figura ya en caché: mide la escritura)
+    entrada = _talud(n)
+    ruta = os.path.join(tempfile.mkdtemp(prefix="geosuite_bench_"), "memoria.pdf")
+    return lambda: generar_memoria("taludes", entrada, ruta, "pdf")
+
+
+def _registros_spt(n, muestras=60):
+    # n sondeos de `muestras` ensayes cada 0.45 m con suelos y finos al azar
+    generador = np.random.default_rng(0)
+    total = n * muestras
+    return registros_de_tabla({
+        "Sondeo": np.repeat([f"S-{i + 1}" for i in range(n)], muestras),
+        "Profundidad": np.tile(np.arange(1, muestras + 1) * 0.45, n),
+        "N": generador.integers(2, 50, total), "Suelo": generador.choice(["SM", "SP", "CL"], total),
+        "Finos": generador.integers(0, 80, total), "NAF": np.full(total, 2.0),
+    })
+
+
+def _spt_proceso(n):
+    entrada = EntradaSPT(_registros_spt(n), energia=70.0, amax=0.2)
+    return lambda: procesar_spt.sin_cache(entrada)
+
+
+def _spt_carga(n):
+    # Carga de un proyecto guardado en .npz
+    ruta = os.path.join(tempfile.mkdtemp(prefix="geosuite_bench_"), "sondeos.npz")
+    _registros_spt(n).guardar(ruta)
+    return lambda: RegistrosSPT.cargar(ruta)
+
+
+def _unidades_cuadro(n):
+    # Cuadro de columnas en SI llevado a kg, kg·m y cm (una multiplicación por columna)
+    import pandas as pd
+
+    generador = np.random.default_rng(0)
+    cuadro = pd.DataFrame({"Pu [kN]": generador.uniform(100, 1500, n), "Mux [kN·m]": generador.uniform(0, 50, n),
+                           "Muy": generador.uniform(0, 50, n), "b_col": np.full(n, 0.4), "h_col": np.full(n, 0.5)})
+    return lambda: normalizar_unidades(cuadro, UNIDADES_ZAPATA, "SI")
+
+
+def _proyectos(n):
+    # base nueva con n casos de asentamiento de un usuario
+    proyectos = Proyectos(os.path.join(tempfile.mkdtemp(prefix="geosuite_bench_"), "proyectos.sqlite"), lote=n + 1)
+    entradas = [EntradaAsentamiento(q=50.0 + i, L=4.0, B=2.0, Es=15000.0) for i in range(n)]
+    return proyectos, entradas
+
+
+def _proyectos_guardar(n):
+    # n casos encolados y escritos en una transacción
+    proyectos, entradas = _proyectos(n)
+
+    def llamada():
+        for entrada in entradas:
+            proyectos.guardar("ana", "asentamientos", entrada, calculo_matrices(entrada), resumen="")
+        proyectos.vaciar()
+
+    return llamada
+
+
+def _proyectos_listar(n):
+    # primera página de un usuario con n casos guardados
+    proyectos, entradas = _proyectos(n)
+    for entrada in entradas:
+        proyectos.guardar("ana", "asentamientos", entrada, calculo_matrices(entrada))
+    proyectos.vaciar()
+    return lambda: proyectos.listar("ana")
+
+
+def _terzaghi_escalar(_):
+    entrada = EntradaTerzaghi(B=2.0, L=2.0, Df=1.5, gamma=18.0, c=10.0, phi=30.0)
+    return lambda: capacidad_carga_terzaghi.sin_cache(entrada)
+
+
+def _terzaghi_lote(n):
+    generador = np.random.default_rng(0)
+    B = generador.uniform(1, 4, n)
+    Df = generador.uniform(0.5, 3, n)
+    phi = generador.uniform(0, 45, n)
+    return lambda: capacidad_carga_lote(B, Df, 18.0, 10.0, phi)
+
+
+def _mohr(n):
+    generador = np.random.default_rng(0)
+    sigma3 = tuple(generador.uniform(50, 400, n))
+    sigma1 = tuple(s3 * 2.5 + 50 + generador.normal(0, 5) for s3 in sigma3)
+    entrada = EntradaTriaxial(sigma3=sigma3, sigma1=sigma1)
+    return lambda: ajuste_mohr_coulomb.sin_cache(entrada)
+
+
+def _rankine_perfil(n):
+    entrada = EntradaRankine(gamma=18.0, phi=30.0, H=3.0)
+    return lambda: perfil_rankine(entrada, n_puntos=n)
+
+
+def _zapata(_):
+    entrada = EntradaZapata(Pu=60000.0, Mu=3000.0, fc=250.0, fy=4200.0, q_adm=2.0,
+                            b_col=40.0, h_col=40.0, d_propuesto=40.0, C_recubrimiento=7.5)
+    return lambda: calculate_footing_design.sin_cache(entrada)
+
+
+def _optimizador_zapatas(n):
+    cuadro = {
+        "Columna": [f"C{i + 1}" for i in range(n)],
+        "Pu": np.linspace(30000, 150000, n), "Mux": np.linspace(0, 4000, n), "Muy": np.linspace(0, 2000, n),
+        "b_col": [40.0] * n, "h_col": [40.0] * n,
+    }
+    return lambda: optimizar_zapatas.sin_cache(cuadro, 250, 4200, 2.0)
+
+
+# nombre -> (preparar(tamaño) -> llamada, tamaños, qué mide el tamaño)
+CASOS = {
+    "bishop_circulo": (_bishop_circulo, [10, 30, 100, 500], "dovelas"),
+    "bishop_malla": (_bishop_malla, [3, 5, 8], "círculos por eje (n³ círculos)"),
+    "bishop_lote": (_bishop_lote, [100, 10_000], "taludes"),
+    "bishop_terreno": (_bishop_terreno, [2, 50, 400], "vértices del terreno (8000 círculos)"),
+    "asentamiento": (_asentamiento, [80, 800, 8000], "puntos de profundidad"),
+    "asentamiento_lote": (_asentamiento_lote, [100, 10_000], "casos"),
+    "esfuerzo_poligono": (_esfuerzo_poligono, [1000, 100_000], "puntos (losa en L, 6 aristas)"),
+    "asentamiento_losa": (_asentamiento_losa, [500, 2000], "puntos de la malla (120 profundidades)"),
+    "proyectos_guardar": (_proyectos_guardar, [10, 500], "casos por lote"),
+    "proyectos_listar": (_proyectos_listar, [100, 5000], "casos guardados del usuario (una página)"),
+    "exploracion_lote": (_exploracion_lote, [10, 200], "proyectos"),
+    "memoria_talud": (_memoria_talud, [30, 500], "dovelas (PDF)"),
+    "spt_proceso": (_spt_proceso, [1, 100, 1000], "sondeos de 60 muestras"),
+    "spt_carga": (_spt_carga, [100, 1000], "sondeos de 60 muestras (.npz)"),
+    "terzaghi_escalar": (_terzaghi_escalar, [1], "casos"),
+    "terzaghi_lote": (_terzaghi_lote, [100, 10_000, 1_000_000], "filas"),
+    "mohr_coulomb": (_mohr, [3, 30, 300], "probetas"),
+    "rankine_perfil": (_rankine_perfil, [100, 10_000, 1_000_000], "puntos de profundidad"),
+    "zapata": (_zapata, [1], "casos"),
+    "optimizador_zapatas": (_optimizador_zapatas, [5, 30], "columnas"),
+    "unidades_cuadro": (_unidades_cuadro, [100, 1_000_000], "filas"),
+}
+
+
+def medir(llamada, repeticiones=5, min_tiempo=0.05):
+    """Tiempo por llamada (s): mínimo y mediana de `repeticiones`, con `numero` llamadas calibradas."""
+    numero = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            llamada()
+        duracion = time.perf_counter() - inicio
+        if duracion >= min_tiempo or numero >= 1_000_000:
+            break
+        numero *= 10 if duracion < min_tiempo / 10 else 2
+    tiempos = [duracion / numero]
+    for _ in range(repeticiones - 1):
+        inicio = time.perf_counter()
+        for _ in range(numero):
+            llamada()
+        tiempos.append((time.perf_counter() - inicio) / numero)
+    return {"min_s": min(tiempos), "mediana_s": statistics.median(tiempos), "llamadas": numero,
+            "repeticiones": repeticiones}
+
+
+def correr(args):
+    casos = args.casos or list(CASOS)
+    desconocidos = [c for c in casos if c not in CASOS]
+    if desconocidos:
+        raise SystemExit(f"Casos desconocidos: {', '.join(desconocidos)}. Disponibles: {', '.join(CASOS)}")
+
+    resultados = {}
+    for caso in casos:
+        preparar, tamanos, unidad = CASOS[caso]
+        for tamano in tamanos:
+            r = medir(preparar(tamano), args.repeticiones, args.min_tiempo)
+            r.update(caso=caso, tamano=tamano, unidad=unidad)
+            resultados[f"{caso}[{tamano}]"] = r
+            print(f"{caso + '[' + str(tamano) + ']':34s} {r['min_s'] * 1000:11.4f} ms  "
+                  f"(mediana {r['mediana_s'] * 1000:.4f} ms, {r['llamadas']} llamadas)")
+
+    if args.salida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salida)), exist_ok=True)
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "plataforma": platform.platform(),
+                "resultados": resultados,
+            }, archivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+def comparar(args):
+    with open(args.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)["resultados"]
+    with open(args.nuevo, encoding="utf-8") as archivo:
+        nuevo = json.load(archivo)["resultados"]
+
+    regresiones = []
+    for nombre in sorted(set(base) & set(nuevo)):
+        razon = nuevo[nombre]["min_s"] / base[nombre]["min_s"]
+        marca = "REGRESIÓN" if razon > args.umbral else ("mejora" if razon < 1 / args.umbral else "")
+        if marca == "REGRESIÓN":
+            regresiones.append(nombre)
+        print(f"{nombre:34s} {base[nombre]['min_s'] * 1000:11.4f} → {nuevo[nombre]['min_s'] * 1000:11.4f} ms  "
+              f"x{razon:5.2f}  {marca}")
+    for nombre in sorted(set(base) ^ set(nuevo)):
+        print(f"{nombre:34s} solo en {'la base' if nombre in base else 'la corrida nueva'}")
+
+    if regresiones:
+        print(f"\n{len(regresiones)} caso(s) más de x{args.umbral} más lentos que la base: {', '.join(regresiones)}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    p_correr = comandos.add_parser("correr", help="Mide los casos y guarda el JSON")
+    p_correr.add_argument("--casos", nargs="+", default=None, help=f"Subconjunto de: {', '.join(CASOS)}")
+    p_correr.add_argument("--repeticiones", type=int, default=5)
+    p_correr.add_argument("--min-tiempo", type=float, default=0.05, help="Duración mínima de cada repetición (s)")
+    p_correr.add_argument("--salida", default=SALIDA, help="Archivo JSON de resultados")
+    p_correr.set_defaults(funcion=correr)
+
+    p_comparar = comandos.add_parser("comparar", help="Compara dos JSON y marca regresiones")
+    p_comparar.add_argument("base", help="JSON de la línea base")
+    p_comparar.add_argument("nuevo", help="JSON de la corrida nueva")
+    p_comparar.add_argument("--umbral", type=float, default=UMBRAL, help="Razón nuevo/base considerada regresión")
+    p_comparar.set_defaults(funcion=comparar)
+
+    args = parser.parse_args(argv)
+    return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+# benchmarks/carga.py
+"""
+Prueba de carga de ``streamlit_app.py`` con usuarios concurrentes.
+
+Levanta la app con ``streamlit run`` en un puerto libre (o usa un servidor ya
+corriendo con ``--url``) y conecta N clientes por websocket, que hablan el
+mismo protocolo que el navegador (``BackMsg``/``ForwardMsg``). Cada usuario
+simulado elige una página en el menú lateral, la abre, cambia al azar sus
+entradas numéricas y pulsa CALCULAR; repite hasta que se acaba el tiempo. Se
+reportan las latencias p50/p95/p99 de cada rerun (del envío hasta
+``script_finished``), el rendimiento (reruns por segundo) y la RSS del
+servidor a lo largo de la prueba:
+
+    python benchmarks/carga.py --usuarios 8 --duracion 60
+    python benchmarks/carga.py --usuarios 1 4 16 --duracion 30 --salida benchmarks/resultados/carga.json
+    python benchmarks/carga.py --paginas "Slope Bishop" "Asentamiento elastico" --pausa 0.5
+    GEOSUITE_CACHE=0 python benchmarks/carga.py --usuarios 8   # servidor sin las cachés de geosuite
+    python benchmarks/carga.py --url http://localhost:8501 --pid 1234
+
+Los escalones corren uno tras otro sobre el mismo servidor, así que los
+últimos encuentran las cachés calientes. ``AppTest`` no sirve para esto: usa
+un ``Runtime`` global por proceso y no admite sesiones en hilos paralelos.
+"""
+import argparse
+import ast
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np  # noqa: E402
+
+APP = os.path.join(RAIZ, "streamlit_app.py")
+MENU = "streamlit_option_menu" # nombre del componente del menú lateral
+VARIACION = 0.3 # las entradas se mueven ±30 % alrededor de su valor actual
+PERCENTILES = (50, 95, 99)
+
+
+def paginas_de_la_app(ruta=APP):
+    """Nombres del registro PAGINAS de la app, leídos sin ejecutarla."""
+    with open(ruta, encoding="utf-8") as archivo:
+        arbol = ast.parse(archivo.read())
+    for nodo in arbol.body:
+        if isinstance(nodo, ast.Assign) and any(getattr(t, "id", None) == "PAGINAS" for t in nodo.targets):
+            return list(ast.literal_eval(nodo.value))
+    raise ValueError(f"No se encontró PAGINAS en {ruta}")
+
+
+def rss_mb(pid):
+    """Memoria residente de un proceso en MB (Linux, /proc); None si no se puede leer."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as archivo:
+            for linea in archivo:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+# --- Servidor ----------------------------------------------------------------
+
+def _puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _esperar_salud(url, proceso=None, espera=60.0):
+    limite = time.monotonic() + espera
+    while time.monotonic() < limite:
+        if proceso is not None and proceso.poll() is not None:
+            raise SystemExit(f"El servidor terminó con código {proceso.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=2) as respuesta:
+                if respuesta.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.3)
+    raise SystemExit(f"El servidor en {url} no respondió en {espera:.0f} s")
+
+
+def levantar_servidor():
+    """Inicia ``streamlit run streamlit_app.py`` sin navegador; devuelve (proceso, url)."""
+    puerto = _puerto_libre()
+    proceso = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(puerto), "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{puerto}"
+    _esperar_salud(url, proceso)
+    return proceso, url
+
+
+# --- Cliente -----------------------------------------------------------------
+
+class Usuario:
+    """
+    Sesión de Streamlit vista desde el cliente: manda reruns con el estado de
+    los widgets y recoge los widgets y excepciones que dibuja cada rerun.
+    """
+
+    def __init__(self, url, rng, timeout):
+        self.url = url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.rng = rng
+        self.timeout = timeout
+        self.conexion = None
+        self.widgets = {} # id -> (clase, proto) del último rerun
+        self.valores = {} # id -> WidgetState
+
+    async def conectar(self):
+        from tornado.websocket import websocket_connect
+
+        self.conexion = await websocket_connect(self.url, subprotocols=["streamlit"], max_message_size=512 * 2**20)
+
+    def cerrar(self):
+        if self.conexion is not None:
+            self.conexion.close()
+
+    async def rerun(self, disparador=None):
+        """Manda un rerun y espera su ``script_finished``; devuelve las excepciones que mostró."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        mensaje = BackMsg()
+        mensaje.rerun_script.SetInParent()
+        estados = mensaje.rerun_script.widget_states.widgets
+        for id_widget in self.widgets:
+            if id_widget in self.valores:
+                estados.append(self.valores[id_widget])
+        if disparador is not None:
+            estados.append(WidgetState(id=disparador, trigger_value=True))
+        await self.conexion.write_message(mensaje.SerializeToString(), binary=True)
+
+        self.widgets, excepciones = {}, []
+        while True:
+            crudo = await asyncio.wait_for(self.conexion.read_message(), self.timeout)
+            if crudo is None:
+                raise ConnectionError("el servidor cerró la conexión")
+            msg = ForwardMsg()
+            msg.ParseFromString(crudo)
+            clase = msg.WhichOneof("type")
+            if clase == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                elemento = msg.delta.new_element
+                tipo = elemento.WhichOneof("type")
+                if tipo in ("number_input", "slider", "button", "component_instance"):
+                    widget = getattr(elemento, tipo)
+                    self.widgets[widget.id] = (tipo, widget)
+                elif tipo == "exception":
+                    excepciones.append(f"{elemento.exception.type}: {elemento.exception.message}")
+            elif clase == "script_finished" and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return excepciones
+
+    def menu(self):
+        for id_widget, (tipo, widget) in self.widgets.items():
+            if tipo == "component_instance" and widget.component_name.startswith(MENU):
+                return id_widget
+        return None
+
+    def boton_calcular(self):
+        for id_widget, (tipo, widget) in self.widgets.items():
+            if tipo == "button" and widget.label.upper().startswith("CALCULAR") and not widget.disabled:
+                return id_widget
+        return None
+
+    def elegir(self, id_menu, pagina):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        self.valores[id_menu] = WidgetState(id=id_menu, json_value=json.dumps(pagina))
+
+    def aleatorizar(self):
+        """Mueve al azar las entradas numéricas de la página, sin salir de sus límites."""
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        for id_widget, (tipo, w) in self.widgets.items():
+            if tipo == "number_input":
+                actual = self.valores.get(id_widget)
+                valor = (actual.int_value if w.data_type == w.INT else actual.double_value) if actual else (
+                    w.value if w.set_value else w.default)
+                minimo, maximo = (w.min if w.has_min else None), (w.max if w.has_max else None)
+            elif tipo == "slider" and w.type != w.SELECT_SLIDER and w.data_type in (w.INT, w.FLOAT) and len(w.default) == 1:
+                actual = self.valores.get(id_widget)
+                valor = actual.double_array_value.data[0] if actual else (w.value[0] if w.set_value else w.default[0])
+                minimo, maximo = w.min, w.max
+            else:
+                continue
+            if w.disabled:
+                continue
+            bajo, alto = valor - VARIACION * abs(valor), valor + VARIACION * abs(valor)
+            bajo, alto = max(bajo, minimo) if minimo is not None else bajo, min(alto, maximo) if maximo is not None else alto
+            nuevo = self.rng.uniform(bajo, alto) if alto > bajo else valor
+            if w.step:
+                base = minimo if minimo is not None and abs(minimo) < 1e12 else 0.0 # sin mínimo, Streamlit manda ±1.8e308
+                nuevo = min(max(base + round((nuevo - base) / w.step) * w.step, bajo), alto)
+            if tipo == "slider":
+                estado = WidgetState(id=id_widget)
+                estado.double_array_value.data.append(float(nuevo))
+            elif w.data_type == w.INT:
+                estado = WidgetState(id=id_widget, int_value=int(round(nuevo)))
+            else:
+                estado = WidgetState(id=id_widget, double_value=float(nuevo))
+            self.valores[id_widget] = estado
+
+
+class Registro:
+    """Latencias de los reruns de todos los usuarios."""
+
+    def __init__(self):
+        self.reruns = [] # (accion, pagina, segundos)
+        self.errores = defaultdict(int)
+
+    async def medir(self, usuario, accion, pagina, disparador=None):
+        inicio = time.perf_counter()
+        try:
+            excepciones = await usuario.rerun(disparador)
+        except asyncio.TimeoutError:
+            excepciones = [f"sin respuesta en {usuario.timeout:g} s"]
+        except ConnectionError as error:
+            excepciones = [str(error)]
+        self.reruns.append((accion, pagina, time.perf_counter() - inicio))
+        for excepcion in excepciones:
+            self.errores[f"{pagina}: {excepcion.splitlines()[0][:120]}"] += 1
+        return not excepciones
+
+
+async def usuario(url, paginas, fin, semilla, registro, pausa, timeout):
+    """Una sesión: abre páginas al azar y pulsa CALCULAR con entradas aleatorias hasta `fin`."""
+    rng = random.Random(semilla)
+    sesion = Usuario(url, rng, timeout)
+    await sesion.conectar()
+    try:
+        await registro.medir(sesion, "navegar", "Inicio")
+        id_menu = sesion.menu()
+        if id_menu is None:
+            raise RuntimeError("No se encontró el menú lateral en la página de inicio")
+        while time.perf_counter() < fin:
+            pagina = rng.choice(paginas)
+            sesion.elegir(id_menu, pagina)
+            if not await registro.medir(sesion, "navegar", pagina):
+                continue
+            boton = sesion.boton_calcular()
+            if boton is not None:
+                sesion.aleatorizar()
+                await registro.medir(sesion, "calcular", pagina, boton)
+            if pausa:
+                await asyncio.sleep(rng.expovariate(1 / pausa))
+    finally:
+        sesion.cerrar()
+
+
+def _resumen(latencias):
+    if not latencias:
+        return {"reruns": 0}
+    ms = np.asarray(latencias) * 1000
+    return {"reruns": int(ms.size), "media_ms": float(ms.mean()),
+            **{f"p{p}_ms": float(v) for p, v in zip(PERCENTILES, np.percentile(ms, PERCENTILES))}}
+
+
+async def _escalon(url, pid, usuarios, paginas, duracion, pausa, muestreo, timeout, semilla):
+    registro = Registro()
+    rss = []
+    inicio = time.perf_counter()
+    fin = inicio + duracion
+    tareas = [asyncio.create_task(usuario(url, paginas, fin, semilla + i, registro, pausa, timeout))
+              for i in range(usuarios)]
+    while not all(t.done() for t in tareas):
+        if pid is not None:
+            rss.append((round(time.perf_counter() - inicio, 2), rss_mb(pid)))
+        await asyncio.wait(tareas, timeout=muestreo)
+    for tarea in tareas:
+        tarea.result() # propaga errores de conexión
+    total = time.perf_counter() - inicio
+    if pid is not None:
+        rss.append((round(total, 2), rss_mb(pid)))
+
+    por_pagina = defaultdict(list)
+    for accion, pagina, segundos in registro.reruns:
+        por_pagina[f"{pagina} [{accion}]"].append(segundos)
+    memoria = [m for _, m in rss if m is not None]
+    return {
+        "usuarios": usuarios,
+        "duracion_s": total,
+        "reruns_por_s": len(registro.reruns) / total,
+        "calculos_por_s": sum(1 for r in registro.reruns if r[0] == "calcular") / total,
+        **_resumen([r[2] for r in registro.reruns]),
+        "rss_inicial_mb": memoria[0] if memoria else None,
+        "rss_max_mb": max(memoria) if memoria else None,
+        "rss_final_mb": memoria[-1] if memoria else None,
+        "rss_mb": rss,
+        "errores": dict(registro.errores),
+        "paginas": {nombre: _resumen(lat) for nombre, lat in sorted(por_pagina.items())},
+    }
+
+
+def escalon(url, pid, usuarios, paginas, duracion, pausa=0.0, muestreo=1.0, timeout=120.0, semilla=0):
+    """Corre `usuarios` sesiones concurrentes durante `duracion` s y resume latencias, rendimiento y RSS."""
+    return asyncio.run(_escalon(url, pid, usuarios, paginas, duracion, pausa, muestreo, timeout, semilla))
+
+
+def _mb(valor):
+    return "?" if valor is None else f"{valor:.0f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, nargs="+", default=[1, 4, 8],
+                        help="Usuarios concurrentes; con varios valores se corre un escalón por valor")
+    parser.add_argument("--duracion", type=float, default=30.0, help="Segundos por escalón")
+    parser.add_argument("--paginas", nargs="+", default=None, help="Páginas del menú (por omisión, todas)")
+    parser.add_argument("--pausa", type=float, default=0.0, help="Tiempo medio de 'lectura' entre acciones (s)")
+    parser.add_argument("--muestreo", type=float, default=1.0, help="Segundos entre muestras de RSS")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Tiempo máximo por rerun (s)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--url", default=None, help="Servidor ya corriendo (por omisión se levanta uno)")
+    parser.add_argument("--pid", type=int, default=None, help="PID del servidor de --url, para medir su RSS")
+    parser.add_argument("--detalle", action="store_true", help="Imprime las latencias por página")
+    parser.add_argument("--salida", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args(argv)
+
+    disponibles = paginas_de_la_app()
+    paginas = args.paginas or disponibles
+    desconocidas = [p for p in paginas if p not in disponibles]
+    if desconocidas:
+        raise SystemExit(f"Páginas desconocidas: {', '.join(desconocidas)}. Disponibles: {', '.join(disponibles)}")
+
+    proceso = None
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.pid
+        _esperar_salud(url)
+    else:
+        proceso, url = levantar_servidor()
+        pid = proceso.pid
+
+    escalones = []
+    try:
+        print(f"{'usuarios':>8s} {'reruns':>7s} {'reruns/s':>9s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} "
+              f"{'errores':>8s}  RSS MB")
+        for usuarios in args.usuarios:
+            r = escalon(url, pid, usuarios, paginas, args.duracion, args.pausa, args.muestreo, args.timeout,
+                        args.semilla)
+            escalones.append(r)
+            print(f"{usuarios:8d} {r['reruns']:7d} {r['reruns_por_s']:9.2f} {r.get('p50_ms', 0):8.1f} "
+                  f"{r.get('p95_ms', 0):8.1f} {r.get('p99_ms', 0):8.1f} {sum(r['errores'].values()):8d}  "
+                  f"{_mb(r['rss_inicial_mb'])} → {_mb(r['rss_final_mb'])} (máx {_mb(r['rss_max_mb'])})")
+            if args.detalle:
+                for nombre, p in r["paginas"].items():
+                    print(f"    {nombre:45s} {p['reruns']:5d} reruns  p50 {p['p50_ms']:8.1f}  "
+                          f"p95 {p['p95_ms']:8.1f}  p99 {p['p99_ms']:8.1f} ms")
+            for error, n in r["errores"].items():
+                print(f"    {n:4d} × {error}")
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait(timeout=30)
+
+    if args.salida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salida)), exist_ok=True)
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "cache": os.environ.get("GEOSUITE_CACHE", "1") != "0",
+                "paginas": paginas,
+                "pausa_s": args.pausa,
+                "escalones": escalones,
+            }, archivo, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
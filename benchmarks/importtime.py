@@ -0,0 +1,107 @@
+# benchmarks/importtime.py
+"""
+Reporte de tiempos de importación (estilo ``python -X importtime``).
+
+Cada módulo se importa en un proceso nuevo (arranque en frío) y se registra el
+tiempo acumulado de su importación, el tiempo total del proceso y qué librerías
+pesadas quedaron cargadas. El reporte se guarda en JSON para compararlo entre
+versiones:
+
+    python benchmarks/importtime.py
+    python benchmarks/importtime.py --repeticiones 5 --salida benchmarks/resultados/importtime.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS = [
+    "geosuite",
+    "geosuite.capacidad_carga",
+    "geosuite.settlement",
+    "geosuite.esfuerzos",
+    "geosuite.slope_bishop",
+    "geosuite.presiones_tierra",
+    "geosuite.ensayo_triaxial",
+    "geosuite.estr_zap",
+    "geosuite.graficas",
+    "geosuite.reportes",
+    "geosuite.spt",
+    "geosuite.unidades",
+    "geosuite.proyectos",
+    "apps.capacidad_carga",
+    "apps.settlement",
+    "apps.geotexplo_gdl",
+    "apps.ensayo_triaxial",
+    "apps.presiones_tierra",
+    "apps.slope_bishop",
+    "apps.estr_zap",
+    "apps.reportes",
+    "apps.spt",
+    "apps.proyectos",
+    "apps.dashboard_inicio",
+]
+
+# Librerías que no deberían cargarse al importar una página o el núcleo
+PESADAS = ["matplotlib", "matplotlib.pyplot", "pandas", "streamlit"]
+
+
+def medir(modulo):
+    """Importa `modulo` en un proceso nuevo y devuelve sus tiempos (µs) y librerías pesadas cargadas."""
+    entorno = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    inicio = time.perf_counter()
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, env=entorno, capture_output=True, text=True, check=True,
+    )
+    total = time.perf_counter() - inicio
+
+    acumulado = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        _, cumulativo, nombre = (parte.strip() for parte in linea.split(":", 1)[1].split("|"))
+        if cumulativo.isdigit():
+            acumulado[nombre] = int(cumulativo)
+
+    return {
+        "acumulado_us": acumulado.get(modulo, 0),
+        "proceso_s": total,
+        "pesadas": {lib: acumulado[lib] for lib in PESADAS if lib in acumulado},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modulos", nargs="*", default=MODULOS, help="Módulos a medir")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Se reporta el mínimo de N arranques")
+    parser.add_argument("--salida", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for modulo in args.modulos:
+        corridas = [medir(modulo) for _ in range(args.repeticiones)]
+        mejor = min(corridas, key=lambda r: r["acumulado_us"])
+        resultados[modulo] = mejor
+        pesadas = ", ".join(mejor["pesadas"]) or "-"
+        print(f"{modulo:28s} {mejor['acumulado_us'] / 1000:9.1f} ms  proceso {mejor['proceso_s']:6.2f} s  pesadas: {pesadas}")
+
+    if args.salida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salida)), exist_ok=True)
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "repeticiones": args.repeticiones,
+                "modulos": resultados,
+            }, archivo, indent=2, ensure_ascii=False)
+    return resultados
+
+
+if __name__ == "__main__":
+    main()
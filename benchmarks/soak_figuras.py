@@ -0,0 +1,160 @@
+# benchmarks/soak_figuras.py
+"""
+Prueba de resistencia (soak) del renderizado de gráficas.
+
+Renderiza miles de gráficas con datos distintos en cada vuelta (sin caché, para
+que cada render sea real) y muestrea la memoria residente (RSS) del proceso.
+Con ``geosuite.graficas`` la RSS debe quedar plana después del calentamiento;
+el modo ``pyplot`` reproduce el patrón anterior (``plt.subplots`` sin cerrar la
+figura) para comparar.
+
+    python benchmarks/soak_figuras.py
+    python benchmarks/soak_figuras.py --renders 10000 --salida benchmarks/resultados/soak_figuras.json
+    python benchmarks/soak_figuras.py --modos pyplot --renders 500
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import numpy as np  # noqa: E402
+
+from geosuite.graficas import grafica, svg_lineas  # noqa: E402
+
+MODOS = ["png", "svg", "vectorial"]
+
+
+def rss_mb():
+    """Memoria residente actual en MB (Linux: /proc; otros: pico de getrusage)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as archivo:
+            for linea in archivo:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _datos(i):
+    z = np.linspace(0, 10 + i % 7, 100)
+    return z, (100 + i) * np.exp(-z / 4)
+
+
+@grafica("soak")
+def _perfil(fig, z, sigma):
+    ax = fig.subplots()
+    ax.plot(sigma, z, label="Δσz")
+    ax.set_xlabel("Incremento de esfuerzos Δσz [kPa]")
+    ax.set_ylabel("Profundidad [m]")
+    ax.invert_yaxis()
+    ax.legend()
+    ax.grid(True)
+
+
+def render_png(i):
+    return _perfil.sin_cache(*_datos(i))
+
+
+def render_svg(i):
+    return _perfil.sin_cache(*_datos(i), formato="svg")
+
+
+def render_vectorial(i):
+    z, sigma = _datos(i)
+    return svg_lineas.sin_cache([(sigma, z, "Δσz", None)], etiqueta_x="Δσz [kPa]", etiqueta_y="Profundidad [m]",
+                                invertir_y=True, rejilla=True)
+
+
+def render_pyplot(i):
+    """Patrón anterior de las páginas: la figura queda en el registro de pyplot."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import io
+
+    import matplotlib.pyplot as plt
+
+    z, sigma = _datos(i)
+    fig, ax = plt.subplots()
+    ax.plot(sigma, z)
+    ax.invert_yaxis()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+RENDERIZADORES = {"png": render_png, "svg": render_svg, "vectorial": render_vectorial, "pyplot": render_pyplot}
+
+
+def soak(modo, renders, muestreo, calentamiento):
+    renderizar = RENDERIZADORES[modo]
+    for i in range(calentamiento):
+        renderizar(i)
+    gc.collect()
+    muestras = [(0, rss_mb())]
+    inicio = time.perf_counter()
+    for i in range(1, renders + 1):
+        renderizar(calentamiento + i)
+        if i % muestreo == 0 or i == renders:
+            gc.collect()
+            muestras.append((i, rss_mb()))
+    duracion = time.perf_counter() - inicio
+    base = muestras[0][1]
+    return {
+        "renders": renders,
+        "duracion_s": duracion,
+        "ms_por_render": duracion / renders * 1000,
+        "rss_inicial_mb": base,
+        "rss_final_mb": muestras[-1][1],
+        "rss_max_mb": max(m for _, m in muestras),
+        "crecimiento_mb": muestras[-1][1] - base,
+        "muestras": muestras,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modos", nargs="+", default=MODOS, choices=list(RENDERIZADORES))
+    parser.add_argument("--renders", type=int, default=10000)
+    parser.add_argument("--muestreo", type=int, default=1000, help="Renders entre muestras de RSS")
+    parser.add_argument("--calentamiento", type=int, default=200, help="Renders antes de tomar la RSS base")
+    parser.add_argument("--tolerancia-mb", type=float, default=20.0,
+                        help="Crecimiento máximo aceptado; si se supera el proceso termina con código 1")
+    parser.add_argument("--salida", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    for modo in args.modos:
+        r = soak(modo, args.renders, args.muestreo, args.calentamiento)
+        resultados[modo] = r
+        print(f"{modo:10s} {r['renders']:6d} renders  {r['ms_por_render']:7.2f} ms/render  "
+              f"RSS {r['rss_inicial_mb']:7.1f} → {r['rss_final_mb']:7.1f} MB  (Δ {r['crecimiento_mb']:+.1f} MB)")
+
+    if args.salida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salida)), exist_ok=True)
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "plataforma": platform.platform(),
+                "tolerancia_mb": args.tolerancia_mb,
+                "modos": resultados,
+            }, archivo, indent=2, ensure_ascii=False)
+
+    excedidos = [m for m, r in resultados.items() if r["crecimiento_mb"] > args.tolerancia_mb]
+    if excedidos:
+        print(f"La memoria creció más de {args.tolerancia_mb} MB en: {', '.join(excedidos)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# geosuite/__init__.py
+"""
+Núcleo de cálculo de GeoSuite, independiente de la interfaz.
+
+Ningún módulo de este paquete importa Streamlit ni matplotlib al cargarse, por lo
+que los cálculos se pueden usar desde scripts, procesos de lote o trabajadores.
+Las páginas en ``apps/`` son envoltorios de interfaz sobre estas funciones.
+
+Los nombres públicos se resuelven de forma perezosa: ``import geosuite`` no carga
+ningún submódulo y ``from geosuite import calculate_bishop_fs`` solo carga
+``geosuite.slope_bishop``.
+"""
+import importlib
+
+_EXPORTACIONES = {
+    "geosuite.capacidad_carga": [
+        "EntradaTerzaghi", "ResultadoTerzaghi", "capacidad_carga_lote", "capacidad_carga_terzaghi", "factores_terzaghi",
+    ],
+    "geosuite.ensayo_triaxial": [
+        "EntradaTriaxial", "ResultadoTriaxial", "ajuste_mohr_coulomb", "circulos_mohr", "grafo_triaxial",
+    ],
+    "geosuite.esfuerzos": [
+        "esfuerzo_carga_lineal", "esfuerzo_circular", "esfuerzo_franja", "esfuerzo_poligono", "esfuerzo_poligono_malla",
+        "esfuerzo_poligono_rectangulos", "esfuerzo_rectangulo", "esfuerzo_terraplen",
+    ],
+    "geosuite.estr_zap": [
+        "EntradaZapata", "ResultadoZapata", "calculate_footing_design", "optimizar_zapatas",
+        "presion_contacto_biaxial", "revisar_zapatas",
+    ],
+    "geosuite.exploracion": [
+        "EntradaExploracion", "ResultadoExploracion", "cargar_reglas", "planear_exploracion", "planear_lote",
+        "puntos_en_poligono", "ubicar_sondeos",
+    ],
+    "geosuite.grafo": ["Grafo"],
+    "geosuite.presiones_tierra": [
+        "EntradaRankine", "ResultadoRankine", "coeficientes_rankine", "perfil_rankine", "presiones_rankine",
+    ],
+    "geosuite.reportes": ["ColaReportes", "Trabajo", "generar_memoria", "memoria"],
+    "geosuite.sensibilidad": ["ResultadoSobol", "ResultadoTornado", "sobol", "tornado"],
+    "geosuite.settlement": [
+        "EntradaAsentamiento", "EntradaLosa", "ResultadoAsentamiento", "ResultadoLosa", "asentamiento_lote",
+        "asentamiento_losa", "bou_rect_c", "calculo_matrices",
+    ],
+    "geosuite.slope_bishop": [
+        "EntradaBishop", "ResultadoBishop", "ResultadoBusqueda", "buscar_circulo_critico", "calculate_bishop_fs",
+        "fs_circulo", "fs_lote", "grafo_bishop", "resistencia_dovelas", "terreno_de",
+    ],
+    "geosuite.spt": [
+        "EntradaSPT", "Perfil", "RegistrosSPT", "ResultadoSPT", "corregir_N", "entrada_asentamiento",
+        "entrada_capacidad", "entrada_talud", "leer_registros", "licuacion", "perfil_de_diseno", "procesar_spt",
+    ],
+    "geosuite.terreno": ["Terreno", "cortes_circulo"],
+    "geosuite.unidades": ["convertir", "convertir_tabla", "en_sistema", "factor", "normalizar_unidades"],
+}
+_MODULO_DE = {nombre: modulo for modulo, nombres in _EXPORTACIONES.items() for nombre in nombres}
+
+__all__ = list(_MODULO_DE)
+
+
+def __getattr__(nombre):
+    if nombre in _MODULO_DE:
+        valor = getattr(importlib.import_module(_MODULO_DE[nombre]), nombre)
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f"module 'geosuite' has no attribute {nombre!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,319 @@
+# geosuite/almacen.py
+"""
+Almacén persistente en disco de resultados costosos, direccionado por contenido.
+
+Complementa a ``geosuite.cache``: la caché en memoria vive lo que vive el
+proceso, mientras que el almacén sobrevive a reinicios y se comparte entre los
+procesos de Streamlit que corren en la misma máquina (o sobre el mismo volumen).
+
+- El índice es una base SQLite en modo WAL (lectores y un escritor concurrentes).
+- Los arreglos grandes se guardan como ``.npy`` y se leen con ``mmap_mode="r"``:
+  abrir un resultado no copia los datos a memoria hasta que se usan.
+- El resto del resultado (escalares, dicts, dataclasses de ``geosuite``,
+  DataFrames) se guarda como JSON en el índice.
+- Cuando el tamaño total supera ``max_bytes`` se borran las entradas usadas
+  hace más tiempo.
+
+Los archivos se escriben con un nombre temporal y se renombran con
+``os.replace``; como el nombre final es el hash del contenido, dos procesos que
+calculen lo mismo escriben lo mismo y el último renombrado gana sin corromper
+nada.
+
+    almacen = obtener_almacen()
+    almacen.guardar("optimizador_zapatas", clave, resultado)
+    almacen.obtener("optimizador_zapatas", clave)
+
+Variables de entorno: GEOSUITE_ALMACEN (carpeta), GEOSUITE_ALMACEN_MB (límite de
+tamaño) y GEOSUITE_ALMACEN=0 para desactivarlo.
+"""
+import dataclasses
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+MB = 1024 * 1024
+
+CARPETA = os.path.join(os.path.expanduser("~"), ".cache", "geosuite")
+MAX_BYTES = 1024 * MB
+MIN_BYTES_NPY = 4096 # arreglos más chicos van dentro del JSON
+FRACCION_DESALOJO = 0.9 # al desalojar se baja hasta el 90 % del límite
+INTERVALO_ACCESO = 60.0 # segundos entre actualizaciones de 'accedido' de una misma entrada
+TIMEOUT_BLOQUEO = 30.0 # segundos de espera si otro proceso tiene la base bloqueada
+GRACIA_HUERFANOS = 300.0 # un .npy sin entrada solo se borra si tiene más de 5 min (otro proceso puede estar registrándolo)
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    espacio TEXT NOT NULL,
+    clave TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    archivos TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    creado REAL NOT NULL,
+    accedido REAL NOT NULL,
+    PRIMARY KEY (espacio, clave)
+);
+CREATE INDEX IF NOT EXISTS entradas_accedido ON entradas (accedido);
+"""
+
+
+def _codificar(valor, arreglos):
+    """Convierte un resultado en JSON; los arreglos grandes se apartan en `arreglos`."""
+    if valor is None or isinstance(valor, (bool, str)):
+        return valor
+    if isinstance(valor, (int, np.integer)):
+        return int(valor)
+    if isinstance(valor, (float, np.floating)):
+        valor = float(valor)
+        return valor if np.isfinite(valor) else {"__float__": repr(valor)}
+    if isinstance(valor, np.ndarray):
+        if valor.dtype == object:
+            return {"__lista__": [_codificar(v, arreglos) for v in valor.tolist()]}
+        # NaN e infinitos no caben en JSON: ese arreglo va a .npy aunque sea chico
+        if valor.nbytes < MIN_BYTES_NPY and (valor.dtype.kind not in "fc" or np.isfinite(valor).all()):
+            return {"__nd__": valor.tolist(), "dtype": valor.dtype.str, "forma": list(valor.shape)}
+        arreglos.append(valor)
+        return {"__npy__": len(arreglos) - 1}
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        tipo = type(valor)
+        if not tipo.__module__.startswith("geosuite."):
+            raise TypeError(f"Solo se almacenan dataclasses de geosuite, no {tipo.__qualname__}")
+        return {"__dc__": f"{tipo.__module__}:{tipo.__qualname__}",
+                "campos": {c.name: _codificar(getattr(valor, c.name), arreglos) for c in dataclasses.fields(valor)}}
+    if hasattr(valor, "columns") and hasattr(valor, "to_numpy"): # DataFrame
+        return {"__df__": [[str(c), _codificar(valor[c].to_numpy(), arreglos)] for c in valor.columns]}
+    if isinstance(valor, dict):
+        if not all(isinstance(k, str) for k in valor):
+            raise TypeError("Solo se almacenan dicts con claves de texto")
+        return {"__dict__": {k: _codificar(v, arreglos) for k, v in valor.items()}}
+    if isinstance(valor, tuple):
+        return {"__tupla__": [_codificar(v, arreglos) for v in valor]}
+    if isinstance(valor, list):
+        return [_codificar(v, arreglos) for v in valor]
+    raise TypeError(f"Tipo no soportado por el almacén: {type(valor).__name__}")
+
+
+def _decodificar(valor, arreglos):
+    if isinstance(valor, list):
+        return [_decodificar(v, arreglos) for v in valor]
+    if not isinstance(valor, dict):
+        return valor
+    if "__npy__" in valor:
+        return arreglos[valor["__npy__"]]
+    if "__nd__" in valor:
+        arreglo = np.array(valor["__nd__"], dtype=np.dtype(valor["dtype"])).reshape(valor["forma"])
+        arreglo.flags.writeable = False
+        return arreglo
+    if "__lista__" in valor:
+        return np.array([_decodificar(v, arreglos) for v in valor["__lista__"]], dtype=object)
+    if "__float__" in valor:
+        return float(valor["__float__"])
+    if "__tupla__" in valor:
+        return tuple(_decodificar(v, arreglos) for v in valor["__tupla__"])
+    if "__dict__" in valor:
+        return {k: _decodificar(v, arreglos) for k, v in valor["__dict__"].items()}
+    if "__dc__" in valor:
+        modulo, nombre = valor["__dc__"].split(":")
+        if not modulo.startswith("geosuite."):
+            raise ValueError(f"Dataclass fuera de geosuite en el almacén: {valor['__dc__']}")
+        tipo = getattr(importlib.import_module(modulo), nombre)
+        return tipo(**{k: _decodificar(v, arreglos) for k, v in valor["campos"].items()})
+    if "__df__" in valor:
+        import pandas as pd
+
+        return pd.DataFrame({c: _decodificar(v, arreglos) for c, v in valor["__df__"]}, copy=False)
+    raise ValueError(f"Entrada del almacén con formato desconocido: {sorted(valor)}")
+
+
+class Almacen:
+    """Índice SQLite (WAL) + archivos ``.npy`` direccionados por contenido."""
+
+    def __init__(self, carpeta=CARPETA, max_bytes=MAX_BYTES):
+        self.carpeta = os.path.abspath(carpeta)
+        self.max_bytes = max_bytes
+        self._objetos = os.path.join(self.carpeta, "objetos")
+        os.makedirs(self._objetos, exist_ok=True)
+        self._local = threading.local()
+        self.aciertos = self.fallos = self.escrituras = self.desalojos = 0
+        with self._conexion() as conexion:
+            conexion.executescript(_ESQUEMA)
+
+    def _conexion(self):
+        """Una conexión por hilo y por proceso (las conexiones no sobreviven a un fork)."""
+        conexion = getattr(self._local, "conexion", None)
+        if conexion is None or self._local.pid != os.getpid():
+            conexion = sqlite3.connect(os.path.join(self.carpeta, "indice.sqlite"), timeout=TIMEOUT_BLOQUEO,
+                                       isolation_level=None)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexion, self._local.pid = conexion, os.getpid()
+        return conexion
+
+    def _ruta(self, nombre):
+        return os.path.join(self._objetos, nombre[:2], nombre)
+
+    def _escribir_npy(self, arreglo):
+        """Escribe el arreglo con nombre = hash de su contenido. Devuelve (nombre, bytes)."""
+        arreglo = np.ascontiguousarray(arreglo)
+        resumen = hashlib.blake2b(arreglo.tobytes(), digest_size=20)
+        resumen.update(f"{arreglo.dtype.str}{arreglo.shape}".encode())
+        nombre = resumen.hexdigest() + ".npy"
+        ruta = self._ruta(nombre)
+        if os.path.exists(ruta):
+            os.utime(ruta) # evita que otro proceso lo recolecte como huérfano antes de registrarlo
+        else:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as archivo:
+                    np.save(archivo, arreglo, allow_pickle=False)
+                os.replace(temporal, ruta)
+            except BaseException:
+                if os.path.exists(temporal):
+                    os.remove(temporal)
+                raise
+        return nombre, arreglo.nbytes
+
+    def obtener(self, espacio, clave, defecto=None):
+        """Devuelve el resultado guardado o `defecto`. Los arreglos grandes llegan como memmap de solo lectura."""
+        conexion = self._conexion()
+        fila = conexion.execute(
+            "SELECT datos, archivos, accedido FROM entradas WHERE espacio = ? AND clave = ?", (espacio, clave),
+        ).fetchone()
+        if fila is None:
+            self.fallos += 1
+            return defecto
+        datos, archivos, accedido = fila
+        try:
+            arreglos = [np.load(self._ruta(nombre), mmap_mode="r", allow_pickle=False)
+                        for nombre in json.loads(archivos)]
+            valor = _decodificar(json.loads(datos), arreglos)
+        except Exception:
+            # Archivo borrado por otro proceso entre la consulta y la lectura, o entrada que
+            # ya no se puede decodificar (otra versión de los dataclasses): cuenta como fallo
+            self.borrar(espacio, clave)
+            self.fallos += 1
+            return defecto
+        ahora = time.time()
+        if ahora - accedido > INTERVALO_ACCESO:
+            conexion.execute("UPDATE entradas SET accedido = ? WHERE espacio = ? AND clave = ?", (ahora, espacio, clave))
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, espacio, clave, valor):
+        """Guarda un resultado. Devuelve False si su tipo no se puede almacenar."""
+        arreglos = []
+        try:
+            datos = json.dumps(_codificar(valor, arreglos), ensure_ascii=False, allow_nan=False)
+        except TypeError:
+            return False
+        archivos = [self._escribir_npy(a) for a in arreglos]
+        n_bytes = len(datos) + sum(b for _, b in archivos)
+        ahora = time.time()
+        conexion = self._conexion()
+        conexion.execute(
+            "INSERT OR REPLACE INTO entradas (espacio, clave, datos, archivos, bytes, creado, accedido) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (espacio, clave, datos, json.dumps([n for n, _ in archivos]), n_bytes, ahora, ahora),
+        )
+        self.escrituras += 1
+        if self.bytes_totales() > self.max_bytes:
+            self.desalojar()
+        return True
+
+    def borrar(self, espacio, clave):
+        conexion = self._conexion()
+        conexion.execute("DELETE FROM entradas WHERE espacio = ? AND clave = ?", (espacio, clave))
+        self._recolectar()
+
+    def bytes_totales(self):
+        return self._conexion().execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+
+    def desalojar(self, objetivo=None):
+        """Borra las entradas usadas hace más tiempo hasta bajar de `objetivo` bytes."""
+        objetivo = self.max_bytes * FRACCION_DESALOJO if objetivo is None else objetivo
+        conexion = self._conexion()
+        conexion.execute("BEGIN IMMEDIATE")
+        try:
+            total = conexion.execute("SELECT COALESCE(SUM(bytes), 0) FROM entradas").fetchone()[0]
+            borrar = []
+            for espacio, clave, n_bytes in conexion.execute(
+                    "SELECT espacio, clave, bytes FROM entradas ORDER BY accedido"):
+                if total <= objetivo:
+                    break
+                borrar.append((espacio, clave))
+                total -= n_bytes
+            conexion.executemany("DELETE FROM entradas WHERE espacio = ? AND clave = ?", borrar)
+            conexion.execute("COMMIT")
+        except BaseException:
+            conexion.execute("ROLLBACK")
+            raise
+        self.desalojos += len(borrar)
+        self._recolectar()
+        return len(borrar)
+
+    def _recolectar(self, gracia=GRACIA_HUERFANOS):
+        """Borra los .npy (y temporales abandonados) que ya no referencia ninguna entrada."""
+        usados = set()
+        for (archivos,) in self._conexion().execute("SELECT archivos FROM entradas"):
+            usados.update(json.loads(archivos))
+        limite = time.time() - gracia
+        for subcarpeta in os.listdir(self._objetos):
+            ruta_sub = os.path.join(self._objetos, subcarpeta)
+            for nombre in os.listdir(ruta_sub):
+                ruta = os.path.join(ruta_sub, nombre)
+                try:
+                    if nombre not in usados and os.path.getmtime(ruta) < limite:
+                        os.remove(ruta)
+                except OSError:
+                    pass # ya borrado por otro proceso, o en Windows un memmap abierto impide borrarlo
+
+    def limpiar(self, espacio=None):
+        conexion = self._conexion()
+        if espacio is None:
+            conexion.execute("DELETE FROM entradas")
+        else:
+            conexion.execute("DELETE FROM entradas WHERE espacio = ?", (espacio,))
+        self._recolectar(gracia=0)
+
+    def estadisticas(self):
+        conexion = self._conexion()
+        por_espacio = {
+            espacio: {"entradas": n, "bytes": b}
+            for espacio, n, b in conexion.execute("SELECT espacio, COUNT(*), SUM(bytes) FROM entradas GROUP BY espacio")
+        }
+        return {
+            "carpeta": self.carpeta,
+            "bytes": sum(e["bytes"] for e in por_espacio.values()),
+            "max_bytes": self.max_bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "escrituras": self.escrituras,
+            "desalojos": self.desalojos,
+            "espacios": por_espacio,
+        }
+
+
+_ALMACEN = None
+_ALMACEN_LOCK = threading.Lock()
+
+
+def habilitado():
+    return os.environ.get("GEOSUITE_ALMACEN", "1") != "0"
+
+
+def obtener_almacen():
+    """Almacén compartido del proceso, configurado con las variables de entorno."""
+    global _ALMACEN
+    with _ALMACEN_LOCK:
+        if _ALMACEN is None:
+            carpeta = os.environ.get("GEOSUITE_ALMACEN") or CARPETA
+            max_bytes = int(float(os.environ.get("GEOSUITE_ALMACEN_MB", MAX_BYTES / MB)) * MB)
+            _ALMACEN = Almacen(carpeta, max_bytes)
+        return _ALMACEN
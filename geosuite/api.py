@@ -0,0 +1,430 @@
+# geosuite/api.py
+"""
+API HTTP (JSON) sobre el núcleo de cálculo, con asyncio y solo la biblioteca estándar.
+
+    python -m geosuite.api --puerto 8502 --procesos 4
+
+Rutas (los tipos son los mismos que en ``geosuite.lote``: capacidad,
+asentamientos, zapatas, taludes, muros, triaxiales):
+
+    GET  /salud                 estado del servidor y ocupación de las colas
+    POST /<tipo>                un caso: {"B": 2, "Df": 1.5, ...} -> {"resultado": {...}}
+    POST /<tipo>/lote           muchos casos: {"casos": [{...}, ...]} -> {"resultados": [...]}
+
+Los campos van en las unidades del motor (como en ``geosuite.lote``), o en otro
+sistema con ``"unidades": "SI" | "tecnico"`` o con la unidad en el nombre
+(``{"Pu [kN]": 600}``).
+
+Los cálculos nunca corren en el event loop: se envían a un pool de procesos
+acotado. Las peticiones individuales que llegan juntas se agrupan en
+micro-lotes (hasta ``max_lote`` casos o ``espera_ms`` milisegundos) y cada
+micro-lote se resuelve con una sola llamada al pool; la capacidad de carga usa
+además la versión vectorizada ``capacidad_carga_lote``. Cada tipo tiene una
+cola acotada: si está llena, la API responde 503 con ``Retry-After`` en vez de
+acumular trabajo sin límite. Los casos de ``/lote`` cuentan contra la misma
+capacidad (un lote mayor que la cola solo entra si no hay nada en espera). Si
+un proceso del pool muere, el pool se reemplaza y solo fallan los lotes que
+estaban en él.
+
+Para pruebas y scripts, ``iniciar_en_hilo`` levanta el servidor en segundo
+plano y ``ClienteAPI`` lo consulta:
+
+    servidor = iniciar_en_hilo(puerto=0)
+    cliente = ClienteAPI(servidor.puerto)
+    cliente.post("/capacidad", {"B": 2, "L": 2, "Df": 1.5, "gamma": 18, "c": 10, "phi": 30})
+    servidor.detener()
+"""
+import argparse
+import asyncio
+import contextlib
+import http.client
+import json
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+import numpy as np
+
+from geosuite.lote import TIPOS, preparar_entrada, resolver_caso
+
+MAX_LOTE = 64 # casos por micro-lote
+ESPERA_MS = 5.0 # espera máxima para juntar un micro-lote
+MAX_COLA = 1024 # casos en espera por tipo antes de responder 503
+MAX_CASOS_LOTE = 10_000 # casos por petición al endpoint /lote
+MAX_CUERPO = 16 * 1024 * 1024 # bytes
+MAX_ENCABEZADOS = 64 * 1024 # bytes
+
+
+class ErrorHTTP(Exception):
+    def __init__(self, estado, mensaje, encabezados=None):
+        super().__init__(mensaje)
+        self.estado = HTTPStatus(estado)
+        self.encabezados = encabezados or {}
+
+
+def _json_seguro(valor):
+    """NaN e infinitos no son JSON válido: se envían como null."""
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    if isinstance(valor, dict):
+        return {k: _json_seguro(v) for k, v in valor.items()}
+    if isinstance(valor, list):
+        return [_json_seguro(v) for v in valor]
+    return valor
+
+
+def _capacidad_vectorizada(lista):
+    """Micro-lote de capacidad de carga en una sola llamada vectorizada."""
+    from geosuite.capacidad_carga import capacidad_carga_lote
+
+    salida, entradas, posiciones = [None] * len(lista), [], []
+    for i, parametros in enumerate(lista):
+        try:
+            entradas.append(preparar_entrada("capacidad", parametros)[0])
+            posiciones.append(i)
+        except Exception as error:
+            salida[i] = ("error", f"{type(error).__name__}: {error}")
+    if entradas:
+        try:
+            columnas = {campo: np.array([getattr(e, campo) for e in entradas], dtype=float)
+                        for campo in ("B", "L", "Df", "gamma", "c", "phi", "FS")}
+            r = capacidad_carga_lote(columnas["B"], columnas["Df"], columnas["gamma"], columnas["c"],
+                                     columnas["phi"], columnas["FS"])
+        except Exception:
+            # Un caso inválido no debe tumbar el micro-lote: se resuelven uno por uno
+            return [salida[i] or _resolver_uno("capacidad", p) for i, p in enumerate(lista)]
+        for k, i in enumerate(posiciones):
+            fila = {campo: float(v[k]) for campo, v in columnas.items()}
+            fila.update({campo: float(np.broadcast_to(v, columnas["B"].shape)[k]) for campo, v in r.items()})
+            salida[i] = ("ok", fila)
+    return salida
+
+
+def _resolver_uno(tipo, parametros):
+    if isinstance(parametros.get("terreno"), str):
+        # La API no lee archivos del servidor: el terreno viaja en la petición
+        return "error", 'ValueError: el terreno se envía como {"x": [...], "y": [...]}, no como ruta.'
+    try:
+        return "ok", resolver_caso(tipo, parametros)
+    except Exception as error: # cualquier fallo es del caso, nunca de sus compañeros de micro-lote
+        return "error", f"{type(error).__name__}: {error}"
+
+
+def resolver_lote(tipo, lista):
+    """Resuelve una lista de casos de un tipo: [("ok", fila) | ("error", mensaje)]. Corre en el pool."""
+    if tipo == "capacidad":
+        return _capacidad_vectorizada(lista)
+    return [_resolver_uno(tipo, parametros) for parametros in lista]
+
+
+class Microlotes:
+    """Cola acotada de un tipo de caso y la tarea que la vacía en micro-lotes."""
+
+    def __init__(self, servidor, tipo):
+        self.servidor = servidor
+        self.tipo = tipo
+        self.cola = asyncio.Queue(maxsize=servidor.max_cola)
+        self.tarea = asyncio.create_task(self._despachar())
+        self.lotes = self.casos = 0
+        self.reservados = 0 # casos de /lote admitidos y aún sin resolver
+
+    def _llena(self):
+        return ErrorHTTP(503, f"Cola de '{self.tipo}' llena; reintente en un momento.", {"Retry-After": "1"})
+
+    def en_espera(self):
+        return self.cola.qsize() + self.reservados
+
+    def enviar(self, parametros):
+        """Encola un caso y devuelve el futuro de su resultado; 503 si la cola está llena."""
+        if self.en_espera() >= self.servidor.max_cola:
+            raise self._llena()
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self.cola.put_nowait((parametros, futuro))
+        except asyncio.QueueFull:
+            raise self._llena()
+        return futuro
+
+    @contextlib.contextmanager
+    def reservar(self, n):
+        """
+        Admite `n` casos de /lote contra la capacidad de la cola mientras se
+        resuelven; 503 si no caben. Un lote mayor que la cola entra solo si no
+        hay nada en espera.
+        """
+        if self.en_espera() and self.en_espera() + n > self.servidor.max_cola:
+            raise self._llena()
+        self.reservados += n
+        try:
+            yield
+        finally:
+            self.reservados -= n
+
+    async def _despachar(self):
+        while True:
+            lote = [await self.cola.get()]
+            limite = asyncio.get_running_loop().time() + self.servidor.espera_ms / 1000
+            while len(lote) < self.servidor.max_lote:
+                restante = limite - asyncio.get_running_loop().time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self.cola.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+            vivos = [(p, f) for p, f in lote if not f.cancelled()]
+            if vivos:
+                asyncio.create_task(self._resolver(vivos))
+
+    async def _resolver(self, lote):
+        self.lotes += 1
+        self.casos += len(lote)
+        try:
+            resultados = await self.servidor.en_pool(self.tipo, [p for p, _ in lote])
+        except Exception as error: # el pool falló (p. ej. un proceso murió)
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(error)
+            return
+        for (_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+
+class ServidorAPI:
+    """Servidor HTTP/1.1 mínimo (keep-alive, Content-Length) sobre asyncio."""
+
+    def __init__(self, host="127.0.0.1", puerto=8502, procesos=None, max_lote=MAX_LOTE, espera_ms=ESPERA_MS,
+                 max_cola=MAX_COLA):
+        self.host, self.puerto = host, puerto
+        self.procesos = procesos or os.cpu_count() or 1
+        self.max_lote, self.espera_ms, self.max_cola = max_lote, espera_ms, max_cola
+        self._pool = None
+        self._limite_pool = None
+        self._colas = {}
+        self._conexiones = set()
+        self._servidor = None
+
+    async def iniciar(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+        # A lo más dos lotes por proceso en vuelo; el resto espera en las colas acotadas
+        self._limite_pool = asyncio.Semaphore(2 * self.procesos)
+        self._colas = {tipo: Microlotes(self, tipo) for tipo in TIPOS}
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto, limit=MAX_ENCABEZADOS)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+        return self
+
+    async def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+        for escritor in list(self._conexiones): # las lecturas pendientes terminan con IncompleteReadError
+            escritor.close()
+        tareas = [cola.tarea for cola in self._colas.values()]
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        await asyncio.sleep(0)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def en_pool(self, tipo, lista):
+        async with self._limite_pool:
+            pool = self._pool
+            try:
+                return await asyncio.get_running_loop().run_in_executor(pool, resolver_lote, tipo, lista)
+            except BrokenProcessPool:
+                # Un proceso murió: el pool ya no acepta trabajo. El primero que lo nota lo reemplaza
+                # y el error llega solo a los lotes que estaban en él.
+                if pool is self._pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+                raise
+
+    # --- HTTP -----------------------------------------------------------------
+
+    async def _atender(self, lector, escritor):
+        self._conexiones.add(escritor)
+        try:
+            while True:
+                try:
+                    peticion = await self._leer_peticion(lector)
+                except ErrorHTTP as error:
+                    await self._responder(escritor, error.estado, {"error": str(error)}, error.encabezados, False)
+                    break
+                if peticion is None:
+                    break
+                metodo, ruta, encabezados, cuerpo = peticion
+                seguir = encabezados.get("connection", "").lower() != "close"
+                try:
+                    estado, datos, extra = HTTPStatus.OK, await self._enrutar(metodo, ruta, cuerpo), {}
+                except ErrorHTTP as error:
+                    estado, datos, extra = error.estado, {"error": str(error)}, error.encabezados
+                except Exception as error: # la conexión siempre recibe respuesta
+                    estado, datos, extra = (HTTPStatus.INTERNAL_SERVER_ERROR,
+                                            {"error": f"Error interno: {type(error).__name__}: {error}"}, {})
+                await self._responder(escritor, estado, datos, extra, seguir)
+                if not seguir:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._conexiones.discard(escritor)
+            escritor.close()
+
+    async def _leer_peticion(self, lector):
+        try:
+            cabecera = await lector.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None # el cliente cerró la conexión
+        except asyncio.LimitOverrunError:
+            raise ErrorHTTP(431, "Encabezados demasiado grandes.")
+        lineas = cabecera.decode("latin-1").split("\r\n")
+        try:
+            metodo, ruta, _ = lineas[0].split(" ", 2)
+        except ValueError:
+            raise ErrorHTTP(400, "Línea de petición inválida.")
+        encabezados = {}
+        for linea in lineas[1:]:
+            if ":" in linea:
+                nombre, valor = linea.split(":", 1)
+                encabezados[nombre.strip().lower()] = valor.strip()
+        try:
+            longitud = int(encabezados.get("content-length", 0) or 0)
+        except ValueError:
+            raise ErrorHTTP(400, "Content-Length inválido.")
+        if longitud > MAX_CUERPO:
+            raise ErrorHTTP(413, f"Cuerpo de más de {MAX_CUERPO} bytes.")
+        cuerpo = await lector.readexactly(longitud) if longitud else b""
+        return metodo.upper(), ruta.split("?", 1)[0].rstrip("/") or "/", encabezados, cuerpo
+
+    async def _responder(self, escritor, estado, datos, encabezados, seguir):
+        cuerpo = json.dumps(_json_seguro(datos), ensure_ascii=False).encode("utf-8")
+        lineas = [f"HTTP/1.1 {estado.value} {estado.phrase}", "Content-Type: application/json; charset=utf-8",
+                  f"Content-Length: {len(cuerpo)}", f"Connection: {'keep-alive' if seguir else 'close'}"]
+        lineas += [f"{k}: {v}" for k, v in encabezados.items()]
+        escritor.write(("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1") + cuerpo)
+        await escritor.drain()
+
+    async def _enrutar(self, metodo, ruta, cuerpo):
+        partes = ruta.strip("/").split("/")
+        if partes == ["salud"]:
+            if metodo != "GET":
+                raise ErrorHTTP(405, "Use GET.")
+            return {"estado": "ok", "procesos": self.procesos,
+                    "colas": {t: {"en_espera": c.en_espera(), "lotes": c.lotes, "casos": c.casos}
+                              for t, c in self._colas.items()}}
+        if partes[0] not in TIPOS or len(partes) > 2 or (len(partes) == 2 and partes[1] != "lote"):
+            raise ErrorHTTP(404, f"Ruta desconocida: {ruta}. Tipos: {', '.join(TIPOS)}")
+        if metodo != "POST":
+            raise ErrorHTTP(405, "Use POST con un cuerpo JSON.")
+        try:
+            datos = json.loads(cuerpo or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            raise ErrorHTTP(400, f"JSON inválido: {error}")
+
+        tipo = partes[0]
+        if len(partes) == 1:
+            if not isinstance(datos, dict):
+                raise ErrorHTTP(400, "Se esperaba un objeto JSON con los datos del caso.")
+            estado, valor = await self._colas[tipo].enviar(datos)
+            if estado == "error":
+                raise ErrorHTTP(422, valor)
+            return {"resultado": valor}
+
+        casos = datos.get("casos") if isinstance(datos, dict) else None
+        if not isinstance(casos, list) or not all(isinstance(c, dict) for c in casos):
+            raise ErrorHTTP(400, 'Se esperaba {"casos": [{...}, ...]}.')
+        if len(casos) > MAX_CASOS_LOTE:
+            raise ErrorHTTP(413, f"Máximo {MAX_CASOS_LOTE} casos por petición.")
+        trozos = [casos[i:i + self.max_lote] for i in range(0, len(casos), self.max_lote)]
+        resultados = []
+        with self._colas[tipo].reservar(len(casos)):
+            for trozo in await asyncio.gather(*(self.en_pool(tipo, t) for t in trozos)):
+                resultados += [{"resultado": v} if e == "ok" else {"error": v} for e, v in trozo]
+        return {"resultados": resultados}
+
+
+class _ServidorEnHilo:
+    def __init__(self, servidor, hilo, loop):
+        self.servidor, self.hilo, self.loop = servidor, hilo, loop
+        self.puerto = servidor.puerto
+
+    def detener(self):
+        asyncio.run_coroutine_threadsafe(self.servidor.cerrar(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.hilo.join()
+
+
+def iniciar_en_hilo(host="127.0.0.1", puerto=0, **opciones):
+    """Levanta el servidor en un hilo con su propio event loop (puerto=0 elige uno libre)."""
+    listo = threading.Event()
+    estado = {}
+
+    def correr():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        estado["loop"] = loop
+        estado["servidor"] = loop.run_until_complete(ServidorAPI(host, puerto, **opciones).iniciar())
+        listo.set()
+        loop.run_forever()
+        loop.close()
+
+    hilo = threading.Thread(target=correr, name="geosuite-api", daemon=True)
+    hilo.start()
+    listo.wait()
+    return _ServidorEnHilo(estado["servidor"], hilo, estado["loop"])
+
+
+class ClienteAPI:
+    """Cliente mínimo (http.client) para probar la API en la máquina local."""
+
+    def __init__(self, puerto, host="127.0.0.1", timeout=60):
+        self._conexion = http.client.HTTPConnection(host, puerto, timeout=timeout)
+
+    def _pedir(self, metodo, ruta, datos=None):
+        cuerpo = None if datos is None else json.dumps(datos).encode("utf-8")
+        self._conexion.request(metodo, ruta, body=cuerpo, headers={"Content-Type": "application/json"})
+        respuesta = self._conexion.getresponse()
+        return respuesta.status, json.loads(respuesta.read() or b"null")
+
+    def get(self, ruta):
+        return self._pedir("GET", ruta)
+
+    def post(self, ruta, datos):
+        return self._pedir("POST", ruta, datos)
+
+    def cerrar(self):
+        self._conexion.close()
+
+
+async def _servir(args):
+    servidor = await ServidorAPI(args.host, args.puerto, args.procesos, args.max_lote, args.espera_ms,
+                                 args.max_cola).iniciar()
+    print(f"GeoSuite API en http://{args.host}:{servidor.puerto} ({servidor.procesos} procesos)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servidor.cerrar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m geosuite.api", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8502)
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument("--max-lote", type=int, default=MAX_LOTE, help="Casos por micro-lote")
+    parser.add_argument("--espera-ms", type=float, default=ESPERA_MS, help="Espera máxima para juntar un micro-lote")
+    parser.add_argument("--max-cola", type=int, default=MAX_COLA, help="Casos en espera por tipo antes de 503")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_servir(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+# geosuite/cache.py
+"""
+Caché en memoria de resultados del núcleo de cálculo.
+
+Cada calculadora tiene su propia caché LRU con límite de entradas, límite de
+memoria (bytes estimados) y tiempo de vida (TTL). La clave es un hash canónico
+de los argumentos: dataclasses, arreglos de NumPy, DataFrames, números y
+contenedores se normalizan antes de calcular el hash, de modo que 10 y 10.0
+producen la misma clave.
+
+    @cacheado("bishop", max_entradas=256, max_bytes=32 * MB, ttl=3600)
+    def calculate_bishop_fs(entrada): ...
+
+    calculate_bishop_fs.sin_cache(entrada)   # llamada directa, sin caché
+    estadisticas()                           # aciertos/fallos por calculadora
+
+Con ``persistente=True`` los fallos en memoria se buscan también en el almacén
+en disco (``geosuite.almacen``), que sobrevive a reinicios y se comparte entre
+procesos. ``version`` forma parte de la clave en disco: se incrementa cuando
+cambia el cálculo para no leer resultados viejos.
+
+La variable de entorno GEOSUITE_CACHE=0 desactiva todas las cachés.
+"""
+import dataclasses
+import functools
+import hashlib
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from geosuite import diagnostico
+
+MB = 1024 * 1024
+
+MAX_ENTRADAS = 128
+MAX_BYTES = 64 * MB
+TTL = 3600.0 # segundos
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+_FALTA = object()
+
+
+def _canonico(valor):
+    """Representación canónica (tuplas de tipos básicos) de un argumento."""
+    if valor is None or isinstance(valor, (bool, str, bytes)):
+        return valor
+    if isinstance(valor, (int, float, np.integer, np.floating)):
+        valor = float(valor)
+        return "nan" if math.isnan(valor) else valor + 0.0 # -0.0 → 0.0
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return (type(valor).__qualname__,) + tuple(
+            (campo.name, _canonico(getattr(valor, campo.name))) for campo in dataclasses.fields(valor))
+    if isinstance(valor, np.ndarray):
+        if valor.dtype == object:
+            return ("nd-obj", valor.shape, tuple(_canonico(v) for v in valor.ravel()))
+        datos = np.ascontiguousarray(valor)
+        return ("nd", datos.dtype.str, datos.shape, hashlib.blake2b(datos.tobytes(), digest_size=16).hexdigest())
+    if hasattr(valor, "columns") and hasattr(valor, "to_numpy"): # DataFrame
+        return ("df",) + tuple((str(c), _canonico(np.asarray(valor[c]))) for c in valor.columns)
+    if isinstance(valor, dict):
+        return ("dict",) + tuple(sorted((str(k), _canonico(v)) for k, v in valor.items()))
+    if isinstance(valor, (list, tuple)):
+        return ("seq",) + tuple(_canonico(v) for v in valor)
+    raise TypeError(f"Tipo no soportado para la clave de caché: {type(valor).__name__}")
+
+
+def clave_canonica(*args, **kwargs):
+    """Hash canónico (hex) de los argumentos de una llamada."""
+    texto = repr((_canonico(args), _canonico(kwargs)))
+    return hashlib.blake2b(texto.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def tamano(valor):
+    """Estimación en bytes de la memoria ocupada por un resultado."""
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        return sum(tamano(getattr(valor, campo.name)) for campo in dataclasses.fields(valor))
+    if hasattr(valor, "memory_usage") and hasattr(valor, "columns"):
+        return int(valor.memory_usage(deep=True).sum())
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamano(v) for v in valor.values())
+    if isinstance(valor, (list, tuple)):
+        return sys.getsizeof(valor) + sum(tamano(v) for v in valor)
+    return sys.getsizeof(valor)
+
+
+def _solo_lectura(valor):
+    """Marca como de solo lectura los arreglos de un resultado compartido entre sesiones."""
+    if isinstance(valor, np.ndarray):
+        valor.flags.writeable = False
+    elif dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        for campo in dataclasses.fields(valor):
+            _solo_lectura(getattr(valor, campo.name))
+    elif isinstance(valor, dict):
+        for v in valor.values():
+            _solo_lectura(v)
+    elif isinstance(valor, (list, tuple)):
+        for v in valor:
+            _solo_lectura(v)
+    return valor
+
+
+def _copiar_tablas(valor):
+    """
+    El resultado con una copia de cada DataFrame: pandas no tiene tablas de solo
+    lectura, así que cada llamada recibe las suyas. Lo demás se comparte.
+    """
+    if hasattr(valor, "columns") and hasattr(valor, "copy"):
+        return valor.copy()
+    if dataclasses.is_dataclass(valor) and not isinstance(valor, type):
+        cambios = {}
+        for campo in dataclasses.fields(valor):
+            original = getattr(valor, campo.name)
+            copia = _copiar_tablas(original)
+            if copia is not original:
+                cambios[campo.name] = copia
+        return dataclasses.replace(valor, **cambios) if cambios else valor
+    if isinstance(valor, dict):
+        copia = {k: _copiar_tablas(v) for k, v in valor.items()}
+        return copia if any(copia[k] is not v for k, v in valor.items()) else valor
+    if isinstance(valor, (list, tuple)):
+        copia = [_copiar_tablas(v) for v in valor]
+        if any(c is not v for c, v in zip(copia, valor)):
+            return tuple(copia) if isinstance(valor, tuple) else copia
+    return valor
+
+
+class CacheLRU:
+    """Caché LRU con límite de entradas, de memoria y TTL. Segura entre hilos."""
+
+    def __init__(self, nombre, max_entradas=MAX_ENTRADAS, max_bytes=MAX_BYTES, ttl=TTL):
+        self.nombre = nombre
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._datos = OrderedDict() # clave -> (valor, bytes, instante)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = self.fallos = self.desalojos = self.expirados = 0
+
+    def __len__(self):
+        return len(self._datos)
+
+    def obtener(self, clave, defecto=None):
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self.fallos += 1
+                return defecto
+            valor, _, instante = entrada
+            if self.ttl is not None and time.monotonic() - instante > self.ttl:
+                self._quitar(clave)
+                self.expirados += 1
+                self.fallos += 1
+                return defecto
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave, valor):
+        n_bytes = tamano(valor)
+        if n_bytes > self.max_bytes:
+            return False
+        with self._lock:
+            if clave in self._datos:
+                self._quitar(clave)
+            self._datos[clave] = (valor, n_bytes, time.monotonic())
+            self._bytes += n_bytes
+            while self._datos and (len(self._datos) > self.max_entradas or self._bytes > self.max_bytes):
+                self._quitar(next(iter(self._datos)))
+                self.desalojos += 1
+        return True
+
+    def _quitar(self, clave):
+        _, n_bytes, _ = self._datos.pop(clave)
+        self._bytes -= n_bytes
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self._bytes = 0
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._datos),
+            "bytes": self._bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "expirados": self.expirados,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+        }
+
+
+def obtener_cache(nombre, max_entradas=MAX_ENTRADAS, max_bytes=MAX_BYTES, ttl=TTL):
+    """Devuelve (creándola si no existe) la caché registrada con `nombre`."""
+    with _CACHES_LOCK:
+        if nombre not in _CACHES:
+            _CACHES[nombre] = CacheLRU(nombre, max_entradas, max_bytes, ttl)
+        return _CACHES[nombre]
+
+
+def configurar(nombre, **limites):
+    """Cambia max_entradas, max_bytes o ttl de una caché registrada."""
+    cache = obtener_cache(nombre)
+    for atributo, valor in limites.items():
+        if atributo not in ("max_entradas", "max_bytes", "ttl"):
+            raise ValueError(f"Límite desconocido: {atributo}")
+        setattr(cache, atributo, valor)
+    return cache
+
+
+def habilitado():
+    return os.environ.get("GEOSUITE_CACHE", "1") != "0"
+
+
+def _almacen():
+    """Almacén en disco, o None si está desactivado o no se puede abrir."""
+    from geosuite import almacen
+
+    if not almacen.habilitado():
+        return None
+    try:
+        return almacen.obtener_almacen()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def cacheado(nombre, max_entradas=MAX_ENTRADAS, max_bytes=MAX_BYTES, ttl=TTL, persistente=False, version=1):
+    """
+    Decorador que memoriza los resultados de una calculadora por el hash canónico
+    de sus argumentos. Los arreglos del resultado quedan en solo lectura porque el
+    mismo objeto se comparte entre sesiones; las tablas (DataFrame) se entregan
+    copiadas. Las excepciones no se guardan.
+    """
+    def decorador(funcion):
+        cache = obtener_cache(nombre, max_entradas, max_bytes, ttl)
+        espacio = f"{nombre}/v{version}"
+
+        def de_disco(clave):
+            disco = _almacen() if persistente else None
+            if disco is None:
+                return _FALTA
+            try:
+                return disco.obtener(espacio, clave, _FALTA)
+            except Exception: # una entrada ilegible es un fallo, nunca un error del cálculo
+                return _FALTA
+
+        def a_disco(clave, resultado):
+            disco = _almacen() if persistente else None
+            if disco is not None:
+                try:
+                    disco.guardar(espacio, clave, resultado)
+                except (OSError, sqlite3.Error):
+                    pass # el disco es una optimización: un fallo no debe romper el cálculo
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not habilitado():
+                return funcion(*args, **kwargs)
+            try:
+                clave = clave_canonica(*args, **kwargs)
+            except TypeError:
+                return funcion(*args, **kwargs)
+            resultado = cache.obtener(clave, _FALTA)
+            if resultado is not _FALTA:
+                diagnostico.contar(f"cache.{nombre}.aciertos")
+                return _copiar_tablas(resultado)
+            diagnostico.contar(f"cache.{nombre}.fallos")
+            resultado = de_disco(clave)
+            if resultado is _FALTA:
+                with diagnostico.etapa(f"calculo.{nombre}"):
+                    resultado = _solo_lectura(funcion(*args, **kwargs))
+                a_disco(clave, resultado)
+            else:
+                diagnostico.contar(f"almacen.{nombre}.aciertos")
+            cache.guardar(clave, resultado)
+            return _copiar_tablas(resultado)
+
+        envoltura.sin_cache = funcion
+        envoltura.cache = cache
+        return envoltura
+
+    return decorador
+
+
+def estadisticas():
+    """Estadísticas de aciertos/fallos y memoria de todas las cachés registradas."""
+    with _CACHES_LOCK:
+        return {nombre: cache.estadisticas() for nombre, cache in _CACHES.items()}
+
+
+def limpiar(nombre=None):
+    """Vacía una caché o todas."""
+    with _CACHES_LOCK:
+        caches = [_CACHES[nombre]] if nombre is not None else list(_CACHES.values())
+    for cache in caches:
+        cache.limpiar()
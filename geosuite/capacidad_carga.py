@@ -0,0 +1,84 @@
+# geosuite/capacidad_carga.py
+"""Capacidad de carga de zapatas cuadradas por el método de Terzaghi."""
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+# Valores de Nγ según φ (0° a 50°), calculados por De Kumbhojkar 1993 (para zapata cuadrada)
+NY_KUMBHOJKAR = np.array([
+    0.0, 0.01, 0.04, 0.06, 0.10, 0.14, 0.20, 0.27, 0.35, 0.44,
+    0.56, 0.69, 0.85, 1.04, 1.26, 1.52, 1.82, 2.18, 2.59, 3.07,
+    3.64, 4.31, 5.09, 6.00, 7.08, 8.43, 9.84, 11.60, 13.70, 16.18,
+    19.13, 22.65, 26.87, 31.94, 38.04, 45.41, 54.36, 65.27, 78.61, 95.03,
+    115.31, 140.51, 171.99, 211.56, 261.60, 325.34, 407.11, 512.84, 650.67, 831.99,
+    1072.80,
+])
+PHI_NY = np.arange(len(NY_KUMBHOJKAR), dtype=float)
+
+NC_PHI_CERO = 5.7 # Nc ≈ 5.7 para φ = 0
+FS_DEFECTO = 3.0
+
+# Unidades de los campos de entrada (ver geosuite.unidades)
+UNIDADES = {"B": "m", "L": "m", "Df": "m", "gamma": "kN/m³", "c": "kPa"}
+
+
+@dataclass(frozen=True)
+class EntradaTerzaghi:
+    """Datos de una zapata cuadrada: B, L, Df en m; γ en kN/m³; c en kPa; φ en grados."""
+    B: float
+    L: float
+    Df: float
+    gamma: float
+    c: float
+    phi: float
+    FS: float = FS_DEFECTO
+
+
+@dataclass(frozen=True)
+class ResultadoTerzaghi:
+    """Factores de capacidad de carga y capacidades última y admisible (kPa)."""
+    Nc: float
+    Nq: float
+    Ny: float
+    q: float
+    qu: float
+    qadm: float
+
+
+def factores_terzaghi(phi):
+    """
+    Factores de capacidad de carga de Terzaghi (Nc, Nq, Nγ) para φ en grados.
+
+    Acepta escalares o arreglos; Nγ se interpola linealmente en la tabla de Kumbhojkar.
+    """
+    phi = np.asarray(phi, dtype=float)
+    phi_rad = np.radians(phi)
+
+    Nq = np.exp(2*(3*np.pi/4-phi_rad/2)*np.tan(phi_rad))/(2*np.cos(np.pi/4+phi_rad/2)**2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Nc = np.where(phi != 0, (Nq - 1) / np.tan(phi_rad), NC_PHI_CERO)
+    Ny = np.interp(phi, PHI_NY, NY_KUMBHOJKAR)
+    return Nc, Nq, Ny
+
+
+def capacidad_carga_lote(B, Df, gamma, c, phi, FS=FS_DEFECTO):
+    """
+    Capacidad de carga de Terzaghi para muchos casos a la vez (arreglos que se difunden entre sí).
+
+    Returns:
+        dict: 'Nc', 'Nq', 'Ny', 'q', 'qu', 'qadm' como arreglos.
+    """
+    B, Df, gamma, c = (np.asarray(v, dtype=float) for v in (B, Df, gamma, c))
+    Nc, Nq, Ny = factores_terzaghi(phi)
+    q = gamma * Df
+    qu = c * Nc + q * Nq + 0.4 * gamma * B * Ny  # factor 0.4 para zapata cuadrada
+    return {'Nc': Nc, 'Nq': Nq, 'Ny': Ny, 'q': q, 'qu': qu, 'qadm': qu / FS}
+
+
+@cacheado("terzaghi", max_entradas=1024, max_bytes=4 * MB)
+def capacidad_carga_terzaghi(entrada: EntradaTerzaghi) -> ResultadoTerzaghi:
+    """Capacidad de carga última y admisible de una zapata cuadrada (drenada, sin factores de forma)."""
+    r = capacidad_carga_lote(entrada.B, entrada.Df, entrada.gamma, entrada.c, entrada.phi, entrada.FS)
+    return ResultadoTerzaghi(**{k: float(v) for k, v in r.items()})
@@ -0,0 +1,242 @@
+# geosuite/diagnostico.py
+"""
+Modo de diagnóstico: tiempos por etapa, contadores del solver y perfiles.
+
+Está apagado por defecto y, apagado, cada punto de medición cuesta una
+comparación. Se enciende para todo el proceso con GEOSUITE_DIAGNOSTICO=1, o
+solo para una corrida (un rerun de una sesión) con ``corrida(..., forzar=True)``.
+
+    with corrida("Slope Bishop") as traza:
+        with etapa("bishop.entradas"):
+            ...
+        contar("bishop.iteraciones", 4)
+    traza.etapas        # [(nombre, segundos), ...] de esta corrida
+    traza.contadores    # {"bishop.iteraciones": 4, ...}
+
+Los tiempos también se acumulan por proceso y se exportan en formato de texto
+de Prometheus (``metricas_prometheus``, ``servir_metricas``). Con
+GEOSUITE_DIAGNOSTICO_LOG=<ruta> cada corrida se agrega como una línea JSON.
+"""
+import io
+import json
+import marshal
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+_activo_global = os.environ.get("GEOSUITE_DIAGNOSTICO", "0") == "1"
+_local = threading.local()
+_lock = threading.Lock()
+_tiempos = {} # nombre -> [llamadas, segundos totales, segundos máximo]
+_contadores = defaultdict(float)
+
+
+class Traza:
+    """Etapas y contadores registrados durante una corrida."""
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.inicio = time.time()
+        self.total = 0.0
+        self.etapas = []
+        self.contadores = defaultdict(float)
+        self.perfil = None
+
+
+class Perfil:
+    """Resultado de perfilar un bloque: estadísticas de cProfile y asignaciones de tracemalloc."""
+
+    def __init__(self, perfilador, instantanea, n_lineas=40):
+        import pstats
+
+        perfilador.create_stats()
+        self.pstats = marshal.dumps(perfilador.stats) # formato de ``pstats``/snakeviz (.prof)
+        texto = io.StringIO()
+        pstats.Stats(perfilador, stream=texto).sort_stats("cumulative").print_stats(n_lineas)
+        self.resumen = texto.getvalue()
+        lineas = [str(estadistica) for estadistica in instantanea.statistics("lineno")[:n_lineas]]
+        self.memoria = "\n".join(lineas)
+
+
+def activo():
+    return _activo_global or getattr(_local, "forzado", False)
+
+
+def activar(valor=True):
+    """Enciende o apaga el diagnóstico para todo el proceso."""
+    global _activo_global
+    _activo_global = bool(valor)
+
+
+def registrar(nombre, segundos):
+    """Agrega la duración de una etapa a los acumulados y a la traza de la corrida actual."""
+    with _lock:
+        acumulado = _tiempos.get(nombre)
+        if acumulado is None:
+            _tiempos[nombre] = [1, segundos, segundos]
+        else:
+            acumulado[0] += 1
+            acumulado[1] += segundos
+            acumulado[2] = max(acumulado[2], segundos)
+    traza = getattr(_local, "traza", None)
+    if traza is not None:
+        traza.etapas.append((nombre, segundos))
+
+
+@contextmanager
+def etapa(nombre):
+    """Mide el tiempo de pared del bloque si el diagnóstico está activo."""
+    if not activo():
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(nombre, time.perf_counter() - inicio)
+
+
+def contar(nombre, n=1):
+    """Suma `n` a un contador del solver (iteraciones, círculos, aciertos de caché...)."""
+    if not activo():
+        return
+    with _lock:
+        _contadores[nombre] += n
+    traza = getattr(_local, "traza", None)
+    if traza is not None:
+        traza.contadores[nombre] += n
+
+
+@contextmanager
+def perfilar(n_lineas=40):
+    """Perfila el bloque con cProfile y tracemalloc; el Perfil se llena al salir."""
+    import cProfile
+    import tracemalloc
+
+    perfilador = cProfile.Profile()
+    ya_trazaba = tracemalloc.is_tracing()
+    if not ya_trazaba:
+        tracemalloc.start()
+    resultado = {}
+    perfilador.enable()
+    try:
+        yield resultado
+    finally:
+        perfilador.disable()
+        instantanea = tracemalloc.take_snapshot()
+        if not ya_trazaba:
+            tracemalloc.stop()
+        resultado["perfil"] = Perfil(perfilador, instantanea, n_lineas)
+
+
+@contextmanager
+def corrida(nombre, forzar=False, perfil=False):
+    """
+    Registra una corrida completa (un rerun de página). Con `forzar` el diagnóstico
+    se activa solo en este hilo; con `perfil` además se perfila la corrida.
+    """
+    forzado_previo = getattr(_local, "forzado", False)
+    _local.forzado = forzado_previo or forzar
+    if not activo():
+        _local.forzado = forzado_previo
+        yield None
+        return
+
+    traza = Traza(nombre)
+    _local.traza = traza
+    inicio = time.perf_counter()
+    try:
+        if perfil:
+            with perfilar() as resultado:
+                yield traza
+            traza.perfil = resultado["perfil"]
+        else:
+            yield traza
+    finally:
+        traza.total = time.perf_counter() - inicio
+        registrar(f"corrida.{nombre}", traza.total)
+        _local.traza = None
+        _local.forzado = forzado_previo
+        _escribir_log(traza)
+
+
+def _escribir_log(traza):
+    ruta = os.environ.get("GEOSUITE_DIAGNOSTICO_LOG")
+    if not ruta:
+        return
+    registro = {
+        "instante": traza.inicio, "corrida": traza.nombre, "total_s": traza.total,
+        "etapas": traza.etapas, "contadores": dict(traza.contadores),
+    }
+    with _lock, open(ruta, "a", encoding="utf-8") as archivo:
+        archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+def resumen():
+    """Acumulados del proceso: {'tiempos': {nombre: {...}}, 'contadores': {...}}."""
+    with _lock:
+        tiempos = {nombre: {"llamadas": n, "total_s": total, "max_s": maximo, "media_s": total / n}
+                   for nombre, (n, total, maximo) in _tiempos.items()}
+        return {"tiempos": tiempos, "contadores": dict(_contadores)}
+
+
+def reiniciar():
+    with _lock:
+        _tiempos.clear()
+        _contadores.clear()
+
+
+def _etiqueta(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def metricas_prometheus():
+    """Acumulados de tiempos, contadores y cachés en formato de texto de Prometheus."""
+    from geosuite import cache
+
+    datos = resumen()
+    lineas = [
+        "# HELP geosuite_etapa_segundos Tiempo de pared por etapa o corrida.",
+        "# TYPE geosuite_etapa_segundos summary",
+    ]
+    for nombre, t in sorted(datos["tiempos"].items()):
+        lineas.append(f'geosuite_etapa_segundos_count{{etapa="{_etiqueta(nombre)}"}} {t["llamadas"]}')
+        lineas.append(f'geosuite_etapa_segundos_sum{{etapa="{_etiqueta(nombre)}"}} {t["total_s"]:.6f}')
+    lineas += ["# HELP geosuite_etapa_segundos_max Duración máxima por etapa.",
+               "# TYPE geosuite_etapa_segundos_max gauge"]
+    for nombre, t in sorted(datos["tiempos"].items()):
+        lineas.append(f'geosuite_etapa_segundos_max{{etapa="{_etiqueta(nombre)}"}} {t["max_s"]:.6f}')
+    lineas += ["# HELP geosuite_contador_total Contadores del solver.", "# TYPE geosuite_contador_total counter"]
+    for nombre, valor in sorted(datos["contadores"].items()):
+        lineas.append(f'geosuite_contador_total{{nombre="{_etiqueta(nombre)}"}} {valor:g}')
+    lineas += ["# HELP geosuite_cache Estado de las cachés en memoria.", "# TYPE geosuite_cache gauge"]
+    for nombre, e in sorted(cache.estadisticas().items()):
+        for campo in ("entradas", "bytes", "aciertos", "fallos", "desalojos", "expirados"):
+            lineas.append(f'geosuite_cache{{cache="{_etiqueta(nombre)}",campo="{campo}"}} {e[campo]}')
+    return "\n".join(lineas) + "\n"
+
+
+def servir_metricas(puerto, host="127.0.0.1"):
+    """Sirve ``/metrics`` en un hilo en segundo plano. Devuelve el servidor (``.shutdown()`` lo detiene)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Manejador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            cuerpo = metricas_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((host, puerto), Manejador)
+    threading.Thread(target=servidor.serve_forever, name="geosuite-metricas", daemon=True).start()
+    return servidor
@@ -0,0 +1,77 @@
+# geosuite/ensayo_triaxial.py
+"""Envolvente de falla de Mohr-Coulomb a partir de ensayos triaxiales."""
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+from geosuite.grafo import Grafo
+
+# Unidades de los campos de entrada (ver geosuite.unidades)
+UNIDADES = {"sigma3": "kPa", "sigma1": "kPa"}
+
+
+@dataclass(frozen=True)
+class EntradaTriaxial:
+    """Esfuerzos principales de falla por probeta: σ₃ (confinamiento) y σ₁ = σ₃ + desviador, en kPa."""
+    sigma3: tuple
+    sigma1: tuple
+
+
+@dataclass(frozen=True)
+class ResultadoTriaxial:
+    """Cohesión (kPa), ángulo de fricción y puntos (s, t) usados en el ajuste."""
+    c: float
+    phi_deg: float
+    phi_rad: float
+    sigma_mean: np.ndarray
+    tau_max: np.ndarray
+
+
+@cacheado("mohr_coulomb", max_entradas=512, max_bytes=4 * MB)
+def ajuste_mohr_coulomb(entrada: EntradaTriaxial) -> ResultadoTriaxial:
+    """
+    Transforma a círculo de Mohr y obtiene c/φ mediante regresión lineal en el espacio s-t.
+
+    Raises:
+        ValueError: Si hay menos de dos probetas o las longitudes no coinciden.
+    """
+    s3 = np.asarray(entrada.sigma3, dtype=float)
+    s1 = np.asarray(entrada.sigma1, dtype=float)
+    if s3.shape != s1.shape or s3.size < 2:
+        raise ValueError("Se requieren al menos dos probetas con σ₃ y σ₁.")
+
+    sigma_mean = (s1 + s3) / 2
+    tau_max = (s1 - s3) / 2
+
+    # Regresión lineal en el espacio st: t = c·cos(φ) + s·sin(φ)
+    m, b = np.polyfit(sigma_mean, tau_max, 1) #m=sin(fi), b=c*cos(fi)
+    phi_rad = np.arcsin(m)
+    c = b / np.cos(phi_rad)
+    return ResultadoTriaxial(c=float(c), phi_deg=float(np.degrees(phi_rad)), phi_rad=float(phi_rad),
+                             sigma_mean=sigma_mean, tau_max=tau_max)
+
+
+def circulos_mohr(sigma1, sigma3, n_puntos=200):
+    """
+    Coordenadas de los círculos de Mohr de cada probeta.
+
+    Returns:
+        tuple: (x, y) de forma (n_probetas, n_puntos).
+    """
+    s1 = np.asarray(sigma1, dtype=float)[:, None]
+    s3 = np.asarray(sigma3, dtype=float)[:, None]
+    center = (s1 + s3) / 2
+    radius = (s1 - s3) / 2
+    theta = np.linspace(0, 2 * np.pi, n_puntos)
+    return center + radius * np.cos(theta), radius * np.sin(theta)
+
+
+# Ajuste → figura: la página agrega el nodo de la figura, que se reusa mientras
+# no cambien los esfuerzos de las probetas.
+grafo_triaxial = Grafo("triaxial")
+
+
+@grafo_triaxial.nodo("ajuste", campos=("sigma3", "sigma1"))
+def _nodo_ajuste(entrada):
+    return ajuste_mohr_coulomb.sin_cache(entrada)
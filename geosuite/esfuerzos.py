@@ -0,0 +1,263 @@
+# geosuite/esfuerzos.py
+"""
+Incremento de esfuerzo vertical Δσz (Boussinesq, semiespacio elástico) bajo
+cargas uniformes y distribuidas en la superficie.
+
+Todas las funciones reciben las coordenadas de los puntos de cálculo como
+arreglos que se difunden entre sí (x, y en planta y z hacia abajo, en m, con
+z = 0 en el nivel de la carga) y devuelven Δσz con la forma difundida, sin
+ciclos de Python por punto:
+
+    esfuerzo_franja(q, B, x, z)                          # franja infinita de ancho B (deformación plana)
+    esfuerzo_terraplen(gamma, H, corona, talud, x, z)    # terraplén trapecial
+    esfuerzo_carga_lineal(xs, ps, x, z)                  # cualquier carga lineal por tramos p(x)
+    esfuerzo_circular(q, R, x, y, z)                     # tanques y losas circulares
+    esfuerzo_poligono(q, vertices, x, y, z)              # losas de cualquier forma
+    esfuerzo_poligono_malla(q, vertices, x, y, z)        # matriz puntos × profundidades
+    esfuerzo_poligono_rectangulos(q, vertices, x, y, z)  # verificación por subdivisión
+
+Polígonos: la carga uniforme sobre el polígono se integra en coordenadas
+polares alrededor de la proyección del punto, así que el polígono es la suma
+con signo de los triángulos (punto, arista). Cada triángulo tiene forma
+cerrada en función del ángulo φ medido desde la perpendicular a la arista
+(h: distancia del punto a la recta de la arista, A² = h² + z²):
+
+    Δσz = q/2π · Σ signo · [φ − asin(z·senφ/A) + z·h²·senφ / (A²·√(A² − z²·sen²φ))] de φ1 a φ2
+
+Se evalúan todas las aristas contra todos los puntos a la vez, por bloques para
+acotar la memoria; la suma de los φ2 − φ1 y los senφ dependen solo de la
+planta y se calculan una vez por punto y arista. La subdivisión en rectángulos (fórmula de Newmark para la
+esquina de un rectángulo y superposición) sirve para verificar el resultado.
+
+Cargas lineales por tramos (franjas y terraplenes): la solución de Flamant para
+una carga lineal se integra en forma cerrada sobre cada tramo lineal de p(x).
+"""
+import numpy as np
+
+N_LADOS_CIRCULO = 256 # lados del polígono de igual área para el círculo fuera del eje
+BLOQUE = 2_000_000 # elementos punto × arista por bloque
+
+
+def _difundir(*valores):
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in valores))
+
+
+# --- Cargas en franja (deformación plana) ------------------------------------
+
+def esfuerzo_carga_lineal(xs, ps, x, z):
+    """
+    Δσz bajo una carga en franja infinita con intensidad p(x) lineal por tramos:
+    vale ps[i] en xs[i] (xs creciente; dos vértices con la misma x forman un
+    escalón) y cero fuera de [xs[0], xs[-1]].
+    """
+    xs, ps = np.asarray(xs, dtype=float), np.asarray(ps, dtype=float)
+    if xs.ndim != 1 or xs.shape != ps.shape or xs.size < 2 or np.any(np.diff(xs) < 0):
+        raise ValueError("La carga necesita al menos dos vértices con x creciente.")
+    x, z = _difundir(x, z)
+    forma = x.shape
+    x, z = x.reshape(-1, 1), z.reshape(-1, 1)
+    a, b, pa, pb = xs[:-1], xs[1:], ps[:-1], ps[1:]
+    ancho = b - a
+    tramo = ancho > 0
+    k = np.where(tramo, (pb - pa) / np.where(tramo, ancho, 1.0), 0.0) # pendiente de p en cada tramo
+    c0 = pa + k * (x - a) # p del tramo prolongada hasta la abscisa del punto
+
+    def primitivas(u):
+        r2 = u**2 + z**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            j0 = 0.5 * (np.where(r2 > 0, z * u / r2, 0.0) + np.arctan2(u, z))
+            j1 = np.where(r2 > 0, -z**3 / (2 * r2), 0.0)
+        return j0, j1
+
+    j0a, j1a = primitivas(a - x)
+    j0b, j1b = primitivas(b - x)
+    tramos = c0 * (j0b - j0a) + k * (j1b - j1a)
+    return (2 / np.pi * np.where(tramo, tramos, 0.0).sum(axis=1)).reshape(forma)
+
+
+def esfuerzo_franja(q, B, x, z):
+    """Δσz bajo una franja infinita de ancho B con carga uniforme q; x desde el eje de la franja."""
+    if B <= 0:
+        raise ValueError("El ancho de la franja debe ser positivo.")
+    return esfuerzo_carga_lineal((-B / 2, B / 2), (q, q), x, z)
+
+
+def perfil_terraplen(gamma, H, corona, talud, x0=0.0):
+    """
+    Vértices (xs, ps) de la carga de un terraplén simétrico con eje en x0: altura
+    H (m), peso volumétrico γ (kN/m³), corona de ancho `corona` (m) y taludes
+    `talud`:1 (horizontal:vertical).
+    """
+    if H <= 0 or corona < 0 or talud < 0:
+        raise ValueError("La altura debe ser positiva y la corona y el talud no negativos.")
+    b, s = corona / 2, talud * H
+    return (np.array([x0 - b - s, x0 - b, x0 + b, x0 + b + s]), np.array([0.0, gamma * H, gamma * H, 0.0]))
+
+
+def esfuerzo_terraplen(gamma, H, corona, talud, x, z, x0=0.0):
+    """Δσz bajo un terraplén trapecial (ver `perfil_terraplen`)."""
+    return esfuerzo_carga_lineal(*perfil_terraplen(gamma, H, corona, talud, x0), x, z)
+
+
+# --- Cargas en planta --------------------------------------------------------
+
+def _aristas(vertices):
+    """Vértices (n, 2) en sentido antihorario, sin repetir el primero al final."""
+    v = np.asarray(vertices, dtype=float)
+    if v.ndim != 2 or v.shape[1] != 2 or len(v) < 3:
+        raise ValueError("El polígono necesita al menos tres vértices (x, y).")
+    if np.allclose(v[0], v[-1]):
+        v = v[:-1]
+    area = 0.5 * np.sum(v[:, 0] * np.roll(v[:, 1], -1) - np.roll(v[:, 0], -1) * v[:, 1])
+    if abs(area) <= 0:
+        raise ValueError("El polígono no tiene área.")
+    return v if area > 0 else v[::-1]
+
+
+def _geometria(px, py, v):
+    """
+    Términos en planta de los triángulos (punto, arista) para puntos (m, 1) y
+    las aristas del polígono: h² (con 1 donde el punto cae sobre la recta de la
+    arista, que no aporta), senφ en los extremos, el signo de cada triángulo y
+    Σ signo·(φ2 − φ1), que no depende de z.
+    """
+    x1, y1 = v[:, 0], v[:, 1]
+    dx, dy = np.roll(x1, -1) - x1, np.roll(y1, -1) - y1
+    largo = np.hypot(dx, dy)
+    ux, uy = dx / largo, dy / largo
+    # distancia con signo del punto a la recta de la arista (< 0 si el punto queda a la izquierda)
+    h = (px - x1) * uy - (py - y1) * ux
+    t1 = (x1 - px) * ux + (y1 - py) * uy
+    t2 = t1 + largo
+    signo = -np.sign(h)
+    h = np.abs(h)
+    r1, r2 = np.hypot(t1, h), np.hypot(t2, h)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s1, s2 = np.where(r1 > 0, t1 / r1, 0.0), np.where(r2 > 0, t2 / r2, 0.0)
+    angulo = (signo * (np.arctan2(t2, h) - np.arctan2(t1, h))).sum(axis=1, keepdims=True)
+    return np.where(signo != 0, h * h, 1.0), s1, s2, signo, angulo
+
+
+def _suma_aristas(h2, s1, s2, signo, angulo, z):
+    """Σ de los triángulos para h2, s1, s2, signo (m, 1, n), angulo (m, 1) y z (m o 1, k, 1) -> (m, k)."""
+    z2 = z * z
+    A2 = h2 + z2
+
+    def primitiva(s):
+        # φ − asin(z·senφ/A) + z·h²·senφ / (A²·√(A² − z²·sen²φ)), sin el φ que va en `angulo`;
+        # asin(z·senφ/A) = atan2(z·senφ, √(A² − z²·sen²φ)) reutiliza la raíz
+        zs = z * s
+        resto = np.sqrt(A2 - zs * s * z)
+        return zs * h2 / (A2 * resto) - np.arctan2(zs, resto)
+
+    return angulo + (signo * (primitiva(s2) - primitiva(s1))).sum(axis=2)
+
+
+def esfuerzo_poligono(q, vertices, x, y, z):
+    """
+    Δσz bajo un polígono simple (convexo o no) con carga uniforme q, en forma
+    cerrada por aristas. Dentro del polígono y con z → 0 tiende a q; en el borde, a q/2.
+    """
+    v = _aristas(vertices)
+    x, y, z = _difundir(x, y, z)
+    forma = x.shape
+    x, y, z = (c.reshape(-1, 1) for c in (x, y, z))
+    salida = np.empty(x.shape[0])
+    paso = max(1, BLOQUE // len(v))
+    for i in range(0, x.shape[0], paso):
+        t = slice(i, i + paso)
+        h2, s1, s2, signo, angulo = _geometria(x[t], y[t], v)
+        salida[t] = _suma_aristas(h2[:, None], s1[:, None], s2[:, None], signo[:, None], angulo, z[t, None])[:, 0]
+    return _acotar(q / (2 * np.pi) * salida, q).reshape(forma)
+
+
+def esfuerzo_poligono_malla(q, vertices, x, y, z):
+    """
+    Δσz bajo un polígono en la malla puntos × profundidades: (len(x), len(z)).
+
+    Igual que ``esfuerzo_poligono(q, vertices, x[:, None], y[:, None], z[None, :])``,
+    pero los términos en planta se calculan una sola vez por punto y arista.
+    """
+    v = _aristas(vertices)
+    x, y = (np.asarray(c, dtype=float).reshape(-1, 1) for c in (x, y))
+    z = np.asarray(z, dtype=float).reshape(1, -1, 1)
+    salida = np.empty((x.shape[0], z.shape[1]))
+    paso = max(1, BLOQUE // (len(v) * z.shape[1]))
+    for i in range(0, x.shape[0], paso):
+        t = slice(i, i + paso)
+        h2, s1, s2, signo, angulo = _geometria(x[t], y[t], v)
+        salida[t] = _suma_aristas(h2[:, None], s1[:, None], s2[:, None], signo[:, None], angulo, z)
+    return _acotar(q / (2 * np.pi) * salida, q)
+
+
+def _acotar(sigma, q):
+    # el redondeo cerca de z = 0 puede dejar el resultado apenas fuera de [0, q]
+    return np.clip(sigma, min(0.0, q), max(0.0, q))
+
+
+def _esquina(a, b, z):
+    """Δσz/q bajo la esquina de un rectángulo a × b (con signo en a y b), Newmark."""
+    m, n = np.abs(a), np.abs(b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m, n = m / z, n / z
+        s = m**2 + n**2 + 1
+        r = np.sqrt(s)
+        termino = 2 * m * n * r / (s + m**2 * n**2) * (s + 1) / s
+        angulo = np.arctan2(2 * m * n * r, s - m**2 * n**2)
+        valor = (termino + angulo) / (4 * np.pi)
+    valor = np.where(z > 0, valor, 0.25) # en la superficie, el cuadrante completo
+    return np.sign(a) * np.sign(b) * np.nan_to_num(valor)
+
+
+def esfuerzo_rectangulo(q, x1, y1, x2, y2, x, y, z):
+    """Δσz bajo el rectángulo [x1, x2] × [y1, y2] con carga q, por superposición de esquinas."""
+    return q * (_esquina(x2 - x, y2 - y, z) - _esquina(x1 - x, y2 - y, z)
+                - _esquina(x2 - x, y1 - y, z) + _esquina(x1 - x, y1 - y, z))
+
+
+def esfuerzo_poligono_rectangulos(q, vertices, x, y, z, n=64):
+    """
+    Verificación de `esfuerzo_poligono`: el rectángulo circunscrito se divide en
+    n × n celdas y se suman las celdas con centro dentro del polígono. El error
+    viene solo de la discretización del borde.
+    """
+    from geosuite.exploracion import puntos_en_poligono
+
+    v = _aristas(vertices)
+    bordes_x = np.linspace(v[:, 0].min(), v[:, 0].max(), n + 1)
+    bordes_y = np.linspace(v[:, 1].min(), v[:, 1].max(), n + 1)
+    cx, cy = np.meshgrid((bordes_x[:-1] + bordes_x[1:]) / 2, (bordes_y[:-1] + bordes_y[1:]) / 2, indexing="ij")
+    i, j = np.nonzero(puntos_en_poligono(cx, cy, v))
+    x, y, z = _difundir(x, y, z)
+    forma = x.shape
+    x, y, z = (c.reshape(-1, 1) for c in (x, y, z))
+    salida = np.zeros(x.shape[0])
+    paso = max(1, BLOQUE // max(i.size, 1))
+    for k in range(0, x.shape[0], paso):
+        t = slice(k, k + paso)
+        salida[t] = esfuerzo_rectangulo(q, bordes_x[i], bordes_y[j], bordes_x[i + 1], bordes_y[j + 1],
+                                        x[t], y[t], z[t]).sum(axis=1)
+    return salida.reshape(forma)
+
+
+def poligono_circulo(R, xc=0.0, yc=0.0, lados=N_LADOS_CIRCULO):
+    """Polígono regular de `lados` lados con la misma área que el círculo de radio R."""
+    radio = R * np.sqrt(2 * np.pi / (lados * np.sin(2 * np.pi / lados)))
+    angulos = 2 * np.pi * np.arange(lados) / lados
+    return np.column_stack([xc + radio * np.cos(angulos), yc + radio * np.sin(angulos)])
+
+
+def esfuerzo_circular(q, R, x, y, z, xc=0.0, yc=0.0):
+    """
+    Δσz bajo un círculo de radio R con carga uniforme q. Sobre el eje se usa la
+    solución exacta q·[1 − (1 + (R/z)²)^(-3/2)]; fuera de él, el polígono de
+    igual área de `poligono_circulo` (la solución exacta requiere integrales elípticas).
+    """
+    if R <= 0:
+        raise ValueError("El radio debe ser positivo.")
+    x, y, z = _difundir(x, y, z)
+    sigma = esfuerzo_poligono(q, poligono_circulo(R, xc, yc), x, y, z)
+    eje = np.hypot(x - xc, y - yc) < 1e-9 * R
+    with np.errstate(divide="ignore"):
+        exacto = q * (1 - (1 + (R / z)**2) ** -1.5)
+    return np.where(eje, np.where(z > 0, exacto, q), sigma)
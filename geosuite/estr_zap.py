@@ -0,0 +1,517 @@
+# geosuite/estr_zap.py
+"""Diseño estructural de zapatas aisladas (ACI 318-19) con momento biaxial."""
+from dataclasses import dataclass
+import math
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+from geosuite.unidades import convertir, convertir_tabla, en_sistema, normalizar_unidades
+
+# ACI 318-19 load factors
+PHI_FLEXION = 0.90
+PHI_CORTANTE = 0.75
+
+# --- PRESIÓN DE CONTACTO CON MOMENTO BIAXIAL ---
+#
+# Convención: B es la dimensión de la zapata en x y L en y (cm). El ancho de la
+# columna (b_col) es paralelo a B y el alto (h_col) paralelo a L.
+# My produce la excentricidad ex = My / P (en dirección de B) y Mx produce
+# ey = Mx / P (en dirección de L).
+#
+# La presión bajo la zapata se supone plana:  q(x, y) = a + b·x + c·y
+# Dentro del núcleo central (6·|ex|/B + 6·|ey|/L ≤ 1) toda la base está en
+# contacto. Fuera del núcleo el suelo no toma tensión, la zapata se levanta
+# parcialmente y (a, b, c) se resuelven con Newton imponiendo el equilibrio
+# solo sobre la zona comprimida. La base se discretiza en N_CELDAS x N_CELDAS.
+
+N_CELDAS = 16
+N_CELDAS_NEWTON = 64 # Malla más fina para ubicar el eje neutro cuando hay levantamiento
+FACTOR_SERVICIO = 1.4 # Pu / P de servicio (aproximado, igual que en el diseño original)
+PESO_ACERO = 7.85e-3 # kg/cm³
+LD_MIN = 30.0 # cm, ACI 318-19 25.4.2.1
+RECUBRIMIENTO = 7.5 # cm, recubrimiento libre por omisión en el optimizador
+DIAMETRO_VARILLA = 1.27 # cm, varilla #4
+AREA_VARILLA = 1.27 # cm², varilla #4
+
+# Unidades de los campos de entrada y del cuadro de columnas (ver geosuite.unidades).
+# Las ecuaciones del ACI (0.53√f'c, 1.06√f'c, ...) están escritas para estas unidades.
+UNIDADES = {
+    "Pu": "kg", "Mu": "kg·m", "Mux": "kg·m", "Muy": "kg·m", "fc": "kg/cm²", "fy": "kg/cm²", "q_adm": "kg/cm²",
+    "b_col": "cm", "h_col": "cm", "d_propuesto": "cm", "C_recubrimiento": "cm", "db": "cm",
+}
+
+# Precios por defecto para el optimizador
+PRECIO_CONCRETO = 3000.0 # $/m³
+PRECIO_ACERO = 25.0 # $/kg
+
+ECUACIONES_VC = ["1.06√f'c", "0.53(1+2/β)√f'c", "0.27(2+αs·d/bo)√f'c"]
+
+
+def presion_contacto_biaxial(P, Mx, My, B, L, n_celdas=N_CELDAS, max_iter=50, tol=1e-9):
+    """
+    Distribución de presiones bajo una zapata rígida con carga P y momentos Mx, My,
+    sin tensión en el contacto (levantamiento parcial).
+
+    Args:
+        P (array): Carga vertical en kg.
+        Mx, My (array): Momentos en kg-m (ey = Mx/P, ex = My/P).
+        B, L (array): Dimensiones de la zapata en cm.
+        n_celdas (int): Divisiones por lado de la base.
+
+    Todos los argumentos se difunden (broadcast) entre sí.
+
+    Returns:
+        dict: 'q' (..., n, n) en kg/cm² [eje -2 = y, eje -1 = x], 'q_max', 'q_min',
+        'fraccion_contacto', 'en_nucleo', 'estable', 'ex', 'ey'.
+    """
+    P, Mx, My, B, L = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (P, Mx, My, B, L)))
+    forma = P.shape
+    P, Mx, My, B, L = (v.reshape(-1) for v in (P, Mx, My, B, L))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ex = convertir(My, "kg·m", "kg·cm") / P
+        ey = convertir(Mx, "kg·m", "kg·cm") / P
+    estable = (P > 0) & (np.abs(ex) < B / 2) & (np.abs(ey) < L / 2)
+    ex = np.where(estable, ex, 0.0)
+    ey = np.where(estable, ey, 0.0)
+
+    xi = (np.arange(n_celdas) + 0.5) / n_celdas - 0.5
+    x = xi[None, None, :] * B[:, None, None]
+    y = xi[None, :, None] * L[:, None, None]
+
+    # Solución elástica con contacto total (exacta dentro del núcleo central)
+    a = P / (B * L)
+    b = 12 * P * ex / (L * B**3)
+    c = 12 * P * ey / (B * L**3)
+    en_nucleo = estable & (6 * np.abs(ex) / B + 6 * np.abs(ey) / L <= 1 + 1e-9)
+
+    # Fuera del núcleo: Newton solo sobre los casos con levantamiento
+    idx = np.flatnonzero(estable & ~en_nucleo)
+    if idx.size:
+        a[idx], b[idx], c[idx] = _newton_sin_tension(
+            a[idx], b[idx], c[idx], P[idx], ex[idx], ey[idx], B[idx], L[idx],
+            max(n_celdas, N_CELDAS_NEWTON), max_iter, tol)
+
+    q = a[:, None, None] + b[:, None, None] * x + c[:, None, None] * y
+    q = np.where(estable[:, None, None], np.maximum(q, 0.0), np.nan)
+
+    # Extremos en las esquinas de la base (el plano es lineal)
+    esquinas = np.abs(b) * B / 2 + np.abs(c) * L / 2
+    q_max = np.where(estable, a + esquinas, np.nan)
+    q_min = np.where(estable, np.maximum(a - esquinas, 0.0), np.nan)
+    fraccion = (q > 0).mean(axis=(1, 2))
+
+    return {
+        'q': q.reshape(forma + (n_celdas, n_celdas)),
+        'q_max': q_max.reshape(forma),
+        'q_min': q_min.reshape(forma),
+        'fraccion_contacto': np.where(estable, fraccion, 0.0).reshape(forma),
+        'en_nucleo': en_nucleo.reshape(forma),
+        'estable': estable.reshape(forma),
+        'ex': ex.reshape(forma),
+        'ey': ey.reshape(forma),
+    }
+
+
+def _newton_sin_tension(a, b, c, P, ex, ey, B, L, n_celdas, max_iter, tol):
+    """Newton sobre (a, b, c) imponiendo equilibrio de fuerzas y momentos solo en la zona comprimida."""
+    xi = (np.arange(n_celdas) + 0.5) / n_celdas - 0.5
+    x = xi[None, None, :] * B[:, None, None]
+    y = xi[None, :, None] * L[:, None, None]
+    dA = (B * L / n_celdas**2)[:, None, None]
+
+    for _ in range(max_iter):
+        q = a[:, None, None] + b[:, None, None] * x + c[:, None, None] * y
+        w = np.where(q > 0, dA, 0.0)
+        wx, wy = w * x, w * y
+        qw = q * w
+        R = np.stack([
+            qw.sum((1, 2)) - P,
+            (qw * x).sum((1, 2)) - P * ex,
+            (qw * y).sum((1, 2)) - P * ey,
+        ], axis=-1)
+        if np.all(np.abs(R).max(axis=-1) <= tol * P * np.maximum(B, L)):
+            break
+
+        s0 = w.sum((1, 2))
+        sx, sy = wx.sum((1, 2)), wy.sum((1, 2))
+        sxx, syy, sxy = (wx * x).sum((1, 2)), (wy * y).sum((1, 2)), (wx * y).sum((1, 2))
+        J = np.stack([
+            np.stack([s0, sx, sy], -1),
+            np.stack([sx, sxx, sxy], -1),
+            np.stack([sy, sxy, syy], -1),
+        ], axis=-2)
+
+        # Sin zona comprimida (resultante casi en la esquina): se deja fijo
+        singular = s0 <= 0
+        J[singular] = np.eye(3)
+        R[singular] = 0.0
+
+        delta = np.linalg.solve(J, R[..., None])[..., 0]
+        a, b, c = a - delta[:, 0], b - delta[:, 1], c - delta[:, 2]
+    return a, b, c
+
+
+def _interp_bordes(F, s, dim):
+    """Interpola linealmente F (N, n+1), definida en los bordes de las celdas, en s (N, m)."""
+    n = F.shape[-1] - 1
+    t = np.clip((s / dim[:, None] + 0.5) * n, 0, n)
+    i = np.minimum(np.floor(t).astype(int), n - 1)
+    f = t - i
+    F0 = np.take_along_axis(F, i, axis=-1)
+    F1 = np.take_along_axis(F, i + 1, axis=-1)
+    return F0 + f * (F1 - F0)
+
+
+def _interp_bordes_2d(S, sx, sy, B, L):
+    """Interpolación bilineal de la tabla de áreas sumadas S (N, n+1, n+1) en (sx, sy) de forma (N, m)."""
+    n = S.shape[-1] - 1
+    tx = np.clip((sx / B[:, None] + 0.5) * n, 0, n)
+    ty = np.clip((sy / L[:, None] + 0.5) * n, 0, n)
+    ix = np.minimum(np.floor(tx).astype(int), n - 1)
+    iy = np.minimum(np.floor(ty).astype(int), n - 1)
+    fx, fy = tx - ix, ty - iy
+    plano = S.reshape(S.shape[0], -1)
+
+    def valor(jy, jx):
+        return np.take_along_axis(plano, jy * (n + 1) + jx, axis=-1)
+
+    return ((1 - fy) * ((1 - fx) * valor(iy, ix) + fx * valor(iy, ix + 1))
+            + fy * ((1 - fx) * valor(iy + 1, ix) + fx * valor(iy + 1, ix + 1)))
+
+
+def _cargas_franjas(carga, centros, dim):
+    """
+    Carga acumulada F y primer momento G por franjas a lo largo de un eje, en los
+    bordes de las celdas: F[k] = Σ_{i<k} carga_i, G[k] = Σ_{i<k} carga_i · x_i.
+    """
+    ceros = np.zeros((carga.shape[0], 1))
+    F = np.concatenate([ceros, np.cumsum(carga, axis=-1)], axis=-1)
+    G = np.concatenate([ceros, np.cumsum(carga * centros[None, :] * dim[:, None], axis=-1)], axis=-1)
+    return F, G
+
+
+def longitud_desarrollo(fc, fy, db=DIAMETRO_VARILLA, psi_t=1.0, psi_e=1.0, lambda_c=1.0):
+    """Longitud de desarrollo en tensión (cm), ACI 318-19 Tabla 25.4.2.3 para varillas ≤ #6."""
+    ld = fy * psi_t * psi_e / (6.6 * lambda_c * np.sqrt(fc)) * db
+    return np.maximum(ld, LD_MIN)
+
+
+def revisar_zapatas(Pu, Mux, Muy, B, L, d, b_col, h_col, fc, fy, q_adm, C_recubrimiento,
+                    db=DIAMETRO_VARILLA, permitir_levantamiento=False, n_celdas=N_CELDAS):
+    """
+    Revisión vectorizada de zapatas aisladas (ACI 318-19) con momento biaxial.
+
+    Las cargas, dimensiones en planta y de columna tienen forma (N,); el peralte d
+    tiene forma (m,) o (N, m). Todas las revisiones se devuelven con forma (N, m),
+    salvo las que no dependen de d.
+
+    Unidades: kg, kg-m, kg/cm² y cm, igual que calculate_footing_design.
+    """
+    Pu, Mux, Muy, B, L, b_col, h_col = (np.atleast_1d(np.asarray(v, dtype=float))
+                                       for v in np.broadcast_arrays(Pu, Mux, Muy, B, L, b_col, h_col))
+    N = Pu.shape[0]
+    d = np.asarray(d, dtype=float)
+    d = np.broadcast_to(np.atleast_1d(d) if d.ndim < 2 else d, (N, np.atleast_1d(d).shape[-1]))
+
+    # --- Presiones de contacto: factorizadas y de servicio (escalan linealmente) ---
+    presion = presion_contacto_biaxial(Pu, Mux, Muy, B, L, n_celdas=n_celdas)
+    q_u = np.nan_to_num(presion['q'])
+    q_max_servicio = presion['q_max'] / FACTOR_SERVICIO
+    suelo_ok = presion['estable'] & (q_max_servicio <= q_adm)
+    if not permitir_levantamiento:
+        suelo_ok &= presion['en_nucleo']
+
+    centros = (np.arange(n_celdas) + 0.5) / n_celdas - 0.5
+    carga = q_u * (B * L / n_celdas**2)[:, None, None]
+    Fx, Gx = _cargas_franjas(carga.sum(axis=1), centros, B)
+    Fy, Gy = _cargas_franjas(carga.sum(axis=2), centros, L)
+    total = Fx[:, -1:]
+
+    def carga_fuera(F, G, corte, dim):
+        """Carga y momento (respecto al corte) de la franja más cargada más allá de ±corte."""
+        F_pos, G_pos = _interp_bordes(F, corte, dim), _interp_bordes(G, corte, dim)
+        F_neg, G_neg = _interp_bordes(F, -corte, dim), _interp_bordes(G, -corte, dim)
+        V = np.maximum(total - F_pos, F_neg)
+        M = np.maximum((G[:, -1:] - G_pos) - corte * (total - F_pos), -corte * F_neg - G_neg)
+        return np.maximum(V, 0.0), np.maximum(M, 0.0)
+
+    raiz_fc = np.sqrt(fc)
+
+    # --- 1. Cortante en una dirección, a d de la cara de la columna ---
+    Vu1_x, _ = carga_fuera(Fx, Gx, b_col[:, None] / 2 + d, B)
+    Vu1_y, _ = carga_fuera(Fy, Gy, h_col[:, None] / 2 + d, L)
+    phi_Vc1_x = PHI_CORTANTE * 0.53 * raiz_fc * L[:, None] * d
+    phi_Vc1_y = PHI_CORTANTE * 0.53 * raiz_fc * B[:, None] * d
+    relacion_1 = np.maximum(Vu1_x / phi_Vc1_x, Vu1_y / phi_Vc1_y)
+
+    # --- 2. Cortante en dos direcciones (punzonamiento), ACI 318-19 22.6.5.2 ---
+    mx, my = (b_col[:, None] + d) / 2, (h_col[:, None] + d) / 2
+    S = np.zeros((N, n_celdas + 1, n_celdas + 1))
+    S[:, 1:, 1:] = carga.cumsum(axis=1).cumsum(axis=2)
+    dentro = (_interp_bordes_2d(S, mx, my, B, L) - _interp_bordes_2d(S, -mx, my, B, L)
+              - _interp_bordes_2d(S, mx, -my, B, L) + _interp_bordes_2d(S, -mx, -my, B, L))
+    Vu2 = np.maximum(total - dentro, 0.0)
+
+    bo = 4 * (mx + my)
+    beta_c = (np.maximum(b_col, h_col) / np.minimum(b_col, h_col))[:, None]
+    alpha_s = 40 # Columna interior
+    vc = np.stack(np.broadcast_arrays(
+        1.06 * raiz_fc,
+        0.53 * (1 + 2 / beta_c) * raiz_fc,
+        0.27 * (2 + alpha_s * d / bo) * raiz_fc,
+    ), axis=0)
+    gobernante = vc.argmin(axis=0)
+    phi_Vc2 = PHI_CORTANTE * vc.min(axis=0) * bo * d
+    relacion_2 = Vu2 / phi_Vc2
+
+    # --- 3. Flexión en la cara de la columna, ambas direcciones ---
+    h = d + C_recubrimiento + db
+    _, Mu_x = carga_fuera(Fx, Gx, b_col[:, None] / 2 + 0 * d, B) # Varillas paralelas a B
+    _, Mu_y = carga_fuera(Fy, Gy, h_col[:, None] / 2 + 0 * d, L) # Varillas paralelas a L
+
+    def acero(Mu, ancho):
+        disc = 1 - (2 * Mu) / (0.85 * fc * ancho * d**2 * PHI_FLEXION)
+        rho = 0.85 * fc / fy * (1 - np.sqrt(np.maximum(disc, 0.0)))
+        As_min = 0.0018 * ancho * h # ACI 318-19, Sección 7.6.1.1
+        return np.maximum(rho * ancho * d, As_min), disc >= 0
+
+    As_x, flexion_x = acero(Mu_x, L[:, None])
+    As_y, flexion_y = acero(Mu_y, B[:, None])
+
+    # --- 4. Longitud de desarrollo ---
+    ld = longitud_desarrollo(fc, fy, db)
+    disponible = np.minimum((B - b_col) / 2, (L - h_col) / 2) - C_recubrimiento
+
+    cumple = (
+        suelo_ok[:, None]
+        & (relacion_1 <= 1) & (relacion_2 <= 1)
+        & flexion_x & flexion_y
+        & (disponible >= ld)[:, None]
+    )
+
+    return {
+        'q_max_servicio': q_max_servicio,
+        'q_min_servicio': presion['q_min'] / FACTOR_SERVICIO,
+        'fraccion_contacto': presion['fraccion_contacto'],
+        'en_nucleo': presion['en_nucleo'],
+        'suelo_ok': suelo_ok,
+        'Vu1': np.maximum(Vu1_x, Vu1_y),
+        'phi_Vc1': np.where(Vu1_x / phi_Vc1_x >= Vu1_y / phi_Vc1_y, phi_Vc1_x, phi_Vc1_y),
+        'relacion_1': relacion_1,
+        'Vu2': Vu2,
+        'phi_Vc2': phi_Vc2,
+        'relacion_2': relacion_2,
+        'Vc_gobernante': gobernante,
+        'Mu_x': convertir(Mu_x, "kg·cm", "kg·m"),
+        'Mu_y': convertir(Mu_y, "kg·cm", "kg·m"),
+        'As_x': As_x,
+        'As_y': As_y,
+        'flexion_ok': flexion_x & flexion_y,
+        'h': h,
+        'ld': ld,
+        'ld_disponible': disponible,
+        'cumple': cumple,
+    }
+
+
+def costo_zapatas(B, L, h, As_x, As_y, precio_concreto=PRECIO_CONCRETO, precio_acero=PRECIO_ACERO):
+    """Costo de concreto + acero; B, L, h en cm y As en cm² (parrillas en ambas direcciones)."""
+    volumen = convertir(B * L * h, "cm³", "m³")
+    peso_acero = (As_x * B + As_y * L) * PESO_ACERO # kg
+    return volumen * precio_concreto + peso_acero * precio_acero
+
+
+@cacheado("optimizador_zapatas", max_entradas=32, max_bytes=64 * MB, persistente=True)
+def optimizar_zapatas(cuadro, fc, fy, q_adm, C_recubrimiento=None, db=None,
+                      B_opciones=None, L_opciones=None, d_opciones=None,
+                      precio_concreto=PRECIO_CONCRETO, precio_acero=PRECIO_ACERO,
+                      relacion_max=2.0, permitir_levantamiento=False,
+                      n_celdas=N_CELDAS, max_candidatos=20000, unidades=None):
+    """
+    Busca para cada columna del cuadro la zapata (B, L, d) de costo mínimo que cumple
+    presión en el suelo, cortante en una y dos direcciones, flexión y longitud de desarrollo.
+
+    Args:
+        cuadro (DataFrame o dict): Columnas 'Columna' (opcional), 'Pu' [kg], 'Mux' [kg-m],
+            'Muy' [kg-m], 'b_col' [cm] (paralelo a B) y 'h_col' [cm] (paralelo a L).
+            Un encabezado con unidad ('Pu [kN]') se convierte desde esa unidad.
+        B_opciones, L_opciones, d_opciones (array): Valores candidatos en cm (o en la
+            longitud del sistema `unidades`).
+        C_recubrimiento, db (float): Recubrimiento libre y diámetro de varilla en cm (o en la
+            longitud del sistema `unidades`); por omisión RECUBRIMIENTO y DIAMETRO_VARILLA.
+        relacion_max (float): Relación máxima L/B o B/L permitida.
+        max_candidatos (int): Número de combinaciones (B, L) evaluadas por bloque.
+        unidades (str): "SI" o "tecnico" para los datos y la tabla de salida; por
+            omisión kg, kg/cm² y cm.
+
+    Returns:
+        DataFrame: Una fila por columna con la zapata óptima.
+    """
+    if unidades is not None:
+        cuadro = normalizar_unidades(cuadro, UNIDADES, unidades)
+        fc, fy, q_adm = normalizar_unidades({"fc": fc, "fy": fy, "q_adm": q_adm}, UNIDADES, unidades).values()
+        C_recubrimiento, db, B_opciones, L_opciones, d_opciones = (
+            None if v is None else convertir(np.asarray(v, dtype=float), en_sistema("cm", unidades), "cm")
+            for v in (C_recubrimiento, db, B_opciones, L_opciones, d_opciones))
+    C_recubrimiento = RECUBRIMIENTO if C_recubrimiento is None else float(C_recubrimiento)
+    db = DIAMETRO_VARILLA if db is None else float(db)
+    B_opciones = np.arange(60.0, 610.0, 10.0) if B_opciones is None else np.asarray(B_opciones, dtype=float)
+    L_opciones = B_opciones if L_opciones is None else np.asarray(L_opciones, dtype=float)
+    d_opciones = np.arange(15.0, 125.0, 5.0) if d_opciones is None else np.asarray(d_opciones, dtype=float)
+
+    import pandas as pd
+
+    Pu, Mux, Muy, b_col, h_col = (np.asarray(cuadro[k], dtype=float) for k in ('Pu', 'Mux', 'Muy', 'b_col', 'h_col'))
+    n_columnas = len(Pu)
+    nombres = list(cuadro['Columna']) if 'Columna' in cuadro else list(range(1, n_columnas + 1))
+
+    # --- Malla de candidatos (fila, B, L) con filtro previo barato ---
+    fila, iB, iL = np.meshgrid(np.arange(n_columnas), np.arange(len(B_opciones)), np.arange(len(L_opciones)), indexing='ij')
+    fila, Bc, Lc = fila.ravel(), B_opciones[iB.ravel()], L_opciones[iL.ravel()]
+    ld = longitud_desarrollo(fc, fy, db)
+    filtro = (
+        (Bc >= b_col[fila] + 2 * (ld + C_recubrimiento)) & (Lc >= h_col[fila] + 2 * (ld + C_recubrimiento))
+        & (np.maximum(Bc, Lc) / np.minimum(Bc, Lc) <= relacion_max)
+        & (Pu[fila] / FACTOR_SERVICIO / (Bc * Lc) <= q_adm) # La presión media ya excede q_adm
+    )
+    fila, Bc, Lc = fila[filtro], Bc[filtro], Lc[filtro]
+
+    mejor_costo = np.full(n_columnas, np.inf)
+    mejor = [None] * n_columnas
+
+    for inicio in range(0, len(fila), max_candidatos):
+        sl = slice(inicio, inicio + max_candidatos)
+        f = fila[sl]
+        rev = revisar_zapatas(Pu[f], Mux[f], Muy[f], Bc[sl], Lc[sl], d_opciones, b_col[f], h_col[f],
+                              fc, fy, q_adm, C_recubrimiento, db=db,
+                              permitir_levantamiento=permitir_levantamiento, n_celdas=n_celdas)
+        costo = costo_zapatas(Bc[sl, None], Lc[sl, None], rev['h'], rev['As_x'], rev['As_y'],
+                              precio_concreto, precio_acero)
+        costo = np.where(rev['cumple'], costo, np.inf)
+
+        # Mejor d para cada (B, L) y luego mejor (B, L) para cada columna
+        j = costo.argmin(axis=1)
+        k = np.arange(len(j))
+        costo_min = costo[k, j]
+        orden = np.lexsort((costo_min, f))
+        filas_bloque, primero = np.unique(f[orden], return_index=True)
+        for r, p in zip(filas_bloque, orden[primero]):
+            if costo_min[p] < mejor_costo[r]:
+                mejor_costo[r] = costo_min[p]
+                mejor[r] = {
+                    'B (cm)': Bc[sl][p], 'L (cm)': Lc[sl][p], 'd (cm)': d_opciones[j[p]],
+                    'h (cm)': rev['h'][p, j[p]],
+                    'q_max servicio (kg/cm²)': rev['q_max_servicio'][p],
+                    'Contacto (%)': 100 * rev['fraccion_contacto'][p],
+                    'Núcleo': bool(rev['en_nucleo'][p]),
+                    'Vu1/φVc1': rev['relacion_1'][p, j[p]],
+                    'Vu2/φVc2': rev['relacion_2'][p, j[p]],
+                    'Vc gobernante': ECUACIONES_VC[rev['Vc_gobernante'][p, j[p]]],
+                    'As_x (cm²)': rev['As_x'][p, j[p]],
+                    'As_y (cm²)': rev['As_y'][p, j[p]],
+                    'Costo ($)': costo_min[p],
+                }
+
+    filas = []
+    for r, nombre in enumerate(nombres):
+        if mejor[r] is None:
+            filas.append({'Columna': nombre, 'Estado': "Sin solución"})
+        else:
+            filas.append({'Columna': nombre, **mejor[r], 'Estado': "Óptima"})
+    tabla = pd.DataFrame(filas)
+    return tabla if unidades is None else convertir_tabla(tabla, unidades)
+
+
+@dataclass(frozen=True)
+class EntradaZapata:
+    """
+    Zapata aislada cuadrada. Unidades: Pu en kg, Mu en kg-m (en dirección de B),
+    f'c, fy y q_adm en kg/cm²; dimensiones de columna, d y recubrimiento en cm.
+    """
+    Pu: float
+    Mu: float
+    fc: float
+    fy: float
+    q_adm: float
+    b_col: float
+    h_col: float
+    d_propuesto: float
+    C_recubrimiento: float
+
+
+@dataclass(frozen=True)
+class ResultadoZapata:
+    """Dimensiones (cm), presiones de servicio (kg/cm²) y revisiones de cortante, flexión y anclaje."""
+    L_zapata: float
+    B_zapata: float
+    Peralte_total: float
+    q_max: float
+    q_min: float
+    Cortante_1_direccion_Vu: float
+    Cortante_1_direccion_Vc: float
+    Cortante_1_direccion_pasa: bool
+    Cortante_2_direcciones_Vu: float
+    Cortante_2_direcciones_Vc: float
+    Cortante_2_direcciones_Vc_ecuacion: str
+    Cortante_2_direcciones_pasa: bool
+    Momento_diseno_Mu: float
+    As_requerido: float
+    Longitud_desarrollo_ld: float
+    Longitud_disponible: float
+    Longitud_desarrollo_pasa: bool
+
+
+@cacheado("zapata", max_entradas=512, max_bytes=8 * MB)
+def calculate_footing_design(entrada: EntradaZapata) -> ResultadoZapata:
+    """
+    Calcula el diseño de una zapata aislada cuadrada según el ACI 318-19.
+
+    Raises:
+        ValueError: Si no existe zapata dentro del núcleo central o el peralte no alcanza en flexión.
+    """
+    Pu, Mu, q_adm = entrada.Pu, entrada.Mu, entrada.q_adm
+
+    # 1. Dimensionamiento de la zapata: área por carga de servicio y luego se aumenta
+    # el lado (de 10 en 10 cm) hasta que q_max ≤ q_adm sin salir del núcleo central.
+    A_requerida_cm2 = (Pu / FACTOR_SERVICIO) / q_adm
+    B_inicial = math.ceil(math.sqrt(A_requerida_cm2) / 10) * 10 # Redondear a la siguiente decima de metro
+    lados = B_inicial + 10.0 * np.arange(200)
+    presion = presion_contacto_biaxial(Pu, 0.0, Mu, lados, lados)
+    valido = presion['en_nucleo'] & (presion['q_max'] / FACTOR_SERVICIO <= q_adm)
+    if not valido.any():
+        raise ValueError("No se encontró una zapata cuadrada que resista la carga y el momento dentro del núcleo central.")
+    lado = float(lados[valido.argmax()])
+
+    rev = revisar_zapatas(Pu, 0.0, Mu, lado, lado, entrada.d_propuesto, entrada.b_col, entrada.h_col,
+                          entrada.fc, entrada.fy, q_adm, entrada.C_recubrimiento)
+    if not rev['flexion_ok'][0, 0]:
+        raise ValueError("El peralte efectivo (d) o las dimensiones de la zapata son insuficientes. Aumente los valores de entrada para el cálculo.")
+
+    ld = float(rev['ld'])
+    disponible = float(rev['ld_disponible'][0])
+    return ResultadoZapata(
+        L_zapata=lado,
+        B_zapata=lado,
+        Peralte_total=entrada.d_propuesto + entrada.C_recubrimiento + DIAMETRO_VARILLA,
+        q_max=float(rev['q_max_servicio'][0]),
+        q_min=float(rev['q_min_servicio'][0]),
+        # 2. Verificación por cortante a una dirección (One-way shear)
+        Cortante_1_direccion_Vu=float(rev['Vu1'][0, 0]),
+        Cortante_1_direccion_Vc=float(rev['phi_Vc1'][0, 0]),
+        Cortante_1_direccion_pasa=bool(rev['relacion_1'][0, 0] <= 1),
+        # 3. Verificación por cortante a dos direcciones (Two-way shear / Punching)
+        # ACI 318-19, Section 22.6.5.2 - se toma el menor valor de las tres ecuaciones
+        Cortante_2_direcciones_Vu=float(rev['Vu2'][0, 0]),
+        Cortante_2_direcciones_Vc=float(rev['phi_Vc2'][0, 0]),
+        Cortante_2_direcciones_Vc_ecuacion=ECUACIONES_VC[rev['Vc_gobernante'][0, 0]],
+        Cortante_2_direcciones_pasa=bool(rev['relacion_2'][0, 0] <= 1),
+        # 4. Diseño por momento (dirección más desfavorable)
+        Momento_diseno_Mu=float(max(rev['Mu_x'][0, 0], rev['Mu_y'][0, 0])), # kg-m
+        As_requerido=float(max(rev['As_x'][0, 0], rev['As_y'][0, 0])),
+        # 5. Longitud de desarrollo (Development Length)
+        Longitud_desarrollo_ld=ld,
+        Longitud_disponible=disponible,
+        Longitud_desarrollo_pasa=disponible >= ld, # mismo criterio que revisar_zapatas
+    )
@@ -0,0 +1,376 @@
+# geosuite/exploracion.py
+"""
+Planeación de la exploración geotécnica: número, profundidad y ubicación de sondeos.
+
+La profundidad y el número mínimo de sondeos salen de una tabla de reglas
+(``reglas_exploracion.json``: profundidad por número de niveles, sondeos por
+área de construcción y separación máxima entre sondeos). La tabla se lee una
+sola vez por proceso; otra tabla se carga con ``cargar_reglas(ruta)``.
+
+Con el polígono del predio los sondeos se ubican dentro de él con una garantía
+de cobertura: ningún punto del predio queda a más de separacion_maxima / √2 de
+un sondeo (la mitad de la diagonal de una retícula con esa separación). Si el
+número de la tabla no alcanza para cumplirla, se agregan sondeos.
+
+    entrada = EntradaExploracion(niveles=4, poligono=((0, 0), (40, 0), (40, 25), (0, 25)))
+    res = planear_exploracion(entrada)
+    res.num_sondeos, res.profundidad, res.sondeos, res.cobertura
+
+``planear_lote`` resuelve un cuadro (CSV, Excel o DataFrame) con muchos
+proyectos a la vez: la consulta de la tabla se hace con ``searchsorted`` sobre
+todas las filas y cada predio se resuelve con la caché de ``planear_exploracion``.
+"""
+import functools
+import json
+import math
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+RUTA_REGLAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reglas_exploracion.json")
+MAX_MUESTRAS = 20_000 # puntos de muestreo del predio para verificar la cobertura
+ITERACIONES_LLOYD = 30
+BLOQUE_PUNTOS = 2_000_000 # elementos puntos × aristas por bloque en puntos_en_poligono
+
+
+@dataclass(frozen=True)
+class ReglasExploracion:
+    """Tabla de reglas: límites superiores (niveles, área en m²) y su valor."""
+    zona: str
+    ubicaciones: tuple
+    tipo_sondeo: str
+    niveles_max: np.ndarray
+    profundidades: np.ndarray
+    area_max: np.ndarray
+    sondeos: np.ndarray
+    separacion_maxima: float
+
+    @property
+    def radio_cobertura(self):
+        """Distancia máxima de cualquier punto del predio al sondeo más cercano (m)."""
+        return self.separacion_maxima / math.sqrt(2)
+
+    def profundidad(self, niveles):
+        """Profundidad por sondeo (m) para `niveles` (escalar o arreglo); ValueError fuera de la tabla."""
+        niveles = np.asarray(niveles)
+        fuera = (niveles < 1) | (niveles > self.niveles_max[-1]) | (niveles != np.round(niveles))
+        if np.any(fuera):
+            raise ValueError(f"El número de niveles debe ser un entero entre 1 y {int(self.niveles_max[-1])}.")
+        return self.profundidades[np.searchsorted(self.niveles_max, niveles, side="left")]
+
+    def num_sondeos(self, area):
+        """Número mínimo de sondeos por área (m², escalar o arreglo); ValueError fuera de la tabla."""
+        area = np.asarray(area, dtype=float)
+        if np.any(~(area > 0)) or np.any(area > self.area_max[-1]):
+            raise ValueError(f"El área de construcción debe estar entre 0 y {self.area_max[-1]:g} m².")
+        return self.sondeos[np.searchsorted(self.area_max, area, side="left")]
+
+
+@functools.lru_cache(maxsize=8)
+def cargar_reglas(ruta=RUTA_REGLAS) -> ReglasExploracion:
+    """
+    Lee la tabla de reglas (JSON) una sola vez por ruta.
+
+    Raises:
+        ValueError: Si la tabla no está ordenada o le faltan datos.
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        datos = json.load(archivo)
+    try:
+        niveles_max, profundidades = np.array(datos["profundidad_por_niveles"], dtype=float).T
+        area_max, sondeos = np.array(datos["sondeos_por_area"], dtype=float).T
+        reglas = ReglasExploracion(
+            zona=datos.get("zona", ""), ubicaciones=tuple(datos.get("ubicaciones", ())),
+            tipo_sondeo=datos.get("tipo_sondeo", "SPT"), niveles_max=niveles_max, profundidades=profundidades,
+            area_max=area_max, sondeos=sondeos.astype(int), separacion_maxima=float(datos["separacion_maxima"]),
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError(f"Tabla de reglas inválida ({ruta}): {error}")
+    if np.any(np.diff(reglas.niveles_max) <= 0) or np.any(np.diff(reglas.area_max) <= 0):
+        raise ValueError(f"Tabla de reglas inválida ({ruta}): los límites deben ser crecientes.")
+    for arreglo in (niveles_max, profundidades, area_max, reglas.sondeos):
+        arreglo.flags.writeable = False
+    return reglas
+
+
+@dataclass(frozen=True)
+class EntradaExploracion:
+    """
+    Proyecto por explorar. Con `poligono` (vértices (x, y) en m) el área es la del
+    predio; sin él, el predio se supone cuadrado con el `area` dada (m²).
+    """
+    niveles: int
+    area: float = None
+    poligono: tuple = None
+    ubicacion: str = "Guadalajara"
+
+
+@dataclass(frozen=True)
+class ResultadoExploracion:
+    """Plan de exploración; `cobertura` es la cota garantizada de la distancia al sondeo más cercano."""
+    tipo_sondeo: str
+    profundidad: float
+    num_sondeos: int
+    num_sondeos_tabla: int
+    area: float
+    poligono: np.ndarray
+    sondeos: np.ndarray
+    cobertura: float
+    radio_cobertura: float
+    metros_perforacion: float
+
+
+# --- Geometría del predio ----------------------------------------------------
+
+def _vertices(poligono):
+    P = np.asarray(poligono, dtype=float)
+    if P.ndim != 2 or P.shape[1] != 2 or P.shape[0] < 3:
+        raise ValueError("El polígono del predio requiere al menos tres vértices (x, y).")
+    if not np.isfinite(P).all():
+        raise ValueError("Las coordenadas del predio deben ser números finitos.")
+    if np.allclose(P[0], P[-1]):
+        P = P[:-1] # polígono cerrado explícitamente
+    if area_poligono(P) <= 0:
+        raise ValueError("El polígono del predio no tiene área.")
+    return P
+
+
+def area_poligono(poligono):
+    """Área (m²) del polígono por la fórmula del área de Gauss."""
+    x, y = np.asarray(poligono, dtype=float).T
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def puntos_en_poligono(x, y, poligono):
+    """
+    Regla par-impar vectorizada: True para los puntos (x, y) dentro del polígono.
+    Los puntos se procesan en bloques de ``BLOQUE_PUNTOS`` / aristas.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    xa, ya = np.asarray(poligono, dtype=float).T
+    xb, yb = np.roll(xa, -1), np.roll(ya, -1)
+    forma = np.broadcast(x, y).shape
+    x, y = (np.broadcast_to(v, forma).ravel() for v in (x, y))
+    dentro = np.empty(x.size, dtype=bool)
+    paso = max(1, BLOQUE_PUNTOS // xa.size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(0, x.size, paso):
+            px, py = x[i:i + paso, None], y[i:i + paso, None]
+            cruza = ((ya > py) != (yb > py)) & (px < xa + (xb - xa) * (py - ya) / (yb - ya))
+            dentro[i:i + paso] = np.count_nonzero(cruza, axis=1) % 2 == 1
+    return dentro.reshape(forma)
+
+
+def _muestras(P, paso):
+    """Puntos de una retícula de lado `paso` dentro del predio más puntos sobre su contorno."""
+    (x0, y0), (x1, y1) = P.min(axis=0), P.max(axis=0)
+    gx, gy = np.meshgrid(np.arange(x0, x1 + paso, paso), np.arange(y0, y1 + paso, paso))
+    interior = puntos_en_poligono(gx, gy, P)
+    lados = np.roll(P, -1, axis=0) - P
+    partes = np.maximum(np.ceil(np.hypot(*lados.T) / paso).astype(int), 1)
+    contorno = np.concatenate([a + np.arange(k)[:, None] / k * d for a, d, k in zip(P, lados, partes)])
+    return np.concatenate([np.column_stack([gx[interior], gy[interior]]), contorno])
+
+
+def _distancias(muestras, centros):
+    """Distancia de cada muestra al centro más cercano y el índice de ese centro."""
+    d2 = ((muestras[:, None, :] - centros[None, :, :])**2).sum(axis=-1)
+    cercano = d2.argmin(axis=1)
+    return np.sqrt(d2[np.arange(muestras.shape[0]), cercano]), cercano
+
+
+def _distribuir(muestras, k, iteraciones=ITERACIONES_LLOYD):
+    """
+    k sondeos sobre las muestras: punto más lejano (k-centro voraz) seguido de
+    iteraciones de Lloyd con los centros ajustados a la muestra más cercana, que
+    siempre está dentro del predio. Devuelve la distribución de menor distancia máxima.
+    """
+    centro = muestras.mean(axis=0)
+    elegidos = [int(((muestras - centro)**2).sum(axis=1).argmin())]
+    distancia = np.sqrt(((muestras - muestras[elegidos[0]])**2).sum(axis=1))
+    for _ in range(1, k):
+        elegidos.append(int(distancia.argmax()))
+        distancia = np.minimum(distancia, np.sqrt(((muestras - muestras[elegidos[-1]])**2).sum(axis=1)))
+    centros = muestras[elegidos]
+    mejor, mejor_maximo = centros, distancia.max()
+
+    for _ in range(iteraciones):
+        distancia, cercano = _distancias(muestras, centros)
+        if distancia.max() < mejor_maximo:
+            mejor, mejor_maximo = centros, distancia.max()
+        suma = np.zeros_like(centros)
+        np.add.at(suma, cercano, muestras)
+        conteo = np.bincount(cercano, minlength=k)[:, None]
+        medias = np.where(conteo > 0, suma / np.maximum(conteo, 1), centros)
+        nuevos = muestras[_distancias(medias, muestras)[1]]
+        if np.array_equal(nuevos, centros):
+            break
+        centros = nuevos
+    distancia, _ = _distancias(muestras, centros)
+    if distancia.max() < mejor_maximo:
+        mejor, mejor_maximo = centros, distancia.max()
+    return mejor, float(mejor_maximo)
+
+
+def ubicar_sondeos(poligono, n_min, radio):
+    """
+    Ubica al menos `n_min` sondeos dentro del predio de modo que todo punto quede a
+    no más de `radio` (m) del sondeo más cercano.
+
+    La distancia máxima se mide en muestras con separación h (retícula interior y
+    contorno) y se le suma h·(√2 + 1/2): todo punto del predio está a menos de esa
+    distancia de una muestra, así que la cobertura reportada es una cota superior.
+
+    Returns:
+        tuple: (sondeos (k, 2), cobertura garantizada en m)
+    """
+    P = _vertices(poligono)
+    area = area_poligono(P)
+    paso = max(radio / 16, math.sqrt(area / MAX_MUESTRAS))
+    muestras = _muestras(P, paso)
+    holgura = paso * (math.sqrt(2) + 0.5)
+    # Cota inferior: un sondeo no cubre más que el hexágono inscrito en su círculo de radio r
+    k = max(int(n_min), math.ceil(area / (1.5 * math.sqrt(3) * radio**2)))
+    while True:
+        centros, maximo = _distribuir(muestras, k)
+        if maximo + holgura <= radio or k >= muestras.shape[0]:
+            return centros, maximo + holgura
+        k += 1
+
+
+# --- Planeación --------------------------------------------------------------
+
+def _cuadrado(area):
+    lado = math.sqrt(area)
+    return ((0.0, 0.0), (lado, 0.0), (lado, lado), (0.0, lado))
+
+
+@cacheado("exploracion", max_entradas=512, max_bytes=16 * MB)
+def planear_exploracion(entrada: EntradaExploracion, ruta_reglas=RUTA_REGLAS) -> ResultadoExploracion:
+    """
+    Tipo, número, profundidad y ubicación de los sondeos de un proyecto.
+
+    Raises:
+        ValueError: Si los niveles, el área o la ubicación quedan fuera de la tabla
+            de reglas o si el polígono no es válido.
+    """
+    reglas = cargar_reglas(ruta_reglas)
+    if reglas.ubicaciones and entrada.ubicacion not in reglas.ubicaciones:
+        raise ValueError(f"Ubicación fuera de la tabla de reglas ({reglas.zona}): {entrada.ubicacion}. "
+                         f"Ubicaciones: {', '.join(reglas.ubicaciones)}")
+    if entrada.poligono is not None:
+        P = _vertices(entrada.poligono)
+        area = area_poligono(P)
+    elif entrada.area is not None:
+        area = float(entrada.area)
+        P = np.array(_cuadrado(area)) if area > 0 else None
+    else:
+        raise ValueError("Indique el área de construcción o el polígono del predio.")
+
+    profundidad = float(reglas.profundidad(entrada.niveles))
+    n_tabla = int(reglas.num_sondeos(area))
+    sondeos, cobertura = ubicar_sondeos(P, n_tabla, reglas.radio_cobertura)
+    sondeos = np.round(sondeos, 2)
+    return ResultadoExploracion(
+        tipo_sondeo=reglas.tipo_sondeo, profundidad=profundidad, num_sondeos=len(sondeos),
+        num_sondeos_tabla=n_tabla, area=area, poligono=P, sondeos=sondeos, cobertura=cobertura,
+        radio_cobertura=reglas.radio_cobertura, metros_perforacion=profundidad * len(sondeos),
+    )
+
+
+# --- Lote --------------------------------------------------------------------
+
+def leer_poligono(texto):
+    """Vértices de un texto "x,y; x,y; ..." (también acepta "x y; x y"); None si está vacío."""
+    if texto is None or (isinstance(texto, float) and math.isnan(texto)) or not str(texto).strip():
+        return None
+    vertices = []
+    for par in str(texto).split(";"):
+        if par.strip():
+            try:
+                x, y = (float(v) for v in par.replace(",", " ").split())
+            except ValueError:
+                raise ValueError(f"Vértice inválido en el polígono: '{par.strip()}'")
+            vertices.append((x, y))
+    return tuple(vertices)
+
+
+def leer_cuadro(fuente, nombre=None):
+    """
+    Cuadro de proyectos desde un CSV o un Excel (ruta o bytes; `nombre` indica la
+    extensión cuando se pasan bytes). Excel requiere openpyxl.
+
+    Raises:
+        ValueError: Si el archivo no se puede leer como cuadro.
+    """
+    import io
+
+    import pandas as pd
+
+    nombre = nombre or (fuente if isinstance(fuente, str) else "")
+    datos = io.BytesIO(fuente) if isinstance(fuente, bytes) else fuente
+    if nombre.lower().endswith((".xlsx", ".xls")):
+        try:
+            return pd.read_excel(datos)
+        except ImportError as error:
+            raise ValueError(f"Para leer Excel instale openpyxl ({error}); o guarde el cuadro como CSV.")
+    try:
+        return pd.read_csv(datos, sep=None, engine="python", encoding="utf-8-sig")
+    except UnicodeDecodeError: # CSV guardado desde Excel en Windows
+        if hasattr(datos, "seek"):
+            datos.seek(0)
+        return pd.read_csv(datos, sep=None, engine="python", encoding="cp1252")
+
+
+def planear_lote(cuadro, ruta_reglas=RUTA_REGLAS):
+    """
+    Plan de exploración de muchos proyectos, para cotizar.
+
+    Args:
+        cuadro (DataFrame o dict): Columnas 'Niveles' y 'Área' (m²) o 'Polígono'
+            ("x,y; x,y; ..."), y opcionalmente 'Proyecto' y 'Ubicación'.
+
+    Returns:
+        DataFrame: Una fila por proyecto; las filas con datos inválidos llevan el
+        motivo en 'Estado'.
+    """
+    import pandas as pd
+
+    cuadro = pd.DataFrame(cuadro)
+    n = len(cuadro)
+    columna = lambda nombre, defecto: list(cuadro[nombre]) if nombre in cuadro else [defecto] * n # noqa: E731
+    proyectos = columna("Proyecto", None)
+    ubicaciones = columna("Ubicación", "Guadalajara")
+    poligonos = columna("Polígono", None)
+    niveles = pd.to_numeric(pd.Series(columna("Niveles", np.nan)), errors="coerce").to_numpy()
+    areas = pd.to_numeric(pd.Series(columna("Área", np.nan)), errors="coerce").to_numpy()
+
+    # La tabla se consulta para todo el cuadro de una vez; solo las filas inválidas se revisan una por una
+    reglas = cargar_reglas(ruta_reglas)
+    validos = (niveles >= 1) & (niveles <= reglas.niveles_max[-1]) & (niveles == np.round(niveles))
+    profundidades = np.full(n, np.nan)
+    profundidades[validos] = reglas.profundidad(niveles[validos])
+
+    filas = []
+    for i in range(n):
+        fila = {"Proyecto": proyectos[i] if proyectos[i] is not None else i + 1, "Ubicación": ubicaciones[i]}
+        try:
+            poligono = leer_poligono(poligonos[i])
+            if not validos[i]:
+                reglas.profundidad(niveles[i]) # lanza el ValueError con el motivo
+            entrada = EntradaExploracion(niveles=int(niveles[i]), area=None if poligono else areas[i],
+                                         poligono=poligono, ubicacion=ubicaciones[i])
+            res = planear_exploracion(entrada, ruta_reglas)
+        except ValueError as error:
+            filas.append({**fila, "Estado": str(error)})
+            continue
+        filas.append({
+            **fila, "Niveles": int(niveles[i]), "Área (m²)": round(res.area, 1), "Tipo de sondeo": res.tipo_sondeo,
+            "Sondeos": res.num_sondeos, "Profundidad (m)": profundidades[i],
+            "Metros de perforación": res.metros_perforacion, "Cobertura (m)": round(res.cobertura, 1),
+            "Coordenadas": "; ".join(f"{x:g},{y:g}" for x, y in res.sondeos), "Estado": "OK",
+        })
+    return pd.DataFrame(filas)
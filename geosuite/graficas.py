@@ -0,0 +1,186 @@
+# geosuite/graficas.py
+"""
+Renderizado de gráficas sin el estado global de pyplot.
+
+``plt.subplots()`` registra cada figura en pyplot y, si nadie llama a
+``plt.close``, la figura vive hasta que el proceso termina. En un servidor con
+muchas sesiones eso hace crecer la memoria sin límite. Aquí las figuras se
+crean con la API orientada a objetos (``matplotlib.figure.Figure``), que no
+pasa por el registro de pyplot. Cada hilo reutiliza una sola figura que se
+limpia antes de cada dibujo, y lo que se guarda en caché son los bytes PNG o
+el texto SVG ya renderizados, nunca la figura.
+
+    @grafica("asentamiento")
+    def grafica_asentamiento(fig, z, Dsz):
+        ax = fig.subplots()
+        ax.plot(Dsz, z)
+
+    st.image(grafica_asentamiento(z, Dsz))                 # PNG (bytes)
+    st.image(grafica_asentamiento(z, Dsz, formato="svg"))  # SVG (texto)
+
+Para gráficas de líneas simples ``svg_lineas`` escribe el SVG directamente,
+sin importar matplotlib.
+
+matplotlib solo se importa al dibujar la primera gráfica.
+"""
+import functools
+import io
+import math
+import threading
+from html import escape
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+DPI = 100
+TAMANO_FIGURA = (6.4, 4.8) # pulgadas, el tamaño por defecto de matplotlib
+FORMATOS = ("png", "svg")
+
+_local = threading.local()
+
+
+def _figura_del_hilo(figsize):
+    """Figura reutilizable del hilo actual, vacía y con el tamaño pedido."""
+    fig = getattr(_local, "figura", None)
+    if fig is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _local.figura = fig
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
+
+def a_bytes(fig, formato="png", dpi=DPI):
+    """Renderiza la figura: bytes para PNG, texto para SVG. La figura queda vacía."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}. Use uno de {FORMATOS}")
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=formato, dpi=dpi)
+    finally:
+        fig.clear()
+    datos = buffer.getvalue()
+    return datos.decode("utf-8") if formato == "svg" else datos
+
+
+def grafica(nombre, figsize=TAMANO_FIGURA, dpi=DPI, max_entradas=64, max_bytes=32 * MB):
+    """
+    Decorador para funciones que dibujan sobre una figura: ``dibujar(fig, *args)``.
+
+    La función decorada recibe los mismos argumentos sin ``fig`` (más
+    ``formato="png"|"svg"``) y devuelve la imagen renderizada. El resultado se
+    guarda en la caché ``figura_<nombre>`` con el hash de los argumentos.
+    """
+    def decorador(dibujar):
+        @cacheado(f"figura_{nombre}", max_entradas=max_entradas, max_bytes=max_bytes)
+        @functools.wraps(dibujar)
+        def renderizar(*args, formato="png", **kwargs):
+            fig = _figura_del_hilo(figsize)
+            dibujar(fig, *args, **kwargs)
+            return a_bytes(fig, formato, dpi)
+
+        return renderizar
+
+    return decorador
+
+
+# --- Gráficas de líneas en SVG directo --------------------------------------
+
+_COLORES = {"r": "red", "g": "green", "b": "blue", "k": "black", "c": "cyan", "m": "magenta", "y": "gold"}
+_CICLO = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"] # ciclo por defecto de matplotlib
+
+
+def _marcas(minimo, maximo, n=6):
+    """Marcas de eje "redondas" (1, 2, 5 × 10^k) que cubren [minimo, maximo]."""
+    if not maximo > minimo:
+        maximo = minimo + 1.0
+    paso = (maximo - minimo) / n
+    potencia = 10 ** math.floor(math.log10(paso))
+    paso = min((m * potencia for m in (1, 2, 5, 10) if m * potencia >= paso), default=10 * potencia)
+    inicio = math.floor(minimo / paso) * paso
+    fin = math.ceil(maximo / paso) * paso
+    return np.round(np.arange(inicio, fin + paso / 2, paso), 10)
+
+
+def _texto_marca(valor):
+    return f"{valor:g}"
+
+
+@cacheado("figura_svg_lineas", max_entradas=128, max_bytes=16 * MB)
+def svg_lineas(series, titulo="", etiqueta_x="", etiqueta_y="", invertir_y=False, rejilla=False,
+               ancho=640, alto=480):
+    """
+    Gráfica de líneas como texto SVG, sin matplotlib.
+
+    Args:
+        series (list): tuplas (x, y, etiqueta, color); etiqueta y color pueden ser None.
+        invertir_y (bool): eje y creciente hacia abajo (perfiles de profundidad).
+
+    Returns:
+        str: documento SVG, apto para ``st.image``.
+    """
+    izquierda, derecha, arriba, abajo = 70, 20, 40 if titulo else 20, 55
+    ancho_util, alto_util = ancho - izquierda - derecha, alto - arriba - abajo
+
+    xs = np.concatenate([np.asarray(s[0], dtype=float).ravel() for s in series])
+    ys = np.concatenate([np.asarray(s[1], dtype=float).ravel() for s in series])
+    marcas_x = _marcas(np.nanmin(xs), np.nanmax(xs))
+    marcas_y = _marcas(np.nanmin(ys), np.nanmax(ys))
+    x0, x1, y0, y1 = marcas_x[0], marcas_x[-1], marcas_y[0], marcas_y[-1]
+
+    def px(x):
+        return izquierda + (np.asarray(x, dtype=float) - x0) / (x1 - x0) * ancho_util
+
+    def py(y):
+        t = (np.asarray(y, dtype=float) - y0) / (y1 - y0)
+        return arriba + (t if invertir_y else 1 - t) * alto_util
+
+    partes = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" viewBox="0 0 {ancho} {alto}" '
+        'font-family="DejaVu Sans, Arial, sans-serif" font-size="12">',
+        f'<rect width="{ancho}" height="{alto}" fill="white"/>',
+    ]
+    for x in marcas_x:
+        xp = px(x)
+        if rejilla:
+            partes.append(f'<line x1="{xp:.1f}" y1="{arriba}" x2="{xp:.1f}" y2="{arriba + alto_util}" stroke="#b0b0b0" stroke-width="0.8"/>')
+        partes.append(f'<line x1="{xp:.1f}" y1="{arriba + alto_util}" x2="{xp:.1f}" y2="{arriba + alto_util + 5}" stroke="black"/>')
+        partes.append(f'<text x="{xp:.1f}" y="{arriba + alto_util + 18}" text-anchor="middle">{_texto_marca(x)}</text>')
+    for y in marcas_y:
+        yp = py(y)
+        if rejilla:
+            partes.append(f'<line x1="{izquierda}" y1="{yp:.1f}" x2="{izquierda + ancho_util}" y2="{yp:.1f}" stroke="#b0b0b0" stroke-width="0.8"/>')
+        partes.append(f'<line x1="{izquierda - 5}" y1="{yp:.1f}" x2="{izquierda}" y2="{yp:.1f}" stroke="black"/>')
+        partes.append(f'<text x="{izquierda - 8}" y="{yp + 4:.1f}" text-anchor="end">{_texto_marca(y)}</text>')
+
+    leyenda = []
+    for i, (x, y, etiqueta, color) in enumerate(series):
+        color = _COLORES.get(color, color) or _CICLO[i % len(_CICLO)]
+        puntos = " ".join(f"{a:.2f},{b:.2f}" for a, b in zip(px(x).ravel(), py(y).ravel()) if np.isfinite(a) and np.isfinite(b))
+        partes.append(f'<polyline points="{puntos}" fill="none" stroke="{escape(color)}" stroke-width="1.5"/>')
+        if etiqueta:
+            leyenda.append((etiqueta, color))
+
+    partes.append(f'<rect x="{izquierda}" y="{arriba}" width="{ancho_util}" height="{alto_util}" fill="none" stroke="black"/>')
+    if titulo:
+        partes.append(f'<text x="{izquierda + ancho_util / 2:.1f}" y="{arriba - 14}" text-anchor="middle" font-size="14">{escape(titulo)}</text>')
+    if etiqueta_x:
+        partes.append(f'<text x="{izquierda + ancho_util / 2:.1f}" y="{alto - 12}" text-anchor="middle">{escape(etiqueta_x)}</text>')
+    if etiqueta_y:
+        yc = arriba + alto_util / 2
+        partes.append(f'<text x="16" y="{yc:.1f}" text-anchor="middle" transform="rotate(-90 16 {yc:.1f})">{escape(etiqueta_y)}</text>')
+    if leyenda:
+        ancho_leyenda = 30 + 7 * max(len(e) for e, _ in leyenda)
+        xl, yl = izquierda + ancho_util - ancho_leyenda - 8, arriba + 8
+        partes.append(f'<rect x="{xl}" y="{yl}" width="{ancho_leyenda}" height="{18 * len(leyenda) + 6}" fill="white" fill-opacity="0.8" stroke="#cccccc"/>')
+        for i, (etiqueta, color) in enumerate(leyenda):
+            yi = yl + 14 + 18 * i
+            partes.append(f'<line x1="{xl + 6}" y1="{yi - 4}" x2="{xl + 24}" y2="{yi - 4}" stroke="{escape(color)}" stroke-width="1.5"/>')
+            partes.append(f'<text x="{xl + 28}" y="{yi}">{escape(etiqueta)}</text>')
+    partes.append("</svg>")
+    return "\n".join(partes)
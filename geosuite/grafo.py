@@ -0,0 +1,141 @@
+# geosuite/grafo.py
+"""
+Grafo de dependencias para recalcular solo lo que cambió.
+
+Un cálculo se parte en nodos (geometría → dovelas → resistencia → FS → tabla
+→ figura). Cada nodo declara de qué campos de la entrada, de qué opciones de
+presentación y de qué otros nodos depende, y se memoriza con una clave que
+combina esos valores con las claves de sus dependencias. Cambiar la cohesión
+cambia la clave de "resistencia" y de lo que está aguas abajo, pero no la de
+"dovelas": la geometría de las dovelas sale de la caché y solo se repite la
+iteración del FS.
+
+    grafo = Grafo("bishop")
+
+    @grafo.nodo("geometria", campos=("slope_height", "slope_angle"))
+    def _geometria(entrada): ...
+
+    @grafo.nodo("fs", campos=("cohesion",), depende=("geometria",))
+    def _fs(entrada, geometria): ...
+
+    ev = grafo.evaluar("fs", entrada)
+    ev["fs"], ev.recalculados, ev.reusados
+
+Las claves se calculan sin evaluar nada, así que si el nodo pedido está en
+caché sus dependencias ni se consultan. Los nodos recalculados y reusados se
+cuentan en ``geosuite.diagnostico`` (``grafo.<grafo>.<nodo>.recalculos`` y
+``.reusos``) y cada recálculo se mide como la etapa ``grafo.<grafo>.<nodo>``.
+"""
+from geosuite import diagnostico
+from geosuite.cache import MB, _FALTA, _copiar_tablas, _solo_lectura, clave_canonica, habilitado, obtener_cache
+
+
+class Nodo:
+    """Una etapa del grafo: función, campos de la entrada, opciones y dependencias."""
+
+    def __init__(self, grafo, nombre, funcion, campos, depende, opciones, max_entradas, max_bytes):
+        self.nombre = nombre
+        self.funcion = funcion
+        self.campos = tuple(campos)
+        self.depende = tuple(depende)
+        self.opciones = dict(opciones)
+        self.cache = obtener_cache(f"grafo_{grafo}_{nombre}", max_entradas, max_bytes)
+
+
+class Evaluacion:
+    """Valores de los nodos evaluados y qué nodos se recalcularon o salieron de la caché."""
+
+    def __init__(self):
+        self.valores = {}
+        self.recalculados = []
+        self.reusados = []
+
+    def __getitem__(self, nombre):
+        return self.valores[nombre]
+
+
+class Grafo:
+    """Conjunto de nodos memorizados de una calculadora."""
+
+    def __init__(self, nombre, max_entradas=64, max_bytes=32 * MB):
+        self.nombre = nombre
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._nodos = {}
+
+    def nodo(self, nombre, campos=(), depende=(), opciones=None, max_entradas=None, max_bytes=None):
+        """
+        Decorador que registra ``funcion(entrada, **dependencias, **opciones)`` como nodo.
+
+        `campos` son los atributos de la entrada que la función lee, `depende` los
+        nodos cuyos valores recibe y `opciones` un dict {nombre: valor por defecto}
+        de parámetros que no son parte de la entrada (p. ej. de presentación).
+        Volver a registrar un nombre reemplaza el nodo.
+        """
+        def decorador(funcion):
+            desconocidos = [d for d in depende if d not in self._nodos]
+            if desconocidos:
+                raise ValueError(f"El nodo '{nombre}' depende de nodos no registrados: {', '.join(desconocidos)}")
+            self._nodos[nombre] = Nodo(self.nombre, nombre, funcion, campos, depende, opciones or {},
+                                       max_entradas or self.max_entradas, max_bytes or self.max_bytes)
+            return funcion
+
+        return decorador
+
+    def evaluar(self, objetivos, entrada, **opciones):
+        """
+        Evalúa uno o varios nodos (y lo que necesiten de aguas arriba) para `entrada`.
+
+        Raises:
+            ValueError: Si un nodo u opción no existe; las funciones de los nodos
+                pueden lanzar sus propios ValueError, que no se guardan en caché.
+        """
+        if isinstance(objetivos, str):
+            objetivos = (objetivos,)
+        for objetivo in objetivos:
+            if objetivo not in self._nodos:
+                raise ValueError(f"Nodo desconocido: {objetivo}. Nodos: {', '.join(self._nodos)}")
+        validas = {o for nodo in self._nodos.values() for o in nodo.opciones}
+        sobrantes = set(opciones) - validas
+        if sobrantes:
+            raise ValueError(f"Opciones desconocidas para el grafo '{self.nombre}': {', '.join(sorted(sobrantes))}")
+
+        claves, evaluacion = {}, Evaluacion()
+        for objetivo in objetivos:
+            self._valor(objetivo, entrada, opciones, claves, evaluacion)
+        return evaluacion
+
+    def _opciones(self, nodo, opciones):
+        return {nombre: opciones.get(nombre, defecto) for nombre, defecto in nodo.opciones.items()}
+
+    def _clave(self, nombre, entrada, opciones, claves):
+        """Clave del nodo: sus campos, sus opciones y las claves de sus dependencias."""
+        if nombre not in claves:
+            nodo = self._nodos[nombre]
+            claves[nombre] = clave_canonica(
+                self.nombre, nombre,
+                tuple(getattr(entrada, campo) for campo in nodo.campos),
+                self._opciones(nodo, opciones),
+                tuple(self._clave(d, entrada, opciones, claves) for d in nodo.depende),
+            )
+        return claves[nombre]
+
+    def _valor(self, nombre, entrada, opciones, claves, evaluacion):
+        if nombre in evaluacion.valores:
+            return evaluacion.valores[nombre]
+        nodo = self._nodos[nombre]
+        clave = self._clave(nombre, entrada, opciones, claves)
+        valor = nodo.cache.obtener(clave, _FALTA) if habilitado() else _FALTA
+        if valor is _FALTA:
+            dependencias = {d: self._valor(d, entrada, opciones, claves, evaluacion) for d in nodo.depende}
+            with diagnostico.etapa(f"grafo.{self.nombre}.{nombre}"):
+                valor = _solo_lectura(nodo.funcion(entrada, **dependencias, **self._opciones(nodo, opciones)))
+            if habilitado():
+                nodo.cache.guardar(clave, valor)
+            evaluacion.recalculados.append(nombre)
+            diagnostico.contar(f"grafo.{self.nombre}.{nombre}.recalculos")
+        else:
+            evaluacion.reusados.append(nombre)
+            diagnostico.contar(f"grafo.{self.nombre}.{nombre}.reusos")
+        evaluacion.valores[nombre] = valor = _copiar_tablas(valor)
+        return valor
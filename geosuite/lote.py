@@ -0,0 +1,451 @@
+# geosuite/lote.py
+"""
+Corridas por lote desde la línea de comandos, sin navegador.
+
+Lee un archivo de proyecto (YAML o JSON) con muchos casos, los resuelve con el
+núcleo de cálculo en un pool de procesos y escribe los resultados conforme
+terminan, un archivo por tipo de caso (CSV o Parquet):
+
+    python -m geosuite.lote proyecto.yaml
+    python -m geosuite.lote proyecto.yaml --salida resultados/ --formato parquet --procesos 8
+    python -m geosuite.lote proyecto.yaml --desde-cero
+
+Formato del proyecto (cada caso lleva un ``id`` y los campos de la Entrada
+correspondiente; los que tienen valor por defecto pueden omitirse):
+
+    nombre: Torre Norte
+    casos:
+      capacidad:      [{id: Z1, B: 2, L: 2, Df: 1.5, gamma: 18, c: 10, phi: 30}]
+      asentamientos:  [{id: A1, q: 100, L: 4, B: 2, Es: 15000}]
+      zapatas:        [{id: C1, Pu: 60000, Mu: 3000, fc: 250, fy: 4200, q_adm: 2,
+                        b_col: 40, h_col: 40, d_propuesto: 40, C_recubrimiento: 7.5}]
+      taludes:        [{id: S1, cohesion: 10, friction_angle: 30, unit_weight: 16,
+                        slope_height: 10, slope_angle: 45, circle_center_x: 5,
+                        circle_center_y: 18, circle_radius: 15, num_slices: 30,
+                        busqueda: {centros_x: [0, 10, 11], centros_y: [12, 22, 11], radios: [10, 20, 11]}}]
+      muros:          [{id: M1, gamma: 18, phi: 30, H: 3}]
+      triaxiales:     [{id: T1, sigma3: [100, 200, 300], sigma1: [350, 600, 850]}]
+
+``unidades`` (opcional, en el proyecto o en cada caso) es "SI" o "tecnico" e
+indica en qué sistema vienen los valores; un campo también puede llevar su
+unidad en el nombre ("Pu [kN]: 600"). Sin ellos, cada campo está en las
+unidades de su motor (``UNIDADES`` de cada módulo: kN, kPa y m en los
+geotécnicos; kg, kg/cm² y cm en zapatas). Se convierten al preparar cada
+caso; los resultados se escriben en las unidades del motor.
+
+``busqueda`` (opcional en taludes) evalúa la malla [mínimo, máximo, n] de
+centros y radios y reporta el círculo crítico en lugar del círculo dado.
+``terreno`` (opcional en taludes) es la ruta de un CSV o DXF con la polilínea del
+terreno levantado, relativa al archivo de proyecto, o la polilínea en línea
+({x: [...], y: [...]}); reemplaza el talud de H y β. Mínimos y máximos de la
+búsqueda, la polilínea en línea y los estratos se convierten con ``unidades``
+como los demás campos; las coordenadas de un archivo de terreno van en m.
+
+Reanudar: cada caso terminado se anota en ``avance.jsonl`` junto con el hash de
+sus parámetros. Al volver a correr se omiten los casos ya resueltos con los
+mismos parámetros; los que terminaron con error se vuelven a intentar. Un caso
+cuyos parámetros cambiaron se vuelve a calcular y su fila nueva se agrega al
+final: la última fila de cada ``id`` es la vigente. Si el proceso se
+interrumpe, a lo sumo se repiten los casos que estaban en vuelo.
+"""
+import argparse
+import csv
+import dataclasses
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from geosuite.cache import clave_canonica
+from geosuite.unidades import SISTEMAS, normalizar_unidades
+
+# tipo -> (módulo, clase de entrada, función, clase de resultado)
+TIPOS = {
+    "capacidad": ("geosuite.capacidad_carga", "EntradaTerzaghi", "capacidad_carga_terzaghi", "ResultadoTerzaghi"),
+    "asentamientos": ("geosuite.settlement", "EntradaAsentamiento", "calculo_matrices", "ResultadoAsentamiento"),
+    "zapatas": ("geosuite.estr_zap", "EntradaZapata", "calculate_footing_design", "ResultadoZapata"),
+    "taludes": ("geosuite.slope_bishop", "EntradaBishop", "calculate_bishop_fs", "ResultadoBishop"),
+    "muros": ("geosuite.presiones_tierra", "EntradaRankine", "presiones_rankine", "ResultadoRankine"),
+    "triaxiales": ("geosuite.ensayo_triaxial", "EntradaTriaxial", "ajuste_mohr_coulomb", "ResultadoTriaxial"),
+}
+# Columnas adicionales de algunos tipos
+EXTRAS = {"taludes": [("circulos_evaluados", int)]}
+# Malla de búsqueda de taludes: [mínimo, máximo, n]; n es un conteo y no se convierte
+UNIDADES_BUSQUEDA = {"centros_x": ("m", "m", None), "centros_y": ("m", "m", None), "radios": ("m", "m", None)}
+COLUMNAS_CONTROL = [("id", str), ("estado", str), ("mensaje", str), ("hash", str)]
+
+AVANCE = "avance.jsonl"
+CASOS_POR_TAREA = 8 # casos por tarea enviada al pool (menos comunicación entre procesos)
+FILAS_POR_GRUPO = 1000 # filas por row group de Parquet
+
+
+def _clases(tipo):
+    modulo, entrada, funcion, resultado = TIPOS[tipo]
+    modulo = importlib.import_module(modulo)
+    return getattr(modulo, entrada), getattr(modulo, funcion), getattr(modulo, resultado)
+
+
+def _unidades(tipo):
+    """Unidades de los campos de entrada del motor de un tipo de caso."""
+    return getattr(importlib.import_module(TIPOS[tipo][0]), "UNIDADES", {})
+
+
+def _tipo_columna(anotacion):
+    anotacion = anotacion if isinstance(anotacion, type) else {"float": float, "int": int, "bool": bool, "str": str}.get(
+        str(anotacion), None)
+    return anotacion if anotacion in (float, int, bool, str) else None
+
+
+def columnas(tipo):
+    """Columnas (nombre, tipo) de la tabla de resultados de un tipo de caso."""
+    Entrada, _, Resultado = _clases(tipo)
+    tipos_entrada = typing.get_type_hints(Entrada)
+    tipos_resultado = typing.get_type_hints(Resultado)
+    cols = list(COLUMNAS_CONTROL)
+    for campo in dataclasses.fields(Entrada):
+        cols.append((campo.name, _tipo_columna(tipos_entrada[campo.name]) or str))
+    for campo in dataclasses.fields(Resultado):
+        tipo_col = _tipo_columna(tipos_resultado[campo.name])
+        if tipo_col is not None: # los arreglos y dicts no van a la tabla
+            cols.append((campo.name, tipo_col))
+    return cols + EXTRAS.get(tipo, [])
+
+
+def _escalar(valor):
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, (tuple, list, np.ndarray)):
+        return ";".join(f"{v:g}" if isinstance(v, (int, float, np.number)) else str(v) for v in np.ravel(valor))
+    return valor
+
+
+def _malla(limites):
+    minimo, maximo, n = limites
+    return np.linspace(float(minimo), float(maximo), int(n))
+
+
+@functools.lru_cache(maxsize=16)
+def _terreno(ruta):
+    from geosuite.terreno import Terreno
+
+    return Terreno.desde_archivo(ruta)
+
+
+def preparar_entrada(tipo, parametros):
+    """
+    Entrada de un caso del proyecto (con la búsqueda del círculo crítico ya
+    resuelta) y las columnas extra de su fila. Lanza ValueError/TypeError.
+    """
+    Entrada, _, _ = _clases(tipo)
+    parametros = {k: v for k, v in parametros.items() if k != "id"}
+    busqueda = parametros.pop("busqueda", None)
+    sistema = parametros.pop("unidades", None)
+    if busqueda is not None and not (isinstance(busqueda, dict) and all(
+            isinstance(busqueda.get(k), (list, tuple)) and len(busqueda[k]) == 3 for k in UNIDADES_BUSQUEDA)):
+        raise ValueError("busqueda se escribe {centros_x: [mínimo, máximo, n], centros_y: [...], radios: [...]}.")
+    terreno = parametros.get("terreno")
+    if tipo == "taludes" and not (terreno is None or isinstance(terreno, str)
+                                  or isinstance(terreno, dict) and {"x", "y"} <= set(terreno)):
+        raise ValueError("terreno es la ruta de un CSV o DXF o la polilínea {x: [...], y: [...]}.")
+    parametros = normalizar_unidades(parametros, _unidades(tipo), sistema)
+    if busqueda is not None:
+        busqueda = normalizar_unidades(busqueda, UNIDADES_BUSQUEDA, sistema)
+    if tipo == "triaxiales":
+        parametros = {k: tuple(v) if isinstance(v, list) else v for k, v in parametros.items()}
+    ruta_terreno = parametros.get("terreno") if tipo == "taludes" else None
+    if isinstance(ruta_terreno, str):
+        parametros["terreno"] = _terreno(ruta_terreno)
+    elif isinstance(ruta_terreno, dict): # polilínea en línea: {x: [...], y: [...]}
+        from geosuite.terreno import Terreno
+
+        parametros["terreno"] = Terreno(ruta_terreno["x"], ruta_terreno["y"])
+        ruta_terreno = f"polilínea de {parametros['terreno'].x.size} vértices"
+    entrada = Entrada(**parametros)
+
+    extras = {}
+    if ruta_terreno is not None:
+        extras["terreno"] = ruta_terreno
+    if tipo == "taludes":
+        extras["circulos_evaluados"] = 1
+        if busqueda is not None:
+            from geosuite.slope_bishop import buscar_circulo_critico
+
+            b = buscar_circulo_critico(entrada, _malla(busqueda["centros_x"]), _malla(busqueda["centros_y"]),
+                                       _malla(busqueda["radios"]))
+            entrada, extras["circulos_evaluados"] = b.critico, b.evaluados
+    return entrada, extras
+
+
+def resolver_caso(tipo, parametros):
+    """Resuelve un caso y devuelve su fila (sin columnas de control). Lanza ValueError/TypeError."""
+    _, funcion, _ = _clases(tipo)
+    entrada, extras = preparar_entrada(tipo, parametros)
+    resultado = funcion(entrada)
+
+    fila = {c.name: _escalar(getattr(entrada, c.name)) for c in dataclasses.fields(entrada)}
+    for campo in dataclasses.fields(resultado):
+        valor = getattr(resultado, campo.name)
+        if not isinstance(valor, (np.ndarray, dict, tuple, list)):
+            fila[campo.name] = _escalar(valor)
+    fila.update(extras)
+    return fila
+
+
+def _resolver_tarea(tarea):
+    """Ejecuta en un proceso del pool una lista de casos [(tipo, id, hash, parámetros)]."""
+    filas = []
+    for tipo, id_caso, hash_caso, parametros in tarea:
+        control = {"id": id_caso, "hash": hash_caso}
+        try:
+            filas.append((tipo, {**control, "estado": "ok", "mensaje": "", **resolver_caso(tipo, parametros)}))
+        except Exception as error: # un caso malformado es una fila con error, no el fin de la corrida
+            filas.append((tipo, {**control, "estado": "error", "mensaje": f"{type(error).__name__}: {error}"}))
+    return filas
+
+
+class EscritorCSV:
+    """Agrega filas a ``<tipo>.csv`` y las vacía al disco una por una."""
+
+    def __init__(self, ruta, cols):
+        self.ruta = ruta + ".csv"
+        self.nombres = [n for n, _ in cols]
+        nuevo = not os.path.exists(self.ruta) or os.path.getsize(self.ruta) == 0
+        self._archivo = open(self.ruta, "a", newline="", encoding="utf-8")
+        self._escritor = csv.DictWriter(self._archivo, fieldnames=self.nombres, extrasaction="ignore")
+        if nuevo:
+            self._escritor.writeheader()
+
+    def escribir(self, filas):
+        self._escritor.writerows(filas)
+        self._archivo.flush()
+        return True
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class EscritorParquet:
+    """
+    Escribe ``<tipo>-<n>.parquet`` por row groups. Cada corrida (o reanudación)
+    crea una parte nueva; el directorio completo se lee como un solo dataset.
+    """
+
+    def __init__(self, ruta, cols, filas_por_grupo=FILAS_POR_GRUPO):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise SystemExit("La salida Parquet requiere pyarrow (pip install pyarrow).") from error
+        self._pa, self._pq = pa, pq
+        tipos = {float: pa.float64(), int: pa.int64(), bool: pa.bool_(), str: pa.string()}
+        self.esquema = pa.schema([(n, tipos[t]) for n, t in cols])
+        self._convertir = dict(cols)
+        parte = 1
+        while os.path.exists(f"{ruta}-{parte:04d}.parquet"):
+            parte += 1
+        self.ruta = f"{ruta}-{parte:04d}.parquet"
+        self.filas_por_grupo = filas_por_grupo
+        self._pendientes = []
+        self._escritor = None
+
+    def escribir(self, filas):
+        """Devuelve True cuando las filas pendientes quedaron en disco."""
+        self._pendientes.extend(filas)
+        if len(self._pendientes) < self.filas_por_grupo:
+            return False
+        self._vaciar()
+        return True
+
+    def _vaciar(self):
+        if not self._pendientes:
+            return
+        if self._escritor is None:
+            self._escritor = self._pq.ParquetWriter(self.ruta, self.esquema)
+        nombres = self.esquema.names
+        filas = [{n: None if f.get(n) is None else self._convertir[n](f[n]) for n in nombres} for f in self._pendientes]
+        tabla = self._pa.Table.from_pylist(filas, schema=self.esquema)
+        self._escritor.write_table(tabla)
+        self._pendientes = []
+
+    def cerrar(self):
+        self._vaciar()
+        if self._escritor is not None:
+            self._escritor.close()
+
+
+def leer_proyecto(ruta):
+    """Carga el proyecto (YAML o JSON) y devuelve {tipo: [casos]}."""
+    with open(ruta, encoding="utf-8") as archivo:
+        if ruta.lower().endswith(".json"):
+            proyecto = json.load(archivo)
+        else:
+            import yaml
+
+            proyecto = yaml.safe_load(archivo)
+    casos = (proyecto or {}).get("casos") or {}
+    sistema = (proyecto or {}).get("unidades")
+    if sistema is not None and sistema not in SISTEMAS:
+        raise ValueError(f"Sistema de unidades desconocido: {sistema}. Use: {', '.join(SISTEMAS)}")
+    desconocidos = [t for t in casos if t not in TIPOS]
+    if desconocidos:
+        raise ValueError(f"Tipos de caso desconocidos: {', '.join(desconocidos)}. Use: {', '.join(TIPOS)}")
+    for tipo, lista in casos.items():
+        if not isinstance(lista, list) or not all(isinstance(c, dict) for c in lista):
+            raise ValueError(f"Los casos de '{tipo}' van en una lista de objetos {{id: ..., ...}}.")
+        ids = [str(c.get("id", "")) for c in lista]
+        if "" in ids or len(set(ids)) != len(ids):
+            raise ValueError(f"Cada caso de '{tipo}' necesita un 'id' único.")
+        if sistema is not None:
+            for caso in lista:
+                caso.setdefault("unidades", sistema)
+        if tipo == "taludes":
+            base = os.path.dirname(os.path.abspath(ruta))
+            for caso in lista:
+                if isinstance(caso.get("terreno"), str):
+                    caso["terreno"] = os.path.join(base, caso["terreno"])
+    return casos
+
+
+def _leer_avance(ruta):
+    hechos = set()
+    if os.path.exists(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError:
+                    continue # última línea a medio escribir
+                if registro.get("estado") == "ok": # los casos con error se vuelven a intentar
+                    hechos.add((registro["tipo"], registro["id"], registro["hash"]))
+    return hechos
+
+
+def correr(ruta_proyecto, salida=None, formato="csv", procesos=None, desde_cero=False, tipos=None,
+           casos_por_tarea=CASOS_POR_TAREA, informar=None):
+    """
+    Resuelve todos los casos pendientes del proyecto.
+
+    Returns:
+        dict: conteo de casos 'ok', 'error' y 'omitidos' (ya resueltos en una corrida anterior).
+    """
+    casos = leer_proyecto(ruta_proyecto)
+    if tipos:
+        casos = {t: c for t, c in casos.items() if t in tipos}
+    salida = salida or os.path.splitext(ruta_proyecto)[0] + "_resultados"
+    os.makedirs(salida, exist_ok=True)
+    ruta_avance = os.path.join(salida, AVANCE)
+    if desde_cero:
+        for nombre in os.listdir(salida):
+            if nombre == AVANCE or nombre.endswith((".csv", ".parquet")):
+                os.remove(os.path.join(salida, nombre))
+    hechos = _leer_avance(ruta_avance)
+
+    pendientes, conteo = [], {"ok": 0, "error": 0, "omitidos": 0}
+    for tipo, lista in casos.items():
+        for caso in lista:
+            id_caso = str(caso["id"])
+            hash_caso = clave_canonica(tipo, {k: v for k, v in caso.items() if k != "id"})
+            if (tipo, id_caso, hash_caso) in hechos:
+                conteo["omitidos"] += 1
+            else:
+                pendientes.append((tipo, id_caso, hash_caso, caso))
+
+    Escritor = EscritorParquet if formato == "parquet" else EscritorCSV
+    escritores = {t: Escritor(os.path.join(salida, t), columnas(t)) for t in {p[0] for p in pendientes}}
+    tareas = [pendientes[i:i + casos_por_tarea] for i in range(0, len(pendientes), casos_por_tarea)]
+    sin_anotar = {t: [] for t in escritores} # filas escritas que el escritor aún no vació al disco
+
+    with open(ruta_avance, "a", encoding="utf-8") as avance:
+        def anotar(filas):
+            for tipo, fila in filas:
+                avance.write(json.dumps({"tipo": tipo, "id": fila["id"], "hash": fila["hash"],
+                                         "estado": fila["estado"]}, ensure_ascii=False) + "\n")
+            avance.flush()
+
+        def recibir(filas):
+            por_tipo = {}
+            for tipo, fila in filas:
+                por_tipo.setdefault(tipo, []).append(fila)
+                conteo["ok" if fila["estado"] == "ok" else "error"] += 1
+            for tipo, lista in por_tipo.items():
+                sin_anotar[tipo].extend((tipo, f) for f in lista)
+                if escritores[tipo].escribir(lista):
+                    anotar(sin_anotar[tipo])
+                    sin_anotar[tipo] = []
+            if informar:
+                informar(conteo, len(pendientes))
+
+        try:
+            if procesos == 0:
+                for tarea in tareas:
+                    recibir(_resolver_tarea(tarea))
+            else:
+                procesos = procesos or os.cpu_count() or 1
+                pool = ProcessPoolExecutor(max_workers=procesos)
+                try:
+                    # Ventana acotada de tareas en vuelo: la memoria no crece con el tamaño del proyecto
+                    ventana = 4 * procesos
+                    en_vuelo, siguiente = set(), 0
+                    while siguiente < len(tareas) or en_vuelo:
+                        while siguiente < len(tareas) and len(en_vuelo) < ventana:
+                            en_vuelo.add(pool.submit(_resolver_tarea, tareas[siguiente]))
+                            siguiente += 1
+                        listos, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                        for futuro in listos:
+                            recibir(futuro.result())
+                except BaseException:
+                    # Interrupción: se descartan las tareas pendientes sin esperarlas
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                pool.shutdown()
+        finally:
+            for tipo, escritor in escritores.items():
+                escritor.cerrar()
+                anotar(sin_anotar[tipo])
+    return conteo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m geosuite.lote", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("proyecto", help="Archivo de proyecto .yaml/.yml/.json")
+    parser.add_argument("--salida", default=None, help="Carpeta de resultados (por defecto <proyecto>_resultados)")
+    parser.add_argument("--formato", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="Procesos del pool (por defecto, uno por CPU; 0 = sin pool)")
+    parser.add_argument("--casos-por-tarea", type=int, default=CASOS_POR_TAREA)
+    parser.add_argument("--tipos", nargs="+", choices=list(TIPOS), default=None, help="Solo estos tipos de caso")
+    parser.add_argument("--desde-cero", action="store_true", help="Borra resultados y avance anteriores")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    ultimo_aviso = [0.0]
+
+    def informar(conteo, total):
+        hechos = conteo["ok"] + conteo["error"]
+        if hechos == total or time.perf_counter() - ultimo_aviso[0] > 1.0:
+            ultimo_aviso[0] = time.perf_counter()
+            print(f"\r{hechos}/{total} casos ({conteo['error']} con error)", end="", file=sys.stderr, flush=True)
+
+    try:
+        conteo = correr(args.proyecto, args.salida, args.formato, args.procesos, args.desde_cero, args.tipos,
+                        args.casos_por_tarea, informar)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("\nInterrumpido. Vuelva a correr el mismo comando para reanudar.", file=sys.stderr)
+        return 130
+    print(f"\n{conteo['ok']} ok, {conteo['error']} con error, {conteo['omitidos']} omitidos (ya resueltos) "
+          f"en {time.perf_counter() - inicio:.1f} s", file=sys.stderr)
+    return 1 if conteo["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# geosuite/presiones_tierra.py
+"""Presiones de tierra de Rankine para suelo sin cohesión, muro vertical y terreno horizontal."""
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+# Unidades de los campos de entrada (ver geosuite.unidades)
+UNIDADES = {"gamma": "kN/m³", "H": "m"}
+
+
+@dataclass(frozen=True)
+class EntradaRankine:
+    """γ en kN/m³, φ en grados y altura del muro H en m."""
+    gamma: float
+    phi: float
+    H: float
+
+
+@dataclass(frozen=True)
+class ResultadoRankine:
+    """Coeficientes, presiones en la base (kPa) y fuerzas totales (kN/m)."""
+    Ka: float
+    K0: float
+    Kp: float
+    pa: float
+    p0: float
+    pp: float
+    Pa: float
+    P0: float
+    Pp: float
+
+
+def coeficientes_rankine(phi):
+    """Coeficientes activo, en reposo y pasivo (Ka, K0, Kp) para φ en grados (escalar o arreglo)."""
+    phi = np.asarray(phi, dtype=float)
+    Ka = np.tan(np.radians(45 - phi / 2)) ** 2
+    K0 = 1 - np.sin(np.radians(phi))
+    Kp = np.tan(np.radians(45 + phi / 2)) ** 2
+    return Ka, K0, Kp
+
+
+@cacheado("rankine", max_entradas=1024, max_bytes=4 * MB)
+def presiones_rankine(entrada: EntradaRankine) -> ResultadoRankine:
+    """Presiones en la base del muro y fuerzas totales (triángulo: P = 0.5 * K * γ * H²)."""
+    Ka, K0, Kp = (float(k) for k in coeficientes_rankine(entrada.phi))
+    gamma, H = entrada.gamma, entrada.H
+    return ResultadoRankine(
+        Ka=Ka, K0=K0, Kp=Kp,
+        pa=Ka * gamma * H, p0=K0 * gamma * H, pp=Kp * gamma * H,
+        Pa=0.5 * Ka * gamma * H**2, P0=0.5 * K0 * gamma * H**2, Pp=0.5 * Kp * gamma * H**2,
+    )
+
+
+def perfil_rankine(entrada: EntradaRankine, n_puntos=100):
+    """
+    Distribución de presiones con la profundidad.
+
+    Returns:
+        tuple: (z, sigma_a, sigma_h0, sigma_p) como arreglos de n_puntos.
+    """
+    Ka, K0, Kp = coeficientes_rankine(entrada.phi)
+    z = np.linspace(0, entrada.H, n_puntos)
+    sigma_v = entrada.gamma * z
+    return z, Ka * sigma_v, K0 * sigma_v, Kp * sigma_v
@@ -0,0 +1,297 @@
+# geosuite/proyectos.py
+"""
+Proyectos de cada usuario: los cálculos guardados (entrada, resultado y un
+resumen de una línea) en una base SQLite local.
+
+- La base está en modo WAL: muchas sesiones leen mientras una escribe.
+- Las conexiones salen de un pool compartido por todos los hilos del proceso
+  (Streamlit atiende cada sesión en su propio hilo), en lugar de abrir una por
+  consulta.
+- Las escrituras se encolan y se escriben por lotes en una sola transacción:
+  al juntar `LOTE` casos, a los `INTERVALO` segundos de la primera pendiente o
+  antes de cualquier lectura (cada quien ve lo que acaba de guardar).
+- Listar no lee entradas ni resultados, solo el resumen, por páginas; un caso se
+  decodifica completo hasta que se abre. Un usuario con cientos de casos abre
+  la aplicación con una consulta indexada de una página.
+
+Entradas y resultados se guardan como en ``geosuite.almacen`` (JSON con los
+dataclasses de geosuite) y los arreglos grandes en un ``.npz`` dentro de la
+misma fila. Guardar dos veces el mismo cálculo (misma entrada) actualiza el
+caso en lugar de duplicarlo.
+
+    proyectos = obtener_proyectos()
+    proyectos.guardar("ana", "asentamientos", entrada, resultado, resumen="2.3 cm")
+    proyectos.listar("ana", limite=20)    # [Resumen, ...] sin decodificar nada
+    proyectos.abrir("ana", id_caso)       # Caso completo
+
+Variables de entorno: GEOSUITE_PROYECTOS (ruta de la base).
+"""
+import atexit
+import io
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.almacen import _codificar, _decodificar
+from geosuite.cache import clave_canonica
+
+RUTA = os.path.join(os.path.expanduser("~"), ".local", "share", "geosuite", "proyectos.sqlite")
+CONEXIONES = 4 # tamaño del pool
+LOTE = 32 # casos pendientes que disparan la escritura
+INTERVALO = 2.0 # segundos máximos que un caso espera en la cola
+POR_PAGINA = 25
+TIMEOUT_BLOQUEO = 30.0
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS casos (
+    id INTEGER PRIMARY KEY,
+    usuario TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    clave TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    resumen TEXT NOT NULL,
+    entrada TEXT NOT NULL,
+    resultado TEXT,
+    arreglos BLOB,
+    creado REAL NOT NULL,
+    modificado REAL NOT NULL,
+    UNIQUE (usuario, tipo, clave)
+);
+CREATE INDEX IF NOT EXISTS casos_usuario ON casos (usuario, modificado DESC);
+"""
+
+
+@dataclass(frozen=True)
+class Resumen:
+    """Fila de la lista de casos de un usuario (sin entrada ni resultado)."""
+    id: int
+    tipo: str
+    nombre: str
+    resumen: str
+    modificado: float
+
+
+@dataclass(frozen=True)
+class Caso:
+    """Caso guardado completo."""
+    id: int
+    tipo: str
+    nombre: str
+    resumen: str
+    entrada: object
+    resultado: object
+    creado: float
+    modificado: float
+
+
+def _empacar(entrada, resultado):
+    """(entrada JSON, resultado JSON, .npz con los arreglos grandes o None)."""
+    arreglos = []
+    entrada = json.dumps(_codificar(entrada, arreglos), ensure_ascii=False, allow_nan=False)
+    resultado = None if resultado is None else json.dumps(_codificar(resultado, arreglos), ensure_ascii=False,
+                                                          allow_nan=False)
+    if not arreglos:
+        return entrada, resultado, None
+    buffer = io.BytesIO()
+    np.savez(buffer, *arreglos)
+    return entrada, resultado, buffer.getvalue()
+
+
+def _desempacar(entrada, resultado, datos):
+    arreglos = []
+    if datos is not None:
+        with np.load(io.BytesIO(datos), allow_pickle=False) as npz:
+            arreglos = [npz[f"arr_{i}"] for i in range(len(npz.files))]
+        for arreglo in arreglos:
+            arreglo.flags.writeable = False
+    return (_decodificar(json.loads(entrada), arreglos),
+            None if resultado is None else _decodificar(json.loads(resultado), arreglos))
+
+
+class Proyectos:
+    """Casos guardados por usuario en SQLite (WAL), con pool de conexiones y escrituras por lotes."""
+
+    def __init__(self, ruta=RUTA, conexiones=CONEXIONES, lote=LOTE, intervalo=INTERVALO):
+        self.ruta = os.path.abspath(ruta)
+        self.lote, self.intervalo = lote, intervalo
+        os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+        self._tamano_pool = conexiones
+        self._pool = queue.LifoQueue()
+        self._abiertas = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._pendientes = {} # (usuario, tipo, clave) -> fila; la última versión de un caso gana
+        self._temporizador = None
+        self.escrituras = self.lotes = 0
+        with self._conexion() as conexion:
+            conexion.executescript(_ESQUEMA)
+
+    # --- Pool de conexiones ---
+
+    def _nueva_conexion(self):
+        conexion = sqlite3.connect(self.ruta, timeout=TIMEOUT_BLOQUEO, isolation_level=None, check_same_thread=False)
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")
+        return conexion
+
+    @contextmanager
+    def _conexion(self):
+        """Toma una conexión del pool (o abre una si hay menos de `conexiones`) y la devuelve al salir."""
+        with self._lock:
+            if self._pid != os.getpid(): # las conexiones no sobreviven a un fork
+                self._pool, self._abiertas, self._pid = queue.LifoQueue(), 0, os.getpid()
+            abrir = self._pool.empty() and self._abiertas < self._tamano_pool
+            if abrir:
+                self._abiertas += 1
+        try:
+            conexion = self._nueva_conexion() if abrir else self._pool.get(timeout=TIMEOUT_BLOQUEO)
+        except BaseException:
+            if abrir:
+                with self._lock:
+                    self._abiertas -= 1
+            raise
+        try:
+            yield conexion
+        finally:
+            self._pool.put(conexion)
+
+    # --- Escritura por lotes ---
+
+    def guardar(self, usuario, tipo, entrada, resultado=None, nombre=None, resumen=""):
+        """
+        Encola un caso del usuario. La clave es el hash de la entrada: guardar
+        otra vez el mismo cálculo lo actualiza. Devuelve la clave.
+
+        Raises:
+            TypeError: Si la entrada o el resultado no se pueden guardar.
+        """
+        clave = clave_canonica(tipo, entrada)
+        entrada_json, resultado_json, arreglos = _empacar(entrada, resultado)
+        fila = (usuario, tipo, clave, nombre or f"{tipo} {clave[:8]}", resumen, entrada_json, resultado_json,
+                arreglos, time.time())
+        with self._lock:
+            self._pendientes[(usuario, tipo, clave)] = fila
+            lleno = len(self._pendientes) >= self.lote
+            if not lleno and self._temporizador is None:
+                self._temporizador = threading.Timer(self.intervalo, self.vaciar)
+                self._temporizador.daemon = True
+                self._temporizador.start()
+        if lleno:
+            self.vaciar()
+        return clave
+
+    def vaciar(self):
+        """Escribe los casos pendientes en una sola transacción. Devuelve cuántos escribió."""
+        with self._lock:
+            filas = list(self._pendientes.values())
+            self._pendientes.clear()
+            if self._temporizador is not None:
+                self._temporizador.cancel()
+                self._temporizador = None
+        if not filas:
+            return 0
+        with self._conexion() as conexion:
+            conexion.execute("BEGIN IMMEDIATE")
+            try:
+                conexion.executemany(
+                    "INSERT INTO casos (usuario, tipo, clave, nombre, resumen, entrada, resultado, arreglos, creado, "
+                    "modificado) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?9, ?9) "
+                    "ON CONFLICT (usuario, tipo, clave) DO UPDATE SET nombre = excluded.nombre, "
+                    "resumen = excluded.resumen, resultado = excluded.resultado, arreglos = excluded.arreglos, "
+                    "modificado = excluded.modificado",
+                    filas,
+                )
+                conexion.execute("COMMIT")
+            except BaseException:
+                conexion.execute("ROLLBACK")
+                raise
+        self.escrituras += len(filas)
+        self.lotes += 1
+        return len(filas)
+
+    # --- Lectura perezosa ---
+
+    def contar(self, usuario, tipo=None):
+        self.vaciar()
+        with self._conexion() as conexion:
+            if tipo is None:
+                return conexion.execute("SELECT COUNT(*) FROM casos WHERE usuario = ?", (usuario,)).fetchone()[0]
+            return conexion.execute("SELECT COUNT(*) FROM casos WHERE usuario = ? AND tipo = ?",
+                                    (usuario, tipo)).fetchone()[0]
+
+    def listar(self, usuario, tipo=None, limite=POR_PAGINA, desde=0):
+        """Una página de casos del usuario, el más reciente primero, sin entrada ni resultado."""
+        self.vaciar()
+        consulta = "SELECT id, tipo, nombre, resumen, modificado FROM casos WHERE usuario = ?"
+        parametros = [usuario]
+        if tipo is not None:
+            consulta += " AND tipo = ?"
+            parametros.append(tipo)
+        consulta += " ORDER BY modificado DESC, id DESC LIMIT ? OFFSET ?"
+        with self._conexion() as conexion:
+            filas = conexion.execute(consulta, (*parametros, int(limite), int(desde))).fetchall()
+        return [Resumen(*fila) for fila in filas]
+
+    def abrir(self, usuario, id_caso):
+        """
+        Caso completo del usuario.
+
+        Raises:
+            KeyError: Si el caso no existe o es de otro usuario.
+        """
+        self.vaciar()
+        with self._conexion() as conexion:
+            fila = conexion.execute(
+                "SELECT id, tipo, nombre, resumen, entrada, resultado, arreglos, creado, modificado FROM casos "
+                "WHERE id = ? AND usuario = ?", (int(id_caso), usuario),
+            ).fetchone()
+        if fila is None:
+            raise KeyError(f"No existe el caso {id_caso}.")
+        id_caso, tipo, nombre, resumen, entrada, resultado, arreglos, creado, modificado = fila
+        entrada, resultado = _desempacar(entrada, resultado, arreglos)
+        return Caso(id_caso, tipo, nombre, resumen, entrada, resultado, creado, modificado)
+
+    def renombrar(self, usuario, id_caso, nombre):
+        self.vaciar()
+        with self._conexion() as conexion:
+            conexion.execute("UPDATE casos SET nombre = ? WHERE id = ? AND usuario = ?", (nombre, int(id_caso), usuario))
+
+    def borrar(self, usuario, id_caso):
+        self.vaciar()
+        with self._conexion() as conexion:
+            conexion.execute("DELETE FROM casos WHERE id = ? AND usuario = ?", (int(id_caso), usuario))
+
+    def cerrar(self):
+        """Escribe lo pendiente y cierra las conexiones del pool."""
+        self.vaciar()
+        with self._lock:
+            while not self._pool.empty():
+                self._pool.get_nowait().close()
+            self._abiertas = 0
+
+    def estadisticas(self):
+        with self._lock:
+            pendientes = len(self._pendientes)
+        return {"ruta": self.ruta, "conexiones": self._abiertas, "pendientes": pendientes,
+                "escrituras": self.escrituras, "lotes": self.lotes}
+
+
+_PROYECTOS = None
+_PROYECTOS_LOCK = threading.Lock()
+
+
+def obtener_proyectos():
+    """Base de proyectos compartida del proceso; lo pendiente se escribe al salir."""
+    global _PROYECTOS
+    with _PROYECTOS_LOCK:
+        if _PROYECTOS is None:
+            _PROYECTOS = Proyectos(os.environ.get("GEOSUITE_PROYECTOS") or RUTA)
+            atexit.register(_PROYECTOS.vaciar)
+        return _PROYECTOS
@@ -0,0 +1,557 @@
+# geosuite/reportes.py
+"""
+Memorias de cálculo en PDF o HTML generadas en segundo plano.
+
+Una memoria es una secuencia de secciones (título, párrafos, ecuaciones,
+tablas y figuras) que ``memoria`` produce a partir de la entrada de un caso
+y de su resultado, que sale de la caché de cada calculadora. Las tablas
+largas (una fila por dovela o por estrato) se entregan como iteradores y
+los escritores las vuelcan al archivo por bloques, sin armar la tabla
+completa en memoria:
+
+    generar_memoria("taludes", entrada, "S-1.pdf")
+
+En el servidor, ``ColaReportes`` genera las memorias en un pool de hilos (o
+de procesos) y expone el estado de cada trabajo para mostrarlo en la UI:
+
+    cola = ColaReportes()
+    trabajo = cola.enviar("taludes", entrada, formato="html", nombre="S-1")
+    trabajos = cola.enviar_proyecto("ejemplos/proyecto.yaml")  # una memoria por caso
+    trabajo.estado   # "en cola" | "generando" | "listo" | "error"
+
+matplotlib solo se importa al dibujar una figura o escribir un PDF.
+"""
+import base64
+import dataclasses
+import datetime
+import html
+import io
+import os
+import shutil
+import tempfile
+import textwrap
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from geosuite import diagnostico
+from geosuite.graficas import grafica
+from geosuite.lote import TIPOS, _clases, leer_proyecto, preparar_entrada
+from geosuite.slope_bishop import FS_INICIAL
+
+FORMATOS = ("pdf", "html")
+ESTADOS = ("en cola", "generando", "listo", "error")
+FILAS_POR_BLOQUE = 256 # filas que se formatean y escriben juntas
+FILAS_POR_PAGINA = 60 # filas de tabla por página del PDF
+MAX_TRABAJOS = 500 # trabajos terminados que recuerda la cola
+
+TITULOS = {
+    "capacidad": "Capacidad de carga (Terzaghi)",
+    "asentamientos": "Asentamiento elástico (Boussinesq)",
+    "zapatas": "Diseño estructural de zapata aislada (ACI 318-19)",
+    "taludes": "Estabilidad de taludes (Bishop simplificado)",
+    "muros": "Presiones de tierra (Rankine)",
+    "triaxiales": "Ensayo triaxial (Mohr-Coulomb)",
+}
+
+ECUACIONES = {
+    "capacidad": [
+        "q = γ·Df",
+        "qu = c·Nc + q·Nq + 0.4·γ·B·Nγ   (zapata cuadrada)",
+        "Nq = e^(2(3π/4 − φ/2)·tanφ) / (2·cos²(45° + φ/2)),   Nc = (Nq − 1)·cotφ,   Nγ de tabla (Kumbhojkar)",
+        "qadm = qu / FS",
+    ],
+    "asentamientos": [
+        "Δσz = q·I4,   I4 = (2/π)·[m·n/√(1+m²+n²)·(1+m²+2n²)/((1+n²)(m²+n²)) + asin(m/(√(m²+n²)·√(1+n²)))]",
+        "m = L/B,   n = z/(B/2)   (centro del rectángulo)",
+        "S = Σ Δσz·Δz / Es",
+    ],
+    "zapatas": [
+        "A = (Pu / 1.4) / qadm,   q = P/A ± 6M/(B·L²)",
+        "Vc (una dirección) = 0.53·√f'c·b·d,   φ = 0.75",
+        "Vc (dos direcciones) = mín(1.06√f'c, 0.53(1+2/β)√f'c, 0.27(2+αs·d/bo)√f'c)·bo·d",
+        "Mu = q·B·l²/2,   As = Mu / (φ·fy·(d − a/2)),   φ = 0.90",
+        "ld = (fy·ψt·ψe / (6.6·λ·√f'c))·db",
+    ],
+    "taludes": [
+        "FS = Σ [c'·b + (W − u·b)·tanφ'] / mα  /  Σ W·sinα",
+        "mα = cosα + sinα·tanφ' / FS",
+        "u = ru·γ·h",
+        f"Se itera desde FS = {FS_INICIAL:g} hasta que |FSi+1 − FSi| < tolerancia.",
+    ],
+    "muros": [
+        "Ka = tan²(45° − φ/2),   K0 = 1 − sinφ,   Kp = tan²(45° + φ/2)",
+        "p = K·γ·H   (presión en la base)",
+        "P = ½·K·γ·H²   (empuje por metro de muro)",
+    ],
+    "triaxiales": [
+        "s = (σ1 + σ3)/2,   t = (σ1 − σ3)/2",
+        "t = b + m·s   (mínimos cuadrados)",
+        "φ = asin(m),   c = b / cosφ",
+    ],
+}
+
+
+# --- Figuras -----------------------------------------------------------------
+
+def _dibujar_talud(fig, geom_data):
+    from geosuite.slope_bishop import dibujar_talud
+
+    dibujar_talud(fig, geom_data, True)
+
+
+_figura_talud = grafica("memoria_talud", figsize=(10, 7), max_entradas=16)(_dibujar_talud)
+
+
+@grafica("memoria_asentamiento", figsize=(6, 6), max_entradas=16)
+def _figura_asentamiento(fig, z, Dsz):
+    ax = fig.subplots()
+    ax.plot(Dsz, z, color="tab:blue")
+    ax.invert_yaxis()
+    ax.set_xlabel("Δσz (kPa)"); ax.set_ylabel("z (m)")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    fig.tight_layout()
+
+
+def _figuras(tipo, resultado):
+    if tipo == "taludes":
+        yield _figura_talud(resultado.geometria), "Talud, círculo de falla y dovelas."
+    elif tipo == "asentamientos":
+        yield _figura_asentamiento(resultado.z, resultado.Dsz), "Incremento de esfuerzo vertical con la profundidad."
+
+
+# --- Secciones ---------------------------------------------------------------
+
+def _texto(valor):
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, bool):
+        return "Sí" if valor else "No"
+    if isinstance(valor, float):
+        return f"{valor:.4g}" if abs(valor) < 1e-3 or abs(valor) >= 1e6 else f"{valor:,.3f}".rstrip("0").rstrip(".")
+    if isinstance(valor, (tuple, list, np.ndarray)):
+        return ", ".join(_texto(v) for v in np.ravel(valor))
+    if valor is None:
+        return "—"
+    if hasattr(valor, "x") and hasattr(valor, "cota"): # Terreno
+        return f"polilínea de {valor.x.size} vértices"
+    return str(valor)
+
+
+def _filas(columnas):
+    """Filas de texto de columnas de igual longitud, formateadas por bloques."""
+    n = len(columnas[0])
+    for inicio in range(0, n, FILAS_POR_BLOQUE):
+        bloque = [np.asarray(c[inicio:inicio + FILAS_POR_BLOQUE]).tolist() for c in columnas]
+        for fila in zip(*bloque):
+            yield tuple(_texto(v) for v in fila)
+
+
+def _tablas_de_detalle(resultado):
+    """(título, columnas, arreglos) de los campos tabulares del resultado."""
+    grupos = OrderedDict()
+    for campo in dataclasses.fields(resultado):
+        valor = getattr(resultado, campo.name)
+        if isinstance(valor, dict):
+            arreglos = [np.asarray(v) for v in valor.values()]
+            n = {a.size for a in arreglos}
+            if arreglos and len(n) == 1 and all(a.ndim == 1 for a in arreglos) and n.pop() > 1:
+                yield f"Detalle de {campo.name}", tuple(valor), arreglos
+        elif isinstance(valor, np.ndarray) and valor.ndim == 1:
+            grupos.setdefault(valor.size, []).append((campo.name, valor))
+    for campos in grupos.values():
+        yield "Detalle", tuple(nombre for nombre, _ in campos), [v for _, v in campos]
+
+
+def memoria(tipo, entrada, nombre=None):
+    """
+    Secciones de la memoria de cálculo de un caso. Cada sección es una tupla
+    cuyo primer elemento es su clase: ("titulo", texto), ("seccion", texto),
+    ("parrafo", texto), ("ecuaciones", líneas), ("tabla", columnas, filas)
+    con `filas` iterable, o ("figura", png, pie).
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo de caso desconocido: {tipo}. Use: {', '.join(TIPOS)}")
+    _, funcion, _ = _clases(tipo)
+    resultado = funcion(entrada)
+
+    yield ("titulo", f"Memoria de cálculo — {TITULOS[tipo]}")
+    fecha = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    yield ("parrafo", f"Caso: {nombre or tipo}. Generada el {fecha} con GeoSuite.")
+
+    yield ("seccion", "Datos de entrada")
+    yield ("tabla", ("Dato", "Valor"),
+           ((c.name, _texto(getattr(entrada, c.name))) for c in dataclasses.fields(entrada)))
+
+    yield ("seccion", "Ecuaciones")
+    yield ("ecuaciones", ECUACIONES[tipo])
+
+    yield ("seccion", "Resultados")
+    yield ("tabla", ("Resultado", "Valor"),
+           ((c.name, _texto(getattr(resultado, c.name))) for c in dataclasses.fields(resultado)
+            if not isinstance(getattr(resultado, c.name), (np.ndarray, dict))))
+
+    for png, pie in _figuras(tipo, resultado):
+        yield ("figura", png, pie)
+
+    for titulo, columnas, arreglos in _tablas_de_detalle(resultado):
+        yield ("seccion", titulo)
+        yield ("tabla", columnas, _filas(arreglos))
+
+
+# --- Escritores --------------------------------------------------------------
+
+_ESTILO_HTML = """
+body { font-family: sans-serif; max-width: 60em; margin: 2em auto; color: #222; }
+h1 { font-size: 1.5em; border-bottom: 2px solid #444; }
+h2 { font-size: 1.2em; margin-top: 1.6em; }
+table { border-collapse: collapse; margin: 0.5em 0; font-size: 0.9em; }
+th, td { border: 1px solid #bbb; padding: 0.2em 0.6em; text-align: right; }
+th { background: #eee; }
+td:first-child { text-align: left; }
+pre { background: #f6f6f6; padding: 0.6em; }
+figure { margin: 1em 0; } img { max-width: 100%; }
+"""
+
+
+class _EscritorHTML:
+    """HTML autocontenido; las filas de las tablas se escriben por bloques."""
+
+    def __init__(self, archivo):
+        self.archivo = archivo
+        archivo.write(f'<!DOCTYPE html>\n<html lang="es"><head><meta charset="utf-8"><style>{_ESTILO_HTML}</style></head><body>\n')
+
+    def titulo(self, texto):
+        self.archivo.write(f"<h1>{html.escape(texto)}</h1>\n")
+
+    def seccion(self, texto):
+        self.archivo.write(f"<h2>{html.escape(texto)}</h2>\n")
+
+    def parrafo(self, texto):
+        self.archivo.write(f"<p>{html.escape(texto)}</p>\n")
+
+    def ecuaciones(self, lineas):
+        self.archivo.write("<pre>" + "\n".join(html.escape(l) for l in lineas) + "</pre>\n")
+
+    def tabla(self, columnas, filas):
+        self.archivo.write("<table><thead><tr>" + "".join(f"<th>{html.escape(c)}</th>" for c in columnas)
+                           + "</tr></thead><tbody>\n")
+        bloque = []
+        for fila in filas:
+            bloque.append("<tr>" + "".join(f"<td>{html.escape(v)}</td>" for v in fila) + "</tr>\n")
+            if len(bloque) >= FILAS_POR_BLOQUE:
+                self.archivo.write("".join(bloque))
+                bloque.clear()
+        self.archivo.write("".join(bloque) + "</tbody></table>\n")
+
+    def figura(self, png, pie):
+        datos = base64.b64encode(png).decode("ascii")
+        self.archivo.write(f'<figure><img src="data:image/png;base64,{datos}" alt="{html.escape(pie)}">'
+                           f"<figcaption>{html.escape(pie)}</figcaption></figure>\n")
+
+    def cerrar(self):
+        self.archivo.write("</body></html>\n")
+
+
+class _EscritorPDF:
+    """
+    PDF tamaño carta con matplotlib (``PdfPages``). Cada página es una figura
+    que se escribe y se descarta al llenarse, así que una tabla de miles de
+    filas nunca está completa en memoria.
+    """
+    TAMANO = (8.5, 11.0) # pulgadas
+    MARGEN = 0.07
+    ANCHO_TEXTO = 95 # caracteres por línea de párrafo
+
+    def __init__(self, archivo):
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        self.pdf = PdfPages(archivo)
+        self.pagina = None
+        self.numero = 0
+        self.y = 0.0
+
+    def _alto(self, puntos):
+        return puntos * 1.45 / 72 / self.TAMANO[1]
+
+    def _nueva_pagina(self):
+        from matplotlib.figure import Figure
+
+        self._terminar_pagina()
+        self.pagina = Figure(figsize=self.TAMANO)
+        self.numero += 1
+        self.y = 1 - self.MARGEN
+
+    def _terminar_pagina(self):
+        if self.pagina is not None:
+            self.pagina.text(0.5, self.MARGEN / 2, str(self.numero), ha="center", fontsize=8, color="0.4")
+            self.pdf.savefig(self.pagina)
+            self.pagina = None
+
+    def _espacio(self, alto):
+        if self.pagina is None or self.y - alto < self.MARGEN:
+            self._nueva_pagina()
+
+    def _linea(self, texto, puntos=10, x=None, **kwargs):
+        alto = self._alto(puntos)
+        self._espacio(alto)
+        self.pagina.text(self.MARGEN if x is None else x, self.y, texto, fontsize=puntos, va="top", **kwargs)
+        self.y -= alto
+
+    def titulo(self, texto):
+        for linea in textwrap.wrap(texto, 60):
+            self._linea(linea, 15, weight="bold")
+        self.y -= self._alto(6)
+
+    def seccion(self, texto):
+        self._espacio(self._alto(12) + 3 * self._alto(8))
+        self.y -= self._alto(6)
+        self._linea(texto, 12, weight="bold")
+
+    def parrafo(self, texto):
+        for linea in textwrap.wrap(texto, self.ANCHO_TEXTO) or [""]:
+            self._linea(linea, 10)
+
+    def ecuaciones(self, lineas):
+        for linea in lineas:
+            for parte in textwrap.wrap(linea, self.ANCHO_TEXTO, subsequent_indent="    "):
+                self._linea(parte, 9, x=self.MARGEN + 0.02, family="monospace")
+
+    def _columnas(self, textos, ancho):
+        """Un texto multilínea por columna de la tabla: pocos artistas por página."""
+        for j, lineas in enumerate(textos):
+            self.pagina.text(self.MARGEN + j * ancho, self.y, "\n".join(lineas), fontsize=7.5, va="top",
+                             linespacing=1.15) # ≈ 1.45 × tamaño de letra entre renglones, como _alto
+
+    def tabla(self, columnas, filas):
+        ancho = (1 - 2 * self.MARGEN) / len(columnas)
+        caracteres = max(int(ancho * self.TAMANO[0] * 72 / 4.2), 6) # ~4.2 pt por carácter a 7.5 pt
+        encabezado = [textwrap.wrap(c, caracteres) or [""] for c in columnas]
+        renglones = max(len(e) for e in encabezado)
+        encabezado = [e + [""] * (renglones - len(e)) for e in encabezado]
+        alto_fila = self._alto(7.5)
+
+        def volcar(bloque):
+            for r in range(renglones):
+                for j, partes in enumerate(encabezado):
+                    self.pagina.text(self.MARGEN + j * ancho, self.y, partes[r], fontsize=7.5, va="top", weight="bold")
+                self.y -= alto_fila
+            self.y -= alto_fila * 0.3
+            if bloque:
+                self._columnas(zip(*bloque), ancho)
+                self.y -= alto_fila * len(bloque)
+
+        self._espacio(alto_fila * (renglones + 2))
+        bloque = []
+        for fila in filas:
+            disponibles = int((self.y - self.MARGEN) / alto_fila) - renglones - 1
+            if len(bloque) >= min(disponibles, FILAS_POR_PAGINA):
+                volcar(bloque)
+                bloque = []
+                self._nueva_pagina()
+            bloque.append([valor[:caracteres] for valor in fila])
+        volcar(bloque)
+        self.y -= alto_fila
+
+    def figura(self, png, pie):
+        from matplotlib.image import imread
+
+        imagen = imread(io.BytesIO(png), format="png")
+        ancho = 1 - 2 * self.MARGEN
+        alto = ancho * imagen.shape[0] / imagen.shape[1] * self.TAMANO[0] / self.TAMANO[1]
+        self._espacio(alto + self._alto(12))
+        ax = self.pagina.add_axes([self.MARGEN, self.y - alto, ancho, alto])
+        ax.imshow(imagen)
+        ax.set_axis_off()
+        self.y -= alto
+        self._linea(pie, 8, style="italic")
+
+    def cerrar(self):
+        self._terminar_pagina()
+        self.pdf.close()
+
+
+def generar_memoria(tipo, entrada, ruta, formato="pdf", nombre=None):
+    """
+    Escribe la memoria de cálculo de un caso en `ruta` y la devuelve. El
+    archivo se escribe junto a su destino y se mueve al terminar, así que
+    nunca se ve a medias. Lanza ValueError con tipo o formato desconocidos.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}. Use uno de {FORMATOS}")
+    temporal = f"{ruta}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with diagnostico.etapa(f"memoria.{tipo}.{formato}"):
+            if formato == "html":
+                with open(temporal, "w", encoding="utf-8") as archivo:
+                    _escribir(_EscritorHTML(archivo), memoria(tipo, entrada, nombre))
+            else:
+                _escribir(_EscritorPDF(temporal), memoria(tipo, entrada, nombre))
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    diagnostico.contar("memorias.generadas")
+    return ruta
+
+
+def _escribir(escritor, secciones):
+    try:
+        for clase, *contenido in secciones:
+            getattr(escritor, clase)(*contenido)
+    finally:
+        escritor.cerrar()
+
+
+def _generar_caso(tipo, parametros, ruta, formato, nombre):
+    """Prepara un caso de proyecto (incluida la búsqueda del círculo crítico) y escribe su memoria."""
+    entrada, _ = preparar_entrada(tipo, parametros)
+    return generar_memoria(tipo, entrada, ruta, formato, nombre)
+
+
+# --- Cola de trabajos --------------------------------------------------------
+
+@dataclasses.dataclass
+class Trabajo:
+    """Memoria enviada a la cola. El estado se deriva del futuro del pool."""
+    id: str
+    tipo: str
+    nombre: str
+    formato: str
+    ruta: str
+    futuro: object = dataclasses.field(repr=False)
+    creado: float = dataclasses.field(default_factory=time.time)
+
+    @property
+    def estado(self):
+        if not self.futuro.done():
+            return "generando" if self.futuro.running() else "en cola"
+        return "error" if self.futuro.cancelled() or self.futuro.exception() is not None else "listo"
+
+    @property
+    def mensaje(self):
+        """Error del trabajo, o cadena vacía."""
+        if not self.futuro.done() or self.futuro.cancelled():
+            return "cancelado" if self.futuro.cancelled() else ""
+        error = self.futuro.exception()
+        return "" if error is None else f"{type(error).__name__}: {error}"
+
+    @property
+    def archivo(self):
+        return os.path.basename(self.ruta)
+
+    def contenido(self):
+        """Bytes del archivo generado (solo con estado "listo")."""
+        with open(self.ruta, "rb") as archivo:
+            return archivo.read()
+
+
+class ColaReportes:
+    """
+    Pool de generación de memorias. Por omisión usa hilos: el trabajo pesado
+    (numpy, el render de matplotlib y la escritura) libera el GIL buena parte
+    del tiempo y los resultados ya calculados se reutilizan desde la caché.
+    Con ``procesos=N`` usa un pool de procesos.
+    """
+
+    def __init__(self, directorio=None, hilos=2, procesos=None, max_trabajos=MAX_TRABAJOS):
+        self._propio = directorio is None
+        self.directorio = directorio or tempfile.mkdtemp(prefix="geosuite_memorias_")
+        os.makedirs(self.directorio, exist_ok=True)
+        self.max_trabajos = max_trabajos
+        if procesos:
+            self._pool = ProcessPoolExecutor(max_workers=procesos)
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="geosuite-memorias")
+        self._trabajos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _registrar(self, tipo, nombre, formato, funcion, *args):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato no soportado: {formato}. Use uno de {FORMATOS}")
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de caso desconocido: {tipo}. Use: {', '.join(TIPOS)}")
+        id_trabajo = uuid.uuid4().hex[:12]
+        nombre = str(nombre or f"{tipo}-{id_trabajo[:6]}")
+        seguro = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in nombre)
+        ruta = os.path.join(self.directorio, f"{seguro}-{id_trabajo[:6]}.{formato}")
+        futuro = self._pool.submit(funcion, *args, ruta, formato, nombre)
+        trabajo = Trabajo(id_trabajo, tipo, nombre, formato, ruta, futuro)
+        with self._lock:
+            self._trabajos[id_trabajo] = trabajo
+            self._recortar()
+        return trabajo
+
+    def enviar(self, tipo, entrada, formato="pdf", nombre=None):
+        """Encola la memoria de una entrada ya armada y devuelve su `Trabajo`."""
+        return self._registrar(tipo, nombre, formato, generar_memoria, tipo, entrada)
+
+    def enviar_proyecto(self, proyecto, formato="pdf", tipos=None, rutas=True):
+        """
+        Encola una memoria por caso de un proyecto de ``geosuite.lote`` (ruta
+        YAML/JSON o {tipo: [casos]}). Los casos se preparan en el pool, así que
+        las búsquedas del círculo crítico no bloquean a quien envía.
+
+        Con ``rutas=False`` (proyectos subidos por usuarios) el terreno solo se
+        acepta en línea, {x: [...], y: [...]}: una ruta leería archivos del servidor.
+
+        Raises:
+            ValueError: Si ``rutas=False`` y algún caso da el terreno como ruta.
+        """
+        casos = leer_proyecto(proyecto) if isinstance(proyecto, (str, os.PathLike)) else proyecto
+        if not rutas:
+            con_ruta = [str(c.get("id")) for lista in casos.values() for c in lista if isinstance(c.get("terreno"), str)]
+            if con_ruta:
+                raise ValueError(f"El terreno se envía como {{x: [...], y: [...]}}, no como ruta (casos: {', '.join(con_ruta)}).")
+        trabajos = []
+        for tipo, lista in casos.items():
+            if tipos and tipo not in tipos:
+                continue
+            for parametros in lista:
+                trabajos.append(self._registrar(tipo, parametros.get("id"), formato, _generar_caso, tipo, dict(parametros)))
+        return trabajos
+
+    def trabajos(self, ids=None):
+        """Trabajos en orden de envío; solo los de `ids` si se indica (los olvidados se omiten)."""
+        with self._lock:
+            if ids is None:
+                return list(self._trabajos.values())
+            return [self._trabajos[i] for i in ids if i in self._trabajos]
+
+    def _recortar(self):
+        sobrantes = len(self._trabajos) - self.max_trabajos
+        for id_trabajo, trabajo in list(self._trabajos.items()):
+            if sobrantes <= 0:
+                break
+            if trabajo.futuro.done():
+                del self._trabajos[id_trabajo]
+                if os.path.exists(trabajo.ruta):
+                    os.remove(trabajo.ruta)
+                sobrantes -= 1
+
+    def cerrar(self, esperar=True):
+        """Detiene el pool; si la cola creó su directorio, lo borra."""
+        self._pool.shutdown(wait=esperar, cancel_futures=not esperar)
+        if self._propio:
+            shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def empaquetar(trabajos):
+    """ZIP (bytes) con los archivos de los trabajos terminados."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_:
+        for trabajo in trabajos:
+            if trabajo.estado == "listo":
+                zip_.write(trabajo.ruta, trabajo.archivo)
+    return buffer.getvalue()
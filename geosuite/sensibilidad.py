@@ -0,0 +1,245 @@
+# geosuite/sensibilidad.py
+"""
+Análisis de sensibilidad: tornado (uno a la vez) e índices de Sobol.
+
+Funciona sobre las calculadoras que tienen versión vectorizada:
+
+    capacidad     capacidad_carga_lote  -> 'qadm' (o 'qu')
+    asentamiento  asentamiento_lote     -> 'asentamiento' (m)
+    bishop        fs_lote               -> 'fs'
+
+Todas las evaluaciones de un análisis se arman como columnas de arreglos y se
+resuelven en una sola llamada al kernel vectorizado (decenas de miles de casos),
+nunca llamando a la calculadora caso por caso. Para Bishop, que es el kernel
+más pesado, ``procesos`` reparte los bloques en un pool de procesos.
+
+    base = EntradaBishop(10, 30, 16, 10, 45, 5, 18, 15, 30)
+    rangos = {"cohesion": (5, 15), "friction_angle": (25, 35), "ru": (0, 0.3)}
+    tornado("bishop", base, rangos)
+    sobol("bishop", base, rangos, n=4096, procesos=4)
+
+Los índices de Sobol se estiman con el muestreo de Saltelli (matrices A, B y
+A_B^(i), n·(k + 2) evaluaciones), con los estimadores de Saltelli (2010) para
+el índice de primer orden y de Jansen para el total, y con intervalos de
+confianza del 95 % por bootstrap. Los parámetros varían uniformemente en sus
+rangos; los demás quedan en el valor de `base`. Con estratos en la base del
+asentamiento, los estratos quedan fijos y `Es` es el módulo debajo del último.
+"""
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite import diagnostico
+from geosuite.cache import MB, cacheado
+
+BLOQUE_POOL = 8192 # casos por tarea del pool
+MAX_ELEMENTOS_BOOTSTRAP = 4_000_000 # tamaño de los arreglos intermedios del bootstrap
+
+
+def _capacidad(columnas):
+    from geosuite.capacidad_carga import capacidad_carga_lote
+
+    return capacidad_carga_lote(columnas["B"], columnas["Df"], columnas["gamma"], columnas["c"], columnas["phi"],
+                                columnas["FS"])
+
+
+def _asentamiento(columnas):
+    from geosuite.settlement import asentamiento_lote
+
+    return {"asentamiento": asentamiento_lote(columnas["q"], columnas["L"], columnas["B"], columnas["Es"],
+                                              columnas["delta_z"], columnas.get("estratos"))}
+
+
+def _bishop(columnas):
+    from geosuite.slope_bishop import fs_lote
+
+    return {"fs": fs_lote(**columnas)}
+
+
+# nombre -> (kernel(columnas) -> {salida: arreglo}, salidas, salida por defecto)
+MODELOS = {
+    "capacidad": (_capacidad, ("qadm", "qu"), "qadm"),
+    "asentamiento": (_asentamiento, ("asentamiento",), "asentamiento"),
+    "bishop": (_bishop, ("fs",), "fs"),
+}
+
+
+@dataclass(frozen=True)
+class ResultadoTornado:
+    """
+    Salida con cada parámetro en su mínimo (`bajo`) y en su máximo (`alto`) y los
+    demás en la base. Los parámetros van ordenados de mayor a menor oscilación.
+    """
+    salida: str
+    valor_base: float
+    parametros: tuple
+    bajo: np.ndarray
+    alto: np.ndarray
+    rangos: tuple
+
+
+@dataclass(frozen=True)
+class ResultadoSobol:
+    """Índices de primer orden (S1) y totales (ST) con la semiamplitud de su intervalo del 95 %."""
+    salida: str
+    parametros: tuple
+    S1: np.ndarray
+    ST: np.ndarray
+    S1_ic: np.ndarray
+    ST_ic: np.ndarray
+    media: float
+    varianza: float
+    evaluaciones: int
+    validas: int
+
+
+def _modelo(nombre, salida):
+    if nombre not in MODELOS:
+        raise ValueError(f"Modelo desconocido: {nombre}. Modelos: {', '.join(MODELOS)}")
+    _, salidas, defecto = MODELOS[nombre]
+    salida = salida or defecto
+    if salida not in salidas:
+        raise ValueError(f"Salida desconocida para '{nombre}': {salida}. Salidas: {', '.join(salidas)}")
+    return salida
+
+
+def _validar_rangos(base, rangos):
+    campos = {c.name for c in dataclasses.fields(base)}
+    if not rangos:
+        raise ValueError("Indique al menos un parámetro con su rango (mínimo, máximo).")
+    for nombre, (minimo, maximo) in rangos.items():
+        if nombre not in campos:
+            raise ValueError(f"'{nombre}' no es un dato de {type(base).__name__}. Datos: {', '.join(sorted(campos))}")
+        if not minimo <= maximo:
+            raise ValueError(f"Rango inválido para '{nombre}': ({minimo}, {maximo}).")
+
+
+def _evaluar_bloque(modelo, salida, columnas):
+    """Corre el kernel vectorizado sobre un bloque de casos. Se ejecuta también en el pool."""
+    return np.asarray(MODELOS[modelo][0](columnas)[salida], dtype=float)
+
+
+def evaluar(modelo, base, variaciones, salida=None, procesos=None):
+    """
+    Evalúa el modelo con los datos de `base` y las columnas de `variaciones`
+    ({campo: arreglo}) reemplazando los campos correspondientes.
+
+    Returns:
+        ndarray: la salida pedida para cada fila de `variaciones`.
+    """
+    salida = _modelo(modelo, salida)
+    n = len(next(iter(variaciones.values())))
+    # Los datos que no son números (p. ej. el terreno de Bishop) pasan tal cual al kernel
+    fijos = {c.name: getattr(base, c.name) for c in dataclasses.fields(base)
+             if c.name not in variaciones and not isinstance(getattr(base, c.name), (int, float, np.number))}
+    columnas = {c.name: np.asarray(variaciones.get(c.name, getattr(base, c.name)), dtype=float)
+                for c in dataclasses.fields(base) if c.name not in fijos}
+    columnas = dict(zip(columnas, np.broadcast_arrays(*columnas.values())))
+    diagnostico.contar(f"sensibilidad.{modelo}.evaluaciones", n)
+
+    if not procesos or procesos <= 1 or n <= BLOQUE_POOL:
+        with diagnostico.etapa(f"sensibilidad.{modelo}"):
+            return _evaluar_bloque(modelo, salida, {**columnas, **fijos})
+
+    bloques = [{**{k: v[i:i + BLOQUE_POOL] for k, v in columnas.items()}, **fijos} for i in range(0, n, BLOQUE_POOL)]
+    with diagnostico.etapa(f"sensibilidad.{modelo}.pool"), ProcessPoolExecutor(max_workers=procesos) as pool:
+        partes = list(pool.map(_evaluar_bloque, [modelo] * len(bloques), [salida] * len(bloques), bloques))
+    return np.concatenate(partes)
+
+
+@cacheado("sensibilidad_tornado", max_entradas=64, max_bytes=4 * MB)
+def tornado(modelo, base, rangos, salida=None) -> ResultadoTornado:
+    """
+    Sensibilidad uno a la vez: 2·k + 1 evaluaciones en una sola llamada vectorizada.
+
+    Raises:
+        ValueError: Si el modelo, la salida o algún rango no son válidos.
+    """
+    salida = _modelo(modelo, salida)
+    _validar_rangos(base, rangos)
+    nombres = tuple(rangos)
+    k = len(nombres)
+
+    # Fila 0: base; filas 1..k: parámetro i en su mínimo; filas k+1..2k: en su máximo
+    variaciones = {}
+    for i, nombre in enumerate(nombres):
+        columna = np.full(2 * k + 1, float(getattr(base, nombre)))
+        columna[1 + i], columna[1 + k + i] = rangos[nombre]
+        variaciones[nombre] = columna
+    y = evaluar(modelo, base, variaciones, salida)
+
+    bajo, alto = y[1:k + 1], y[k + 1:]
+    orden = np.argsort(-np.abs(alto - bajo), kind="stable")
+    return ResultadoTornado(salida=salida, valor_base=float(y[0]), parametros=tuple(nombres[i] for i in orden),
+                            bajo=bajo[orden], alto=alto[orden], rangos=tuple(tuple(rangos[nombres[i]]) for i in orden))
+
+
+def matrices_saltelli(rangos, n, semilla=0):
+    """
+    Matrices A y B (n × k) uniformes en los rangos y la pila A_B (k × n × k) en la
+    que A_B[i] es A con la columna i tomada de B.
+    """
+    generador = np.random.default_rng(semilla)
+    minimos, maximos = (np.array(v, dtype=float) for v in zip(*rangos.values()))
+    muestras = minimos + (maximos - minimos) * generador.random((2, n, len(rangos)))
+    A, B = muestras
+    AB = np.repeat(A[None], len(rangos), axis=0)
+    for i in range(len(rangos)):
+        AB[i, :, i] = B[:, i]
+    return A, B, AB
+
+
+def _indices(fA, fB, fAB):
+    """S1 (Saltelli 2010) y ST (Jansen) a partir de las evaluaciones; fAB tiene forma (k, n)."""
+    varianza = np.var(np.concatenate([fA, fB], axis=-1), axis=-1)
+    S1 = np.mean(fB[..., None, :] * (fAB - fA[..., None, :]), axis=-1) / varianza[..., None]
+    ST = 0.5 * np.mean((fA[..., None, :] - fAB) ** 2, axis=-1) / varianza[..., None]
+    return S1, ST
+
+
+@cacheado("sensibilidad_sobol", max_entradas=32, max_bytes=4 * MB)
+def sobol(modelo, base, rangos, n=4096, salida=None, semilla=0, procesos=None, n_bootstrap=200) -> ResultadoSobol:
+    """
+    Índices de Sobol por muestreo de Saltelli: n·(k + 2) evaluaciones vectorizadas.
+
+    Las filas en que alguna evaluación no es finita (p. ej. círculos de Bishop que
+    no cortan el talud) se descartan de los estimadores.
+
+    Raises:
+        ValueError: Si el modelo, la salida o algún rango no son válidos, o si la
+            salida no varía en los rangos dados.
+    """
+    salida = _modelo(modelo, salida)
+    _validar_rangos(base, rangos)
+    nombres = tuple(rangos)
+    k = len(nombres)
+    A, B, AB = matrices_saltelli(rangos, n, semilla)
+
+    # Todas las evaluaciones en una sola pila: [A; B; A_B(1); ...; A_B(k)]
+    X = np.concatenate([A, B, AB.reshape(k * n, k)])
+    y = evaluar(modelo, base, {nombre: X[:, i] for i, nombre in enumerate(nombres)}, salida, procesos)
+    fA, fB, fAB = y[:n], y[n:2 * n], y[2 * n:].reshape(k, n)
+
+    finitas = np.isfinite(fA) & np.isfinite(fB) & np.isfinite(fAB).all(axis=0)
+    fA, fB, fAB = fA[finitas], fB[finitas], fAB[:, finitas]
+    m = fA.size
+    if m < 2 or np.var(np.concatenate([fA, fB])) == 0:
+        raise ValueError("La salida no varía (o no es finita) en los rangos dados; no se pueden calcular índices.")
+    S1, ST = _indices(fA, fB, fAB)
+
+    # Bootstrap: remuestreo de filas, varias réplicas por operación vectorizada
+    generador = np.random.default_rng(semilla + 1)
+    por_bloque = max(1, MAX_ELEMENTOS_BOOTSTRAP // (k * m))
+    S1_b, ST_b = [], []
+    for inicio in range(0, n_bootstrap, por_bloque):
+        filas = generador.integers(0, m, (min(por_bloque, n_bootstrap - inicio), m))
+        s1, st = _indices(fA[filas], fB[filas], fAB[:, filas].transpose(1, 0, 2))
+        S1_b.append(s1)
+        ST_b.append(st)
+    S1_b, ST_b = np.concatenate(S1_b), np.concatenate(ST_b)
+    z = 1.96
+    return ResultadoSobol(salida=salida, parametros=nombres, S1=S1, ST=ST, S1_ic=z * S1_b.std(axis=0),
+                          ST_ic=z * ST_b.std(axis=0), media=float(np.mean(np.concatenate([fA, fB]))),
+                          varianza=float(np.var(np.concatenate([fA, fB]))), evaluaciones=y.size, validas=m)
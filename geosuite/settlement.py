@@ -0,0 +1,192 @@
+# geosuite/settlement.py
+"""
+Asentamiento elástico (Boussinesq) bajo el centro de una cimentación
+rectangular y, con `asentamiento_losa`, en una malla de puntos bajo una losa
+poligonal (ver geosuite.esfuerzos).
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+DELTA_Z = 0.1 # Valor para subdividir el medio (m)
+FACTOR_PROF_MAX = 8 # Profundidad máxima de cálculo = 8·B
+
+# Unidades de los campos de entrada (ver geosuite.unidades)
+UNIDADES = {"q": "kPa", "L": "m", "B": "m", "Es": "kPa", "delta_z": "m", "paso": "m", "profundidad": "m",
+            "estratos": ("m", "kPa"), "vertices": ("m", "m"), "puntos": ("m", "m")}
+
+
+@dataclass(frozen=True)
+class EntradaAsentamiento:
+    """
+    Cimentación B x L (m) con presión de contacto q (kPa) sobre suelo de módulo Es (kPa).
+    Con `estratos` ((z_base, Es), ...), con z_base en m desde el desplante y en
+    orden creciente, el módulo varía por estrato y `Es` queda para lo que esté
+    debajo del último.
+    """
+    q: float
+    L: float
+    B: float
+    Es: float
+    delta_z: float = DELTA_Z
+    estratos: tuple = None
+
+
+@dataclass(frozen=True)
+class ResultadoAsentamiento:
+    """Perfil de incremento de esfuerzos y asentamiento total (m)."""
+    z: np.ndarray
+    Dsz: np.ndarray
+    asentamiento_parcial: np.ndarray
+    asentamiento: float
+
+
+@dataclass(frozen=True)
+class EntradaLosa:
+    """
+    Losa poligonal con presión de contacto uniforme q (kPa) sobre suelo de
+    módulo Es (kPa). `vertices` ((x, y), ...) en m, en cualquier sentido. Los
+    puntos de cálculo son `puntos` ((x, y), ...) o, si no se dan, los centros de
+    una malla de separación `paso` (m) dentro de la losa. La profundidad de
+    cálculo es `profundidad` (m) o 8 veces el lado menor del rectángulo
+    circunscrito; `estratos` como en EntradaAsentamiento.
+    """
+    q: float
+    vertices: tuple
+    Es: float
+    paso: float = 1.0
+    delta_z: float = 0.25
+    estratos: tuple = None
+    puntos: tuple = None
+    profundidad: float = None
+
+
+@dataclass(frozen=True)
+class ResultadoLosa:
+    """Asentamiento (m) en cada punto (x, y) de la losa y sus extremos."""
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+    asentamiento: np.ndarray
+    maximo: float
+    minimo: float
+    diferencial: float
+
+
+#Funcion de Boussinesq rect al centro, esta z es desde la Df
+def bou_rect_c(q, L, B, z):
+    """
+    Incremento de esfuerzo vertical bajo el centro de un rectángulo cargado.
+
+    Acepta escalares o arreglos para cualquiera de los argumentos.
+    """
+    z = np.asarray(z, dtype=float)
+    m1 = L/B
+    b = B/2
+    n1 = z/b
+
+    I4 = 2 / np.pi * ((m1*n1)/np.sqrt(1+m1**2+n1**2)*(1+m1**2+2*n1**2)/((1+n1**2)*(m1**2+n1**2))+np.arcsin(m1/(np.sqrt(m1**2+n1**2)*np.sqrt(1+n1**2))))
+
+    Dsz = q * I4
+
+    #Supone que el incremento de esfuerzos es representativo hasta la profundidad que llega el 10% de q y tambien evita errores si Dsz es negativo
+    return np.maximum(Dsz, 0.0)
+
+
+def profundidades(B, delta_z=DELTA_Z, maxima=None):
+    """Profundidades de cálculo Δz, 2Δz, ... hasta 8·B o hasta `maxima` (exclusivo)."""
+    maxima = FACTOR_PROF_MAX * B if maxima is None else maxima
+    n = int(np.ceil(round(maxima / delta_z, 9))) - 1
+    return delta_z * np.arange(1, max(n, 0) + 1)
+
+
+def asentamiento_lote(q, L, B, Es, delta_z=DELTA_Z, estratos=None, bloque=4096):
+    """
+    Asentamiento total (m) de muchos casos a la vez (arreglos que se difunden entre sí).
+
+    Equivale a ``calculo_matrices(...).asentamiento`` caso por caso: cada caso suma
+    Δσz·Δz/Es en sus propias profundidades hasta 8·B. Las profundidades se
+    evalúan en una matriz casos × profundidades, por bloques de `bloque` casos
+    para acotar la memoria. `estratos` ((z_base, Es), ...) es el mismo para
+    todos los casos; entonces `Es` es el módulo debajo del último estrato.
+    """
+    q, L, B, Es, delta_z = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (q, L, B, Es, delta_z)))
+    forma = q.shape
+    q, L, B, Es, delta_z = (v.ravel() for v in (q, L, B, Es, delta_z))
+    n = np.maximum(np.ceil(np.round(FACTOR_PROF_MAX * B / delta_z, 9)) - 1, 0)
+    salida = np.empty(q.size)
+    for inicio in range(0, q.size, bloque):
+        t = slice(inicio, inicio + bloque)
+        k = np.arange(1, int(n[t].max(initial=0)) + 1)
+        z = delta_z[t, None] * k
+        Dsz = bou_rect_c(q[t, None], L[t, None], B[t, None], z)
+        if estratos:
+            Dsz = Dsz / modulos(z, Es[t, None], estratos, delta_z[t, None])
+            salida[t] = np.where(k <= n[t, None], Dsz, 0.0).sum(axis=1) * delta_z[t]
+        else:
+            salida[t] = np.where(k <= n[t, None], Dsz, 0.0).sum(axis=1) * delta_z[t] / Es[t]
+    return salida.reshape(forma)
+
+
+#Incremento de esfuerzos a diferentes profundidades
+@cacheado("asentamiento", max_entradas=128, max_bytes=32 * MB)
+def calculo_matrices(entrada: EntradaAsentamiento) -> ResultadoAsentamiento:
+    """Calcula el perfil Δσz(z) y el asentamiento elástico acumulado hasta 8·B."""
+    z = profundidades(entrada.B, entrada.delta_z)
+    Dsz = bou_rect_c(entrada.q, entrada.L, entrada.B, z)
+    parcial = Dsz * entrada.delta_z / modulos(z, entrada.Es, entrada.estratos, entrada.delta_z)
+    return ResultadoAsentamiento(z=z, Dsz=Dsz, asentamiento_parcial=parcial, asentamiento=float(parcial.sum()))
+
+
+def modulos(z, Es, estratos=None, delta_z=DELTA_Z):
+    """
+    Módulo de cada subcapa con base en z: el del estrato en que cae su punto
+    medio, o Es debajo del último. Es y delta_z pueden ser arreglos que se
+    difunden con z (un valor por caso en ``asentamiento_lote``).
+    """
+    if not estratos:
+        return np.full_like(z, Es)
+    z_base, Es_estratos = np.asarray(estratos, dtype=float).reshape(-1, 2).T
+    i = np.searchsorted(z_base, z - delta_z / 2)
+    return np.where(i < z_base.size, Es_estratos[np.minimum(i, z_base.size - 1)], Es)
+
+
+def malla_losa(vertices, paso):
+    """Centros (x, y) de una malla de separación `paso` que quedan dentro del polígono."""
+    from geosuite.exploracion import puntos_en_poligono
+
+    if paso <= 0:
+        raise ValueError("La separación de la malla debe ser positiva.")
+    v = np.asarray(vertices, dtype=float)
+    (x0, y0), (x1, y1) = v.min(axis=0), v.max(axis=0)
+    gx, gy = np.meshgrid(np.arange(x0 + paso / 2, x1, paso), np.arange(y0 + paso / 2, y1, paso))
+    dentro = puntos_en_poligono(gx, gy, v)
+    return gx[dentro], gy[dentro]
+
+
+@cacheado("asentamiento_losa", max_entradas=32, max_bytes=64 * MB)
+def asentamiento_losa(entrada: EntradaLosa) -> ResultadoLosa:
+    """
+    Asentamiento elástico en cada punto de cálculo de una losa poligonal.
+
+    Δσz se evalúa en la matriz puntos × profundidades con la integración por
+    aristas de `esfuerzos.esfuerzo_poligono_malla` (por bloques, sin ciclos por
+    punto) y se suma Δσz·Δz/E por columna, como en `calculo_matrices`.
+    """
+    from geosuite.esfuerzos import esfuerzo_poligono_malla
+
+    v = np.asarray(entrada.vertices, dtype=float)
+    if entrada.puntos is not None:
+        x, y = np.asarray(entrada.puntos, dtype=float).reshape(-1, 2).T
+    else:
+        x, y = malla_losa(v, entrada.paso)
+    if x.size == 0:
+        raise ValueError("No hay puntos de cálculo dentro de la losa; reduzca la separación de la malla.")
+    lado = float((v.max(axis=0) - v.min(axis=0)).min())
+    z = profundidades(lado, entrada.delta_z, entrada.profundidad)
+    Dsz = esfuerzo_poligono_malla(entrada.q, v, x, y, z)
+    s = Dsz @ (entrada.delta_z / modulos(z, entrada.Es, entrada.estratos, entrada.delta_z))
+    return ResultadoLosa(x=x, y=y, z=z, asentamiento=s, maximo=float(s.max()), minimo=float(s.min()),
+                         diferencial=float(s.max() - s.min()))
@@ -0,0 +1,483 @@
+# geosuite/slope_bishop.py
+"""
+Estabilidad de taludes por el método de Bishop Simplificado.
+
+El Factor de Seguridad (FS) se calcula con la siguiente fórmula iterativa:
+
+          Σ [ (c' * b + (W - u * b) * tan(φ')) / m_α ]
+FS = ----------------------------------------------------
+                     Σ(W * sinα)
+
+donde:
+m_α = cos(α) + (sin(α) * tan(φ') / FS)
+
+Debido a que FS aparece en ambos lados, se requiere un proceso iterativo.
+
+Variables:
+c'   : Cohesión efectiva del suelo
+φ'   : Ángulo de fricción interna efectivo
+γ    : Peso unitario del suelo
+W    : Peso de cada dovela
+α    : Ángulo en la base de cada dovela
+b    : Ancho de la base de cada dovela
+u    : Presión de poros en la base de la dovela (simplificado con ru)
+ru   : Coeficiente de presión de poros (u / (γ * h))
+"""
+import functools
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from geosuite import diagnostico
+from geosuite.cache import MB, cacheado
+from geosuite.grafo import Grafo
+from geosuite.terreno import Terreno, cortes_circulo
+
+FS_INICIAL = 1.5
+TOLERANCIA = 0.001
+MAX_ITERACIONES = 100
+BLOQUE_CASOS = 4096 # casos por bloque en fs_lote (acota la matriz casos × dovelas)
+
+# Unidades de los campos de entrada (ver geosuite.unidades)
+UNIDADES = {"cohesion": "kPa", "unit_weight": "kN/m³", "slope_height": "m", "circle_center_x": "m",
+            "circle_center_y": "m", "circle_radius": "m", "terreno": {"x": "m", "y": "m"}}
+
+COLUMNAS_DOVELAS = [
+    "Dovela",
+    "Peso W (kN/m)",
+    "Ángulo α (°)",
+    "Fuerza Actuante (W*sinα)",
+    "Resistencia Cohesiva (c*b)",
+    "Resistencia Friccional ((W-ub)tanφ')",
+    "Numerador FS",
+]
+
+
+@dataclass(frozen=True)
+class EntradaBishop:
+    """
+    Talud homogéneo (H en m, β en grados) y círculo de falla de prueba (centro y radio en m).
+    Con `terreno` (polilínea levantada) la superficie es la del terreno y H, β se ignoran.
+    """
+    cohesion: float
+    friction_angle: float
+    unit_weight: float
+    slope_height: float
+    slope_angle: float
+    circle_center_x: float
+    circle_center_y: float
+    circle_radius: float
+    num_slices: int
+    ru: float = 0.0
+    terreno: Terreno = None
+
+
+@dataclass(frozen=True)
+class ResultadoBishop:
+    """
+    Factor de seguridad, estado de la iteración, detalle por dovela (columnas
+    COLUMNAS_DOVELAS, solo dovelas válidas) y datos geométricos para la gráfica.
+    """
+    fs: float
+    convergio: bool
+    iteraciones: int
+    dovelas: dict
+    geometria: dict
+
+
+@dataclass(frozen=True)
+class ResultadoBusqueda:
+    """
+    Búsqueda del círculo crítico en una malla de centros y radios. `fs` tiene forma
+    (len(centros_x), len(centros_y), len(radios)) con NaN en los círculos que no
+    cortan el talud.
+    """
+    fs_min: float
+    critico: EntradaBishop
+    fs: np.ndarray
+    evaluados: int
+    validos: int
+
+
+@functools.lru_cache(maxsize=256)
+def _terreno_ideal(H, beta):
+    return Terreno.ideal(H, beta)
+
+
+def terreno_de(entrada: EntradaBishop) -> Terreno:
+    """Polilínea del terreno: la levantada o la del talud idealizado (H, β)."""
+    if entrada.terreno is not None:
+        return entrada.terreno
+    return _terreno_ideal(float(entrada.slope_height), float(entrada.slope_angle))
+
+
+def geometria_talud(entrada: EntradaBishop):
+    """
+    Entrada y salida del círculo de falla: primer y último corte de su arco
+    inferior con el terreno. Si el arco sale y vuelve a entrar, las dovelas
+    intermedias sin suelo encima se descartan en ``dovelas``.
+
+    Returns:
+        tuple: (x_entrada, x_salida)
+
+    Raises:
+        ValueError: Si el círculo no corta el terreno en al menos dos puntos.
+    """
+    cortes = terreno_de(entrada).intersecciones(entrada.circle_center_x, entrada.circle_center_y,
+                                                entrada.circle_radius)
+    if cortes.size < 2:
+        raise ValueError("Error: El círculo de falla no intersecta la superficie del talud en dos puntos. "
+                         "Ajusta los parámetros del círculo.")
+    return float(cortes[0]), float(cortes[-1])
+
+
+def dovelas(entrada: EntradaBishop, x_entrada, x_salida):
+    """
+    Geometría y pesos de las dovelas, vectorizados sobre todas las dovelas. La
+    cota superior de cada dovela sale del índice de segmentos del terreno.
+
+    Returns:
+        dict: 'indice', 'W', 'alpha', 'b', 'u' para las dovelas válidas y 'slice_width'.
+    """
+    R = entrada.circle_radius
+    xc, yc = entrada.circle_center_x, entrada.circle_center_y
+    gamma = entrada.unit_weight
+
+    slice_width = (x_salida - x_entrada) / entrada.num_slices
+    j = np.arange(entrada.num_slices)
+    x_mid = x_entrada + (j + 0.5) * slice_width
+
+    y_top = terreno_de(entrada).cota(x_mid)
+    radicando = R**2 - (x_mid - xc)**2
+    y_base = yc - np.sqrt(np.maximum(radicando, 0.0))
+    slice_height = y_top - y_base
+    validas = (radicando >= 0) & (slice_height >= 0)
+
+    j, x_mid, y_base, slice_height = j[validas], x_mid[validas], y_base[validas], slice_height[validas]
+    alpha = np.arctan2(yc - y_base, x_mid - xc) - np.pi/2
+    W = slice_height * slice_width * gamma
+    # Talud que baja hacia la izquierda: se refleja para que la masa deslice en sentido positivo
+    if np.sum(W * np.sin(alpha)) < 0:
+        alpha = -alpha
+    return {
+        'indice': j,
+        'W': W,
+        'alpha': alpha,
+        'b': slice_width / np.cos(alpha),
+        'u': entrada.ru * gamma * slice_height,
+        'slice_width': slice_width,
+    }
+
+
+def resistencia_dovelas(cohesion, tan_phi, dov):
+    """
+    Resistencia cohesiva (c'·b) y friccional ((W - u·b)·tanφ') de cada dovela.
+
+    Returns:
+        dict: 'cohesiva', 'friccional' y 'tan_phi'.
+    """
+    return {
+        'cohesiva': cohesion * dov['b'],
+        'friccional': (dov['W'] - dov['u'] * dov['b']) * tan_phi,
+        'tan_phi': tan_phi,
+    }
+
+
+def iterar_fs(cohesion, tan_phi, W, alpha, b, u, fs_inicial=FS_INICIAL,
+              tolerancia=TOLERANCIA, max_iteraciones=MAX_ITERACIONES, resistencia=None):
+    """
+    Iteración de punto fijo de Bishop Simplificado sobre arreglos de dovelas.
+    `resistencia` (c'·b + (W - u·b)·tanφ' por dovela) se puede pasar ya calculada.
+
+    Returns:
+        tuple: (fs, convergio, iteraciones)
+    """
+    sin_a, cos_a = np.sin(alpha), np.cos(alpha)
+    if resistencia is None:
+        resistencia = cohesion * b + (W - u * b) * tan_phi
+    denominator_sum = np.sum(W * sin_a)
+    if denominator_sum == 0:
+        return float('inf'), False, 0
+
+    fs_assumed = fs_inicial
+    for i in range(1, max_iteraciones + 1):
+        m_alpha = cos_a + sin_a * tan_phi / fs_assumed
+        fs_calculated = np.sum(resistencia / m_alpha) / denominator_sum
+        if abs(fs_calculated - fs_assumed) < tolerancia:
+            return float(fs_calculated), True, i
+        fs_assumed = fs_calculated
+    return float(fs_calculated), False, max_iteraciones
+
+
+def fs_circulo(entrada: EntradaBishop):
+    """
+    Solo el FS de un círculo, sin el detalle por dovela.
+
+    Returns:
+        tuple: (fs, convergio, iteraciones)
+
+    Raises:
+        ValueError: Si el círculo de falla no intersecta la superficie del talud.
+    """
+    x_entrada, x_salida = geometria_talud(entrada)
+    dov = dovelas(entrada, x_entrada, x_salida)
+    tan_phi = np.tan(np.deg2rad(entrada.friction_angle))
+    fs, convergio, iteraciones = iterar_fs(entrada.cohesion, tan_phi, dov['W'], dov['alpha'], dov['b'], dov['u'])
+    diagnostico.contar("bishop.circulos")
+    diagnostico.contar("bishop.iteraciones", iteraciones)
+    return fs, convergio, iteraciones
+
+
+def fs_lote(cohesion, friction_angle, unit_weight, slope_height, slope_angle, circle_center_x, circle_center_y,
+            circle_radius, num_slices, ru=0.0, terreno=None, fs_inicial=FS_INICIAL, tolerancia=TOLERANCIA,
+            max_iteraciones=MAX_ITERACIONES):
+    """
+    FS de Bishop de muchos casos a la vez (arreglos que se difunden entre sí).
+
+    Reproduce ``fs_circulo`` caso por caso: los cortes con el terreno se
+    resuelven sobre una matriz casos × piezas del terreno (con terreno
+    levantado, solo en los pares que pueden cortarse), las dovelas sobre
+    una matriz casos × dovelas y la iteración avanza todos los casos juntos,
+    congelando cada uno al converger. Con `terreno` (común a todos los casos)
+    H y β se ignoran. Los círculos que no cortan el talud dan NaN en vez de
+    ValueError.
+
+    Returns:
+        ndarray: FS con la forma difundida de los argumentos.
+    """
+    args = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        cohesion, friction_angle, unit_weight, slope_height, slope_angle, circle_center_x, circle_center_y,
+        circle_radius, num_slices, ru)))
+    forma = args[0].shape
+    columnas = [v.ravel() for v in args]
+    n = columnas[8]
+    fs = np.full(n.size, np.nan)
+    # Las dovelas forman una matriz rectangular: se agrupan los casos por número de dovelas
+    for n_dovelas in np.unique(n):
+        grupo = np.flatnonzero(n == n_dovelas)
+        for inicio in range(0, grupo.size, BLOQUE_CASOS):
+            casos = grupo[inicio:inicio + BLOQUE_CASOS]
+            fs[casos] = _fs_grupo(*(v[casos] for v in columnas[:8]), int(n_dovelas), columnas[9][casos], terreno,
+                                  fs_inicial, tolerancia, max_iteraciones)
+    return fs.reshape(forma)
+
+
+def _piezas_ideal(H, beta):
+    """Piezas del talud idealizado de cada caso (como Terreno.ideal): forma (casos, 3, ...)."""
+    toe = H / np.tan(np.deg2rad(beta))
+    cero, uno = np.zeros_like(H), np.ones_like(H)
+    origen = np.stack([np.stack([cero, H], -1), np.stack([cero, H], -1), np.stack([toe, cero], -1)], axis=1)
+    direccion = np.stack([np.stack([-uno, cero], -1), np.stack([toe, -H], -1), np.stack([uno, cero], -1)], axis=1)
+    t_max = np.stack([np.full_like(H, np.inf), uno, np.full_like(H, np.inf)], axis=1)
+    return origen, direccion, t_max, toe
+
+
+def _fs_grupo(c, phi, gamma, H, beta, xc, yc, R, n, ru, terreno, fs_inicial, tolerancia, max_iteraciones):
+    """fs_lote para un bloque de casos con el mismo número de dovelas."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Entrada y salida: primer y último corte del arco inferior con el terreno
+        if terreno is None:
+            origen, direccion, t_max, toe = _piezas_ideal(H, beta)
+            pendiente = ((0 - H) / (toe - 0))[:, None]
+            cota = lambda x: np.clip(H[:, None] + pendiente * (x - 0), 0, H[:, None]) # noqa: E731
+            cortes = cortes_circulo(origen, direccion, t_max, xc, yc, R).reshape(xc.size, -1)
+            todos_nan = np.isnan(cortes).all(axis=1)
+            x_entrada = np.where(todos_nan, np.nan, np.nanmin(np.where(todos_nan[:, None], 0.0, cortes), axis=1))
+            x_salida = np.where(todos_nan, np.nan, np.nanmax(np.where(todos_nan[:, None], 0.0, cortes), axis=1))
+        else:
+            cota = terreno.cota
+            x_entrada, x_salida = terreno.extremos(xc, yc, R)
+        valido = x_salida > x_entrada
+
+        # Dovelas: casos × dovelas
+        ancho = ((x_salida - x_entrada) / n)[:, None]
+        x_mid = x_entrada[:, None] + (np.arange(n) + 0.5) * ancho
+        y_top = cota(np.where(valido[:, None], x_mid, 0.0))
+        rad_base = R[:, None]**2 - (x_mid - xc[:, None])**2
+        y_base = yc[:, None] - np.sqrt(np.maximum(rad_base, 0.0))
+        altura = y_top - y_base
+        en_uso = (rad_base >= 0) & (altura >= 0)
+        alpha = np.arctan2(yc[:, None] - y_base, x_mid - xc[:, None]) - np.pi/2
+        W = np.where(en_uso, altura * ancho * gamma[:, None], 0.0)
+        # Taludes que bajan hacia la izquierda: reflejo, como en ``dovelas``
+        alpha = np.where((np.sum(W * np.sin(alpha), axis=1) < 0)[:, None], -alpha, alpha)
+        b = ancho / np.cos(alpha)
+        u = ru[:, None] * gamma[:, None] * altura
+        tan_phi = np.tan(np.deg2rad(phi))[:, None]
+        sin_a, cos_a = np.sin(alpha), np.cos(alpha)
+        resistencia = np.where(en_uso, c[:, None] * b + (W - u * b) * tan_phi, 0.0)
+        denominador = np.sum(W * sin_a, axis=1)
+
+        # Iteración de punto fijo, todos los casos a la vez
+        fs = np.full(c.size, np.nan)
+        activo = valido & (denominador != 0)
+        fs[valido & (denominador == 0)] = np.inf
+        fs_supuesto = np.full(c.size, float(fs_inicial))
+        for _ in range(max_iteraciones):
+            if not activo.any():
+                break
+            i = np.flatnonzero(activo)
+            m_alpha = cos_a[i] + sin_a[i] * tan_phi[i] / fs_supuesto[i, None]
+            m_alpha = np.where(en_uso[i], m_alpha, 1.0)
+            fs_calculado = np.sum(resistencia[i] / m_alpha, axis=1) / denominador[i]
+            fs[i] = fs_calculado
+            activo[i[np.abs(fs_calculado - fs_supuesto[i]) < tolerancia]] = False
+            fs_supuesto[i] = fs_calculado
+    diagnostico.contar("bishop.circulos", int(valido.sum()))
+    return fs
+
+
+@cacheado("bishop_busqueda", max_entradas=32, max_bytes=32 * MB, persistente=True, version=2)
+def buscar_circulo_critico(entrada: EntradaBishop, centros_x, centros_y, radios) -> ResultadoBusqueda:
+    """
+    Evalúa todos los círculos de la malla centros_x × centros_y × radios (los datos
+    del círculo en `entrada` se ignoran) y devuelve el de menor FS. La malla se
+    resuelve en una sola llamada a ``fs_lote``, con terreno levantado o idealizado.
+
+    Raises:
+        ValueError: Si ningún círculo de la malla corta el talud.
+    """
+    centros_x, centros_y, radios = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (centros_x, centros_y, radios))
+    X, Y, R = np.meshgrid(centros_x, centros_y, radios, indexing="ij")
+    fs = fs_lote(entrada.cohesion, entrada.friction_angle, entrada.unit_weight, entrada.slope_height,
+                 entrada.slope_angle, X, Y, R, entrada.num_slices, entrada.ru, terreno=entrada.terreno)
+    fs[~(np.isfinite(fs) & (fs > 0))] = np.nan
+
+    validos = int(np.isfinite(fs).sum())
+    if validos == 0:
+        raise ValueError("Ningún círculo de la malla intersecta el talud. Ajusta la malla de centros y radios.")
+    i, j, k = np.unravel_index(np.nanargmin(fs), fs.shape)
+    critico = replace(entrada, circle_center_x=float(centros_x[i]), circle_center_y=float(centros_y[j]),
+                      circle_radius=float(radios[k]))
+    return ResultadoBusqueda(fs_min=float(fs[i, j, k]), critico=critico, fs=fs, evaluados=fs.size, validos=validos)
+
+
+@cacheado("bishop", max_entradas=256, max_bytes=32 * MB)
+def calculate_bishop_fs(entrada: EntradaBishop) -> ResultadoBishop:
+    """
+    Calcula el Factor de Seguridad (FS) para la estabilidad de un talud
+    utilizando el método de Bishop Simplificado.
+
+    Raises:
+        ValueError: Si el círculo de falla no intersecta la superficie del talud.
+    """
+    x_entrada, x_salida = geometria_talud(entrada)
+    dov = dovelas(entrada, x_entrada, x_salida)
+
+    resistencia = resistencia_dovelas(entrada.cohesion, np.tan(np.deg2rad(entrada.friction_angle)), dov)
+    fs, convergio, iteraciones = _iterar(dov, resistencia)
+    return ResultadoBishop(fs=fs, convergio=convergio, iteraciones=iteraciones,
+                           dovelas=_detalle_dovelas(dov, resistencia, fs),
+                           geometria=_datos_grafica(entrada, (x_entrada, x_salida), dov))
+
+
+def _iterar(dov, resistencia):
+    fs, convergio, iteraciones = iterar_fs(None, resistencia['tan_phi'], dov['W'], dov['alpha'], dov['b'], dov['u'],
+                                           resistencia=resistencia['cohesiva'] + resistencia['friccional'])
+    diagnostico.contar("bishop.circulos")
+    diagnostico.contar("bishop.iteraciones", iteraciones)
+    if not convergio:
+        diagnostico.contar("bishop.sin_convergencia")
+    return fs, convergio, iteraciones
+
+
+def _detalle_dovelas(dov, resistencia, fs):
+    """Detalle por dovela (columnas COLUMNAS_DOVELAS) con las fuerzas evaluadas en el FS final."""
+    W, alpha = dov['W'], dov['alpha']
+    cohesiva, friccional = resistencia['cohesiva'], resistencia['friccional']
+    m_alpha = np.cos(alpha) + np.sin(alpha) * resistencia['tan_phi'] / fs
+    return dict(zip(COLUMNAS_DOVELAS, (
+        dov['indice'] + 1,
+        W,
+        np.rad2deg(alpha),
+        W * np.sin(alpha),
+        cohesiva,
+        friccional,
+        (cohesiva + friccional) / m_alpha,
+    )))
+
+
+def _datos_grafica(entrada: EntradaBishop, geometria, dov):
+    """Datos geométricos que usa la gráfica del talud (incluye los vértices del terreno)."""
+    x_entrada, x_salida = geometria
+    terreno = terreno_de(entrada)
+    return {
+        "terreno_x": terreno.x, "terreno_y": terreno.y,
+        "circle_center_x": entrada.circle_center_x, "circle_center_y": entrada.circle_center_y,
+        "circle_radius": entrada.circle_radius,
+        "x_entrada": x_entrada, "x_salida": x_salida,
+        "num_slices": entrada.num_slices, "slice_width": dov['slice_width'],
+    }
+
+
+def dibujar_talud(fig, geom_data, mostrar_dovelas=True):
+    """
+    Dibuja sobre `fig` el terreno, el círculo de falla y las dovelas a partir de
+    ``ResultadoBishop.geometria``. matplotlib se importa solo al dibujar.
+    """
+    from matplotlib.patches import Circle
+
+    ax = fig.subplots()
+    terreno_x, terreno_y = np.asarray(geom_data["terreno_x"]), np.asarray(geom_data["terreno_y"])
+    center_x, center_y, radius = geom_data["circle_center_x"], geom_data["circle_center_y"], geom_data["circle_radius"]
+    x_crest_start, x_toe_end = geom_data["x_entrada"], geom_data["x_salida"]
+    margen = (terreno_y.max() - terreno_y.min()) / 2
+    crest_x_limit = min(terreno_x[0], center_x - radius) - margen
+    toe_x_limit = max(terreno_x[-1], center_x + radius) + margen
+    # El terreno se prolonga horizontalmente fuera de la polilínea
+    ax.plot(np.r_[crest_x_limit, terreno_x, toe_x_limit], np.r_[terreno_y[0], terreno_y, terreno_y[-1]], 'g-',
+            label="Superficie del Terreno")
+    failure_circle = Circle((center_x, center_y), radius, fill=False, color='r', linestyle='--', label="Círculo de Falla")
+    ax.add_patch(failure_circle)
+    ax.plot(center_x, center_y, 'r+', markersize=10, label="Centro del Círculo")
+    if mostrar_dovelas:
+        for j in range(geom_data["num_slices"]):
+            x_left = x_crest_start + j * geom_data["slice_width"]
+            ax.axvline(x=x_left, color='gray', linestyle=':', linewidth=0.8)
+        ax.axvline(x=x_toe_end, color='gray', linestyle=':', linewidth=0.8, label="Dovelas")
+    ax.set_aspect('equal', adjustable='box')
+    ax.set_xlabel("Distancia Horizontal (m)"); ax.set_ylabel("Distancia Vertical (m)")
+    ax.set_title("Análisis de Estabilidad de Talud - Método de Bishop")
+    ax.legend(); ax.grid(True, linestyle='--', alpha=0.6)
+    ax.set_xlim(crest_x_limit - 1, toe_x_limit + 1)
+    ax.set_ylim(min(terreno_y.min(), center_y - radius) - 1, max(terreno_y.max(), center_y) + 1)
+
+
+# --- Recálculo incremental ----------------------------------------------------
+# geometría → dovelas → resistencia → fs → tabla, y datos_grafica a partir de la
+# geometría. Cada nodo lee solo los campos que declara: cambiar c' o φ' reusa las
+# dovelas y repite la iteración; cambiar el número de dovelas no toca la geometría.
+
+grafo_bishop = Grafo("bishop")
+
+_CAMPOS_CIRCULO = ("slope_height", "slope_angle", "terreno", "circle_center_x", "circle_center_y", "circle_radius")
+
+
+@grafo_bishop.nodo("geometria", campos=_CAMPOS_CIRCULO)
+def _nodo_geometria(entrada):
+    return geometria_talud(entrada)
+
+
+@grafo_bishop.nodo("dovelas", campos=_CAMPOS_CIRCULO + ("unit_weight", "num_slices", "ru"), depende=("geometria",))
+def _nodo_dovelas(entrada, geometria):
+    return dovelas(entrada, *geometria)
+
+
+@grafo_bishop.nodo("resistencia", campos=("cohesion", "friction_angle"), depende=("dovelas",))
+def _nodo_resistencia(entrada, dovelas):
+    return resistencia_dovelas(entrada.cohesion, np.tan(np.deg2rad(entrada.friction_angle)), dovelas)
+
+
+@grafo_bishop.nodo("fs", depende=("dovelas", "resistencia"))
+def _nodo_fs(entrada, dovelas, resistencia):
+    return _iterar(dovelas, resistencia)
+
+
+@grafo_bishop.nodo("tabla", depende=("dovelas", "resistencia", "fs"))
+def _nodo_tabla(entrada, dovelas, resistencia, fs):
+    return _detalle_dovelas(dovelas, resistencia, fs[0])
+
+
+@grafo_bishop.nodo("datos_grafica", campos=_CAMPOS_CIRCULO + ("num_slices",), depende=("geometria", "dovelas"))
+def _nodo_datos_grafica(entrada, geometria, dovelas):
+    return _datos_grafica(entrada, geometria, dovelas)
@@ -0,0 +1,528 @@
+# geosuite/spt.py
+"""
+Registros de sondeos SPT: lectura, correcciones, correlaciones y licuación.
+
+Los registros de todos los sondeos de un proyecto se guardan en arreglos
+planos (una fila por muestra, ordenadas por sondeo y profundidad, con el
+inicio de cada sondeo en ``inicio``), así que las correcciones y las
+correlaciones se aplican a todo el proyecto de una vez, sin ciclos por
+sondeo. ``RegistrosSPT.guardar`` escribe esos arreglos en un ``.npz`` que se
+vuelve a cargar en milisegundos aunque el proyecto tenga cientos de sondeos.
+
+    registros = leer_registros("sondeos.csv")          # o .xlsx / .npz
+    res = procesar_spt(EntradaSPT(registros, energia=60, naf=3.0, amax=0.15))
+    res.N60, res.N1_60, res.phi, res.Es, res.Su, res.FS_licuacion
+
+    perfil = perfil_de_diseno(res, paso=1.0)          # estratos con los valores de todos los sondeos
+    entrada_capacidad(perfil, B=2, L=2, Df=1.5)       # -> EntradaTerzaghi
+    entrada_asentamiento(perfil, q=100, L=4, B=2, Df=1.5)  # -> EntradaAsentamiento con Es por estrato
+    entrada_talud(perfil, EntradaBishop(...))         # -> c', φ', γ promedio en la altura del talud
+
+Correcciones (Youd et al., 2001): N60 = N·CE·CB·CS·CR y (N1)60 = CN·N60 con
+CN = (Pa/σ'v)^0.5 ≤ 1.7. La revisión de licuación es el procedimiento
+simplificado NCEER (CSR de Seed e Idriss con rd de Liao y Whitman, corrección
+por finos y CRR para M = 7.5 escalado con el MSF de Idriss); no incluye Kσ ni Kα.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from geosuite.cache import MB, cacheado
+
+PA = 101.325 # presión atmosférica (kPa)
+GAMMA_AGUA = 9.81 # kN/m³
+CN_MAX = 1.7
+N_RECHAZO = 100 # golpes con que se registra un rechazo ("R")
+N1_60CS_NO_LICUABLE = 30 # con (N1)60cs ≥ 30 la arena se considera no licuable
+SOBRESALIENTE = 1.0 # longitud de barras sobre el terreno (m) para CR
+FACTOR_ES_SU = 300 # Es = 300·Su en suelos finos (Bowles, arcillas normalmente consolidadas)
+
+# CR por longitud de barras (m): < 3, 3-4, 4-6, 6-10, ≥ 10
+LIMITES_CR = np.array([3.0, 4.0, 6.0, 10.0])
+VALORES_CR = np.array([0.75, 0.80, 0.85, 0.95, 1.00])
+# CB por diámetro de la perforación (mm): ≤ 115, ≤ 150, mayor
+LIMITES_CB = np.array([115.0, 150.0])
+VALORES_CB = np.array([1.00, 1.05, 1.15])
+
+# Correlaciones seleccionables: f(N60, (N1)60, σ'v)
+CORRELACIONES_PHI = { # φ' (grados), suelos granulares
+    "hatanaka": lambda N60, N1_60, sv: np.sqrt(20 * N1_60) + 20, # Hatanaka y Uchida (1996)
+    "wolff": lambda N60, N1_60, sv: 27.1 + 0.3 * N60 - 0.00054 * N60**2, # Peck et al. según Wolff (1989)
+    "kulhawy_mayne": lambda N60, N1_60, sv: np.degrees(np.arctan((N60 / (12.2 + 20.3 * sv / PA)) ** 0.34)),
+}
+CORRELACIONES_ES = { # Es (kPa), suelos granulares
+    "bowles": lambda N60, N1_60, sv: 500 * (N60 + 15), # arena normalmente consolidada
+    "bowles_grava": lambda N60, N1_60, sv: 1200 * (N60 + 6), # arena con grava
+    "kulhawy_mayne": lambda N60, N1_60, sv: 10 * PA * N60, # arena limpia normalmente consolidada
+}
+CORRELACIONES_SU = { # Su (kPa), suelos finos
+    "stroud": lambda N60, N1_60, sv: 4.4 * N60, # Stroud (1974), arcillas de plasticidad media
+    "terzaghi_peck": lambda N60, N1_60, sv: 6.25 * N60, # qu = 12.5·N (kPa)
+    "hara": lambda N60, N1_60, sv: 29 * N60 ** 0.72, # Hara et al. (1974)
+}
+
+# Nombres aceptados para cada columna del registro (sin acentos ni mayúsculas)
+COLUMNAS = {
+    "sondeo": ("sondeo", "pozo", "borehole", "id"),
+    "z": ("profundidad", "prof", "z", "depth"),
+    "N": ("n", "nspt", "n_spt", "golpes"),
+    "suelo": ("suelo", "sucs", "clasificacion", "descripcion"),
+    "finos": ("finos", "fc", "finos_%", "finos (%)"),
+    "gamma": ("gamma", "peso_volumetrico", "γ"),
+    "naf": ("naf", "nivel_freatico", "nivel_agua"),
+}
+INCREMENTOS = (("g1", "n1"), ("g2", "n2"), ("g3", "n3")) # golpes por cada 15 cm
+# Descripciones: el sustantivo va primero en español ("arena limosa") y al final en inglés ("silty sand")
+FINOS_ES, GRANULARES_ES = ("ARCILL", "LIMO", "TURBA"), ("ARENA", "GRAVA", "GRAVILLA")
+FINOS_EN, GRANULARES_EN = ("CLAY", "SILT", "PEAT"), ("SAND", "GRAVEL")
+
+
+@dataclass(frozen=True)
+class RegistrosSPT:
+    """
+    Muestras de todos los sondeos en arreglos planos compactos. Las muestras del
+    sondeo k son ``inicio[k]:inicio[k+1]``, ordenadas por profundidad. `finos`,
+    `gamma` y `naf` (por sondeo) llevan NaN donde el registro no los indica.
+    """
+    nombres: tuple
+    inicio: np.ndarray # int32, n_sondeos + 1
+    z: np.ndarray # float32, m (a la mitad del tramo de 0.45 m)
+    N: np.ndarray # float32, golpes en los últimos 0.30 m
+    granular: np.ndarray # bool
+    finos: np.ndarray # float32, %
+    gamma: np.ndarray # float32, kN/m³
+    naf: np.ndarray # float32, m, por sondeo
+
+    @property
+    def sondeo(self):
+        """Índice del sondeo de cada muestra."""
+        return np.repeat(np.arange(len(self.nombres)), np.diff(self.inicio))
+
+    def guardar(self, ruta):
+        """Escribe los arreglos en un .npz (sin pickle)."""
+        np.savez(ruta, nombres=np.asarray(self.nombres, dtype=str),
+                 **{c.name: getattr(self, c.name) for c in fields(self) if c.name != "nombres"})
+
+    @classmethod
+    def cargar(cls, fuente):
+        """Registros guardados con `guardar` (ruta o archivo abierto)."""
+        with np.load(fuente, allow_pickle=False) as datos:
+            valores = {c.name: datos[c.name] for c in fields(cls)}
+        return cls(**{**valores, "nombres": tuple(str(n) for n in valores["nombres"])})
+
+
+def _normalizar(texto):
+    texto = unicodedata.normalize("NFKD", str(texto)).encode("ascii", "ignore").decode() or str(texto)
+    return texto.strip().lower().replace(" ", "_")
+
+
+def _numeros(columna):
+    """Columna a float; "R"/"rechazo" cuenta como N_RECHAZO golpes."""
+    import pandas as pd
+
+    texto = columna.astype(str).str.strip().str.upper()
+    rechazo = texto.str.startswith("R")
+    valores = pd.to_numeric(columna, errors="coerce").to_numpy(dtype=float)
+    valores[rechazo.to_numpy()] = N_RECHAZO
+    return valores
+
+
+def _es_granular(suelo):
+    """
+    True en arenas y gravas, False en arcillas, limos, suelos orgánicos y turba,
+    None si no se reconoce. Acepta el símbolo SUCS, también doble (en "CL-ML" o
+    "SM/SC" manda el primero), o una descripción en español o en inglés.
+    """
+    clave = _normalizar(suelo).upper()
+    simbolo = re.split(r"[-/]", clave)[0]
+    if simbolo == "PT" or len(simbolo) == 2 and simbolo[0] in "CMO" and simbolo[1] in "LH":
+        return False
+    if len(simbolo) == 2 and simbolo[0] in "SG" and simbolo[1] in "WPMC":
+        return True
+    palabras = [p for p in re.split(r"[_,;.()-]+", clave) if p]
+    if not palabras:
+        return None
+    if palabras[0].startswith(FINOS_ES) or palabras[-1].startswith(FINOS_EN):
+        return False
+    if palabras[0].startswith(GRANULARES_ES) or palabras[-1].startswith(GRANULARES_EN):
+        return True
+    return None
+
+
+def registros_de_tabla(tabla):
+    """
+    Registros desde una tabla (DataFrame o dict) con una fila por muestra.
+
+    Columnas: 'Sondeo', 'Profundidad' (m) y 'N' (golpes en los últimos 0.30 m,
+    "R" para rechazo) o los golpes por cada 15 cm en 'G1', 'G2', 'G3'; opcionales
+    'Suelo' (SUCS o descripción), 'Finos' (%), 'Gamma' (kN/m³) y 'NAF' (m).
+    Sin la columna 'Suelo' todas las muestras se toman como granulares.
+
+    Raises:
+        ValueError: Si faltan columnas, no queda ninguna muestra válida o el
+            suelo de alguna muestra no se reconoce (no se supone granular).
+    """
+    import pandas as pd
+
+    tabla = pd.DataFrame(tabla)
+    nombres = {_normalizar(c): c for c in tabla.columns}
+    columna = {clave: next((nombres[a] for a in alias if a in nombres), None) for clave, alias in COLUMNAS.items()}
+    if columna["N"] is None and all(any(a in nombres for a in alias) for alias in INCREMENTOS[1:]):
+        g2, g3 = (_numeros(tabla[next(nombres[a] for a in alias if a in nombres)]) for alias in INCREMENTOS[1:])
+        N = g2 + g3
+    elif columna["N"] is not None:
+        N = _numeros(tabla[columna["N"]])
+    else:
+        raise ValueError("El registro necesita la columna 'N' o los golpes por 15 cm 'G1', 'G2', 'G3'.")
+    if columna["sondeo"] is None or columna["z"] is None:
+        raise ValueError("El registro necesita las columnas 'Sondeo' y 'Profundidad'.")
+
+    opcional = lambda clave: _numeros(tabla[columna[clave]]) if columna[clave] else np.full(len(tabla), np.nan) # noqa: E731
+    datos = pd.DataFrame({
+        "sondeo": tabla[columna["sondeo"]].astype(str).str.strip(),
+        "z": pd.to_numeric(tabla[columna["z"]], errors="coerce"),
+        "N": np.minimum(N, N_RECHAZO),
+        "granular": [_es_granular(s) for s in tabla[columna["suelo"]]] if columna["suelo"] else True,
+        "finos": opcional("finos"),
+        "gamma": opcional("gamma"),
+        "naf": opcional("naf"),
+    })
+    datos = datos[(datos["z"] > 0) & datos["N"].notna() & (datos["sondeo"] != "")]
+    if datos.empty:
+        raise ValueError("El registro no tiene muestras válidas (profundidad > 0 y N).")
+    dudosas = datos[datos["granular"].isna()]
+    if not dudosas.empty:
+        muestras = ", ".join(f"{s} a {z:g} m" for s, z in dudosas[["sondeo", "z"]].head(5).itertuples(index=False))
+        raise ValueError(f"Suelo no reconocido en {len(dudosas)} muestras ({muestras}). Use el símbolo SUCS "
+                         "(SM, CL, ...) o una descripción: arena, grava, arcilla, limo o turba.")
+    datos = datos.sort_values(["sondeo", "z"], kind="stable")
+
+    codigos, nombres_sondeos = pd.factorize(datos["sondeo"], sort=True)
+    conteo = np.bincount(codigos, minlength=len(nombres_sondeos))
+    inicio = np.concatenate([[0], np.cumsum(conteo)]).astype(np.int32)
+    naf = datos.groupby("sondeo", sort=True)["naf"].first().to_numpy(dtype=np.float32)
+    return RegistrosSPT(
+        nombres=tuple(nombres_sondeos), inicio=inicio,
+        z=datos["z"].to_numpy(dtype=np.float32), N=datos["N"].to_numpy(dtype=np.float32),
+        granular=datos["granular"].to_numpy(dtype=bool), finos=datos["finos"].to_numpy(dtype=np.float32),
+        gamma=datos["gamma"].to_numpy(dtype=np.float32), naf=naf,
+    )
+
+
+def leer_registros(fuente, nombre=None):
+    """
+    Registros desde un CSV, un Excel o un .npz guardado con `RegistrosSPT.guardar`
+    (ruta o bytes; `nombre` indica la extensión cuando se pasan bytes).
+
+    Raises:
+        ValueError: Si el archivo no se puede leer como registro SPT.
+    """
+    import io
+
+    nombre = nombre or (fuente if isinstance(fuente, str) else "")
+    if nombre.lower().endswith(".npz"):
+        try:
+            return RegistrosSPT.cargar(io.BytesIO(fuente) if isinstance(fuente, bytes) else fuente)
+        except (OSError, KeyError) as error:
+            raise ValueError(f"El archivo no es un registro SPT guardado: {error}")
+    from geosuite.exploracion import leer_cuadro
+
+    return registros_de_tabla(leer_cuadro(fuente, nombre))
+
+
+# --- Correcciones, correlaciones y licuación ---------------------------------
+
+@dataclass(frozen=True)
+class EntradaSPT:
+    """
+    Registros y parámetros del procesamiento. energia: relación de energía del
+    martinete (%); diametro: de la perforación (mm); sin_camisa: muestreador
+    para camisa usado sin ella (CS = 1.2). naf (m) se usa en los sondeos cuyo
+    registro no lo indica (None: sin nivel freático). gamma / gamma_sat (kN/m³)
+    arriba / abajo del NAF donde el registro no da γ. amax (g) y Mw: sismo de
+    diseño para la licuación.
+    """
+    registros: RegistrosSPT
+    energia: float = 60.0
+    diametro: float = 100.0
+    sin_camisa: bool = False
+    naf: float = None
+    gamma: float = 18.0
+    gamma_sat: float = 19.5
+    correlacion_phi: str = "hatanaka"
+    correlacion_Es: str = "bowles"
+    correlacion_Su: str = "stroud"
+    amax: float = 0.15
+    Mw: float = 7.5
+
+
+@dataclass(frozen=True)
+class ResultadoSPT:
+    """
+    Valores por muestra (mismo orden que los registros). φ' es NaN en suelos
+    finos y Su en granulares; la licuación (CSR, CRR, FS) es NaN arriba del NAF
+    y en suelos finos, y FS = inf con (N1)60cs ≥ 30.
+    """
+    registros: RegistrosSPT
+    gamma: np.ndarray
+    sigma_v: np.ndarray
+    sigma_v_ef: np.ndarray
+    N60: np.ndarray
+    N1_60: np.ndarray
+    phi: np.ndarray
+    Es: np.ndarray
+    Su: np.ndarray
+    N1_60cs: np.ndarray
+    CSR: np.ndarray
+    CRR: np.ndarray
+    FS_licuacion: np.ndarray
+
+
+def _por_sondeo(acumulado, inicio):
+    """Resta a una suma acumulada global el valor con que empieza cada sondeo."""
+    base = np.concatenate([[0.0], acumulado])[inicio[:-1]]
+    return acumulado - np.repeat(base, np.diff(inicio))
+
+
+def esfuerzos_verticales(registros, naf=None, gamma=18.0, gamma_sat=19.5):
+    """
+    γ usado, σv y σ'v (kPa) en cada muestra. Cada muestra representa el tramo
+    desde la muestra anterior (o la superficie); la parte de ese tramo abajo
+    del NAF usa γsat.
+    """
+    r = registros
+    sondeo = r.sondeo
+    z = r.z.astype(float)
+    naf_sondeo = np.where(np.isnan(r.naf), np.inf if naf is None else naf, r.naf)[sondeo]
+    arriba_previo = np.concatenate([[0.0], z[:-1]])
+    arriba_previo[r.inicio[:-1]] = 0.0 # cada sondeo empieza en la superficie
+    espesor = z - arriba_previo
+    seco = np.clip(np.minimum(z, naf_sondeo) - arriba_previo, 0.0, espesor)
+    g = r.gamma.astype(float)
+    g_seco = np.where(np.isnan(g), gamma, g)
+    g_sat = np.where(np.isnan(g), gamma_sat, g)
+    sigma_v = _por_sondeo(np.cumsum(g_seco * seco + g_sat * (espesor - seco)), r.inicio)
+    u = GAMMA_AGUA * np.maximum(z - naf_sondeo, 0.0)
+    return np.where(z > naf_sondeo, g_sat, g_seco), sigma_v, sigma_v - u, naf_sondeo
+
+
+def corregir_N(N, z, sigma_v_ef, energia=60.0, diametro=100.0, sin_camisa=False):
+    """N60 y (N1)60 de arreglos de N, profundidad (m) y σ'v (kPa)."""
+    N = np.asarray(N, dtype=float)
+    CE = energia / 60.0
+    CB = VALORES_CB[np.searchsorted(LIMITES_CB, diametro, side="left")]
+    CS = 1.2 if sin_camisa else 1.0
+    CR = VALORES_CR[np.searchsorted(LIMITES_CR, np.asarray(z, dtype=float) + SOBRESALIENTE, side="right")]
+    N60 = N * CE * CB * CS * CR
+    CN = np.minimum(np.sqrt(PA / np.maximum(sigma_v_ef, 1e-6)), CN_MAX)
+    return N60, CN * N60
+
+
+def _rd(z):
+    """Coeficiente de reducción de esfuerzos con la profundidad (Liao y Whitman, 1986)."""
+    return np.select([z <= 9.15, z <= 23.0, z <= 30.0],
+                     [1.0 - 0.00765 * z, 1.174 - 0.0267 * z, 0.744 - 0.008 * z], 0.5)
+
+
+def licuacion(N1_60, finos, z, sigma_v, sigma_v_ef, amax, Mw):
+    """
+    (N1)60cs, CSR, CRR (ya escalado por MSF) y FS contra licuación (NCEER).
+    Finos desconocidos (NaN) se toman como arena limpia.
+    """
+    FC = np.nan_to_num(np.asarray(finos, dtype=float), nan=0.0)
+    with np.errstate(divide="ignore"):
+        alfa = np.select([FC <= 5, FC < 35], [0.0, np.exp(1.76 - 190 / np.maximum(FC, 1e-9)**2)], 5.0)
+    beta = np.select([FC <= 5, FC < 35], [1.0, 0.99 + FC**1.5 / 1000], 1.2)
+    N1_60cs = alfa + beta * N1_60
+    CSR = 0.65 * amax * sigma_v / np.maximum(sigma_v_ef, 1e-6) * _rd(np.asarray(z, dtype=float))
+    n = np.minimum(N1_60cs, N1_60CS_NO_LICUABLE - 1e-9)
+    CRR75 = 1 / (34 - n) + n / 135 + 50 / (10 * n + 45)**2 - 1 / 200
+    MSF = 10**2.24 / Mw**2.56
+    CRR = np.where(N1_60cs >= N1_60CS_NO_LICUABLE, np.inf, CRR75 * MSF)
+    with np.errstate(divide="ignore"):
+        FS = np.where(CSR > 0, CRR / CSR, np.inf)
+    return N1_60cs, CSR, CRR, FS
+
+
+def _correlacion(tabla, nombre, tipo):
+    if nombre not in tabla:
+        raise ValueError(f"Correlación de {tipo} desconocida: {nombre}. Use: {', '.join(tabla)}")
+    return tabla[nombre]
+
+
+@cacheado("spt", max_entradas=32, max_bytes=64 * MB)
+def procesar_spt(entrada: EntradaSPT) -> ResultadoSPT:
+    """
+    Correcciones, parámetros correlacionados y revisión de licuación de todas las
+    muestras del proyecto.
+
+    Raises:
+        ValueError: Con una correlación desconocida o parámetros fuera de rango.
+    """
+    if entrada.energia <= 0 or entrada.Mw <= 0 or entrada.amax < 0:
+        raise ValueError("La energía y la magnitud deben ser positivas y amax no negativa.")
+    f_phi = _correlacion(CORRELACIONES_PHI, entrada.correlacion_phi, "φ'")
+    f_Es = _correlacion(CORRELACIONES_ES, entrada.correlacion_Es, "Es")
+    f_Su = _correlacion(CORRELACIONES_SU, entrada.correlacion_Su, "Su")
+
+    r = entrada.registros
+    z = r.z.astype(float)
+    gamma, sigma_v, sigma_v_ef, naf = esfuerzos_verticales(r, entrada.naf, entrada.gamma, entrada.gamma_sat)
+    N60, N1_60 = corregir_N(r.N, z, sigma_v_ef, entrada.energia, entrada.diametro, entrada.sin_camisa)
+
+    granular = r.granular
+    phi = np.where(granular, f_phi(N60, N1_60, sigma_v_ef), np.nan)
+    Su = np.where(granular, np.nan, f_Su(N60, N1_60, sigma_v_ef))
+    Es = np.where(granular, f_Es(N60, N1_60, sigma_v_ef), FACTOR_ES_SU * np.nan_to_num(Su))
+
+    N1_60cs, CSR, CRR, FS = licuacion(N1_60, r.finos, z, sigma_v, sigma_v_ef, entrada.amax, entrada.Mw)
+    aplica = granular & (z > naf) & (entrada.amax > 0)
+    sin_revision = lambda valores: np.where(aplica, valores, np.nan) # noqa: E731
+    return ResultadoSPT(
+        registros=r, gamma=gamma, sigma_v=sigma_v, sigma_v_ef=sigma_v_ef, N60=N60, N1_60=N1_60,
+        phi=phi, Es=Es, Su=Su, N1_60cs=sin_revision(N1_60cs), CSR=sin_revision(CSR),
+        CRR=sin_revision(CRR), FS_licuacion=sin_revision(FS),
+    )
+
+
+def tabla_spt(resultado):
+    """DataFrame con una fila por muestra (para mostrar o exportar)."""
+    import pandas as pd
+
+    r = resultado.registros
+    return pd.DataFrame({
+        "Sondeo": np.asarray(r.nombres, dtype=object)[r.sondeo],
+        "Profundidad (m)": r.z.astype(float),
+        "N": r.N.astype(float),
+        "Granular": r.granular,
+        "σv (kPa)": resultado.sigma_v,
+        "σ'v (kPa)": resultado.sigma_v_ef,
+        "N60": resultado.N60,
+        "(N1)60": resultado.N1_60,
+        "φ' (°)": resultado.phi,
+        "Es (kPa)": resultado.Es,
+        "Su (kPa)": resultado.Su,
+        "CSR": resultado.CSR,
+        "CRR": resultado.CRR,
+        "FS licuación": resultado.FS_licuacion,
+    })
+
+
+# --- Perfil de diseño y entradas de las calculadoras -------------------------
+
+@dataclass(frozen=True)
+class Perfil:
+    """
+    Estratos [z_techo, z_base) (m) con los valores promedio (o mínimos) de las
+    muestras que caen en cada uno. `fraccion_granular` pondera φ' (granular) y
+    Su (fino) al combinarlos; φ' y Su son NaN en estratos sin muestras de ese tipo.
+    """
+    z_techo: np.ndarray
+    z_base: np.ndarray
+    gamma: np.ndarray
+    phi: np.ndarray
+    Su: np.ndarray
+    Es: np.ndarray
+    N60: np.ndarray
+    fraccion_granular: np.ndarray
+
+
+def perfil_de_diseno(resultado, paso=1.0, estadistico="media", sondeos=None):
+    """
+    Agrupa las muestras de los sondeos indicados (todos por omisión) en estratos
+    de `paso` m y resume cada estrato con la media o el mínimo (`estadistico`).
+
+    Raises:
+        ValueError: Con un estadístico desconocido o sin muestras.
+    """
+    if estadistico not in ("media", "minimo"):
+        raise ValueError(f"Estadístico desconocido: {estadistico}. Use 'media' o 'minimo'.")
+    r = resultado.registros
+    muestras = np.ones(r.z.size, dtype=bool)
+    if sondeos is not None:
+        muestras = np.isin(np.asarray(r.nombres, dtype=object)[r.sondeo], list(sondeos))
+    if not muestras.any():
+        raise ValueError("No hay muestras en los sondeos indicados.")
+    # la muestra a la profundidad z representa el tramo que termina en z
+    banda = np.floor((r.z[muestras].astype(float) - 1e-9) / paso).astype(int)
+    bandas, indice = np.unique(banda, return_inverse=True)
+
+    def resumir(valores):
+        valores = np.asarray(valores, dtype=float)[muestras]
+        validos = ~np.isnan(valores)
+        if estadistico == "minimo":
+            salida = np.full(bandas.size, np.inf)
+            np.fmin.at(salida, indice[validos], valores[validos])
+            return np.where(np.isinf(salida), np.nan, salida)
+        suma = np.bincount(indice[validos], valores[validos], minlength=bandas.size)
+        conteo = np.bincount(indice[validos], minlength=bandas.size)
+        with np.errstate(invalid="ignore"):
+            return suma / conteo
+
+    z_base = (bandas + 1) * paso
+    z_techo = np.concatenate([[0.0], z_base[:-1]]) # los huecos sin muestras se asignan al estrato de abajo
+    return Perfil(
+        z_techo=z_techo, z_base=z_base.astype(float),
+        gamma=resumir(resultado.gamma), phi=resumir(resultado.phi), Su=resumir(resultado.Su),
+        Es=resumir(resultado.Es), N60=resumir(resultado.N60),
+        fraccion_granular=np.bincount(indice, r.granular[muestras], minlength=bandas.size) / np.bincount(indice),
+    )
+
+
+def promedio_en(perfil, valores, z1, z2):
+    """Promedio ponderado por espesor de `valores` (uno por estrato) entre z1 y z2; el último estrato se extiende."""
+    base = np.append(perfil.z_base[:-1], max(perfil.z_base[-1], z2))
+    espesor = np.clip(np.minimum(base, z2) - np.maximum(perfil.z_techo, z1), 0.0, None)
+    valores = np.asarray(valores, dtype=float)
+    validos = espesor * ~np.isnan(valores)
+    if validos.sum() == 0:
+        return float("nan")
+    return float(np.nansum(valores * validos) / validos.sum())
+
+
+def _resistencia(perfil, z1, z2):
+    """c (kPa) y φ' (°) equivalentes: φ' de la parte granular y Su de la parte fina."""
+    fg = perfil.fraccion_granular
+    phi = promedio_en(perfil, fg * np.nan_to_num(perfil.phi), z1, z2)
+    c = promedio_en(perfil, (1 - fg) * np.nan_to_num(perfil.Su), z1, z2)
+    return c, phi
+
+
+def entrada_capacidad(perfil, B, L, Df, FS=None):
+    """
+    EntradaTerzaghi con γ promedio hasta Df + B y c, φ' promedio en la zona de
+    falla (de Df a Df + B).
+    """
+    from geosuite.capacidad_carga import EntradaTerzaghi
+
+    c, phi = _resistencia(perfil, Df, Df + B)
+    extra = {} if FS is None else {"FS": FS}
+    return EntradaTerzaghi(B=B, L=L, Df=Df, gamma=promedio_en(perfil, perfil.gamma, 0.0, Df + B), c=c, phi=phi, **extra)
+
+
+def entrada_asentamiento(perfil, q, L, B, Df=0.0, delta_z=None):
+    """EntradaAsentamiento con Es por estrato debajo del desplante (z medida desde Df)."""
+    from geosuite.settlement import DELTA_Z, EntradaAsentamiento
+
+    debajo = perfil.z_base > Df
+    z_base = perfil.z_base[debajo] - Df
+    Es = perfil.Es[debajo]
+    Es = np.where(np.isnan(Es), np.nanmean(perfil.Es), Es)
+    estratos = tuple((float(z), float(e)) for z, e in zip(z_base[:-1], Es[:-1]))
+    return EntradaAsentamiento(q=q, L=L, B=B, Es=float(Es[-1]), delta_z=delta_z or DELTA_Z, estratos=estratos or None)
+
+
+def entrada_talud(perfil, entrada, profundidad=None):
+    """
+    La EntradaBishop con c', φ' y γ promedio del perfil hasta `profundidad`
+    (por omisión la altura del talud, o el desnivel del terreno levantado).
+    """
+    from dataclasses import replace
+
+    if profundidad is None:
+        profundidad = (float(np.ptp(entrada.terreno.y)) if entrada.terreno is not None else entrada.slope_height)
+    c, phi = _resistencia(perfil, 0.0, profundidad)
+    return replace(entrada, cohesion=c, friction_angle=phi,
+                   unit_weight=promedio_en(perfil, perfil.gamma, 0.0, profundidad))
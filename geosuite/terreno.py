@@ -0,0 +1,215 @@
+# geosuite/terreno.py
+"""
+Superficie del terreno como polilínea y su intersección con círculos de falla.
+
+La sección levantada en campo es una polilínea y = f(x) con los vértices
+ordenados por x (índice monótono de segmentos). Fuera de sus extremos el
+terreno se prolonga horizontalmente. Con ese índice:
+
+- la cota sobre cualquier abscisa se obtiene con ``searchsorted`` y la pendiente
+  precalculada del segmento, para arreglos de cualquier forma;
+- los cortes de un círculo con el terreno se buscan solo en los segmentos cuyo
+  intervalo de x se traslapa con [xc - R, xc + R];
+- para miles de círculos a la vez (``extremos``), la distancia de cada vértice al
+  centro descarta los segmentos que no pueden tocar la circunferencia y la
+  cuadrática solo se resuelve en los pocos pares (círculo, segmento) restantes.
+
+El talud idealizado (cresta plana, cara a β, pie plano) es la polilínea de dos
+vértices (0, H) y (H / tan β, 0), de modo que ambos casos comparten el mismo
+cálculo.
+
+    terreno = Terreno.desde_archivo("seccion.csv")   # o un .dxf con una LWPOLYLINE
+    terreno.cota(x)
+    terreno.intersecciones(xc, yc, R)                # abscisas de entrada y salida
+"""
+import csv
+import io
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class Terreno:
+    """Polilínea del terreno (m) con x estrictamente creciente."""
+    x: np.ndarray
+    y: np.ndarray
+
+    def __post_init__(self):
+        x = np.array(self.x, dtype=float)
+        y = np.array(self.y, dtype=float)
+        if x.ndim != 1 or x.shape != y.shape or x.size < 2:
+            raise ValueError("La superficie del terreno requiere al menos dos vértices (x, y).")
+        if not (np.isfinite(x).all() and np.isfinite(y).all()):
+            raise ValueError("Las coordenadas del terreno deben ser números finitos.")
+        if x[0] > x[-1]:
+            x, y = x[::-1].copy(), y[::-1].copy()
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("Las abscisas del terreno deben ser estrictamente monótonas (la superficie debe ser "
+                             "función de x, sin voladizos ni tramos verticales).")
+        x.flags.writeable = y.flags.writeable = False
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        # Índice de segmentos: pendiente de cada tramo y piezas (rayo izquierdo, tramos, rayo derecho)
+        pendiente = np.diff(y) / np.diff(x)
+        origen = np.column_stack([np.r_[x[0], x[:-1], x[-1]], np.r_[y[0], y[:-1], y[-1]]])
+        direccion = np.column_stack([np.r_[-1.0, np.diff(x), 1.0], np.r_[0.0, np.diff(y), 0.0]])
+        t_max = np.r_[np.inf, np.ones(x.size - 1), np.inf]
+        object.__setattr__(self, "_pendiente", pendiente)
+        object.__setattr__(self, "_longitud", np.hypot(np.diff(x), np.diff(y)))
+        object.__setattr__(self, "_piezas", (origen, direccion, t_max))
+
+    @classmethod
+    def ideal(cls, H, beta):
+        """Talud idealizado: cresta en y = H para x ≤ 0, cara a β y pie en y = 0."""
+        return cls(np.array([0.0, H / np.tan(np.deg2rad(beta))]), np.array([float(H), 0.0]))
+
+    def cota(self, x):
+        """Cota del terreno sobre las abscisas `x` (escalar o arreglo de cualquier forma)."""
+        x = np.asarray(x, dtype=float)
+        i = np.clip(np.searchsorted(self.x, x, side="right") - 1, 0, self.x.size - 2)
+        return np.clip(self.y[i] + self._pendiente[i] * (x - self.x[i]), *_entre(self.y[i], self.y[i + 1]))
+
+    def piezas(self, x_min=-np.inf, x_max=np.inf):
+        """Origen, dirección y parámetro máximo de las piezas que se traslapan con [x_min, x_max]."""
+        n = self.x.size
+        desde = 0 if x_min < self.x[0] else np.searchsorted(self.x, x_min, side="right")
+        hasta = n + 1 if x_max > self.x[-1] else np.searchsorted(self.x, x_max, side="left") + 1
+        origen, direccion, t_max = self._piezas
+        return origen[desde:hasta], direccion[desde:hasta], t_max[desde:hasta]
+
+    def intersecciones(self, xc, yc, R):
+        """Abscisas (ordenadas) donde el arco inferior del círculo corta el terreno."""
+        cortes = cortes_circulo(*self.piezas(xc - R, xc + R), xc, yc, R)
+        return np.unique(cortes[np.isfinite(cortes)])
+
+    def extremos(self, xc, yc, R):
+        """
+        Primer y último corte del arco inferior para arreglos 1-D de círculos
+        (NaN si el círculo no corta el terreno).
+
+        Un segmento solo puede cortar la circunferencia si uno de sus extremos
+        queda fuera del círculo (el disco es convexo) y el otro a menos de
+        R + longitud del centro; los rayos de los extremos siempre se revisan.
+        """
+        xc, yc, R = (np.asarray(v, dtype=float) for v in (xc, yc, R))
+        d2 = (self.x - xc[:, None])**2 + (self.y - yc[:, None])**2
+        fuera = d2 >= (R * R)[:, None]
+        cerca = np.minimum(d2[:, :-1], d2[:, 1:]) <= (R[:, None] + self._longitud)**2
+        caso, segmento = np.nonzero((fuera[:, :-1] | fuera[:, 1:]) & cerca)
+        todos = np.arange(xc.size)
+        caso = np.concatenate([caso, todos, todos])
+        pieza = np.concatenate([segmento + 1, np.zeros_like(todos), np.full_like(todos, self.x.size)])
+
+        origen, direccion, t_max = (v[pieza][:, None] for v in self._piezas)
+        cortes = cortes_circulo(origen, direccion, t_max, xc[caso], yc[caso], R[caso])[:, 0]
+        entrada, salida = np.full(xc.size, np.nan), np.full(xc.size, np.nan)
+        np.fmin.at(entrada, caso, np.fmin(cortes[:, 0], cortes[:, 1]))
+        np.fmax.at(salida, caso, np.fmax(cortes[:, 0], cortes[:, 1]))
+        return entrada, salida
+
+    # --- Lectura --------------------------------------------------------------
+
+    @classmethod
+    def desde_csv(cls, fuente):
+        """
+        Lee vértices x, y de un CSV (ruta o texto). Acepta coma, punto y coma,
+        tabulador o espacios como separador y un encabezado opcional.
+        """
+        texto = _leer_texto(fuente)
+        lineas = [linea for linea in texto.splitlines() if linea.strip() and not linea.lstrip().startswith("#")]
+        if not lineas:
+            raise ValueError("El archivo de terreno está vacío.")
+        try:
+            dialecto = csv.Sniffer().sniff(lineas[0], delimiters=",;\t ")
+            delimitador = dialecto.delimiter
+        except csv.Error:
+            delimitador = ","
+        puntos = []
+        for numero, fila in enumerate(csv.reader(lineas, delimiter=delimitador), start=1):
+            valores = [v for v in fila if v.strip()]
+            try:
+                puntos.append((float(valores[0]), float(valores[1])))
+            except (ValueError, IndexError):
+                if numero == 1:
+                    continue # encabezado
+                # sin el contenido de la fila: el archivo puede no ser un terreno
+                raise ValueError(f"Fila {numero} del terreno inválida: se esperan dos números x, y.")
+        x, y = np.array(puntos, dtype=float).reshape(-1, 2).T
+        return cls(x, y)
+
+    @classmethod
+    def desde_dxf(cls, fuente, capa=None):
+        """
+        Lee la LWPOLYLINE de un DXF ASCII (ruta o texto). Con `capa` se toma la de esa
+        capa; si hay varias, la de más vértices.
+        """
+        lineas = _leer_texto(fuente).splitlines()
+        pares = [(lineas[i].strip(), lineas[i + 1].strip()) for i in range(0, len(lineas) - 1, 2)]
+        polilineas, actual = [], None
+        for codigo, valor in pares:
+            if codigo == "0":
+                actual = {"capa": None, "x": [], "y": []} if valor == "LWPOLYLINE" else None
+                if actual is not None:
+                    polilineas.append(actual)
+            elif actual is not None:
+                if codigo == "8":
+                    actual["capa"] = valor
+                elif codigo == "10":
+                    actual["x"].append(float(valor))
+                elif codigo == "20":
+                    actual["y"].append(float(valor))
+        if capa is not None:
+            polilineas = [p for p in polilineas if p["capa"] == capa]
+        if not polilineas:
+            raise ValueError("El DXF no contiene una LWPOLYLINE" + (f" en la capa '{capa}'." if capa else "."))
+        mayor = max(polilineas, key=lambda p: len(p["x"]))
+        return cls(np.array(mayor["x"]), np.array(mayor["y"]))
+
+    @classmethod
+    def desde_archivo(cls, ruta, capa=None):
+        """CSV o DXF según la extensión del archivo."""
+        if os.path.splitext(ruta)[1].lower() == ".dxf":
+            return cls.desde_dxf(ruta, capa)
+        return cls.desde_csv(ruta)
+
+
+def _entre(a, b):
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def _leer_texto(fuente):
+    if isinstance(fuente, bytes):
+        return fuente.decode("utf-8", errors="replace")
+    if isinstance(fuente, io.IOBase):
+        datos = fuente.read()
+        return datos.decode("utf-8", errors="replace") if isinstance(datos, bytes) else datos
+    if "\n" not in fuente and os.path.exists(fuente):
+        with open(fuente, encoding="utf-8", errors="replace") as archivo:
+            return archivo.read()
+    return fuente
+
+
+def cortes_circulo(origen, direccion, t_max, xc, yc, R):
+    """
+    Cortes del arco inferior (y ≤ yc) de círculos con piezas del terreno.
+
+    Las piezas son P(t) = origen + t·direccion, 0 ≤ t ≤ t_max, con forma (..., piezas, 2);
+    xc, yc, R se difunden con las dimensiones previas a la de piezas. Devuelve las
+    abscisas de los cortes con forma (..., piezas, 2) y NaN donde no hay corte.
+    """
+    xc, yc, R = (np.asarray(v, dtype=float)[..., None] for v in (xc, yc, R))
+    ox, oy = origen[..., 0] - xc, origen[..., 1] - yc
+    dx, dy = direccion[..., 0], direccion[..., 1]
+    a = dx * dx + dy * dy
+    h = ox * dx + oy * dy # b / 2 de la cuadrática a·t² + b·t + c = 0
+    c = ox * ox + oy * oy - R * R
+    with np.errstate(invalid="ignore"):
+        raiz = np.sqrt(h * h - a * c)
+    salida = np.empty(np.shape(raiz) + (2,))
+    for lado, signo in enumerate((-1.0, 1.0)):
+        t = (signo * raiz - h) / a
+        validos = (t >= 0) & (t <= t_max) & (oy + t * dy <= 0)
+        salida[..., lado] = np.where(validos, origen[..., 0] + t * dx, np.nan)
+    return salida
@@ -0,0 +1,216 @@
+# geosuite/unidades.py
+"""
+Conversión de unidades en las fronteras del núcleo de cálculo.
+
+Cada motor trabaja en un solo sistema (los geotécnicos en kN, kPa y m; el
+diseño de zapatas en kg, kg/cm² y cm) y declara las unidades de sus campos en
+un diccionario ``UNIDADES`` del módulo. Los datos que llegan en otro sistema se
+convierten una vez al entrar y los resultados una vez al salir: la conversión
+es un solo producto por un factor escalar, así que un arreglo completo (o una
+columna de un cuadro) se convierte sin ciclos de Python y los ciclos internos
+de los motores nunca ven unidades.
+
+    convertir(Pu, "kN", "kg")                       # escalar o arreglo
+    normalizar_unidades({"Pu [kN]": 600, "fc": 25000}, estr_zap.UNIDADES, "SI")
+    convertir_tabla(tabla, "SI")                    # encabezados "B (cm)" -> "B (m)"
+
+Los nombres de las unidades no distinguen espacios, ``·``/``-`` ni
+superíndices: "kN·m", "kn-m" y "KN*M" son la misma. La fuerza de 1 kg es el
+kilogramo fuerza (g = 9.80665 m/s²).
+"""
+import functools
+import re
+
+import numpy as np
+
+G = 9.80665 # m/s², gravedad estándar
+
+# unidad -> (magnitud, factor a la unidad SI de la magnitud)
+UNIDADES = {
+    # fuerza (kN)
+    "N": ("fuerza", 1e-3), "kN": ("fuerza", 1.0), "MN": ("fuerza", 1e3),
+    "kg": ("fuerza", G * 1e-3), "kgf": ("fuerza", G * 1e-3), "t": ("fuerza", G), "tf": ("fuerza", G),
+    # momento (kN·m)
+    "N·m": ("momento", 1e-3), "kN·m": ("momento", 1.0),
+    "kg·m": ("momento", G * 1e-3), "kg·cm": ("momento", G * 1e-5), "t·m": ("momento", G),
+    # presión (kPa)
+    "Pa": ("presion", 1e-3), "kPa": ("presion", 1.0), "MPa": ("presion", 1e3), "kN/m²": ("presion", 1.0),
+    "kg/cm²": ("presion", G * 10), "t/m²": ("presion", G),
+    # peso volumétrico (kN/m³)
+    "kN/m³": ("peso_volumetrico", 1.0), "t/m³": ("peso_volumetrico", G), "kg/m³": ("peso_volumetrico", G * 1e-3),
+    # longitud, área y volumen (m, m², m³)
+    "m": ("longitud", 1.0), "cm": ("longitud", 1e-2), "mm": ("longitud", 1e-3),
+    "m²": ("area", 1.0), "cm²": ("area", 1e-4), "mm²": ("area", 1e-6),
+    "m³": ("volumen", 1.0), "cm³": ("volumen", 1e-6),
+}
+
+# Unidad de cada magnitud en los sistemas aceptados por los motores
+SISTEMAS = {
+    "SI": {"fuerza": "kN", "momento": "kN·m", "presion": "kPa", "peso_volumetrico": "kN/m³",
+           "longitud": "m", "area": "mm²", "volumen": "m³"}, # áreas de acero en mm², como se acostumbra
+    "tecnico": {"fuerza": "kg", "momento": "kg·m", "presion": "kg/cm²", "peso_volumetrico": "t/m³",
+                "longitud": "cm", "area": "cm²", "volumen": "cm³"},
+}
+
+_SUPERINDICES = str.maketrans({"²": "2", "³": "3", "·": "-", "*": "-", " ": ""})
+_ENCABEZADO = re.compile(r"^\s*(.*?)\s*[\[(]\s*([^\])]+?)\s*[\])]\s*$")
+
+
+def _clave(unidad):
+    return str(unidad).translate(_SUPERINDICES).lower()
+
+
+_POR_CLAVE = {_clave(u): u for u in UNIDADES}
+
+
+def unidad(nombre):
+    """
+    Nombre canónico de una unidad ("kn-m" -> "kN·m").
+
+    Raises:
+        ValueError: Si la unidad no se conoce.
+    """
+    try:
+        return _POR_CLAVE[_clave(nombre)]
+    except KeyError:
+        raise ValueError(f"Unidad desconocida: {nombre}. Use: {', '.join(UNIDADES)}") from None
+
+
+def magnitud(nombre):
+    """Magnitud de una unidad ("kg/cm²" -> "presion")."""
+    return UNIDADES[unidad(nombre)][0]
+
+
+@functools.lru_cache(maxsize=256)
+def factor(de, a):
+    """
+    Factor escalar que lleva un valor de la unidad `de` a la unidad `a`.
+
+    Raises:
+        ValueError: Si alguna unidad no se conoce o son de magnitudes distintas.
+    """
+    magnitud_de, factor_de = UNIDADES[unidad(de)]
+    magnitud_a, factor_a = UNIDADES[unidad(a)]
+    if magnitud_de != magnitud_a:
+        raise ValueError(f"No se puede convertir {de} ({magnitud_de}) a {a} ({magnitud_a}).")
+    return factor_de / factor_a
+
+
+def convertir(valor, de, a):
+    """
+    `valor` (escalar, secuencia o arreglo) de la unidad `de` a la unidad `a`.
+    Los escalares siguen siendo float, las tuplas siguen siendo tuplas y los
+    arreglos se multiplican completos por el factor.
+    """
+    f = factor(de, a)
+    if f == 1.0:
+        return valor
+    if isinstance(valor, (list, tuple)):
+        return tuple(float(v) for v in np.asarray(valor, dtype=float) * f)
+    if isinstance(valor, np.ndarray) or hasattr(valor, "to_numpy"):
+        return valor * f
+    return float(valor) * f
+
+
+def en_sistema(unidad_motor, sistema):
+    """Unidad del `sistema` con la misma magnitud que `unidad_motor`."""
+    if sistema not in SISTEMAS:
+        raise ValueError(f"Sistema de unidades desconocido: {sistema}. Use: {', '.join(SISTEMAS)}")
+    return SISTEMAS[sistema][magnitud(unidad_motor)]
+
+
+def separar_encabezado(encabezado):
+    """("Pu", "kN") para "Pu [kN]" o "Pu (kN)"; (encabezado, None) sin unidad."""
+    coincide = _ENCABEZADO.match(str(encabezado))
+    if coincide:
+        return coincide.group(1), coincide.group(2)
+    return str(encabezado).strip(), None
+
+
+def _convertir_grupos(valor, destinos, sistema):
+    """
+    Secuencia (o secuencia de filas) cuyos valores vienen en grupos de
+    ``len(destinos)``: el i-ésimo de cada grupo va a ``destinos[i]``; None deja
+    ese valor sin convertir (un conteo, por ejemplo). Devuelve tuplas.
+    """
+    arreglo = np.asarray(valor, dtype=float)
+    if arreglo.size % len(destinos):
+        raise ValueError(f"Se esperan grupos de {len(destinos)} valores; llegaron {arreglo.size}.")
+    factores = np.array([1.0 if u is None else factor(en_sistema(u, sistema), u) for u in destinos])
+    convertido = (arreglo.reshape(-1, len(destinos)) * factores).reshape(arreglo.shape).tolist()
+    return tuple(tuple(fila) if isinstance(fila, list) else fila for fila in convertido)
+
+
+def _convertir_campo(valor, destino, sistema):
+    """`valor` del `sistema` a `destino`: una unidad, una tupla de unidades por posición o un dict por clave."""
+    if isinstance(destino, str):
+        return convertir(valor, en_sistema(destino, sistema), destino)
+    if valor is None:
+        return None
+    if isinstance(destino, dict):
+        if not isinstance(valor, dict):
+            return valor # ruta de archivo u objeto ya construido: en unidades del motor
+        return {k: _convertir_campo(v, destino[k], sistema) if k in destino else v for k, v in valor.items()}
+    return _convertir_grupos(valor, destino, sistema)
+
+
+def normalizar_unidades(datos, unidades_motor, sistema=None):
+    """
+    Lleva a las unidades del motor los campos de `datos` (dict o DataFrame).
+
+    Un encabezado con unidad ("Pu [kN]", "B (m)") se convierte desde esa unidad
+    y se renombra al campo ("Pu"); los campos sin unidad están en `sistema`
+    ("SI" o "tecnico"), o ya en las unidades del motor si `sistema` es None.
+    Los campos que no aparecen en `unidades_motor` (ángulos, nombres, opciones)
+    pasan sin cambio.
+
+    En `unidades_motor` un campo compuesto declara una tupla con la unidad de
+    cada posición, que se aplica a cada fila (``"estratos": ("m", "kPa")`` para
+    ((z_base, Es), ...); None en una posición la deja igual), o un dict con la
+    unidad de cada clave (``"terreno": {"x": "m", "y": "m"}``). Estos campos
+    vienen en `sistema` y no admiten unidad en el encabezado.
+
+    Raises:
+        ValueError: Con una unidad desconocida o de otra magnitud que la del campo.
+    """
+    es_tabla = hasattr(datos, "columns")
+    salida = {}
+    for encabezado in (datos.columns if es_tabla else datos):
+        valor = datos[encabezado]
+        campo, de = separar_encabezado(encabezado) if isinstance(encabezado, str) else (encabezado, None)
+        destino = unidades_motor.get(campo)
+        if isinstance(destino, str):
+            de = de or (en_sistema(destino, sistema) if sistema is not None else destino)
+            valor = convertir(valor.to_numpy(dtype=float) if es_tabla else valor, de, destino)
+        elif destino is not None:
+            if de is not None:
+                raise ValueError(f"{campo} lleva varias unidades; indique el sistema en lugar de {de}.")
+            if sistema is not None:
+                valor = ([_convertir_campo(v, destino, sistema) for v in valor] if es_tabla
+                         else _convertir_campo(valor, destino, sistema))
+        elif de is not None:
+            campo = encabezado # unidad en un campo sin unidades declaradas: se deja como vino
+        salida[campo] = valor
+    if es_tabla:
+        import pandas as pd
+
+        return pd.DataFrame(salida, index=datos.index)
+    return salida
+
+
+def convertir_tabla(tabla, sistema):
+    """
+    Copia de un DataFrame con cada columna "nombre (unidad)" llevada a la unidad
+    del `sistema` y renombrada; las columnas sin unidad reconocida no cambian.
+    """
+    columnas = {}
+    for encabezado in tabla.columns:
+        nombre, de = separar_encabezado(encabezado)
+        valor = tabla[encabezado]
+        if de is not None and _clave(de) in _POR_CLAVE:
+            a = en_sistema(de, sistema)
+            valor, encabezado = convertir(valor.to_numpy(dtype=float), de, a), f"{nombre} ({a})"
+        columnas[encabezado] = valor
+    import pandas as pd
+
+    return pd.DataFrame(columnas, index=tabla.index)
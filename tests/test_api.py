@@ -0,0 +1,86 @@
+# tests/test_api.py
+"""Errores de la API: un caso inválido no tumba su micro-lote ni deja conexiones colgadas."""
+import os
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geosuite.api import ClienteAPI, iniciar_en_hilo
+
+TALUD = {"cohesion": 10, "friction_angle": 30, "unit_weight": 16, "slope_height": 10, "slope_angle": 45,
+         "circle_center_x": 5, "circle_center_y": 18, "circle_radius": 15, "num_slices": 30}
+MUROS = {"gamma": 18, "phi": 30, "H": 3}
+
+
+@pytest.fixture(scope="module")
+def servidor():
+    # espera larga: las peticiones concurrentes caen en el mismo micro-lote
+    servidor = iniciar_en_hilo(puerto=0, procesos=1, espera_ms=200)
+    yield servidor
+    servidor.detener()
+
+
+def _post(puerto, ruta, datos):
+    cliente = ClienteAPI(puerto, timeout=30)
+    try:
+        return cliente.post(ruta, datos)
+    finally:
+        cliente.cerrar()
+
+
+def test_caso_invalido_no_tumba_su_micro_lote(servidor):
+    with ThreadPoolExecutor(2) as hilos:
+        valido = hilos.submit(_post, servidor.puerto, "/taludes", TALUD)
+        invalido = hilos.submit(_post, servidor.puerto, "/taludes", {**TALUD, "terreno": [1, 2]})
+        (estado_valido, valido), (estado_invalido, invalido) = valido.result(), invalido.result()
+    assert estado_valido == 200 and valido["resultado"]["fs"] > 0
+    assert estado_invalido == 422 and "terreno" in invalido["error"]
+
+
+def test_lote_con_casos_invalidos(servidor):
+    estado, datos = _post(servidor.puerto, "/muros/lote", {"casos": [MUROS, {**MUROS, "H": "x"}, {"phi": 30}]})
+    assert estado == 200
+    ok, texto, falta = datos["resultados"]
+    assert "resultado" in ok and "error" in texto and "error" in falta
+
+
+def test_terreno_como_ruta(servidor):
+    estado, datos = _post(servidor.puerto, "/taludes", {**TALUD, "terreno": "/etc/passwd"})
+    assert estado == 422 and "root:" not in datos["error"]
+
+
+def _busqueda(cohesion):
+    return {**TALUD, "cohesion": cohesion,
+            "busqueda": {"centros_x": [0, 10, 30], "centros_y": [12, 22, 30], "radios": [10, 20, 30]}}
+
+
+def test_lote_respeta_la_cola_acotada():
+    servidor = iniciar_en_hilo(puerto=0, procesos=1, max_cola=4)
+    try:
+        with ThreadPoolExecutor(2) as hilos:
+            largo = hilos.submit(_post, servidor.puerto, "/taludes/lote",
+                                 {"casos": [_busqueda(c) for c in (11, 12, 13)]})
+            time.sleep(0.2)
+            estado, datos = _post(servidor.puerto, "/taludes/lote", {"casos": [_busqueda(c) for c in (14, 15)]})
+            assert estado == 503 and "llena" in datos["error"]
+            estado, datos = _post(servidor.puerto, "/taludes", _busqueda(16))
+            assert estado == 200 # 3 en espera + 1 caben en la cola de 4
+            assert largo.result()[0] == 200
+    finally:
+        servidor.detener()
+
+
+def test_pool_se_reemplaza_si_un_proceso_muere():
+    servidor = iniciar_en_hilo(puerto=0, procesos=1)
+    try:
+        assert _post(servidor.puerto, "/muros", MUROS)[0] == 200
+        for proceso in list(servidor.servidor._pool._processes.values()):
+            os.kill(proceso.pid, signal.SIGKILL)
+        time.sleep(0.5)
+        estado, datos = _post(servidor.puerto, "/muros", MUROS)
+        assert estado == 500 and "BrokenProcessPool" in datos["error"]
+        assert _post(servidor.puerto, "/muros", MUROS)[0] == 200
+    finally:
+        servidor.detener()
@@ -0,0 +1,47 @@
+# tests/test_cache.py
+"""Caché de resultados: lo que recibe una llamada no altera lo que reciben las siguientes."""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from geosuite.cache import cacheado
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+@dataclass(frozen=True)
+class Resultado:
+    tabla: object
+    valores: object
+
+
+@cacheado("prueba_tablas")
+def calcular(n):
+    return Resultado(pd.DataFrame({"x": np.arange(float(n))}), np.arange(float(n)))
+
+
+def test_tablas_en_cache_no_se_comparten():
+    primero = calcular(3)
+    primero.tabla.loc[0, "x"] = 99.0
+    primero.tabla["nueva"] = 1
+    segundo = calcular(3)
+    assert segundo.tabla["x"].tolist() == [0.0, 1.0, 2.0] and "nueva" not in segundo.tabla
+    assert segundo.valores is primero.valores # los arreglos se comparten, en solo lectura
+    with pytest.raises(ValueError):
+        segundo.valores[0] = 1.0
+
+
+def test_tabla_del_optimizador_de_zapatas():
+    from geosuite.estr_zap import optimizar_zapatas
+
+    cuadro = pd.DataFrame({"Columna": ["C1"], "Pu": [60000.0], "Mux": [1000.0], "Muy": [2000.0],
+                           "b_col": [40.0], "h_col": [40.0]})
+    tabla = optimizar_zapatas(cuadro, 250, 4200, 2)
+    original = tabla.copy()
+    tabla[tabla.select_dtypes("number").columns] = -1.0
+    pd.testing.assert_frame_equal(optimizar_zapatas(cuadro, 250, 4200, 2), original)
@@ -0,0 +1,53 @@
+# tests/test_esfuerzos.py
+"""Δσz de Boussinesq: las formas cerradas coinciden con las soluciones clásicas."""
+import numpy as np
+import pytest
+
+from geosuite.esfuerzos import (esfuerzo_circular, esfuerzo_franja, esfuerzo_poligono, esfuerzo_poligono_malla,
+                                esfuerzo_poligono_rectangulos, esfuerzo_rectangulo, poligono_circulo)
+from geosuite.settlement import bou_rect_c
+
+Z = np.array([0.5, 1.0, 2.0, 5.0, 10.0])
+RECTANGULO = ((-1.5, -1.0), (1.5, -1.0), (1.5, 1.0), (-1.5, 1.0))
+ELE = ((0, 0), (6, 0), (6, 2), (2, 2), (2, 5), (0, 5))
+X, Y = np.array([1.0, 4.0, -2.0, 3.0]), np.array([1.0, 1.0, 3.0, 4.0])
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+def test_rectangulo_bajo_el_centro_y_la_esquina():
+    centro = bou_rect_c(100, 3, 2, Z)
+    assert esfuerzo_poligono(100, RECTANGULO, 0, 0, Z) == pytest.approx(centro, rel=1e-12)
+    assert esfuerzo_rectangulo(100, -1.5, -1, 1.5, 1, 0, 0, Z) == pytest.approx(centro, rel=1e-12)
+    # la esquina de un rectángulo de 3 × 2 es un cuarto del centro de uno de 6 × 4
+    assert esfuerzo_poligono(100, RECTANGULO, 1.5, 1, Z) == pytest.approx(bou_rect_c(100, 6, 4, Z) / 4, rel=1e-12)
+
+
+def test_poligono_no_convexo_igual_a_la_subdivision():
+    # con n = 60 las celdas de 0.1 × 1/12 m cubren la ele sin error de borde
+    exacto = esfuerzo_poligono(100, ELE, X[:, None], Y[:, None], Z)
+    assert esfuerzo_poligono_rectangulos(100, ELE, X[:, None], Y[:, None], Z, n=60) == pytest.approx(exacto, abs=1e-9)
+    assert esfuerzo_poligono_malla(100, ELE, X, Y, Z) == pytest.approx(exacto, abs=1e-12)
+    assert esfuerzo_poligono(100, ELE[::-1], X[:, None], Y[:, None], Z) == pytest.approx(exacto, abs=1e-12)
+
+
+def test_poligono_en_la_superficie():
+    assert esfuerzo_poligono(100, RECTANGULO, [0.0, 1.5, 3.0], 0, 0) == pytest.approx([100, 50, 0], abs=1e-9)
+
+
+def test_franja_igual_a_la_solucion_clasica():
+    # Δσz = q/π · [α + sen α · cos(α + 2δ)]
+    x, z = np.array([0.0, 1.0, 2.5, -3.0]), 2.0
+    delta = np.arctan((x - 1) / z)
+    alpha = np.arctan((x + 1) / z) - delta
+    esperado = 100 / np.pi * (alpha + np.sin(alpha) * np.cos(alpha + 2 * delta))
+    assert esfuerzo_franja(100, 2, x, z) == pytest.approx(esperado, rel=1e-12)
+
+
+def test_circulo_en_el_eje_y_fuera_de_el():
+    assert esfuerzo_circular(100, 3, 0, 0, Z) == pytest.approx(100 * (1 - (1 + (3 / Z)**2) ** -1.5), rel=1e-12)
+    fuera = esfuerzo_circular(100, 3, 2, 0, 2)
+    assert fuera == pytest.approx(esfuerzo_poligono_rectangulos(100, poligono_circulo(3), 2, 0, 2, n=512), rel=1e-3)
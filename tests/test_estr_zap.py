@@ -0,0 +1,68 @@
+# tests/test_estr_zap.py
+"""Zapatas: presiones de contacto y mismos criterios en la revisión vectorizada y en el diseño de un caso."""
+import numpy as np
+import pytest
+
+from geosuite.estr_zap import (DIAMETRO_VARILLA, EntradaZapata, calculate_footing_design,
+                               presion_contacto_biaxial, revisar_zapatas)
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+def test_longitud_de_desarrollo_justa_pasa_en_ambos():
+    # fy bajo: ld queda en el mínimo de 30 cm; zapata de 160 cm y columna de 40 cm: 60 cm - 30 cm = ld
+    e = EntradaZapata(Pu=60000, Mu=3000, fc=250, fy=2400, q_adm=2, b_col=40, h_col=40, d_propuesto=40,
+                      C_recubrimiento=30)
+    r = calculate_footing_design(e)
+    assert r.B_zapata == 160 and r.Longitud_disponible == r.Longitud_desarrollo_ld == 30
+    assert r.Longitud_desarrollo_pasa
+    rev = revisar_zapatas(e.Pu, 0.0, e.Mu, r.B_zapata, r.L_zapata, e.d_propuesto, e.b_col, e.h_col, e.fc, e.fy,
+                          e.q_adm, e.C_recubrimiento)
+    assert bool(rev["cumple"][0, 0]) == (r.Longitud_desarrollo_pasa and r.Cortante_1_direccion_pasa
+                                         and r.Cortante_2_direcciones_pasa)
+    assert r.Peralte_total == pytest.approx(e.d_propuesto + e.C_recubrimiento + DIAMETRO_VARILLA)
+
+
+def _resultantes(r, B, L):
+    """Fuerza y excentricidades (cm) de la distribución de presiones calculada."""
+    q = r["q"]
+    n = q.shape[-1]
+    xi = (np.arange(n) + 0.5) / n - 0.5
+    fuerza = q.sum() * B * L / n**2
+    return fuerza, (q * xi[None, :] * B).sum() * B * L / n**2 / fuerza, (q * xi[:, None] * L).sum() * B * L / n**2 / fuerza
+
+
+def test_presion_biaxial_en_el_nucleo():
+    P, Mx, My, B, L = 60000.0, 3000.0, 5000.0, 200.0, 250.0
+    r = presion_contacto_biaxial(P, Mx, My, B, L)
+    ex, ey = My * 100 / P, Mx * 100 / P
+    assert r["en_nucleo"] and r["fraccion_contacto"] == 1
+    assert r["q_max"] == pytest.approx(P / (B * L) * (1 + 6 * ex / B + 6 * ey / L))
+    assert r["q_min"] == pytest.approx(P / (B * L) * (1 - 6 * ex / B - 6 * ey / L))
+
+
+def test_presion_uniaxial_fuera_del_nucleo():
+    # e = 50 cm > B/6: reparto triangular sobre 3(B/2 - e) con q_max = 2P / (3L(B/2 - e))
+    P, B, L = 60000.0, 200.0, 200.0
+    r = presion_contacto_biaxial(P, 0.0, 30000.0, B, L, n_celdas=64)
+    assert not r["en_nucleo"] and r["estable"]
+    assert r["fraccion_contacto"] == pytest.approx(3 * (B / 2 - 50) / B)
+    assert r["q_max"] == pytest.approx(2 * P / (3 * L * (B / 2 - 50)), rel=1e-3)
+
+
+def test_presion_biaxial_con_levantamiento_equilibra_la_carga():
+    P, Mx, My, B, L = 60000.0, 10000.0, 20000.0, 200.0, 250.0
+    r = presion_contacto_biaxial(P, Mx, My, B, L, n_celdas=64)
+    assert not r["en_nucleo"] and 0 < r["fraccion_contacto"] < 1 and (r["q"] >= 0).all()
+    fuerza, ex, ey = _resultantes(r, B, L)
+    assert fuerza == pytest.approx(P, rel=1e-6)
+    assert (ex, ey) == pytest.approx((My * 100 / P, Mx * 100 / P), abs=0.05)
+
+
+def test_presion_inestable_si_la_resultante_sale_de_la_base():
+    r = presion_contacto_biaxial([60000.0, 60000.0], 0.0, [5000.0, 60000.0], 200.0, 200.0)
+    assert r["estable"].tolist() == [True, False]
+    assert np.isnan(r["q_max"][1]) and r["fraccion_contacto"][1] == 0
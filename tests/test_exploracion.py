@@ -0,0 +1,48 @@
+# tests/test_exploracion.py
+"""Exploración: los sondeos quedan dentro del predio y la cobertura reportada es una cota real."""
+import numpy as np
+import pytest
+
+from geosuite.exploracion import EntradaExploracion, planear_exploracion, puntos_en_poligono, ubicar_sondeos
+
+ELE = ((0, 0), (60, 0), (60, 20), (20, 20), (20, 50), (0, 50))
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+def _distancia_maxima(poligono, sondeos, paso=0.25):
+    P = np.asarray(poligono, dtype=float)
+    x, y = np.meshgrid(np.arange(P[:, 0].min(), P[:, 0].max() + paso, paso),
+                       np.arange(P[:, 1].min(), P[:, 1].max() + paso, paso))
+    dentro = puntos_en_poligono(x, y, P)
+    x, y = x[dentro], y[dentro]
+    return np.hypot(x[:, None] - sondeos[:, 0], y[:, None] - sondeos[:, 1]).min(axis=1).max()
+
+
+@pytest.mark.parametrize("n_min, radio", [(3, 15.0), (8, 15.0), (1, 40.0)])
+def test_cobertura_garantizada(n_min, radio):
+    sondeos, cobertura = ubicar_sondeos(ELE, n_min, radio)
+    assert len(sondeos) >= n_min and cobertura <= radio
+    assert puntos_en_poligono(sondeos[:, 0], sondeos[:, 1], ELE).all()
+    assert _distancia_maxima(ELE, sondeos) <= cobertura
+
+
+def test_plan_con_area_y_con_poligono():
+    r = planear_exploracion(EntradaExploracion(3, area=900))
+    assert r.num_sondeos >= r.num_sondeos_tabla and r.cobertura <= r.radio_cobertura
+    assert r.metros_perforacion == pytest.approx(r.profundidad * r.num_sondeos)
+    # los sondeos se redondean al centímetro
+    assert _distancia_maxima(r.poligono, r.sondeos) <= r.cobertura + 0.01
+    r = planear_exploracion(EntradaExploracion(3, poligono=ELE))
+    assert r.area == pytest.approx(60 * 20 + 20 * 30)
+    assert puntos_en_poligono(r.sondeos[:, 0], r.sondeos[:, 1], ELE).all()
+
+
+def test_plan_fuera_de_la_tabla():
+    with pytest.raises(ValueError, match="Ubicación"):
+        planear_exploracion(EntradaExploracion(3, area=900, ubicacion="Atlantis"))
+    with pytest.raises(ValueError, match="área"):
+        planear_exploracion(EntradaExploracion(3))
@@ -0,0 +1,56 @@
+# tests/test_lote.py
+"""Corridas por lote: un caso malformado es una fila con error y la corrida sigue."""
+import csv
+import json
+
+import pytest
+
+from geosuite import lote
+
+TALUD = {"cohesion": 10, "friction_angle": 30, "unit_weight": 16, "slope_height": 10, "slope_angle": 45,
+         "circle_center_x": 5, "circle_center_y": 18, "circle_radius": 15, "num_slices": 30}
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+def _proyecto(tmp_path, casos):
+    ruta = tmp_path / "proyecto.json"
+    ruta.write_text(json.dumps({"casos": casos}), encoding="utf-8")
+    return str(ruta)
+
+
+def _filas(ruta):
+    with open(ruta, encoding="utf-8", newline="") as archivo:
+        return {fila["id"]: fila for fila in csv.DictReader(archivo)}
+
+
+@pytest.mark.parametrize("malformado, mensaje", [
+    ({"busqueda": [1, 2, 3]}, "busqueda"),
+    ({"busqueda": {"centros_x": [0, 10], "centros_y": [12, 22, 3], "radios": [10, 20, 3]}}, "busqueda"),
+    ({"terreno": [1, 2]}, "terreno"),
+    ({"terreno": {"x": [0, 10]}}, "terreno"),
+    ({"terreno": {"x": [0, "a"], "y": [0, 1]}}, "Error"),
+    ({"cohesion": None}, "Error"),
+])
+def test_caso_malformado_es_fila_con_error(tmp_path, malformado, mensaje):
+    ruta = _proyecto(tmp_path, {"taludes": [{"id": "S1", **TALUD}, {"id": "S2", **TALUD, **malformado}]})
+    assert lote.correr(ruta, procesos=0) == {"ok": 1, "error": 1, "omitidos": 0}
+    filas = _filas(tmp_path / "proyecto_resultados" / "taludes.csv")
+    assert filas["S1"]["estado"] == "ok"
+    assert filas["S2"]["estado"] == "error" and mensaje in filas["S2"]["mensaje"]
+
+
+def test_reanudar_reintenta_solo_los_errores(tmp_path):
+    ruta = _proyecto(tmp_path, {"taludes": [{"id": "S1", **TALUD}, {"id": "S2", **TALUD, "terreno": [1, 2]}],
+                                "muros": [{"id": "M1", "gamma": 18, "phi": 30, "H": 3}]})
+    assert lote.correr(ruta, procesos=0) == {"ok": 2, "error": 1, "omitidos": 0}
+    assert lote.correr(ruta, procesos=0) == {"ok": 0, "error": 1, "omitidos": 2}
+
+
+def test_caso_que_no_es_objeto(tmp_path):
+    ruta = _proyecto(tmp_path, {"muros": [[18, 30, 3]]})
+    with pytest.raises(ValueError, match="lista de objetos"):
+        lote.correr(ruta, procesos=0)
@@ -0,0 +1,51 @@
+# tests/test_lote_unidades.py
+"""El mismo caso del lote en SI y en sistema técnico debe dar el mismo resultado."""
+import pytest
+
+from geosuite import lote
+from geosuite.unidades import G
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+TALUD_SI = {
+    "unidades": "SI", "cohesion": 10, "friction_angle": 30, "unit_weight": 16, "slope_height": 10,
+    "slope_angle": 45, "circle_center_x": 5, "circle_center_y": 18, "circle_radius": 15, "num_slices": 30,
+    "busqueda": {"centros_x": [0, 10, 6], "centros_y": [12, 22, 6], "radios": [10, 20, 6]},
+}
+# kPa -> kg/cm², kN/m³ -> t/m³, m -> cm; los conteos n de la malla no cambian
+TALUD_TECNICO = {
+    **TALUD_SI, "unidades": "tecnico", "cohesion": 10 / (10 * G), "unit_weight": 16 / G, "slope_height": 1000,
+    "circle_center_x": 500, "circle_center_y": 1800, "circle_radius": 1500,
+    "busqueda": {"centros_x": [0, 1000, 6], "centros_y": [1200, 2200, 6], "radios": [1000, 2000, 6]},
+}
+
+
+def test_busqueda_de_talud_en_sistema_tecnico():
+    si = lote.resolver_caso("taludes", TALUD_SI)
+    tecnico = lote.resolver_caso("taludes", TALUD_TECNICO)
+    assert tecnico["circulos_evaluados"] == si["circulos_evaluados"] == 6 ** 3
+    for campo in ("circle_center_x", "circle_center_y", "circle_radius", "fs"):
+        assert tecnico[campo] == pytest.approx(si[campo])
+
+
+def test_terreno_en_linea_en_sistema_tecnico():
+    terreno = {"x": [0, 10, 20, 30], "y": [0, 0, 10, 10]}
+    si = lote.resolver_caso("taludes", {**TALUD_SI, "terreno": terreno})
+    tecnico = lote.resolver_caso("taludes", {**TALUD_TECNICO, "terreno": {
+        "x": [100 * x for x in terreno["x"]], "y": [100 * y for y in terreno["y"]]}})
+    assert tecnico["fs"] == pytest.approx(si["fs"])
+    assert tecnico["circle_radius"] == pytest.approx(si["circle_radius"])
+
+
+def test_estratos_en_sistema_tecnico():
+    # z_base en cm y Es en kg/cm²
+    tecnico = lote.resolver_caso("asentamientos", {"unidades": "tecnico", "q": 1, "L": 400, "B": 200, "Es": 150,
+                                                   "estratos": [[300, 50], [600, 100]]})
+    si = lote.resolver_caso("asentamientos", {"unidades": "SI", "q": 10 * G, "L": 4, "B": 2, "Es": 1500 * G,
+                                              "estratos": [[3, 500 * G], [6, 1000 * G]]})
+    assert tecnico["asentamiento"] == pytest.approx(si["asentamiento"])
+    assert tecnico["estratos"] == si["estratos"]
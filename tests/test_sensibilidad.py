@@ -0,0 +1,34 @@
+# tests/test_sensibilidad.py
+"""Sensibilidad: el kernel vectorizado coincide con la calculadora caso por caso."""
+import numpy as np
+import pytest
+
+from geosuite.sensibilidad import evaluar, tornado
+from geosuite.settlement import EntradaAsentamiento, asentamiento_lote, calculo_matrices
+
+ESTRATOS = ((1.0, 5000.0), (3.0, 30000.0))
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+@pytest.mark.parametrize("estratos", [None, ESTRATOS])
+def test_asentamiento_lote_igual_a_calculo_matrices(estratos):
+    B = np.array([1.0, 2.0, 3.5])
+    Es = np.array([8000.0, 15000.0, 40000.0])
+    esperado = [calculo_matrices.sin_cache(EntradaAsentamiento(120, 4, b, es, 0.25, estratos)).asentamiento
+                for b, es in zip(B, Es)]
+    assert asentamiento_lote(120, 4, B, Es, 0.25, estratos) == pytest.approx(esperado, rel=1e-12)
+
+
+def test_sensibilidad_de_base_con_estratos():
+    base = EntradaAsentamiento(100, 4, 2, 15000, estratos=ESTRATOS)
+    r = tornado("asentamiento", base, {"q": (80, 120), "Es": (10000, 20000)})
+    assert r.valor_base == pytest.approx(calculo_matrices.sin_cache(base).asentamiento)
+    y = evaluar("asentamiento", base, {"Es": np.array([10000.0, 20000.0])})
+    uniforme = evaluar("asentamiento", EntradaAsentamiento(100, 4, 2, 15000), {"Es": np.array([10000.0, 20000.0])})
+    assert y == pytest.approx([calculo_matrices.sin_cache(EntradaAsentamiento(100, 4, 2, es, estratos=ESTRATOS))
+                               .asentamiento for es in (10000, 20000)])
+    assert not np.allclose(y, uniforme)
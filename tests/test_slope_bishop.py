@@ -0,0 +1,47 @@
+# tests/test_slope_bishop.py
+"""Bishop: el FS vectorizado de muchos círculos coincide con el cálculo caso por caso."""
+import numpy as np
+import pytest
+
+from geosuite.slope_bishop import EntradaBishop, calculate_bishop_fs, fs_circulo, fs_lote
+from geosuite.terreno import Terreno
+
+TALUD = dict(cohesion=10, friction_angle=30, unit_weight=16, slope_height=10, slope_angle=45)
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+def _escalar(xc, yc, R, n, ru=0.0, terreno=None):
+    return fs_circulo(EntradaBishop(**TALUD, circle_center_x=xc, circle_center_y=yc, circle_radius=R,
+                                    num_slices=n, ru=ru, terreno=terreno))[0]
+
+
+@pytest.mark.parametrize("terreno", [None, Terreno([-10, 0, 4, 12, 25], [10, 10, 5, 1, 0])])
+def test_fs_lote_igual_a_fs_circulo(terreno):
+    xc = np.array([3.0, 5.0, 8.0, 6.0])
+    yc = np.array([18.0, 18.0, 16.0, 20.0])
+    R = np.array([14.0, 15.0, 13.0, 18.0])
+    n = np.array([20, 30, 30, 45])
+    ru = np.array([0.0, 0.2, 0.3, 0.1])
+    fs = fs_lote(**TALUD, circle_center_x=xc, circle_center_y=yc, circle_radius=R, num_slices=n, ru=ru,
+                 terreno=terreno)
+    esperado = [_escalar(*caso, terreno=terreno) for caso in zip(xc, yc, R, n, ru)]
+    assert fs == pytest.approx(esperado, rel=1e-9)
+
+
+def test_fs_lote_difunde_y_da_nan_sin_corte():
+    fs = fs_lote(**TALUD, circle_center_x=5, circle_center_y=18, circle_radius=np.array([[15.0], [2.0]]),
+                 num_slices=30, ru=np.array([0.0, 0.2]))
+    assert fs.shape == (2, 2)
+    assert fs[0] == pytest.approx([_escalar(5, 18, 15, 30), _escalar(5, 18, 15, 30, ru=0.2)])
+    assert np.isnan(fs[1]).all()
+    with pytest.raises(ValueError, match="no intersecta"):
+        _escalar(5, 18, 2, 30)
+
+
+def test_detalle_por_dovela_da_el_mismo_fs():
+    entrada = EntradaBishop(**TALUD, circle_center_x=5, circle_center_y=18, circle_radius=15, num_slices=30)
+    assert calculate_bishop_fs(entrada).fs == pytest.approx(fs_circulo(entrada)[0], rel=1e-12)
@@ -0,0 +1,49 @@
+# tests/test_spt.py
+"""Registros SPT: clasificación de suelos, correcciones y correlaciones."""
+import numpy as np
+import pytest
+
+from geosuite.spt import CN_MAX, EntradaSPT, _es_granular, corregir_N, procesar_spt, registros_de_tabla
+
+
+@pytest.fixture(autouse=True)
+def sin_almacen(monkeypatch):
+    monkeypatch.setenv("GEOSUITE_ALMACEN", "0")
+
+
+@pytest.mark.parametrize("suelo, granular", [
+    ("SM", True), ("SP-SM", True), ("SM/SC", True), ("GW-GC", True), ("Arena limosa", True),
+    ("silty sand", True), ("Grava", True), ("gravel", True), ("Arena (SM)", True),
+    ("CL", False), ("CL-ML", False), ("ML-CL", False), ("MH", False), ("OL", False), ("Pt", False),
+    ("Clay", False), ("Silt", False), ("turba", False), ("Peat", False), ("Limo arenoso", False),
+    ("Arcilla", False), ("sandy clay", False),
+    ("relleno", None), ("xyz", None), ("", None),
+])
+def test_clasificacion_de_suelos(suelo, granular):
+    assert _es_granular(suelo) is granular
+
+
+def test_suelo_desconocido_no_se_supone_granular():
+    tabla = {"Sondeo": ["S-1", "S-1"], "Profundidad": [1.0, 2.0], "N": [8, 12], "Suelo": ["SM", "relleno"]}
+    with pytest.raises(ValueError, match="S-1 a 2 m"):
+        registros_de_tabla(tabla)
+
+
+def test_finos_usan_correlaciones_de_finos():
+    tabla = {"Sondeo": ["S-1"] * 3, "Profundidad": [1.0, 2.0, 3.0], "N": [10, 10, 10],
+             "Suelo": ["SM", "CL-ML", "Clay"], "Finos": [15, 60, 80]}
+    r = procesar_spt(EntradaSPT(registros_de_tabla(tabla), naf=0.5, amax=0.3))
+    assert list(r.registros.granular) == [True, False, False]
+    assert np.isfinite(r.phi[0]) and np.isnan(r.phi[1:]).all()
+    assert np.isnan(r.Su[0]) and np.isfinite(r.Su[1:]).all()
+    assert np.isfinite(r.FS_licuacion[0]) and np.isnan(r.FS_licuacion[1:]).all()
+
+
+def test_correcciones_de_N():
+    # barras de z + 1 m: 2 m → CR 0.75, 5.5 m → 0.85, 11 m → 1.0; CN = √(Pa/σ'v) ≤ 1.7
+    N60, N1_60 = corregir_N([10, 10, 10], [1.0, 4.5, 10.0], [101.325, 10.0, 405.3])
+    assert N60 == pytest.approx([7.5, 8.5, 10.0])
+    assert N1_60 == pytest.approx([7.5, 8.5 * CN_MAX, 10.0 * np.sqrt(101.325 / 405.3)])
+    # energía 75 %, perforación de 130 mm y muestreador sin camisa: 1.25 · 1.05 · 1.2
+    N60, _ = corregir_N(10, 10.0, 100.0, energia=75, diametro=130, sin_camisa=True)
+    assert N60 == pytest.approx(10 * 1.25 * 1.05 * 1.2)